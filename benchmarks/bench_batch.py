@@ -0,0 +1,54 @@
+"""
+Benchmark batch sanitization of a JSON Lines dataset against calling
+`sanitize_text` record by record.
+
+Usage:
+    python benchmarks/bench_batch.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sanitext.batch import sanitize_jsonl  # noqa: E402
+from sanitext.text_sanitization import sanitize_text  # noqa: E402
+
+TEXTS = [
+    "A plain ASCII answer that needs no change at all, as most records do.",
+    "Thіs іs а “quoted” tеxt — with ｆｕｌｌwidth 𝑚𝑎𝑡ℎ and naïve café.",
+    "Съешь же ещё этих мягких французских булок, да выпей чаю.",
+]
+LINES = [
+    json.dumps({"id": i, "text": TEXTS[i % len(TEXTS)], "label": "ok"}) + "\n"
+    for i in range(300_000)
+]
+
+
+def row_by_row():
+    output = []
+    for line in LINES:
+        record = json.loads(line)
+        record["text"] = sanitize_text(record["text"])
+        output.append(json.dumps(record) + "\n")
+    return output
+
+
+def main():
+    baseline = timeit.timeit(row_by_row, number=1)
+    print(f"{len(LINES):,} records  row by row        {baseline:6.2f} s")
+    for jobs in (1, None):
+        elapsed = timeit.timeit(
+            lambda: list(sanitize_jsonl(LINES, ["text"], jobs=jobs)), number=1
+        )
+        label = "in process" if jobs == 1 else f"pool of {os.cpu_count()}"
+        print(
+            f"{len(LINES):,} records  batch, {label:11} {elapsed:6.2f} s"
+            f"  ({baseline / elapsed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark grapheme-cluster-aware sanitization against the per-code-point path.
+
+Usage:
+    python benchmarks/bench_graphemes.py
+"""
+
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sanitext.graphemes import grapheme_pattern, sanitize_graphemes  # noqa: E402
+from sanitext.text_sanitization import sanitize_text  # noqa: E402
+
+TEXTS = {
+    "mostly ASCII with homoglyphs": "Thіs іs а “quoted” tеxt — with ｆｕｌｌwidth 𝑚𝑎𝑡ℎ.\n"
+    * 20_000,
+    "decomposed accents (NFD)": unicodedata.normalize(
+        "NFD", "Café crème brûlée, naïve façade, señor Ångström.\n"
+    )
+    * 20_000,
+    "Cyrillic prose": "Съешь же ещё этих мягких французских булок, да выпей чаю.\n"
+    * 20_000,
+    "Hangul and emoji": "한국어 텍스트 👨‍👩‍👧 and 🇬🇧 flags.\n" * 20_000,
+}
+REPEAT = 5
+
+
+def main():
+    grapheme_pattern()  # Compile once, outside the timings
+    for label, text in TEXTS.items():
+        per_code_point = min(
+            timeit.repeat(lambda: sanitize_text(text), number=1, repeat=REPEAT)
+        )
+        per_cluster = min(
+            timeit.repeat(lambda: sanitize_graphemes(text), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{label:30} {len(text):>9,} chars  code points {per_code_point * 1000:7.1f} ms"
+            f"  clusters {per_cluster * 1000:7.1f} ms  ({per_cluster / per_code_point:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark scanning a large file in parallel chunks against reading it into one
+string and running detection on it.
+
+Usage:
+    python benchmarks/bench_scan.py [size in MB]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sanitext.hidden_text import find_hidden_text  # noqa: E402
+from sanitext.scan import scan_large_file  # noqa: E402
+from sanitext.scripts import detect_mixed_script  # noqa: E402
+from sanitext.text_sanitization import summarize_suspicious  # noqa: E402
+
+LINES = [
+    "A plain ASCII line of a log or dump, as most of them are in practice.\n",
+    "Some “quoted” text — with a Cyrillic lookalike in pаypal and naïve.\n",
+]
+
+
+def whole(path):
+    with open(path, encoding="utf-8", errors="replace") as file:
+        text = file.read()
+    return summarize_suspicious(text), find_hidden_text(text), detect_mixed_script(text)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as file:
+        # One line in ten has suspicious characters
+        block = "".join(LINES[i % 10 == 0] for i in range(10_000))
+        for _ in range(size * 1024 * 1024 // len(block.encode("utf-8"))):
+            file.write(block)
+    try:
+        baseline = timeit.timeit(lambda: whole(file.name), number=1)
+        print(f"{size} MB  one string          {baseline:6.2f} s")
+        for jobs in (1, None):
+            elapsed = timeit.timeit(
+                lambda: scan_large_file(file.name, jobs=jobs), number=1
+            )
+            label = "in process" if jobs == 1 else f"pool of {os.cpu_count()}"
+            print(
+                f"{size} MB  chunks, {label:12} {elapsed:6.2f} s"
+                f"  ({baseline / elapsed:.1f}x)"
+            )
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == "__main__":
+    main()
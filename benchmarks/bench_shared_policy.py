@@ -0,0 +1,87 @@
+"""
+Benchmark the memory a worker process needs for its sanitization tables:
+building its own `Policy` against attaching to a policy compiled into shared
+memory. Each variant runs in a fresh interpreter, as a spawned worker would,
+and reports the Python memory it allocated (besides the standard library)
+after sanitizing the same texts.
+
+Usage:
+    python benchmarks/bench_shared_policy.py
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sanitext.compiled_policy import share_policy  # noqa: E402
+from sanitext.policy import Policy  # noqa: E402
+from sanitext.text_sanitization import get_allowed_characters  # noqa: E402
+
+# A large allow list: Cyrillic, CJK ideographs and Hangul syllables
+ALLOW_CHARS = "".join(
+    chr(code)
+    for start, end in [(0x400, 0x530), (0x4E00, 0xA000), (0xAC00, 0xD7A4)]
+    for code in range(start, end)
+)
+
+WORKER = """
+import hashlib
+import multiprocessing.shared_memory
+import tracemalloc
+import unicodedata
+
+# Only count what the policy needs, not the standard library
+tracemalloc.start()
+{setup}
+for _ in range(1000):
+    policy.sanitize("Thіs іs а “quoted” tеxt — naïve ☯ 👍 Ⅵ ﬁ ж")
+current, _ = tracemalloc.get_traced_memory()
+print(current)
+"""
+
+OWN = """
+from sanitext.policy import Policy
+from sanitext.text_sanitization import get_allowed_characters
+
+allowed = get_allowed_characters(allow_emoji=True, allow_chars={chars!r})
+policy = Policy(allowed)
+"""
+
+SHARED = """
+from sanitext.compiled_policy import attach_policy
+
+policy = attach_policy({name!r})
+"""
+
+
+def measure(setup):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER.format(setup=setup)],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+def main():
+    allowed = get_allowed_characters(allow_emoji=True, allow_chars=ALLOW_CHARS)
+    shared = share_policy(Policy(allowed))
+    size = shared.buffer.nbytes
+    try:
+        own = measure(OWN.format(chars=ALLOW_CHARS))
+        attached = measure(SHARED.format(name=shared.name))
+    finally:
+        shared.close()
+        shared.unlink()
+    print(f"Own Policy per worker:       {own / 1024:8.0f} KiB")
+    print(f"Shared compiled per worker:  {attached / 1024:8.0f} KiB")
+    print(f"Shared block (once):         {size / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark Unicode name lookups on text dense in repeated non-ASCII characters.
+
+Compares the uncached `unicodedata.name` call per occurrence with the shared
+`unicode_name` cache used by the detection and reporting paths.
+
+Usage:
+    python benchmarks/bench_unicode_name.py
+"""
+
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sanitext.text_sanitization import (  # noqa: E402
+    detect_suspicious_characters,
+    get_allowed_characters,
+    unicode_name,
+)
+
+TEXT = "Ｔｈｉｓ іѕ а ｔｅｓｔ “quoted” — 𝑚𝑎𝑡ℎ ✓ " * 20_000
+REPEAT = 5
+
+
+def uncached_detect(text, allowed_characters):
+    return [
+        (char, unicodedata.name(char, "Unknown"))
+        for char in text
+        if char not in allowed_characters
+    ]
+
+
+def main():
+    allowed = get_allowed_characters()
+    unicode_name.cache_clear()
+    suspicious = sum(1 for char in TEXT if char not in allowed)
+    print(f"{len(TEXT):,} characters, {suspicious:,} suspicious occurrences")
+
+    uncached = min(
+        timeit.repeat(lambda: uncached_detect(TEXT, allowed), number=1, repeat=REPEAT)
+    )
+    cached = min(
+        timeit.repeat(
+            lambda: detect_suspicious_characters(TEXT, allowed),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+    print(f"unicodedata.name per occurrence: {uncached * 1000:8.1f} ms")
+    print(f"unicode_name (cached):           {cached * 1000:8.1f} ms")
+    print(f"cache info: {unicode_name.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
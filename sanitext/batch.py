@@ -0,0 +1,142 @@
+"""
+Batch sanitization of datasets: selected fields of JSON Lines records or
+selected columns of CSV rows.
+
+Records are processed in a pipeline: the caller's iterator reads them, batches
+of them are sanitized by a pool of worker processes that each receive the
+compiled `Policy` once, and the results are yielded in input order. At most a
+few batches per worker are in flight, so memory use stays bounded however
+large the input is.
+
+Records whose selected fields need no change are passed through as they are:
+a JSON Lines record is only parsed if it may contain a disallowed character,
+and only re-serialized if one of its fields changed.
+"""
+
+import json
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+from sanitext.policy import Policy
+
+BATCH_SIZE = 1024
+BATCHES_PER_WORKER = 4
+
+
+def sanitize_jsonl_record(numbered_line, policy, fields):
+    """
+    Sanitize the string values of `fields` (top-level keys) in one JSON Lines
+    record. `numbered_line` is a (line number, line) pair, the number is used in
+    error messages. Returns the line, unchanged if no field changed.
+    """
+    number, line = numbered_line
+    content = line.rstrip("\r\n")
+    # Without escapes, every string in the record is a part of the raw line
+    if "\\" not in content and policy.is_clean(content):
+        return line
+    if not content.strip():
+        return line
+    try:
+        record = json.loads(content)
+    except ValueError as error:
+        raise ValueError(f"Line {number}: invalid JSON ({error})") from None
+    if not isinstance(record, dict):
+        return line
+    changed = False
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, str):
+            sanitized = policy.sanitize(value)
+            if sanitized != value:
+                record[field] = sanitized
+                changed = True
+    if not changed:
+        return line
+    # Keep the record escaped the way it was
+    return json.dumps(record, ensure_ascii=content.isascii()) + line[len(content) :]
+
+
+def sanitize_csv_row(row, policy, indices):
+    """Sanitize the cells at `indices` of a CSV row (a list of strings)."""
+    if any(index < len(row) and not policy.is_clean(row[index]) for index in indices):
+        row = list(row)
+        for index in indices:
+            if index < len(row):
+                row[index] = policy.sanitize(row[index])
+    return row
+
+
+def _batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+_worker_job = None
+
+
+def _init_worker(function, policy, selection):
+    global _worker_job
+    _worker_job = function, policy, selection
+
+
+def _run_batch(batch):
+    function, policy, selection = _worker_job
+    return [function(item, policy, selection) for item in batch]
+
+
+def pipeline(function, items, policy, selection, jobs=None, batch_size=BATCH_SIZE):
+    """
+    Yields function(item, policy, selection) for every item, in order.
+
+    `jobs` is the number of worker processes (default: one per CPU, 1 runs in
+    this process). Items are read lazily, `batch_size` at a time.
+    """
+    if jobs == 1:
+        for item in items:
+            yield function(item, policy, selection)
+        return
+    jobs = jobs or os.cpu_count() or 1
+    with Pool(
+        jobs, initializer=_init_worker, initargs=(function, policy, selection)
+    ) as pool:
+        pending = deque()
+        for batch in _batches(items, batch_size):
+            pending.append(pool.apply_async(_run_batch, (batch,)))
+            if len(pending) >= jobs * BATCHES_PER_WORKER:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def sanitize_jsonl(lines, fields, policy=None, jobs=None):
+    """
+    Sanitize the string values of `fields` in JSON Lines records read from
+    `lines` (e.g. a file object). Yields the output lines in order.
+    Raises ValueError on a line that is not valid JSON.
+    """
+    policy = policy if policy is not None else Policy()
+    yield from pipeline(
+        sanitize_jsonl_record, enumerate(lines, 1), policy, tuple(fields), jobs
+    )
+
+
+def sanitize_csv(rows, columns, policy=None, jobs=None):
+    """
+    Sanitize the cells of `columns` in CSV rows read from `rows` (e.g. a
+    csv.reader); the first row is the header and is passed through. Yields the
+    output rows in order. Raises ValueError if a column is not in the header.
+    """
+    policy = policy if policy is not None else Policy()
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Column(s) not in the CSV header: {', '.join(missing)}")
+    yield header
+    indices = tuple(header.index(column) for column in columns)
+    yield from pipeline(sanitize_csv_row, rows, policy, indices, jobs)
@@ -0,0 +1,172 @@
+"""
+Bidirectional control detection ("Trojan Source", CVE-2021-42574).
+
+Explicit bidi controls make source code display in a different order than the
+compiler reads it. `sanitize_text` removes them, but for code review we need
+to know where they are and whether they are balanced: an embedding or override
+(LRE, RLE, LRO, RLO) must be closed by PDF, an isolate (LRI, RLI, FSI) by PDI,
+and the bidi algorithm closes whatever is still open at the end of a line,
+which is what lets an override spill over the rest of a line of code.
+
+`scan_paths` scans whole directory trees in parallel. Files are read as bytes
+and only decoded if a UTF-8 encoded bidi control occurs in them; ASCII parts
+of a file are skipped with `bytes.isascii`, so typical source trees are
+scanned at close to the speed they are read.
+"""
+
+import os
+import re
+from multiprocessing import Pool
+
+from sanitext.text_sanitization import unicode_name
+
+EMBEDDINGS = {"\u202a", "\u202b", "\u202d", "\u202e"}  # LRE, RLE, LRO, RLO
+ISOLATES = {"\u2066", "\u2067", "\u2068"}  # LRI, RLI, FSI
+POP_DIRECTIONAL_FORMATTING = "\u202c"
+POP_DIRECTIONAL_ISOLATE = "\u2069"
+MARKS = {"\u200e", "\u200f", "\u061c"}  # LRM, RLM, ALM
+
+# Status of a control in the results
+TERMINATED = "terminated"
+UNTERMINATED = "unterminated"
+UNMATCHED = "unmatched"
+MARK = "mark"
+UNBALANCED = {UNTERMINATED, UNMATCHED}
+
+BIDI_CONTROL_PATTERN = re.compile("[\u061c\u200e\u200f\u202a-\u202e\u2066-\u2069]")
+# The same characters, UTF-8 encoded
+BIDI_CONTROL_BYTES_PATTERN = re.compile(
+    b"\xe2\x80[\x8e\x8f\xaa-\xae]|\xe2\x81[\xa6-\xa9]|\xd8\x9c"
+)
+
+SKIPPED_DIRECTORIES = {".git", ".hg", ".svn", "__pycache__", "node_modules"}
+
+
+def scan_bidi(text):
+    """
+    Find bidi controls in `text` and check their nesting line by line.
+    Returns a list of (offset, line, column, char, status) in order of
+    appearance, with 1-based line and column and status one of TERMINATED,
+    UNTERMINATED (still open at the end of its line), UNMATCHED (a PDF or PDI
+    with nothing to close) or MARK (LRM, RLM, ALM, which don't nest).
+    """
+    found = []
+    line = 1
+    line_start = 0
+    position = 0
+    stack = []  # Indices into `found` of the open embeddings and isolates
+
+    def end_line():
+        for index in stack:
+            found[index][4] = UNTERMINATED
+        stack.clear()
+
+    for match in BIDI_CONTROL_PATTERN.finditer(text):
+        offset = match.start()
+        newlines = text.count("\n", position, offset)
+        if newlines:
+            end_line()
+            line += newlines
+            line_start = text.rindex("\n", position, offset) + 1
+        position = offset
+        char = match.group()
+        entry = [offset, line, offset - line_start + 1, char, TERMINATED]
+        found.append(entry)
+        if char in EMBEDDINGS or char in ISOLATES:
+            stack.append(len(found) - 1)
+        elif char == POP_DIRECTIONAL_FORMATTING:
+            # Closes the innermost embedding, but never across an open isolate
+            if stack and found[stack[-1]][3] in EMBEDDINGS:
+                stack.pop()
+            else:
+                entry[4] = UNMATCHED
+        elif char == POP_DIRECTIONAL_ISOLATE:
+            # Closes the innermost isolate and every embedding opened inside it
+            isolates = [
+                i for i, index in enumerate(stack) if found[index][3] in ISOLATES
+            ]
+            if isolates:
+                del stack[isolates[-1] :]
+            else:
+                entry[4] = UNMATCHED
+        else:
+            entry[4] = MARK
+    end_line()
+    return [tuple(entry) for entry in found]
+
+
+def is_balanced(findings):
+    """Returns True if no control in the output of `scan_bidi` is unbalanced."""
+    return all(status not in UNBALANCED for *_, status in findings)
+
+
+def contains_bidi_bytes(data, chunk_size=4096):
+    """
+    Returns True if the UTF-8 encoded `data` may contain a bidi control.
+    All-ASCII chunks are skipped with a fast C check; only the others are
+    searched, overlapping by two bytes so no encoded control is split.
+    """
+    search = BIDI_CONTROL_BYTES_PATTERN.search
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start : start + chunk_size + 2]
+        if not chunk.isascii() and search(chunk):
+            return True
+    return False
+
+
+def scan_file(path):
+    """
+    Run `scan_bidi` on a file. Binary files (with a NUL byte in the first 8 KiB)
+    and files without bidi controls return an empty list without being decoded.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if b"\0" in data[:8192] or not contains_bidi_bytes(data):
+        return []
+    return scan_bidi(data.decode("utf-8", errors="replace"))
+
+
+def iter_files(paths):
+    """Yields the files in `paths`, walking directories (skipping VCS metadata)."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, directories, files in os.walk(path):
+            directories[:] = sorted(
+                d for d in directories if d not in SKIPPED_DIRECTORIES
+            )
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+
+def _scan_file_job(path):
+    try:
+        return path, scan_file(path), None
+    except OSError as error:
+        return path, [], error
+
+
+def scan_paths(paths, jobs=None):
+    """
+    Scan files and directory trees for bidi controls.
+
+    `jobs` is the number of worker processes (default: one per CPU, 1 scans in
+    this process). Yields (path, findings, error) for every file that contains
+    bidi controls or could not be read, in the order the files are walked.
+    """
+    files = iter_files(paths)
+    if jobs == 1:
+        results = map(_scan_file_job, files)
+        yield from (result for result in results if result[1] or result[2])
+        return
+    with Pool(jobs) as pool:
+        for result in pool.imap(_scan_file_job, files, chunksize=64):
+            if result[1] or result[2]:
+                yield result
+
+
+def format_finding(path, finding):
+    """Renders one finding as "path:line:column: U+XXXX NAME (status)"."""
+    _, line, column, char, status = finding
+    return f"{path}:{line}:{column}: U+{ord(char):04X} {unicode_name(char)} ({status})"
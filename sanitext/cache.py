@@ -0,0 +1,160 @@
+"""
+Whole-text result cache.
+
+Real traffic repeats itself: disclaimers, templated answers, retries. A
+`ResultCache` remembers the sanitized form of whole texts, keyed by the text
+and the policy that sanitized it, so a repeated text is answered with one dict
+lookup instead of being sanitized again. Python caches the hash of a string
+object, so a text that is passed again as the same object costs O(1); an equal
+copy costs one hash and one comparison.
+
+The cache is bounded by the memory its entries use (the texts and their
+results, and once per policy its key), not by their number, and evicts the
+least recently used entries. Equal policy keys are stored as one object, so the
+entries of a policy share its key however often `policy_key` rebuilt it.
+"""
+
+import sys
+from collections import OrderedDict
+
+from sanitext.char_ranges import CharacterRanges
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Number of policies whose keys a cache remembers (see ResultCache.policy_key)
+POLICY_KEYS = 8
+
+# Approximate size of an entry besides its strings (key and value tuples, the
+# size, the OrderedDict node and its share of the table, which doesn't shrink
+# as entries are evicted)
+ENTRY_OVERHEAD = 300
+
+
+def key_size(policy):
+    """Returns the approximate memory used by a policy key from `policy_key`."""
+    if not isinstance(policy, tuple):
+        return sys.getsizeof(policy)
+    size = sys.getsizeof(policy)
+    for part in policy:
+        # Other parts (CharacterRanges, sequence matchers) belong to the caller
+        if isinstance(part, frozenset):
+            size += sys.getsizeof(part)
+            # The (char, replacement) items of the decisions are built for the key
+            size += sum(sys.getsizeof(item) for item in part if isinstance(item, tuple))
+    return size
+
+
+def policy_key(allowed_characters, decisions=None, allowed_sequences=None):
+    """Returns a hashable key that identifies a sanitization policy."""
+    if not isinstance(allowed_characters, CharacterRanges):
+        allowed_characters = frozenset(allowed_characters)
+    return (
+        allowed_characters,
+        frozenset(decisions.items()) if decisions else None,
+        allowed_sequences,
+    )
+
+
+class ResultCache:
+    """
+    LRU cache of sanitization results, bounded to about `max_bytes` of memory.
+    Keys are (policy key, text) pairs; texts bigger than the bound on their own
+    are not cached.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (result, size)
+        self.policies = {}  # policy key -> [shared key, size, entries]
+        self.policy_keys = {}  # ids -> (objects, sizes, policy key)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def policy_key(self, allowed_characters, decisions=None, allowed_sequences=None):
+        """
+        `policy_key`, remembered for the last few (allowed characters, decisions,
+        allowed sequences) objects, so that looking up a text doesn't hash the
+        whole policy again. The key is rebuilt if the allowed characters or the
+        decisions changed size; other changes in place are not noticed.
+        """
+        ids = id(allowed_characters), id(decisions), id(allowed_sequences)
+        sizes = len(allowed_characters), len(decisions) if decisions else 0
+        remembered = self.policy_keys.get(ids)
+        if remembered is not None and remembered[1] == sizes:
+            return remembered[2]
+        key = policy_key(allowed_characters, decisions, allowed_sequences)
+        if remembered is None and len(self.policy_keys) >= POLICY_KEYS:
+            del self.policy_keys[next(iter(self.policy_keys))]
+        # The objects are kept so that their ids are not reused
+        objects = allowed_characters, decisions, allowed_sequences
+        self.policy_keys[ids] = objects, sizes, key
+        return key
+
+    def get(self, key):
+        """Returns the cached result for `key` (now most recently used), or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, result):
+        """Cache `result` for `key`, evicting least recently used entries."""
+        policy, text = key
+        size = ENTRY_OVERHEAD + sys.getsizeof(text)
+        if result is not text:
+            size += sys.getsizeof(result)
+        shared = self.policies.get(policy)
+        if size + (key_size(policy) if shared is None else 0) > self.max_bytes:
+            return
+        self._remove(key)
+        if shared is None:
+            shared = self.policies[policy] = [policy, key_size(policy), 0]
+            self.bytes += shared[1]
+        shared[2] += 1
+        self.entries[shared[0], text] = result, size
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        """Remove the entry for `key`, and its policy key once no entry uses it."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= entry[1]
+        shared = self.policies[key[0]]
+        shared[2] -= 1
+        if not shared[2]:
+            del self.policies[key[0]]
+            self.bytes -= shared[1]
+
+    def clear(self):
+        """Remove all entries (the statistics are kept)."""
+        self.entries.clear()
+        self.policies.clear()
+        self.policy_keys.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """
+        Returns a dict with the number of hits, misses and evictions, the hit
+        rate, the number of entries, and the bytes used out of `max_bytes`.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,251 @@
+"""
+Allowed characters given as Unicode ranges, general categories and scripts.
+
+Allowing all of Greek with --allow-chars means pasting every Greek character,
+and allowing "all letters" that way is impossible. `parse_spec` reads one
+specification:
+
+  - a code point or a range of them: "U+00E9", "U+0370..U+03FF"
+  - a general category, or a major class of them: "Nd", "L"
+  - a script (UAX #24, see sanitext.script_data): "Greek", "Cyrillic"
+  - a named class of invisible or control characters (NAMED_CLASSES):
+    "zero-width", "bidi", "tags", "variation-selectors", "private-use"
+
+`CharacterRanges` keeps the union of specifications and literal characters as
+a sorted table of disjoint intervals, so a membership test is one bisect over
+the interval bounds however many characters are allowed, and checking a whole
+text is one search with a regex character class made of the intervals. It can
+be used wherever a set of allowed characters is expected.
+
+For a deny list ("everything except zero-width and bidi characters"),
+`complement` turns the few denied intervals into the few allowed ones, so the
+table stays small however much of Unicode is allowed.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import groupby
+
+from sanitext.script_data import SCRIPT_RANGES
+
+CODE_POINTS = 0x110000
+ASTRAL = 0x10000  # First code point beyond the Basic Multilingual Plane
+# Code point intervals (end excluded) of the named classes
+NAMED_CLASSES = {
+    "zero-width": (
+        (0x180E, 0x180F),
+        (0x200B, 0x200E),
+        (0x2060, 0x2065),
+        (0xFEFF, 0xFF00),
+    ),
+    "bidi": ((0x061C, 0x061D), (0x200E, 0x2010), (0x202A, 0x202F), (0x2066, 0x206A)),
+    "tags": ((0xE0000, 0xE0080),),
+    "variation-selectors": ((0xFE00, 0xFE10), (0xE0100, 0xE01F0)),
+    "private-use": ((0xE000, 0xF900), (0xF0000, 0xFFFFE), (0x100000, 0x10FFFE)),
+}
+
+RANGE_PATTERN = re.compile(r"U\+([0-9A-F]{1,6})(?:\.\.U\+([0-9A-F]{1,6}))?", re.I)
+
+
+def merge_intervals(intervals):
+    """Sort and merge (start, end) intervals (end excluded) into disjoint ones."""
+    merged = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def _char_intervals(chars):
+    codes = sorted({ord(char) for char in chars})
+    # Consecutive code points have the same code - index
+    return [
+        (run[0][1], run[-1][1] + 1)
+        for run in (
+            list(group)
+            for _, group in groupby(enumerate(codes), lambda item: item[1] - item[0])
+        )
+    ]
+
+
+@lru_cache(maxsize=1)
+def _category_intervals():
+    """Returns a dict of general category -> intervals, from `unicodedata`."""
+    categories = {}
+    start = 0
+    for category, group in groupby(
+        map(unicodedata.category, map(chr, range(CODE_POINTS)))
+    ):
+        end = start + sum(1 for _ in group)
+        categories.setdefault(category, []).append((start, end))
+        start = end
+    return categories
+
+
+@lru_cache(maxsize=1)
+def _script_intervals():
+    """Returns a dict of lowercase script name -> (name, intervals)."""
+    scripts = {}
+    bounds = [start for start, _ in SCRIPT_RANGES[1:]] + [CODE_POINTS]
+    for (start, name), end in zip(SCRIPT_RANGES, bounds):
+        scripts.setdefault(name.lower(), (name, []))[1].append((start, end))
+    return scripts
+
+
+def parse_spec(spec):
+    """
+    Returns the intervals of code points selected by one specification (a
+    range, a general category, a script or a named class, see above).
+    Raises ValueError if it is none of these.
+    """
+    spec = spec.strip()
+    match = RANGE_PATTERN.fullmatch(spec)
+    if match:
+        start = int(match.group(1), 16)
+        end = int(match.group(2) or match.group(1), 16)
+        if start > end or end >= CODE_POINTS:
+            raise ValueError(f"Invalid code point range: {spec!r}")
+        return [(start, end + 1)]
+    named = NAMED_CLASSES.get(spec.lower())
+    if named is not None:
+        return list(named)
+    categories = _category_intervals()
+    if spec in categories:
+        return list(categories[spec])
+    if len(spec) == 1 and any(category[0] == spec for category in categories):
+        return merge_intervals(
+            interval
+            for category, intervals in categories.items()
+            if category[0] == spec
+            for interval in intervals
+        )
+    script = _script_intervals().get(spec.lower().replace(" ", "_"))
+    if script is not None:
+        return list(script[1])
+    raise ValueError(
+        f"Unknown character specification {spec!r} (expected a range like "
+        "U+0370..U+03FF, a general category like L or Nd, a script like Greek "
+        f"or one of {', '.join(NAMED_CLASSES)})."
+    )
+
+
+def character_class(intervals):
+    """Returns the body of a regex character class matching `intervals`."""
+    return "".join(
+        re.escape(chr(start))
+        + ("" if end - start == 1 else "-" + re.escape(chr(end - 1)))
+        for start, end in intervals
+    )
+
+
+class CharacterRanges:
+    """
+    An immutable set of characters stored as disjoint intervals of code points.
+    `specs` are specifications for `parse_spec` and `chars` literal characters.
+    Supports `in`, `issuperset`, iteration, `len`, `|` and equality.
+    """
+
+    def __init__(self, specs=(), chars=(), intervals=()):
+        intervals = list(intervals) + _char_intervals(chars)
+        for spec in specs:
+            intervals += parse_spec(spec)
+        self.intervals = tuple(merge_intervals(intervals))
+        # Flat, sorted bounds: a code point is inside when an odd number of
+        # bounds are at or below it
+        self.bounds = tuple(bound for interval in self.intervals for bound in interval)
+        # Regexes matching a character outside, once needed
+        self.outside = None
+        self.blocked = None
+
+    def __contains__(self, char):
+        if not isinstance(char, str) or len(char) != 1:
+            return False
+        return bisect_right(self.bounds, ord(char)) & 1 == 1
+
+    def issuperset(self, chars):
+        """Returns True if every character of `chars` (e.g. a text) is in the set."""
+        if not isinstance(chars, str):
+            return all(char in self for char in chars)
+        if self.outside is None:
+            self.outside = self._outside_patterns()
+        outside_bmp, outside_astral = self.outside
+        if outside_bmp.search(chars) is not None:
+            return False
+        return chars.isascii() or outside_astral.search(chars) is None
+
+    def _outside_patterns(self):
+        """
+        Returns regexes matching a character outside the set among the Basic
+        Multilingual Plane and among the other planes. `re` compiles a class of
+        BMP characters into a bitmap, but checks classes with characters beyond
+        it range by range, so those are kept apart.
+        """
+        bmp = [
+            (start, min(end, ASTRAL)) for start, end in self.intervals if start < ASTRAL
+        ]
+        astral = [
+            (max(start, ASTRAL), end) for start, end in self.intervals if end > ASTRAL
+        ]
+        # Characters of the other part are always in the class
+        return (
+            re.compile(f"[^{character_class(bmp + [(ASTRAL, CODE_POINTS)])}]"),
+            re.compile(f"[^{character_class([(0, ASTRAL)] + astral)}]"),
+        )
+
+    def complement(self):
+        """Returns the CharacterRanges of every code point not in this one."""
+        bounds = (0,) + self.bounds + (CODE_POINTS,)
+        return CharacterRanges(intervals=zip(bounds[::2], bounds[1::2]))
+
+    def outside_pattern(self):
+        """
+        Returns a regex matching one character outside the set, as a class of
+        the intervals of the complement: for a deny list, a short one.
+        """
+        if self.blocked is None:
+            body = character_class(self.complement().intervals)
+            self.blocked = re.compile(f"[{body}]" if body else "(?!)")
+        return self.blocked
+
+    def __iter__(self):
+        for start, end in self.intervals:
+            for code in range(start, end):
+                yield chr(code)
+
+    def __len__(self):
+        return sum(end - start for start, end in self.intervals)
+
+    def __or__(self, other):
+        if isinstance(other, CharacterRanges):
+            return CharacterRanges(intervals=self.intervals + other.intervals)
+        return CharacterRanges(chars=other, intervals=self.intervals)
+
+    __ror__ = __or__
+
+    def __eq__(self, other):
+        if isinstance(other, CharacterRanges):
+            return self.intervals == other.intervals
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.intervals)
+
+    def __repr__(self):
+        ranges = ", ".join(
+            f"U+{start:04X}..U+{end - 1:04X}" for start, end in self.intervals[:4]
+        )
+        more = ", ..." if len(self.intervals) > 4 else ""
+        return f"CharacterRanges({ranges}{more})"
+
+
+def to_intervals(allowed_characters):
+    """Returns the intervals of a CharacterRanges or of any set of characters."""
+    if isinstance(allowed_characters, CharacterRanges):
+        return allowed_characters.intervals
+    return _char_intervals(allowed_characters)
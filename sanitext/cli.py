@@ -9,37 +9,178 @@ Features:
       - Optionally allow Unicode characters (--allow-unicode).
       - Specify additional allowed characters (--allow-chars).
       - Load a file containing allowed characters (--allow-file).
+      - Allow ranges, general categories or scripts (--allow U+0370..U+03FF, --allow L).
+      - Or allow everything except chosen classes (--deny zero-width --deny bidi).
   - Interactive mode (--interactive):
       - Manually decide what to do with disallowed characters (keep, remove, replace).
+      - Remember decisions across runs (--remember, --decisions-file).
+  - Site-specific replacement maps from TOML or JSON files (--replacements).
+  - Review mode (--review):
+      - List all disallowed characters by frequency and decide in bulk.
+  - Grapheme mode (--graphemes):
+      - Decide per user-perceived character, never leaving orphaned combining marks.
+  - Markdown mode (--markdown):
+      - Sanitize prose only, keep fenced code blocks and inline code as written.
+  - JSON mode (--json):
+      - Sanitize string values only (and keys with --json-keys), keeping the JSON valid.
+  - Batch mode (--jsonl --field, --csv --column):
+      - Sanitize selected fields of a dataset file with a pool of worker processes.
 
 Usage examples:
-  - sanitext --detect          # Detect characters only
+  - sanitext --detect          # Detect characters only (one summary line per distinct character,
+                               # plus hidden text and words mixing scripts)
   - sanitext --string "text"   # Process the provided string and print it
   - sanitext                   # Process the clipboard string, copy to clipboard, print if unchanged
   - sanitext --verbose         # Process + show detected info
   - sanitext --very-verbose    # Process + show input, detected info, and output
   - sanitext --allow-chars "αñøç"  # Allow additional characters (only single unicode code point)
   - sanitext --allow-file allowed_chars.txt  # Allow characters from a file
-  - sanitext --allow-emoji     # Allow single code point emoji
+  - sanitext --allow-emoji     # Allow emoji, including multi-code-point sequences
+  - sanitext --allow Greek --allow Nd  # Allow a script, a general category or a range
+  - sanitext --deny zero-width --deny bidi  # Allow everything except these
   - sanitext --interactive     # Prompt user for handling disallowed characters
+  - sanitext -i --remember     # Reuse saved decisions, prompt only for new characters
+  - sanitext --review          # Review all disallowed characters at once, ranked by frequency
+  - sanitext --replacements site.toml  # Replace e.g. '€' with "EUR" before the defaults
+  - sanitext --graphemes       # Keep, replace or remove whole grapheme clusters
+  - sanitext --markdown        # Leave code blocks and `inline code` untouched
+  - sanitext --json            # Sanitize the string values of a JSON document
+  - sanitext --jsonl --field text --input data.jsonl --output clean.jsonl
+  - sanitext --csv --column body --input data.csv   # Write the sanitized CSV to stdout
+  - sanitext scan --file dump.txt --jobs 8   # Detect in a huge file, in parallel
+  - sanitext estimate --file corpus.txt          # Estimate suspicious rates from a sample
+  - sanitext profile corpus/ --output histogram.csv  # Count disallowed characters in a corpus
+  - sanitext bidi src/         # Report bidi controls (Trojan Source) in files or directories
 """
 
+import csv as csv_module
+import io
+import sys
+
 import pyperclip
 import typer
 from pathlib import Path
+from typing import Annotated
 
 from sanitext.text_sanitization import (
     detect_suspicious_characters,
+    summarize_suspicious,
     sanitize_text,
     get_allowed_characters,
+    get_allowed_sequences,
 )
+from sanitext.decisions import default_decisions_path, load_decisions, save_decisions
+from sanitext.replacements import load_replacements, with_replacements
+from sanitext.review import review_characters
+from sanitext.graphemes import sanitize_graphemes
+from sanitext.markdown import sanitize_markdown
+from sanitext.json_sanitization import sanitize_json
+from sanitext.policy import Policy
+from sanitext.batch import sanitize_csv, sanitize_jsonl
+from sanitext.hidden_text import find_hidden_text
+from sanitext.scripts import detect_mixed_script
+from sanitext.bidi import UNBALANCED, format_finding, scan_paths
+from sanitext.scan import scan_large_file
+from sanitext.estimate import estimate_suspicious
+from sanitext.corpus import histogram, profile_paths, write_histogram
 
+app = typer.Typer(name="cli")
 
-app = typer.Typer()
 
+def format_summary(summary):
+    """Render the output of `summarize_suspicious` as one line per distinct character."""
+    lines = [
+        f"  '{char}' (U+{ord(char):04X}, {name}): {count} occurrence(s), first at offset {first_offset}"
+        for char, count, first_offset, name in summary
+    ]
+    return "\n".join(lines)
 
-@app.command()
+
+# Options choosing the allowed characters, shared by the commands
+AllowChars = Annotated[
+    str,
+    typer.Option(
+        "--allow-chars",
+        help='Additional characters to allow, e.g. --allow-chars "αñøç"',
+    ),
+]
+AllowEmoji = Annotated[
+    bool,
+    typer.Option(
+        "--allow-emoji",
+        help="Allow emoji, including multi-code-point sequences (ZWJ sequences, skin tones, flags, keycaps).",
+    ),
+]
+AllowFile = Annotated[
+    Path,
+    typer.Option(
+        "--allow-file",
+        help="Path to a file containing characters to allow (one big string or multiple lines).",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+    ),
+]
+Allow = Annotated[
+    list[str],
+    typer.Option(
+        "--allow",
+        help="Allow a code point range (U+0370..U+03FF), general category (L, Nd) or script (Greek); repeatable.",
+    ),
+]
+Deny = Annotated[
+    list[str],
+    typer.Option(
+        "--deny",
+        help="Deny-list mode: allow every character except these ranges, categories, scripts or classes (zero-width, bidi, tags, variation-selectors, private-use); repeatable.",
+    ),
+]
+
+
+def allowed_characters_or_exit(allow_chars, allow_file, allow_emoji, allow, deny):
+    """
+    The allowed characters chosen by the shared options above, exiting with an
+    error on an invalid --allow or --deny.
+    """
+    try:
+        return get_allowed_characters(
+            allow_chars=allow_chars,
+            allow_file=allow_file,
+            allow_emoji=allow_emoji,
+            allow_specs=allow,
+            deny_specs=deny,
+        )
+    except ValueError as error:
+        typer.echo(f"Error: {error}", err=True)
+        raise typer.Exit(1)
+
+
+def decisions_or_exit(path):
+    """`load_decisions`, exiting with an error on an invalid decision file."""
+    try:
+        return load_decisions(path)
+    except ValueError as error:
+        typer.echo(f"Error: {error}", err=True)
+        raise typer.Exit(1)
+
+
+def echo_detection(summary, hidden_text, mixed_script_words):
+    """Print the results of detection (`--detect`, `sanitext scan`)."""
+    typer.echo(f"Detected: {len(summary)} distinct suspicious character(s)")
+    if summary:
+        typer.echo(format_summary(summary))
+    for start, end, kind, payload in hidden_text:
+        typer.echo(f"Hidden text ({kind}s) at offsets {start}-{end}: {payload!r}")
+    for start, end, word, scripts in mixed_script_words:
+        typer.echo(
+            f"Mixed-script word at offsets {start}-{end}: {word!r} ({', '.join(scripts)})"
+        )
+
+
+@app.callback(invoke_without_command=True)
 def main(
+    ctx: typer.Context,
     detect: bool = typer.Option(
         False, "--detect", "-d", help="Detect characters only."
     ),
@@ -55,32 +196,146 @@ def main(
         "-vv",
         help="Very verbose mode (process + show input, detected info, and output).",
     ),
-    allow_chars: str = typer.Option(
-        None,
-        "--allow-chars",
-        help='Additional characters to allow, e.g. --allow-chars "αñøç"',
+    allow_chars: AllowChars = None,
+    allow_emoji: AllowEmoji = False,
+    allow_file: AllowFile = None,
+    allow: Allow = None,
+    deny: Deny = None,
+    interactive: bool = typer.Option(
+        False,
+        "--interactive",
+        "-i",
+        help="Interactive prompt for disallowed characters.",
     ),
-    allow_emoji: bool = typer.Option(
+    review: bool = typer.Option(
         False,
-        "--allow-emoji",
-        help='Allow single code point emoji"',  # TODO: extend to multiple codepoints
+        "--review",
+        help="Review all disallowed characters at once, ranked by frequency, and decide in bulk.",
     ),
-    allow_file: Path = typer.Option(
+    remember: bool = typer.Option(
+        False,
+        "--remember",
+        help="Apply saved decisions and save new interactive ones to the per-user decision file.",
+    ),
+    decisions_file: Path = typer.Option(
         None,
-        "--allow-file",
-        help="Path to a file containing characters to allow (one big string or multiple lines).",
+        "--decisions-file",
+        help="Decision file to use instead of the per-user one (implies --remember).",
+        dir_okay=False,
+    ),
+    replacement_files: list[Path] = typer.Option(
+        None,
+        "--replacements",
+        help="TOML or JSON file of site-specific replacements, e.g. '€' = \"EUR\" (repeatable, later files win; saved decisions take precedence).",
         exists=True,
-        file_okay=True,
         dir_okay=False,
         readable=True,
     ),
-    interactive: bool = typer.Option(
+    graphemes: bool = typer.Option(
         False,
-        "--interactive",
-        "-i",
-        help="Interactive prompt for disallowed characters.",
+        "--graphemes",
+        help="Decide per grapheme cluster (e.g. a letter with its combining marks) instead of per code point.",
+    ),
+    markdown: bool = typer.Option(
+        False,
+        "--markdown",
+        help="Treat the text as Markdown: keep fenced code blocks and inline code as they are.",
+    ),
+    json: bool = typer.Option(
+        False,
+        "--json",
+        help="Treat the text as JSON: sanitize string values only, re-escaping them.",
+    ),
+    json_keys: bool = typer.Option(
+        False,
+        "--json-keys",
+        help="With --json, sanitize object keys too.",
+    ),
+    jsonl: bool = typer.Option(
+        False,
+        "--jsonl",
+        help="Batch mode: sanitize the --field values of each JSON Lines record.",
+    ),
+    fields: list[str] = typer.Option(
+        None, "--field", help="Field to sanitize with --jsonl (repeatable)."
+    ),
+    csv: bool = typer.Option(
+        False,
+        "--csv",
+        help="Batch mode: sanitize the --column cells of each CSV row (with a header).",
+    ),
+    columns: list[str] = typer.Option(
+        None, "--column", help="Column to sanitize with --csv (repeatable)."
+    ),
+    input_file: Path = typer.Option(
+        None,
+        "--input",
+        help="Batch mode input file (default: standard input).",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    output_file: Path = typer.Option(
+        None,
+        "--output",
+        help="Batch mode output file (default: standard output).",
+        dir_okay=False,
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Batch mode worker processes (default: one per CPU).",
     ),
 ):
+    # Subcommands (e.g. `sanitext bidi`) do their own processing
+    if ctx.invoked_subcommand is not None:
+        return
+
+    try:
+        replacements = load_replacements(replacement_files or ())
+    except ValueError as error:
+        typer.echo(f"Error: {error}", err=True)
+        raise typer.Exit(1)
+
+    if jsonl or csv:
+        mode = "--jsonl" if jsonl else "--csv"
+        conflicting = {
+            "--csv": jsonl and csv,
+            "--string": string is not None,
+            "--detect": detect,
+            "--interactive": interactive,
+            "--review": review,
+            "--graphemes": graphemes,
+            "--markdown": markdown,
+            "--json": json,
+        }
+        conflicting = [flag for flag, used in conflicting.items() if used]
+        if conflicting:
+            typer.echo(
+                f"Error: {mode} can't be combined with {', '.join(conflicting)}.",
+                err=True,
+            )
+            raise typer.Exit(1)
+        if not (fields if jsonl else columns):
+            option = "--field" if jsonl else "--column"
+            typer.echo(f"Error: {mode} needs at least one {option}.", err=True)
+            raise typer.Exit(1)
+        decisions = None
+        if remember or decisions_file is not None:
+            decisions = decisions_or_exit(decisions_file or default_decisions_path())
+        policy = Policy(
+            allowed_characters_or_exit(
+                allow_chars, allow_file, allow_emoji, allow, deny
+            ),
+            decisions=with_replacements(decisions, replacements),
+            allowed_sequences=get_allowed_sequences(allow_emoji=allow_emoji),
+        )
+        run_batch(
+            policy, fields if jsonl else None, columns, input_file, output_file, jobs
+        )
+        return
+
     # Get text from either CLI or clipboard
     text = string if string is not None else pyperclip.paste()
     if not text:
@@ -89,38 +344,107 @@ def main(
             err=True,
         )
         raise typer.Exit(1)
+    if graphemes and interactive:
+        typer.echo(
+            "Error: --graphemes can't be combined with --interactive (use --review).",
+            err=True,
+        )
+        raise typer.Exit(1)
+    if graphemes + markdown + json > 1:
+        typer.echo(
+            "Error: only one of --graphemes, --markdown and --json can be used.",
+            err=True,
+        )
+        raise typer.Exit(1)
 
-    allowed_characters = get_allowed_characters(
-        allow_chars=allow_chars,
-        allow_file=allow_file,
-        allow_emoji=allow_emoji,
+    allowed_characters = allowed_characters_or_exit(
+        allow_chars, allow_file, allow_emoji, allow, deny
     )
+    allowed_sequences = get_allowed_sequences(allow_emoji=allow_emoji)
 
     # If detection-only, just do detection and exit
     if detect:
-        detected_info = detect_suspicious_characters(
-            text, allowed_characters=allowed_characters
+        summary = summarize_suspicious(
+            text,
+            allowed_characters=allowed_characters,
+            allowed_sequences=allowed_sequences,
         )
-        typer.echo(f"Detected: {detected_info}")
+        echo_detection(summary, find_hidden_text(text), detect_mixed_script(text))
         raise typer.Exit(0)
 
+    # Load decisions taken in previous runs
+    decisions = None
+    remember = remember or decisions_file is not None
+    if remember:
+        decisions_path = decisions_file or default_decisions_path()
+        decisions = decisions_or_exit(decisions_path)
+        known_decisions = len(decisions)
+    saved_decisions = decisions
+    decisions = with_replacements(decisions, replacements)
+
+    if review:
+        decisions, _ = review_characters(
+            text,
+            allowed_characters=allowed_characters,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+
     # Otherwise, sanitize
-    processed_text = sanitize_text(
-        text,
-        allowed_characters=allowed_characters,
-        interactive=interactive,
-    )
+    if graphemes:
+        processed_text = sanitize_graphemes(
+            text,
+            allowed_characters=allowed_characters,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+    elif markdown:
+        processed_text = sanitize_markdown(
+            text,
+            allowed_characters=allowed_characters,
+            interactive=interactive,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+    elif json:
+        try:
+            processed_text = sanitize_json(
+                text,
+                allowed_characters=allowed_characters,
+                sanitize_keys=json_keys,
+                interactive=interactive,
+                decisions=decisions,
+                allowed_sequences=allowed_sequences,
+            )
+        except ValueError as error:
+            typer.echo(f"Error: invalid JSON ({error}).", err=True)
+            raise typer.Exit(1)
+    else:
+        processed_text = sanitize_text(
+            text,
+            allowed_characters=allowed_characters,
+            interactive=interactive,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+
+    if remember and len(saved_decisions) != known_decisions:
+        save_decisions(saved_decisions, decisions_path)
 
     if very_verbose:
         detected_info = detect_suspicious_characters(
-            text, allowed_characters=allowed_characters
+            text,
+            allowed_characters=allowed_characters,
+            allowed_sequences=allowed_sequences,
         )
         typer.echo(f"Input: {text}")
         typer.echo(f"Detected: {detected_info}")
         typer.echo(f"Output: {processed_text}")
     elif verbose:
         detected_info = detect_suspicious_characters(
-            text, allowed_characters=allowed_characters
+            text,
+            allowed_characters=allowed_characters,
+            allowed_sequences=allowed_sequences,
         )
         typer.echo(f"Detected: {detected_info}")
 
@@ -135,5 +459,209 @@ def main(
         typer.echo(processed_text)
 
 
+def run_batch(policy, fields, columns, input_file, output_file, jobs):
+    """
+    Stream a JSON Lines file (if `fields` is given) or a CSV file through
+    `sanitize_jsonl` or `sanitize_csv`, from stdin and to stdout by default.
+    """
+    # newline="" keeps line endings as they are (and is what the csv module expects)
+    if input_file is not None:
+        source = open(input_file, encoding="utf-8", newline="")
+    else:
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    if output_file is not None:
+        target = open(output_file, "w", encoding="utf-8", newline="")
+    else:
+        target = sys.stdout
+    try:
+        if fields:
+            target.writelines(sanitize_jsonl(source, fields, policy=policy, jobs=jobs))
+        else:
+            writer = csv_module.writer(target, lineterminator="\n")
+            rows = csv_module.reader(source)
+            writer.writerows(sanitize_csv(rows, columns, policy=policy, jobs=jobs))
+    except ValueError as error:
+        typer.echo(f"Error: {error}", err=True)
+        raise typer.Exit(1)
+    finally:
+        source.close() if input_file is not None else source.detach()
+        if output_file is not None:
+            target.close()
+
+
+@app.command()
+def bidi(
+    paths: list[Path] = typer.Argument(
+        ..., help="Files or directories to scan.", exists=True
+    ),
+    jobs: int = typer.Option(
+        None, "--jobs", "-j", help="Number of worker processes (default: one per CPU)."
+    ),
+):
+    """
+    Report bidirectional control characters (Trojan Source) in files.
+    Exits with status 1 if any of them is unterminated or unmatched on its line.
+    """
+    unbalanced = False
+    for path, findings, error in scan_paths(paths, jobs=jobs):
+        if error is not None:
+            typer.echo(f"{path}: {error}", err=True)
+            continue
+        for finding in findings:
+            typer.echo(format_finding(path, finding))
+            unbalanced = unbalanced or finding[4] in UNBALANCED
+    if unbalanced:
+        raise typer.Exit(1)
+
+
+@app.command()
+def scan(
+    file: Path = typer.Option(
+        ...,
+        "--file",
+        help="UTF-8 file to scan, of any size (it is memory-mapped).",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    jobs: int = typer.Option(
+        None, "--jobs", "-j", help="Number of worker processes (default: one per CPU)."
+    ),
+    allow_chars: AllowChars = None,
+    allow_emoji: AllowEmoji = False,
+    allow_file: AllowFile = None,
+    allow: Allow = None,
+    deny: Deny = None,
+):
+    """
+    Detect suspicious characters, hidden text and mixed-script words in a large
+    file, scanning chunks of it in parallel. Offsets are in characters.
+    """
+    echo_detection(
+        *scan_large_file(
+            file,
+            allowed_characters=allowed_characters_or_exit(
+                allow_chars, allow_file, allow_emoji, allow, deny
+            ),
+            allowed_sequences=get_allowed_sequences(allow_emoji=allow_emoji),
+            jobs=jobs,
+        )
+    )
+
+
+@app.command()
+def estimate(
+    file: Path = typer.Option(
+        ...,
+        "--file",
+        help="UTF-8 file to sample, of any size.",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    sample_rate: float = typer.Option(
+        0.001, "--sample-rate", help="Fraction of the file to read.", min=0, max=1
+    ),
+    confidence: float = typer.Option(
+        0.95,
+        "--confidence",
+        help="Confidence level of the intervals.",
+        min=0,
+        max=0.9999,
+    ),
+    seed: int = typer.Option(
+        None, "--seed", help="Random seed, to make the sample reproducible."
+    ),
+    allow_chars: AllowChars = None,
+    allow_emoji: AllowEmoji = False,
+    allow_file: AllowFile = None,
+    allow: Allow = None,
+    deny: Deny = None,
+):
+    """
+    Estimate how many suspicious characters a large file contains by reading a
+    random sample of it, with confidence intervals.
+    """
+    result = estimate_suspicious(
+        file,
+        sample_rate=sample_rate,
+        allowed_characters=allowed_characters_or_exit(
+            allow_chars, allow_file, allow_emoji, allow, deny
+        ),
+        allowed_sequences=get_allowed_sequences(allow_emoji=allow_emoji),
+        confidence=confidence,
+        seed=seed,
+    )
+    level = f"{confidence:.0%} CI"
+    rate, low, high = result["rate"]
+    typer.echo(
+        f"Sampled {result['blocks']} block(s), {result['sampled_bytes']:,} bytes, "
+        f"{result['sampled_characters']:,} characters "
+        f"(about {result['estimated_characters']:,} in the file)"
+    )
+    typer.echo(
+        f"Suspicious: {rate * 1e6:,.1f} per million characters "
+        f"({level} {low * 1e6:,.1f}-{high * 1e6:,.1f}), "
+        f"about {round(rate * result['estimated_characters']):,} in the file"
+    )
+    for char, _, rate, low, high, name in result["characters"]:
+        typer.echo(
+            f"  '{char}' (U+{ord(char):04X}, {name}): {rate * 1e6:,.1f} per million "
+            f"({level} {low * 1e6:,.1f}-{high * 1e6:,.1f})"
+        )
+
+
+@app.command()
+def profile(
+    paths: list[Path] = typer.Argument(
+        ..., help="Files or directories to profile.", exists=True
+    ),
+    output: Path = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the full histogram to this file (CSV, or JSON for a .json file).",
+        dir_okay=False,
+    ),
+    top: int = typer.Option(
+        20, "--top", help="Number of characters to print (0 for none).", min=0
+    ),
+    jobs: int = typer.Option(
+        None, "--jobs", "-j", help="Number of worker processes (default: one per CPU)."
+    ),
+    allow_chars: AllowChars = None,
+    allow_emoji: AllowEmoji = False,
+    allow_file: AllowFile = None,
+    allow: Allow = None,
+    deny: Deny = None,
+):
+    """
+    Count every disallowed character across a corpus of files, in parallel, and
+    export a histogram with Unicode names and closest ASCII replacements.
+    """
+    allowed_characters = allowed_characters_or_exit(
+        allow_chars, allow_file, allow_emoji, allow, deny
+    )
+    counts, files, skipped = profile_paths(
+        paths,
+        allowed_characters=allowed_characters,
+        allowed_sequences=get_allowed_sequences(allow_emoji=allow_emoji),
+        jobs=jobs,
+    )
+    for path, reason in skipped:
+        typer.echo(f"{path}: skipped ({reason})", err=True)
+    rows = histogram(counts, allowed_characters)
+    typer.echo(
+        f"Profiled {files} file(s): {sum(counts.values()):,} disallowed "
+        f"character(s), {len(rows)} distinct"
+    )
+    for code_point, char, count, name, _, closest in rows[:top]:
+        typer.echo(f"  '{char}' ({code_point}, {name}): {count:,} -> {closest!r}")
+    if output is not None:
+        format = "json" if output.suffix.lower() == ".json" else "csv"
+        with open(output, "w", encoding="utf-8", newline="") as file:
+            write_histogram(rows, file, format)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,367 @@
+"""
+Compiled policies, shared between processes.
+
+A `Policy` keeps its allowed characters in a set and works out replacements
+from the homoglyph map and `unicodedata`, so every worker process that
+sanitizes builds those tables for itself, and N workers hold N copies.
+`compile_policy` resolves a policy once into a flat, read-only image:
+
+  - a header: magic, format version, Unicode version, sizes
+  - a bitmap with one bit per code point, set if the character is allowed
+  - the sorted code points of the disallowed characters that have a non-empty
+    replacement, the offsets of their replacements and a pool of the UTF-8
+    encoded replacements; every other disallowed character is removed
+  - the allowed multi-code-point sequences (`--allow-emoji` sequences), UTF-8
+    encoded and separated by NUL characters, from which a `SequenceTrie` is
+    built again when the image is used
+
+`share_policy` places the image in a `multiprocessing.shared_memory` block,
+and `attach_policy` maps that block in another process as a `CompiledPolicy`,
+which sanitizes like the `Policy` it was compiled from while reading the image
+in place. `save_policy` writes the image to a file, and `load_policy` maps the
+file, so starting a worker costs one mmap call instead of reading allow files
+and resolving replacements again; processes that load the same file share its
+pages. Images record the Unicode version they were compiled with, and are only
+accepted by a Python with the same Unicode tables. A process only keeps the
+characters it has actually met. This module imports nothing else from sanitext
+until a policy is compiled, so a worker that attaches to a shared policy never
+loads the homoglyph map or the emoji set.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import unicodedata
+from functools import lru_cache
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+MAGIC = b"STXP"
+FORMAT_VERSION = 2
+
+# Magic, format version, reserved, Unicode version, entries, pool size,
+# sequences size
+HEADER = struct.Struct("<4sHH16sIII")
+UINT32 = struct.Struct("<I")
+CODE_POINTS = 0x110000
+BITMAP_OFFSET = HEADER.size
+INDEX_OFFSET = BITMAP_OFFSET + CODE_POINTS // 8
+
+
+@lru_cache(maxsize=1)
+def _decomposable_characters():
+    return frozenset(
+        chr(code) for code in range(CODE_POINTS) if unicodedata.decomposition(chr(code))
+    )
+
+
+def compile_policy(policy):
+    """
+    Compile a `Policy` into an image (bytes) for `CompiledPolicy`.
+    Raises ValueError if an allowed sequence contains a NUL character.
+    """
+    sequences = ()
+    if policy.allowed_sequences is not None:
+        sequences = policy.allowed_sequences.sequences
+        if any("\0" in sequence for sequence in sequences):
+            raise ValueError("Allowed sequences with NUL can't be compiled.")
+    from sanitext.char_ranges import to_intervals
+    from sanitext.homoglyph_map import HOMOGLYPH_MAP
+    from sanitext.text_sanitization import TranslationTable
+
+    allowed_characters = policy.allowed_characters
+    bitmap = bytearray(CODE_POINTS // 8)
+    for start, end in to_intervals(allowed_characters):
+        # Whole bytes at once, bit by bit at the ends of the interval
+        first, last = (start + 7) >> 3, end >> 3
+        if first < last:
+            bitmap[first:last] = b"\xff" * (last - first)
+        else:
+            first = last = end
+        for code in range(start, min(first << 3, end)):
+            bitmap[code >> 3] |= 1 << (code & 7)
+        for code in range(max(last << 3, start), end):
+            bitmap[code >> 3] |= 1 << (code & 7)
+
+    # Other characters have no closest ASCII form, so they are removed
+    candidates = _decomposable_characters().union(HOMOGLYPH_MAP, policy.decisions)
+    table = TranslationTable(allowed_characters, policy.decisions)
+    codes = []
+    offsets = [0]
+    pool = bytearray()
+    for char in sorted(candidates):
+        replacement = table[ord(char)]
+        if char not in allowed_characters and replacement:
+            codes.append(ord(char))
+            pool += replacement.encode("utf-8", errors="surrogatepass")
+            offsets.append(len(pool))
+
+    joined = "\0".join(sequences).encode("utf-8", errors="surrogatepass")
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        unicodedata.unidata_version.encode("ascii"),
+        len(codes),
+        len(pool),
+        len(joined),
+    )
+    index = struct.pack(f"<{len(codes)}I{len(offsets)}I", *codes, *offsets)
+    return b"".join([header, bitmap, index, pool, joined])
+
+
+def read_header(buffer):
+    """
+    Check a compiled policy image and return (Unicode version, entries, pool
+    size, sequences size). Raises ValueError if it is not a valid image of this
+    format version, or if it was compiled with other Unicode tables than this
+    Python's (its replacements would differ from the ones a `Policy` works out
+    here).
+    """
+    if len(buffer) < INDEX_OFFSET:
+        raise ValueError("Not a compiled policy (too short).")
+    magic, version, _, unicode_version, entries, pool_size, sequences_size = (
+        HEADER.unpack_from(buffer)
+    )
+    if magic != MAGIC:
+        raise ValueError("Not a compiled policy (bad magic number).")
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported compiled policy version {version} "
+            f"(expected {FORMAT_VERSION})."
+        )
+    if len(buffer) < INDEX_OFFSET + 8 * entries + 4 + pool_size + sequences_size:
+        raise ValueError("Truncated compiled policy.")
+    unicode_version = unicode_version.rstrip(b"\0").decode("ascii")
+    if unicode_version != unicodedata.unidata_version:
+        raise ValueError(
+            f"Compiled policy uses Unicode {unicode_version}, but this Python has "
+            f"Unicode {unicodedata.unidata_version}; compile it again."
+        )
+    return unicode_version, entries, pool_size, sequences_size
+
+
+class AllowedBitmap:
+    """
+    Read-only, set-like view of the allowed characters of a compiled policy.
+    The allowed characters met so far are also kept in a set, so checking a
+    text made of them costs one `set.issuperset` call.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.seen = set()
+
+    def __contains__(self, char):
+        if not isinstance(char, str) or len(char) != 1:
+            return False
+        code = ord(char)
+        return bool(self.buffer[BITMAP_OFFSET + (code >> 3)] >> (code & 7) & 1)
+
+    def issuperset(self, text):
+        """Returns True if every character of `text` is allowed."""
+        if self.seen.issuperset(text):
+            return True
+        for char in set(text).difference(self.seen):
+            if char not in self:
+                return False
+            self.seen.add(char)
+        return True
+
+
+def find_replacement(buffer, entries, code):
+    """
+    Returns the replacement of the disallowed code point `code` in a compiled
+    policy image with `entries` replacements ("" if it has none).
+    """
+    low, high = 0, entries
+    while low < high:
+        middle = (low + high) // 2
+        if UINT32.unpack_from(buffer, INDEX_OFFSET + 4 * middle)[0] < code:
+            low = middle + 1
+        else:
+            high = middle
+    if low == entries or UINT32.unpack_from(buffer, INDEX_OFFSET + 4 * low)[0] != code:
+        return ""
+    offsets = INDEX_OFFSET + 4 * entries
+    pool = offsets + 4 * (entries + 1)
+    start, end = struct.unpack_from("<II", buffer, offsets + 4 * low)
+    return bytes(buffer[pool + start : pool + end]).decode(
+        "utf-8", errors="surrogatepass"
+    )
+
+
+class CompiledTable(dict):
+    """A `str.translate` table that looks up each new character in the image."""
+
+    def __init__(self, allowed_characters, buffer, entries):
+        super().__init__()
+        self.allowed_characters = allowed_characters
+        self.buffer = buffer
+        self.entries = entries
+
+    def __missing__(self, code):
+        if chr(code) in self.allowed_characters:
+            replacement = code
+        else:
+            replacement = find_replacement(self.buffer, self.entries, code)
+        self[code] = replacement
+        return replacement
+
+
+class CompiledPolicy:
+    """
+    A policy that reads a compiled image (from `compile_policy`) in place. It
+    has the interface of `Policy`: `is_clean`, `sanitize` and an optional
+    `cache`. `buffer` is any object supporting the buffer protocol, e.g. bytes,
+    an mmap or a shared memory block; `source` is closed with the policy, and
+    `path` is the file it was loaded from, if any.
+
+    Pickling a policy attached to shared memory or loaded from a file only
+    sends the name of the block or the path, e.g. to the workers of a pool.
+    """
+
+    def __init__(self, buffer, cache=None, source=None, path=None):
+        with memoryview(buffer) as view:
+            self.buffer = view.toreadonly()
+        self.unicode_version, self.entries, pool_size, sequences_size = read_header(
+            self.buffer
+        )
+        self.allowed_characters = AllowedBitmap(self.buffer)
+        self.allowed_sequences = None
+        if sequences_size:
+            from sanitext.sequence_trie import SequenceTrie
+
+            start = INDEX_OFFSET + 8 * self.entries + 4 + pool_size
+            joined = bytes(self.buffer[start : start + sequences_size])
+            self.allowed_sequences = SequenceTrie(
+                joined.decode("utf-8", errors="surrogatepass").split("\0")
+            )
+        self.table = CompiledTable(self.allowed_characters, self.buffer, self.entries)
+        self.cache = cache
+        self.key = ("compiled", hashlib.blake2b(self.buffer, digest_size=16).digest())
+        self.path = path
+        # Last, so that the views above are gone when a garbage collected
+        # policy closes its source
+        self.source = source
+
+    @property
+    def name(self):
+        """The name of the shared memory block, or None."""
+        return self.source.name if isinstance(self.source, SharedMemory) else None
+
+    def __reduce__(self):
+        if self.name is not None:
+            return attach_policy, (self.name, self.cache)
+        if self.path is not None:
+            return load_policy, (self.path, self.cache)
+        return CompiledPolicy, (bytes(self.buffer), self.cache)
+
+    def replacement(self, char):
+        """Returns what `char` is replaced with ("" if removed, itself if allowed)."""
+        if char in self.allowed_characters:
+            return char
+        return find_replacement(self.buffer, self.entries, ord(char))
+
+    def is_clean(self, text):
+        """Returns True if every character of `text` is allowed."""
+        return self.allowed_characters.issuperset(text)
+
+    def sanitize(self, text):
+        """Sanitize `text` like the policy this one was compiled from."""
+        if self.cache is not None:
+            key = self.key, text
+            sanitized = self.cache.get(key)
+            if sanitized is None:
+                sanitized = self._sanitize(text)
+                self.cache.put(key, sanitized)
+            return sanitized
+        return self._sanitize(text)
+
+    def _sanitize(self, text):
+        if self.allowed_characters.issuperset(text):
+            return text
+        if self.allowed_sequences is None:
+            return text.translate(self.table)
+        # Allowed sequences are kept, the text around them is translated
+        pieces = []
+        position = 0
+        for start, end in self.allowed_sequences.finditer(text):
+            pieces += [text[position:start].translate(self.table), text[start:end]]
+            position = end
+        pieces.append(text[position:].translate(self.table))
+        return "".join(pieces)
+
+    def close(self):
+        """Release the image and close its source (the policy can't be used after)."""
+        self.buffer.release()
+        if self.source is not None:
+            self.source.close()
+
+    def unlink(self):
+        """Remove the shared memory block (for the policy `share_policy` returned)."""
+        self.source.unlink()
+
+
+def share_policy(policy, name=None, cache=None):
+    """
+    Compile `policy` into a new shared memory block (named `name`, or a random
+    name) and return it attached as a `CompiledPolicy`. Other processes attach
+    to it with `attach_policy(compiled.name)`. The caller owns the block: call
+    `close()` and `unlink()` once no process needs it anymore.
+    """
+    image = compile_policy(policy)
+    block = SharedMemory(name=name, create=True, size=len(image))
+    block.buf[: len(image)] = image
+    return CompiledPolicy(block.buf, cache=cache, source=block)
+
+
+def attach_policy(name, cache=None):
+    """
+    Attach to the compiled policy in the shared memory block `name` (see
+    `share_policy`). Only `close()` the result: the block belongs to its creator.
+    """
+    try:
+        block = SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching registers the block with the resource
+        # tracker shared with its creator, which would then unlink it when
+        # this process exits (and unregistering would drop the creator's entry)
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            block = SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+    return CompiledPolicy(block.buf, cache=cache, source=block)
+
+
+def save_policy(policy, path):
+    """
+    Compile `policy` and write it to `path`. The file is replaced atomically,
+    so processes loading it never see it half-written.
+    """
+    image = compile_policy(policy)
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(image)
+    os.replace(tmp_path, path)
+
+
+def load_policy(path, cache=None):
+    """
+    Map the compiled policy file `path` (from `save_policy`) read-only and
+    return it as a `CompiledPolicy`. Raises ValueError if the file is not a
+    compiled policy of this format version.
+    """
+    with open(path, "rb") as file:
+        if not file.seek(0, 2):
+            raise ValueError("Not a compiled policy (empty file).")
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        read_header(data)
+    except ValueError:
+        data.close()
+        raise
+    return CompiledPolicy(data, cache=cache, source=data, path=path)
@@ -0,0 +1,796 @@
+# Generated by tools/generate_confusables.py, do not edit.
+# ASCII look-alikes from Unicode 13.0.0 confusables.txt (UTS #39).
+UNICODE_VERSION = "13.0.0"
+
+CONFUSABLES = {
+    "\u00b4": "'",  # ´
+    "\u00b8": ",",  # ¸
+    "\u00c6": "AE",  # Æ
+    "\u00d7": "x",  # ×
+    "\u00e6": "ae",  # æ
+    "\u0131": "i",  # ı
+    "\u0149": "n",  # ŉ
+    "\u0152": "OE",  # Œ
+    "\u0153": "oe",  # œ
+    "\u0181": "B",  # Ɓ
+    "\u0184": "b",  # Ƅ
+    "\u0187": "C",  # Ƈ
+    "\u018a": "D",  # Ɗ
+    "\u018d": "g",  # ƍ
+    "\u0193": "G",  # Ɠ
+    "\u0196": "I",  # Ɩ
+    "\u0198": "K",  # Ƙ
+    "\u01a0": "O",  # Ơ
+    "\u01a1": "o",  # ơ
+    "\u01a4": "P",  # Ƥ
+    "\u01a6": "R",  # Ʀ
+    "\u01a7": "2",  # Ƨ
+    "\u01ac": "T",  # Ƭ
+    "\u01b3": "Y",  # Ƴ
+    "\u01b7": "3",  # Ʒ
+    "\u01bc": "5",  # Ƽ
+    "\u01bd": "s",  # ƽ
+    "\u01c0": "l",  # ǀ
+    "\u01c1": "ll",  # ǁ
+    "\u01c3": "!",  # ǃ
+    "\u021c": "3",  # Ȝ
+    "\u0222": "8",  # Ȣ
+    "\u0223": "8",  # ȣ
+    "\u0241": "?",  # Ɂ
+    "\u0251": "a",  # ɑ
+    "\u0261": "g",  # ɡ
+    "\u0263": "y",  # ɣ
+    "\u0269": "i",  # ɩ
+    "\u026a": "i",  # ɪ
+    "\u026f": "w",  # ɯ
+    "\u028b": "u",  # ʋ
+    "\u028f": "y",  # ʏ
+    "\u0294": "?",  # ʔ
+    "\u02a3": "dz",  # ʣ
+    "\u02a6": "ts",  # ʦ
+    "\u02aa": "ls",  # ʪ
+    "\u02ab": "lz",  # ʫ
+    "\u02b9": "'",  # ʹ
+    "\u02ba": '"',  # ʺ
+    "\u02bb": "'",  # ʻ
+    "\u02bc": "'",  # ʼ
+    "\u02bd": "'",  # ʽ
+    "\u02be": "'",  # ʾ
+    "\u02c2": "<",  # ˂
+    "\u02c3": ">",  # ˃
+    "\u02c4": "^",  # ˄
+    "\u02c6": "^",  # ˆ
+    "\u02c8": "'",  # ˈ
+    "\u02ca": "'",  # ˊ
+    "\u02cb": "'",  # ˋ
+    "\u02d0": ":",  # ː
+    "\u02d7": "-",  # ˗
+    "\u02db": "i",  # ˛
+    "\u02dc": "~",  # ˜
+    "\u02dd": '"',  # ˝
+    "\u02ee": '"',  # ˮ
+    "\u02f4": "'",  # ˴
+    "\u02f6": '"',  # ˶
+    "\u02f8": ":",  # ˸
+    "\u0374": "'",  # ʹ
+    "\u037a": "i",  # ͺ
+    "\u037f": "J",  # Ϳ
+    "\u0384": "'",  # ΄
+    "\u0391": "A",  # Α
+    "\u0392": "B",  # Β
+    "\u0395": "E",  # Ε
+    "\u0396": "Z",  # Ζ
+    "\u0397": "H",  # Η
+    "\u0399": "I",  # Ι
+    "\u039a": "K",  # Κ
+    "\u039c": "M",  # Μ
+    "\u039d": "N",  # Ν
+    "\u039f": "O",  # Ο
+    "\u03a1": "P",  # Ρ
+    "\u03a4": "T",  # Τ
+    "\u03a5": "Y",  # Υ
+    "\u03a7": "X",  # Χ
+    "\u03b1": "a",  # α
+    "\u03b3": "y",  # γ
+    "\u03b9": "i",  # ι
+    "\u03bd": "v",  # ν
+    "\u03bf": "o",  # ο
+    "\u03c1": "p",  # ρ
+    "\u03c3": "o",  # σ
+    "\u03c5": "u",  # υ
+    "\u03d2": "Y",  # ϒ
+    "\u03dc": "F",  # Ϝ
+    "\u03e8": "2",  # Ϩ
+    "\u03f1": "p",  # ϱ
+    "\u03f2": "c",  # ϲ
+    "\u03f3": "j",  # ϳ
+    "\u03f9": "C",  # Ϲ
+    "\u03fa": "M",  # Ϻ
+    "\u0405": "S",  # Ѕ
+    "\u0406": "I",  # І
+    "\u0408": "J",  # Ј
+    "\u0410": "A",  # А
+    "\u0412": "B",  # В
+    "\u0415": "E",  # Е
+    "\u0417": "3",  # З
+    "\u041a": "K",  # К
+    "\u041c": "M",  # М
+    "\u041d": "H",  # Н
+    "\u041e": "O",  # О
+    "\u0420": "P",  # Р
+    "\u0421": "C",  # С
+    "\u0422": "T",  # Т
+    "\u0423": "Y",  # У
+    "\u0425": "X",  # Х
+    "\u042b": "bl",  # Ы
+    "\u042c": "b",  # Ь
+    "\u042e": "lO",  # Ю
+    "\u0430": "a",  # а
+    "\u0431": "6",  # б
+    "\u0433": "r",  # г
+    "\u0435": "e",  # е
+    "\u043e": "o",  # о
+    "\u0440": "p",  # р
+    "\u0441": "c",  # с
+    "\u0443": "y",  # у
+    "\u0445": "x",  # х
+    "\u0455": "s",  # ѕ
+    "\u0456": "i",  # і
+    "\u0458": "j",  # ј
+    "\u0461": "w",  # ѡ
+    "\u0474": "V",  # Ѵ
+    "\u0475": "v",  # ѵ
+    "\u0491": "r",  # ґ
+    "\u04ae": "Y",  # Ү
+    "\u04af": "y",  # ү
+    "\u04bb": "h",  # һ
+    "\u04bd": "e",  # ҽ
+    "\u04c0": "I",  # Ӏ
+    "\u04cf": "i",  # ӏ
+    "\u04d4": "AE",  # Ӕ
+    "\u04d5": "ae",  # ӕ
+    "\u04e0": "3",  # Ӡ
+    "\u0501": "d",  # ԁ
+    "\u050c": "G",  # Ԍ
+    "\u051b": "q",  # ԛ
+    "\u051c": "W",  # Ԝ
+    "\u051d": "w",  # ԝ
+    "\u054d": "U",  # Ս
+    "\u054f": "S",  # Տ
+    "\u0555": "O",  # Օ
+    "\u055a": "'",  # ՚
+    "\u055d": "'",  # ՝
+    "\u0561": "w",  # ա
+    "\u0563": "q",  # գ
+    "\u0566": "q",  # զ
+    "\u0570": "h",  # հ
+    "\u0578": "n",  # ո
+    "\u057c": "n",  # ռ
+    "\u057d": "u",  # ս
+    "\u0581": "g",  # ց
+    "\u0584": "f",  # ք
+    "\u0585": "o",  # օ
+    "\u0589": ":",  # ։
+    "\u05c0": "|",  # ׀
+    "\u05c3": ":",  # ׃
+    "\u05d5": "l",  # ו
+    "\u05d8": "v",  # ט
+    "\u05d9": "'",  # י
+    "\u05df": "l",  # ן
+    "\u05e1": "o",  # ס
+    "\u05f0": "ll",  # װ
+    "\u05f1": "l",  # ױ
+    "\u05f2": '"',  # ײ
+    "\u05f3": "'",  # ׳
+    "\u05f4": '"',  # ״
+    "\u060d": ",",  # ؍
+    "\u0627": "l",  # ا
+    "\u0647": "o",  # ه
+    "\u0660": "0",  # ٠
+    "\u0661": "1",  # ١
+    "\u0665": "5",  # ٥
+    "\u0667": "7",  # ٧
+    "\u066b": ",",  # ٫
+    "\u066d": "*",  # ٭
+    "\u06be": "o",  # ھ
+    "\u06c1": "o",  # ہ
+    "\u06d4": "-",  # ۔
+    "\u06d5": "o",  # ە
+    "\u06f0": "0",  # ۰
+    "\u06f1": "1",  # ۱
+    "\u06f5": "5",  # ۵
+    "\u06f7": "7",  # ۷
+    "\u0701": ".",  # ܁
+    "\u0702": ".",  # ܂
+    "\u0703": ":",  # ܃
+    "\u0704": ":",  # ܄
+    "\u07c0": "0",  # ߀
+    "\u07ca": "l",  # ߊ
+    "\u07f4": "'",  # ߴ
+    "\u07f5": "'",  # ߵ
+    "\u07fa": "_",  # ߺ
+    "\u0966": "0",  # ०
+    "\u097d": "?",  # ॽ
+    "\u09e6": "0",  # ০
+    "\u09ea": "4",  # ৪
+    "\u09ed": "7",  # ৭
+    "\u0a66": "0",  # ੦
+    "\u0a67": "1",  # ੧
+    "\u0a6a": "4",  # ੪
+    "\u0ae6": "0",  # ૦
+    "\u0b20": "O",  # ଠ
+    "\u0b66": "0",  # ୦
+    "\u0b68": "2",  # ୨
+    "\u0be6": "0",  # ௦
+    "\u0c66": "0",  # ౦
+    "\u0ce6": "0",  # ೦
+    "\u0d20": "o",  # ഠ
+    "\u0d66": "0",  # ൦
+    "\u0d6d": "7",  # ൭
+    "\u0e50": "0",  # ๐
+    "\u0ed0": "0",  # ໐
+    "\u101d": "o",  # ဝ
+    "\u1040": "0",  # ၀
+    "\u10e7": "y",  # ყ
+    "\u10ff": "o",  # ჿ
+    "\u1200": "U",  # ሀ
+    "\u12d0": "O",  # ዐ
+    "\u13a0": "D",  # Ꭰ
+    "\u13a1": "R",  # Ꭱ
+    "\u13a2": "T",  # Ꭲ
+    "\u13a4": "O",  # Ꭴ
+    "\u13a5": "i",  # Ꭵ
+    "\u13a9": "Y",  # Ꭹ
+    "\u13aa": "A",  # Ꭺ
+    "\u13ab": "J",  # Ꭻ
+    "\u13ac": "E",  # Ꭼ
+    "\u13ae": "?",  # Ꭾ
+    "\u13b3": "W",  # Ꮃ
+    "\u13b7": "M",  # Ꮇ
+    "\u13bb": "H",  # Ꮋ
+    "\u13bd": "Y",  # Ꮍ
+    "\u13c0": "G",  # Ꮐ
+    "\u13c2": "h",  # Ꮒ
+    "\u13c3": "Z",  # Ꮓ
+    "\u13ce": "4",  # Ꮞ
+    "\u13cf": "b",  # Ꮟ
+    "\u13d2": "R",  # Ꮢ
+    "\u13d4": "W",  # Ꮤ
+    "\u13d5": "S",  # Ꮥ
+    "\u13d9": "V",  # Ꮩ
+    "\u13da": "S",  # Ꮪ
+    "\u13de": "L",  # Ꮮ
+    "\u13df": "C",  # Ꮯ
+    "\u13e2": "P",  # Ꮲ
+    "\u13e6": "K",  # Ꮶ
+    "\u13e7": "d",  # Ꮷ
+    "\u13ee": "6",  # Ꮾ
+    "\u13f3": "G",  # Ᏻ
+    "\u13f4": "B",  # Ᏼ
+    "\u1400": "=",  # ᐀
+    "\u142f": "V",  # ᐯ
+    "\u1433": ">",  # ᐳ
+    "\u1438": "<",  # ᐸ
+    "\u144a": "'",  # ᑊ
+    "\u144c": "U",  # ᑌ
+    "\u1467": "U",  # ᑧ
+    "\u146d": "P",  # ᑭ
+    "\u146f": "d",  # ᑯ
+    "\u1472": "b",  # ᑲ
+    "\u1486": "P",  # ᒆ
+    "\u1487": "d",  # ᒇ
+    "\u1488": "b",  # ᒈ
+    "\u148d": "J",  # ᒍ
+    "\u14aa": "L",  # ᒪ
+    "\u14bf": "2",  # ᒿ
+    "\u1541": "x",  # ᕁ
+    "\u157c": "H",  # ᕼ
+    "\u157d": "x",  # ᕽ
+    "\u1587": "R",  # ᖇ
+    "\u15af": "b",  # ᖯ
+    "\u15b4": "F",  # ᖴ
+    "\u15c5": "A",  # ᗅ
+    "\u15de": "D",  # ᗞ
+    "\u15ea": "D",  # ᗪ
+    "\u15f0": "M",  # ᗰ
+    "\u15f7": "B",  # ᗷ
+    "\u166d": "X",  # ᙭
+    "\u166e": "x",  # ᙮
+    "\u1680": " ",  # U+1680 OGHAM SPACE MARK
+    "\u16b2": "<",  # ᚲ
+    "\u16b7": "X",  # ᚷ
+    "\u16c1": "l",  # ᛁ
+    "\u16cc": "'",  # ᛌ
+    "\u16d5": "K",  # ᛕ
+    "\u16d6": "M",  # ᛖ
+    "\u16ec": ":",  # ᛬
+    "\u16ed": "+",  # ᛭
+    "\u1735": "/",  # ᜵
+    "\u1803": ":",  # ᠃
+    "\u1809": ":",  # ᠉
+    "\u1cd3": '"',  # ᳓
+    "\u1d04": "c",  # ᴄ
+    "\u1d0f": "o",  # ᴏ
+    "\u1d11": "o",  # ᴑ
+    "\u1d1c": "u",  # ᴜ
+    "\u1d20": "v",  # ᴠ
+    "\u1d21": "w",  # ᴡ
+    "\u1d22": "z",  # ᴢ
+    "\u1d26": "r",  # ᴦ
+    "\u1d6b": "ue",  # ᵫ
+    "\u1d83": "g",  # ᶃ
+    "\u1d8c": "y",  # ᶌ
+    "\u1e9d": "f",  # ẝ
+    "\u1eff": "y",  # ỿ
+    "\u1fbd": "'",  # ᾽
+    "\u1fbe": "i",  # ι
+    "\u1fbf": "'",  # ᾿
+    "\u1fc0": "~",  # ῀
+    "\u1ffd": "'",  # ´
+    "\u1ffe": "'",  # ῾
+    "\u2010": "-",  # ‐
+    "\u2011": "-",  # ‑
+    "\u2012": "-",  # ‒
+    "\u2013": "-",  # –
+    "\u2016": "ll",  # ‖
+    "\u2018": "'",  # ‘
+    "\u2019": "'",  # ’
+    "\u201a": ",",  # ‚
+    "\u201b": "'",  # ‛
+    "\u201c": '"',  # “
+    "\u201d": '"',  # ”
+    "\u201f": '"',  # ‟
+    "\u2028": " ",  # U+2028 LINE SEPARATOR
+    "\u2029": " ",  # U+2029 PARAGRAPH SEPARATOR
+    "\u2032": "'",  # ′
+    "\u2033": '"',  # ″
+    "\u2034": "'''",  # ‴
+    "\u2035": "'",  # ‵
+    "\u2036": '"',  # ‶
+    "\u2037": "'''",  # ‷
+    "\u2039": "<",  # ‹
+    "\u203a": ">",  # ›
+    "\u2041": "/",  # ⁁
+    "\u2043": "-",  # ⁃
+    "\u2044": "/",  # ⁄
+    "\u204e": "*",  # ⁎
+    "\u2053": "~",  # ⁓
+    "\u2057": "''''",  # ⁗
+    "\u205a": ":",  # ⁚
+    "\u212e": "e",  # ℮
+    "\u213d": "y",  # ℽ
+    "\u2212": "-",  # −
+    "\u2215": "/",  # ∕
+    "\u2216": "\\",  # ∖
+    "\u2217": "*",  # ∗
+    "\u2223": "|",  # ∣
+    "\u2228": "v",  # ∨
+    "\u222a": "U",  # ∪
+    "\u2236": ":",  # ∶
+    "\u223c": "~",  # ∼
+    "\u226a": "<<",  # ≪
+    "\u226b": ">>",  # ≫
+    "\u22a4": "T",  # ⊤
+    "\u22c1": "v",  # ⋁
+    "\u22c3": "U",  # ⋃
+    "\u22d8": "<<<",  # ⋘
+    "\u22d9": ">>>",  # ⋙
+    "\u22ff": "E",  # ⋿
+    "\u2373": "i",  # ⍳
+    "\u2374": "p",  # ⍴
+    "\u237a": "a",  # ⍺
+    "\u23fd": "|",  # ⏽
+    "\u244a": "\\\\",  # ⑊
+    "\u2571": "/",  # ╱
+    "\u2573": "X",  # ╳
+    "\u2768": "(",  # ❨
+    "\u2769": ")",  # ❩
+    "\u276e": "<",  # ❮
+    "\u276f": ">",  # ❯
+    "\u2772": "(",  # ❲
+    "\u2773": ")",  # ❳
+    "\u2774": "{",  # ❴
+    "\u2775": "}",  # ❵
+    "\u2795": "+",  # ➕
+    "\u2796": "-",  # ➖
+    "\u27cb": "/",  # ⟋
+    "\u27cd": "\\",  # ⟍
+    "\u27d9": "T",  # ⟙
+    "\u292b": "x",  # ⤫
+    "\u292c": "x",  # ⤬
+    "\u29f5": "\\",  # ⧵
+    "\u29f8": "/",  # ⧸
+    "\u29f9": "\\",  # ⧹
+    "\u2a20": ">>",  # ⨠
+    "\u2a2f": "x",  # ⨯
+    "\u2aa5": "><",  # ⪥
+    "\u2afb": "///",  # ⫻
+    "\u2afd": "//",  # ⫽
+    "\u2c85": "r",  # ⲅ
+    "\u2c8e": "H",  # Ⲏ
+    "\u2c92": "I",  # Ⲓ
+    "\u2c94": "K",  # Ⲕ
+    "\u2c98": "M",  # Ⲙ
+    "\u2c9a": "N",  # Ⲛ
+    "\u2c9e": "O",  # Ⲟ
+    "\u2c9f": "o",  # ⲟ
+    "\u2ca2": "P",  # Ⲣ
+    "\u2ca3": "p",  # ⲣ
+    "\u2ca4": "C",  # Ⲥ
+    "\u2ca5": "c",  # ⲥ
+    "\u2ca6": "T",  # Ⲧ
+    "\u2ca8": "Y",  # Ⲩ
+    "\u2cac": "X",  # Ⲭ
+    "\u2cba": "-",  # Ⲻ
+    "\u2cc6": "/",  # Ⳇ
+    "\u2cca": "9",  # Ⳋ
+    "\u2ccc": "3",  # Ⳍ
+    "\u2cd0": "L",  # Ⳑ
+    "\u2cd2": "6",  # Ⳓ
+    "\u2cf9": "\\\\",  # ⳹
+    "\u2d38": "V",  # ⴸ
+    "\u2d39": "E",  # ⴹ
+    "\u2d4f": "l",  # ⵏ
+    "\u2d51": "!",  # ⵑ
+    "\u2d54": "O",  # ⵔ
+    "\u2d55": "Q",  # ⵕ
+    "\u2d5d": "X",  # ⵝ
+    "\u2e28": "((",  # ⸨
+    "\u2e29": "))",  # ⸩
+    "\u2e40": "=",  # ⹀
+    "\u2f02": "\\",  # ⼂
+    "\u2f03": "/",  # ⼃
+    "\u3003": '"',  # 〃
+    "\u3007": "0",  # 〇
+    "\u3014": "(",  # 〔
+    "\u3015": ")",  # 〕
+    "\u3033": "/",  # 〳
+    "\u30a0": "=",  # ゠
+    "\u30ce": "/",  # ノ
+    "\u31d3": "/",  # ㇓
+    "\u31d4": "\\",  # ㇔
+    "\u4e36": "\\",  # 丶
+    "\u4e3f": "/",  # 丿
+    "\ua4d0": "B",  # ꓐ
+    "\ua4d1": "P",  # ꓑ
+    "\ua4d2": "d",  # ꓒ
+    "\ua4d3": "D",  # ꓓ
+    "\ua4d4": "T",  # ꓔ
+    "\ua4d6": "G",  # ꓖ
+    "\ua4d7": "K",  # ꓗ
+    "\ua4d9": "J",  # ꓙ
+    "\ua4da": "C",  # ꓚ
+    "\ua4dc": "Z",  # ꓜ
+    "\ua4dd": "F",  # ꓝ
+    "\ua4df": "M",  # ꓟ
+    "\ua4e0": "N",  # ꓠ
+    "\ua4e1": "L",  # ꓡ
+    "\ua4e2": "S",  # ꓢ
+    "\ua4e3": "R",  # ꓣ
+    "\ua4e6": "V",  # ꓦ
+    "\ua4e7": "H",  # ꓧ
+    "\ua4ea": "W",  # ꓪ
+    "\ua4eb": "X",  # ꓫ
+    "\ua4ec": "Y",  # ꓬ
+    "\ua4ee": "A",  # ꓮ
+    "\ua4f0": "E",  # ꓰ
+    "\ua4f2": "l",  # ꓲ
+    "\ua4f3": "O",  # ꓳ
+    "\ua4f4": "U",  # ꓴ
+    "\ua4f8": ".",  # ꓸ
+    "\ua4f9": ",",  # ꓹ
+    "\ua4fa": "..",  # ꓺ
+    "\ua4fb": ".,",  # ꓻ
+    "\ua4fd": ":",  # ꓽ
+    "\ua4fe": "-.",  # ꓾
+    "\ua4ff": "=",  # ꓿
+    "\ua60e": ".",  # ꘎
+    "\ua644": "2",  # Ꙅ
+    "\ua647": "i",  # ꙇ
+    "\ua698": "OO",  # Ꚙ
+    "\ua699": "oo",  # ꚙ
+    "\ua6df": "V",  # ꛟ
+    "\ua728": "T3",  # Ꜩ
+    "\ua731": "s",  # ꜱ
+    "\ua732": "AA",  # Ꜳ
+    "\ua733": "aa",  # ꜳ
+    "\ua734": "AO",  # Ꜵ
+    "\ua735": "ao",  # ꜵ
+    "\ua736": "AU",  # Ꜷ
+    "\ua737": "au",  # ꜷ
+    "\ua738": "AV",  # Ꜹ
+    "\ua739": "av",  # ꜹ
+    "\ua73a": "AV",  # Ꜻ
+    "\ua73b": "av",  # ꜻ
+    "\ua73c": "AY",  # Ꜽ
+    "\ua73d": "ay",  # ꜽ
+    "\ua74e": "OO",  # Ꝏ
+    "\ua74f": "oo",  # ꝏ
+    "\ua75a": "2",  # Ꝛ
+    "\ua76a": "3",  # Ꝫ
+    "\ua76e": "9",  # Ꝯ
+    "\ua777": "tf",  # ꝷ
+    "\ua778": "&",  # ꝸ
+    "\ua789": ":",  # ꞉
+    "\ua78c": "'",  # ꞌ
+    "\ua798": "F",  # Ꞙ
+    "\ua799": "f",  # ꞙ
+    "\ua79f": "u",  # ꞟ
+    "\ua7ab": "3",  # Ɜ
+    "\ua7b2": "J",  # Ʝ
+    "\ua7b3": "X",  # Ꭓ
+    "\ua7b4": "B",  # Ꞵ
+    "\uab32": "e",  # ꬲ
+    "\uab35": "f",  # ꬵ
+    "\uab3d": "o",  # ꬽ
+    "\uab47": "r",  # ꭇ
+    "\uab48": "r",  # ꭈ
+    "\uab4e": "u",  # ꭎ
+    "\uab52": "u",  # ꭒ
+    "\uab5a": "y",  # ꭚ
+    "\uab63": "uo",  # ꭣ
+    "\uab75": "i",  # ꭵ
+    "\uab81": "r",  # ꮁ
+    "\uab83": "w",  # ꮃ
+    "\uab93": "z",  # ꮓ
+    "\uaba9": "v",  # ꮩ
+    "\uabaa": "s",  # ꮪ
+    "\uabaf": "c",  # ꮯ
+    "\ufba6": "o",  # ﮦ
+    "\ufba7": "o",  # ﮧ
+    "\ufba8": "o",  # ﮨ
+    "\ufba9": "o",  # ﮩ
+    "\ufbaa": "o",  # ﮪ
+    "\ufbab": "o",  # ﮫ
+    "\ufbac": "o",  # ﮬ
+    "\ufbad": "o",  # ﮭ
+    "\ufd3e": "(",  # ﴾
+    "\ufd3f": ")",  # ﴿
+    "\ufe58": "-",  # ﹘
+    "\ufe8d": "l",  # ﺍ
+    "\ufe8e": "l",  # ﺎ
+    "\ufee9": "o",  # ﻩ
+    "\ufeea": "o",  # ﻪ
+    "\ufeeb": "o",  # ﻫ
+    "\ufeec": "o",  # ﻬ
+    "\uffe8": "|",  # ￨
+    "\U00010282": "B",  # 𐊂
+    "\U00010286": "E",  # 𐊆
+    "\U00010287": "F",  # 𐊇
+    "\U0001028a": "l",  # 𐊊
+    "\U00010290": "X",  # 𐊐
+    "\U00010292": "O",  # 𐊒
+    "\U00010295": "P",  # 𐊕
+    "\U00010296": "S",  # 𐊖
+    "\U00010297": "T",  # 𐊗
+    "\U0001029b": "+",  # 𐊛
+    "\U000102a0": "A",  # 𐊠
+    "\U000102a1": "B",  # 𐊡
+    "\U000102a2": "C",  # 𐊢
+    "\U000102a5": "F",  # 𐊥
+    "\U000102ab": "O",  # 𐊫
+    "\U000102b0": "M",  # 𐊰
+    "\U000102b1": "T",  # 𐊱
+    "\U000102b2": "Y",  # 𐊲
+    "\U000102b4": "X",  # 𐊴
+    "\U000102cf": "H",  # 𐋏
+    "\U00010301": "B",  # 𐌁
+    "\U00010302": "C",  # 𐌂
+    "\U00010309": "l",  # 𐌉
+    "\U00010311": "M",  # 𐌑
+    "\U00010315": "T",  # 𐌕
+    "\U00010317": "X",  # 𐌗
+    "\U0001031a": "8",  # 𐌚
+    "\U0001031f": "*",  # 𐌟
+    "\U00010320": "1",  # 𐌠
+    "\U00010404": "O",  # 𐐄
+    "\U00010415": "C",  # 𐐕
+    "\U0001041b": "L",  # 𐐛
+    "\U00010420": "S",  # 𐐠
+    "\U0001042c": "o",  # 𐐬
+    "\U0001043d": "c",  # 𐐽
+    "\U00010448": "s",  # 𐑈
+    "\U000104b4": "R",  # 𐒴
+    "\U000104c2": "O",  # 𐓂
+    "\U000104ce": "U",  # 𐓎
+    "\U000104d2": "7",  # 𐓒
+    "\U000104ea": "o",  # 𐓪
+    "\U000104f6": "u",  # 𐓶
+    "\U00010513": "N",  # 𐔓
+    "\U00010516": "O",  # 𐔖
+    "\U00010518": "K",  # 𐔘
+    "\U0001051c": "C",  # 𐔜
+    "\U0001051d": "V",  # 𐔝
+    "\U00010525": "F",  # 𐔥
+    "\U00010526": "L",  # 𐔦
+    "\U00010527": "X",  # 𐔧
+    "\U00010a50": ".",  # 𐩐
+    "\U000114d0": "0",  # 𑓐
+    "\U00011700": "rn",  # 𑜀
+    "\U00011706": "v",  # 𑜆
+    "\U0001170a": "w",  # 𑜊
+    "\U0001170e": "w",  # 𑜎
+    "\U0001170f": "w",  # 𑜏
+    "\U000118a0": "V",  # 𑢠
+    "\U000118a2": "F",  # 𑢢
+    "\U000118a3": "L",  # 𑢣
+    "\U000118a4": "Y",  # 𑢤
+    "\U000118a6": "E",  # 𑢦
+    "\U000118a9": "Z",  # 𑢩
+    "\U000118ac": "9",  # 𑢬
+    "\U000118ae": "E",  # 𑢮
+    "\U000118af": "4",  # 𑢯
+    "\U000118b2": "L",  # 𑢲
+    "\U000118b5": "O",  # 𑢵
+    "\U000118b8": "U",  # 𑢸
+    "\U000118bb": "5",  # 𑢻
+    "\U000118bc": "T",  # 𑢼
+    "\U000118c0": "v",  # 𑣀
+    "\U000118c1": "s",  # 𑣁
+    "\U000118c2": "F",  # 𑣂
+    "\U000118c3": "i",  # 𑣃
+    "\U000118c4": "z",  # 𑣄
+    "\U000118c6": "7",  # 𑣆
+    "\U000118c8": "o",  # 𑣈
+    "\U000118ca": "3",  # 𑣊
+    "\U000118cc": "9",  # 𑣌
+    "\U000118d5": "6",  # 𑣕
+    "\U000118d6": "9",  # 𑣖
+    "\U000118d7": "o",  # 𑣗
+    "\U000118d8": "u",  # 𑣘
+    "\U000118dc": "y",  # 𑣜
+    "\U000118e0": "0",  # 𑣠
+    "\U000118e3": "3",  # 𑣣
+    "\U000118e5": "5",  # 𑣥
+    "\U000118e6": "6",  # 𑣦
+    "\U000118e9": "9",  # 𑣩
+    "\U00016f08": "V",  # 𖼈
+    "\U00016f0a": "T",  # 𖼊
+    "\U00016f16": "L",  # 𖼖
+    "\U00016f28": "l",  # 𖼨
+    "\U00016f35": "R",  # 𖼵
+    "\U00016f3a": "S",  # 𖼺
+    "\U00016f3b": "3",  # 𖼻
+    "\U00016f3f": ">",  # 𖼿
+    "\U00016f40": "A",  # 𖽀
+    "\U00016f42": "U",  # 𖽂
+    "\U00016f43": "Y",  # 𖽃
+    "\U0001d114": "{",  # 𝄔
+    "\U0001d206": "3",  # 𝈆
+    "\U0001d20d": "V",  # 𝈍
+    "\U0001d20f": "\\",  # 𝈏
+    "\U0001d212": "7",  # 𝈒
+    "\U0001d213": "F",  # 𝈓
+    "\U0001d216": "R",  # 𝈖
+    "\U0001d22a": "L",  # 𝈪
+    "\U0001d236": "<",  # 𝈶
+    "\U0001d237": ">",  # 𝈷
+    "\U0001d23a": "/",  # 𝈺
+    "\U0001d23b": "\\",  # 𝈻
+    "\U0001d6a4": "i",  # 𝚤
+    "\U0001d6a8": "A",  # 𝚨
+    "\U0001d6a9": "B",  # 𝚩
+    "\U0001d6ac": "E",  # 𝚬
+    "\U0001d6ad": "Z",  # 𝚭
+    "\U0001d6ae": "H",  # 𝚮
+    "\U0001d6b0": "I",  # 𝚰
+    "\U0001d6b1": "K",  # 𝚱
+    "\U0001d6b3": "M",  # 𝚳
+    "\U0001d6b4": "N",  # 𝚴
+    "\U0001d6b6": "O",  # 𝚶
+    "\U0001d6b8": "P",  # 𝚸
+    "\U0001d6bb": "T",  # 𝚻
+    "\U0001d6bc": "Y",  # 𝚼
+    "\U0001d6be": "X",  # 𝚾
+    "\U0001d6c2": "a",  # 𝛂
+    "\U0001d6c4": "y",  # 𝛄
+    "\U0001d6ca": "i",  # 𝛊
+    "\U0001d6ce": "v",  # 𝛎
+    "\U0001d6d0": "o",  # 𝛐
+    "\U0001d6d2": "p",  # 𝛒
+    "\U0001d6d4": "o",  # 𝛔
+    "\U0001d6d6": "u",  # 𝛖
+    "\U0001d6e0": "p",  # 𝛠
+    "\U0001d6e2": "A",  # 𝛢
+    "\U0001d6e3": "B",  # 𝛣
+    "\U0001d6e6": "E",  # 𝛦
+    "\U0001d6e7": "Z",  # 𝛧
+    "\U0001d6e8": "H",  # 𝛨
+    "\U0001d6ea": "I",  # 𝛪
+    "\U0001d6eb": "K",  # 𝛫
+    "\U0001d6ed": "M",  # 𝛭
+    "\U0001d6ee": "N",  # 𝛮
+    "\U0001d6f0": "O",  # 𝛰
+    "\U0001d6f2": "P",  # 𝛲
+    "\U0001d6f5": "T",  # 𝛵
+    "\U0001d6f6": "Y",  # 𝛶
+    "\U0001d6f8": "X",  # 𝛸
+    "\U0001d6fc": "a",  # 𝛼
+    "\U0001d6fe": "y",  # 𝛾
+    "\U0001d704": "i",  # 𝜄
+    "\U0001d708": "v",  # 𝜈
+    "\U0001d70a": "o",  # 𝜊
+    "\U0001d70c": "p",  # 𝜌
+    "\U0001d70e": "o",  # 𝜎
+    "\U0001d710": "u",  # 𝜐
+    "\U0001d71a": "p",  # 𝜚
+    "\U0001d71c": "A",  # 𝜜
+    "\U0001d71d": "B",  # 𝜝
+    "\U0001d720": "E",  # 𝜠
+    "\U0001d721": "Z",  # 𝜡
+    "\U0001d722": "H",  # 𝜢
+    "\U0001d724": "I",  # 𝜤
+    "\U0001d725": "K",  # 𝜥
+    "\U0001d727": "M",  # 𝜧
+    "\U0001d728": "N",  # 𝜨
+    "\U0001d72a": "O",  # 𝜪
+    "\U0001d72c": "P",  # 𝜬
+    "\U0001d72f": "T",  # 𝜯
+    "\U0001d730": "Y",  # 𝜰
+    "\U0001d732": "X",  # 𝜲
+    "\U0001d736": "a",  # 𝜶
+    "\U0001d738": "y",  # 𝜸
+    "\U0001d73e": "i",  # 𝜾
+    "\U0001d742": "v",  # 𝝂
+    "\U0001d744": "o",  # 𝝄
+    "\U0001d746": "p",  # 𝝆
+    "\U0001d748": "o",  # 𝝈
+    "\U0001d74a": "u",  # 𝝊
+    "\U0001d754": "p",  # 𝝔
+    "\U0001d756": "A",  # 𝝖
+    "\U0001d757": "B",  # 𝝗
+    "\U0001d75a": "E",  # 𝝚
+    "\U0001d75b": "Z",  # 𝝛
+    "\U0001d75c": "H",  # 𝝜
+    "\U0001d75e": "I",  # 𝝞
+    "\U0001d75f": "K",  # 𝝟
+    "\U0001d761": "M",  # 𝝡
+    "\U0001d762": "N",  # 𝝢
+    "\U0001d764": "O",  # 𝝤
+    "\U0001d766": "P",  # 𝝦
+    "\U0001d769": "T",  # 𝝩
+    "\U0001d76a": "Y",  # 𝝪
+    "\U0001d76c": "X",  # 𝝬
+    "\U0001d770": "a",  # 𝝰
+    "\U0001d772": "y",  # 𝝲
+    "\U0001d778": "i",  # 𝝸
+    "\U0001d77c": "v",  # 𝝼
+    "\U0001d77e": "o",  # 𝝾
+    "\U0001d780": "p",  # 𝞀
+    "\U0001d782": "o",  # 𝞂
+    "\U0001d784": "u",  # 𝞄
+    "\U0001d78e": "p",  # 𝞎
+    "\U0001d790": "A",  # 𝞐
+    "\U0001d791": "B",  # 𝞑
+    "\U0001d794": "E",  # 𝞔
+    "\U0001d795": "Z",  # 𝞕
+    "\U0001d796": "H",  # 𝞖
+    "\U0001d798": "I",  # 𝞘
+    "\U0001d799": "K",  # 𝞙
+    "\U0001d79b": "M",  # 𝞛
+    "\U0001d79c": "N",  # 𝞜
+    "\U0001d79e": "O",  # 𝞞
+    "\U0001d7a0": "P",  # 𝞠
+    "\U0001d7a3": "T",  # 𝞣
+    "\U0001d7a4": "Y",  # 𝞤
+    "\U0001d7a6": "X",  # 𝞦
+    "\U0001d7aa": "a",  # 𝞪
+    "\U0001d7ac": "y",  # 𝞬
+    "\U0001d7b2": "i",  # 𝞲
+    "\U0001d7b6": "v",  # 𝞶
+    "\U0001d7b8": "o",  # 𝞸
+    "\U0001d7ba": "p",  # 𝞺
+    "\U0001d7bc": "o",  # 𝞼
+    "\U0001d7be": "u",  # 𝞾
+    "\U0001d7c8": "p",  # 𝟈
+    "\U0001d7ca": "F",  # 𝟊
+    "\U0001e8c7": "1",  # 𞣇
+    "\U0001ee00": "l",  # 𞸀
+    "\U0001ee24": "o",  # 𞸤
+    "\U0001ee64": "o",  # 𞹤
+    "\U0001ee80": "l",  # 𞺀
+    "\U0001ee84": "o",  # 𞺄
+    "\U0001f12a": "(S)",  # 🄪
+    "\U0001f74c": "C",  # 🝌
+    "\U0001f768": "T",  # 🝨
+}
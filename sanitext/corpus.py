@@ -0,0 +1,172 @@
+"""
+Corpus profiling: which disallowed characters occur across many files, and
+how often.
+
+`profile_paths` is a map-reduce over the corpus: files are walked and split
+into chunks (as in sanitext.scan, so one huge file is spread over all workers
+as well as many small ones), each worker counts the disallowed characters of
+a chunk into a Counter, and the counters are merged as they come back.
+
+`histogram` turns the counts into rows with each character's Unicode name and
+category and what `closest_ascii` would replace it with. They are the data for
+deciding which characters belong in an --allow-file and which homoglyph
+mappings are missing, and `write_histogram` exports them as CSV or JSON.
+"""
+
+import csv
+import json
+import mmap
+import unicodedata
+from collections import Counter
+from functools import partial
+from multiprocessing import Pool
+
+from sanitext.bidi import iter_files
+from sanitext.scan import (
+    CHUNK_SIZE,
+    allowed_run_pattern,
+    chunk_boundaries,
+    count_suspicious,
+)
+from sanitext.text_sanitization import (
+    closest_ascii,
+    get_allowed_characters,
+    unicode_name,
+)
+
+HISTOGRAM_FIELDS = (
+    "code_point",
+    "character",
+    "count",
+    "name",
+    "category",
+    "closest_ascii",
+)
+
+
+def iter_chunks(paths, chunk_size=CHUNK_SIZE, skipped=None):
+    """
+    Yields (path, start, end) byte ranges covering the text files in `paths`
+    (walking directories). Binary files (with a NUL byte in the first 8 KiB)
+    and unreadable ones are appended to `skipped` as (path, reason) instead.
+    """
+    for path in iter_files(paths):
+        try:
+            with open(path, "rb") as file:
+                if not file.seek(0, 2):
+                    continue
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if b"\0" in data[:8192]:
+                        if skipped is not None:
+                            skipped.append((path, "binary"))
+                        continue
+                    boundaries = chunk_boundaries(data, chunk_size)
+        except OSError as error:
+            if skipped is not None:
+                skipped.append((path, str(error)))
+            continue
+        for start, end in zip(boundaries, boundaries[1:]):
+            yield path, start, end
+
+
+def count_chunk(chunk, pattern, allowed_sequences=None):
+    """Returns a Counter of the disallowed characters in a (path, start, end) chunk."""
+    path, start, end = chunk
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            text = data[start:end].decode("utf-8", errors="replace")
+    suspicious = count_suspicious(text, pattern, allowed_sequences)
+    return Counter({char: count for char, (count, _) in suspicious.items()})
+
+
+def _count_chunk_safely(job, chunk):
+    try:
+        return count_chunk(chunk, *job), None
+    except OSError as error:
+        return None, (chunk[0], str(error))
+
+
+_worker_job = None
+
+
+def _init_worker(pattern, allowed_sequences):
+    global _worker_job
+    _worker_job = pattern, allowed_sequences
+
+
+def _count_chunk_job(chunk):
+    return _count_chunk_safely(_worker_job, chunk)
+
+
+def profile_paths(
+    paths,
+    allowed_characters=get_allowed_characters(),
+    allowed_sequences=None,
+    jobs=None,
+    chunk_size=CHUNK_SIZE,
+):
+    """
+    Count every disallowed character in the files and directory trees in
+    `paths`, with `jobs` worker processes (default: one per CPU, 1 counts in
+    this process).
+
+    Returns (counts, files, skipped): a Counter of the disallowed characters,
+    the number of files counted, and the (path, reason) of the files skipped.
+    """
+    skipped = []
+    files = set()
+    counts = Counter()
+
+    def chunks():
+        for chunk in iter_chunks(paths, chunk_size, skipped):
+            files.add(chunk[0])
+            yield chunk
+
+    def merge(results):
+        for chunk_counts, error in results:
+            if error is not None:
+                skipped.append(error)
+            else:
+                counts.update(chunk_counts)
+
+    job = allowed_run_pattern(allowed_characters), allowed_sequences
+    if jobs == 1:
+        merge(map(partial(_count_chunk_safely, job), chunks()))
+    else:
+        with Pool(jobs, initializer=_init_worker, initargs=job) as pool:
+            merge(pool.imap(_count_chunk_job, chunks(), chunksize=4))
+    failed = {path for path, _ in skipped}
+    return counts, len(files - failed), skipped
+
+
+def histogram(counts, allowed_characters=get_allowed_characters()):
+    """
+    Returns one row per character in `counts` (a Counter), most frequent first:
+    (code point, character, count, name, category, closest_ascii), where the
+    last is what `closest_ascii` gives with `allowed_characters` ("" if none).
+    """
+    return [
+        (
+            f"U+{ord(char):04X}",
+            char,
+            count,
+            unicode_name(char),
+            unicodedata.category(char),
+            closest_ascii(char, allowed_characters),
+        )
+        for char, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
+
+
+def write_histogram(rows, file, format="csv"):
+    """Write the rows of `histogram` to a text `file` as "csv" or "json"."""
+    if format == "json":
+        records = [dict(zip(HISTOGRAM_FIELDS, row)) for row in rows]
+        json.dump(records, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+    elif format == "csv":
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(HISTOGRAM_FIELDS)
+        writer.writerows(rows)
+    else:
+        raise ValueError(f"Unknown histogram format: {format!r}")
@@ -0,0 +1,57 @@
+"""
+Persist interactive decisions (keep / remove / replace) across runs.
+
+Decisions are stored as a JSON mapping from character to replacement string
+(the character itself means "keep", "" means "remove") and are passed to
+`sanitize_text(..., decisions=...)` as an overlay on top of the default policy.
+"""
+
+import json
+import os
+from pathlib import Path
+
+DECISIONS_FORMAT_VERSION = 1
+
+
+def default_decisions_path():
+    """Returns the per-user decision file ($XDG_CONFIG_HOME/sanitext/decisions.json)."""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "sanitext" / "decisions.json"
+
+
+def load_decisions(path=None):
+    """
+    Load saved decisions from `path` (default: the per-user decision file).
+    Returns an empty dict if the file does not exist yet. Raises ValueError if
+    the file is not a valid decision file.
+    """
+    path = Path(path) if path is not None else default_decisions_path()
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Invalid decision file {path}: {error}") from None
+    version = data.get("version") if isinstance(data, dict) else None
+    if version != DECISIONS_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported decision file version {version!r} in {path} "
+            f"(expected {DECISIONS_FORMAT_VERSION})."
+        )
+    if not isinstance(data.get("decisions"), dict):
+        raise ValueError(f"Invalid decision file {path}: no decisions.")
+    return dict(data["decisions"])
+
+
+def save_decisions(decisions, path=None):
+    """
+    Save decisions to `path` (default: the per-user decision file).
+    The file is replaced atomically so a crash never leaves it half-written.
+    """
+    path = Path(path) if path is not None else default_decisions_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": DECISIONS_FORMAT_VERSION, "decisions": decisions}
+    tmp_path = path.with_name(path.name + ".tmp")
+    # Keep the default ASCII escaping so invisible characters stay readable
+    tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
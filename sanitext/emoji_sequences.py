@@ -0,0 +1,3840 @@
+# Generated by tools/generate_emoji_sequences.py, do not edit.
+# Multi-code-point emoji sequences from the emoji package 2.16.0
+# (fully-qualified, minimally-qualified and unqualified forms).
+EMOJI_SEQUENCES = {
+    "\u0023\u20e3",  # #⃣
+    "\u0023\ufe0f\u20e3",  # #️⃣
+    "\u002a\u20e3",  # *⃣
+    "\u002a\ufe0f\u20e3",  # *️⃣
+    "\u0030\u20e3",  # 0⃣
+    "\u0030\ufe0f\u20e3",  # 0️⃣
+    "\u0031\u20e3",  # 1⃣
+    "\u0031\ufe0f\u20e3",  # 1️⃣
+    "\u0032\u20e3",  # 2⃣
+    "\u0032\ufe0f\u20e3",  # 2️⃣
+    "\u0033\u20e3",  # 3⃣
+    "\u0033\ufe0f\u20e3",  # 3️⃣
+    "\u0034\u20e3",  # 4⃣
+    "\u0034\ufe0f\u20e3",  # 4️⃣
+    "\u0035\u20e3",  # 5⃣
+    "\u0035\ufe0f\u20e3",  # 5️⃣
+    "\u0036\u20e3",  # 6⃣
+    "\u0036\ufe0f\u20e3",  # 6️⃣
+    "\u0037\u20e3",  # 7⃣
+    "\u0037\ufe0f\u20e3",  # 7️⃣
+    "\u0038\u20e3",  # 8⃣
+    "\u0038\ufe0f\u20e3",  # 8️⃣
+    "\u0039\u20e3",  # 9⃣
+    "\u0039\ufe0f\u20e3",  # 9️⃣
+    "\u00a9\ufe0f",  # ©️
+    "\u00ae\ufe0f",  # ®️
+    "\u203c\ufe0f",  # ‼️
+    "\u2049\ufe0f",  # ⁉️
+    "\u2122\ufe0f",  # ™️
+    "\u2139\ufe0f",  # ℹ️
+    "\u2194\ufe0f",  # ↔️
+    "\u2195\ufe0f",  # ↕️
+    "\u2196\ufe0f",  # ↖️
+    "\u2197\ufe0f",  # ↗️
+    "\u2198\ufe0f",  # ↘️
+    "\u2199\ufe0f",  # ↙️
+    "\u21a9\ufe0f",  # ↩️
+    "\u21aa\ufe0f",  # ↪️
+    "\u2328\ufe0f",  # ⌨️
+    "\u23cf\ufe0f",  # ⏏️
+    "\u23ed\ufe0f",  # ⏭️
+    "\u23ee\ufe0f",  # ⏮️
+    "\u23ef\ufe0f",  # ⏯️
+    "\u23f1\ufe0f",  # ⏱️
+    "\u23f2\ufe0f",  # ⏲️
+    "\u23f8\ufe0f",  # ⏸️
+    "\u23f9\ufe0f",  # ⏹️
+    "\u23fa\ufe0f",  # ⏺️
+    "\u24c2\ufe0f",  # Ⓜ️
+    "\u25aa\ufe0f",  # ▪️
+    "\u25ab\ufe0f",  # ▫️
+    "\u25b6\ufe0f",  # ▶️
+    "\u25c0\ufe0f",  # ◀️
+    "\u25fb\ufe0f",  # ◻️
+    "\u25fc\ufe0f",  # ◼️
+    "\u2600\ufe0f",  # ☀️
+    "\u2601\ufe0f",  # ☁️
+    "\u2602\ufe0f",  # ☂️
+    "\u2603\ufe0f",  # ☃️
+    "\u2604\ufe0f",  # ☄️
+    "\u260e\ufe0f",  # ☎️
+    "\u2611\ufe0f",  # ☑️
+    "\u2618\ufe0f",  # ☘️
+    "\u261d\ufe0f",  # ☝️
+    "\u261d\U0001f3fb",  # ☝🏻
+    "\u261d\U0001f3fc",  # ☝🏼
+    "\u261d\U0001f3fd",  # ☝🏽
+    "\u261d\U0001f3fe",  # ☝🏾
+    "\u261d\U0001f3ff",  # ☝🏿
+    "\u2620\ufe0f",  # ☠️
+    "\u2622\ufe0f",  # ☢️
+    "\u2623\ufe0f",  # ☣️
+    "\u2626\ufe0f",  # ☦️
+    "\u262a\ufe0f",  # ☪️
+    "\u262e\ufe0f",  # ☮️
+    "\u262f\ufe0f",  # ☯️
+    "\u2638\ufe0f",  # ☸️
+    "\u2639\ufe0f",  # ☹️
+    "\u263a\ufe0f",  # ☺️
+    "\u2640\ufe0f",  # ♀️
+    "\u2642\ufe0f",  # ♂️
+    "\u265f\ufe0f",  # ♟️
+    "\u2660\ufe0f",  # ♠️
+    "\u2663\ufe0f",  # ♣️
+    "\u2665\ufe0f",  # ♥️
+    "\u2666\ufe0f",  # ♦️
+    "\u2668\ufe0f",  # ♨️
+    "\u267b\ufe0f",  # ♻️
+    "\u267e\ufe0f",  # ♾️
+    "\u2692\ufe0f",  # ⚒️
+    "\u2694\ufe0f",  # ⚔️
+    "\u2695\ufe0f",  # ⚕️
+    "\u2696\ufe0f",  # ⚖️
+    "\u2697\ufe0f",  # ⚗️
+    "\u2699\ufe0f",  # ⚙️
+    "\u269b\ufe0f",  # ⚛️
+    "\u269c\ufe0f",  # ⚜️
+    "\u26a0\ufe0f",  # ⚠️
+    "\u26a7\ufe0f",  # ⚧️
+    "\u26b0\ufe0f",  # ⚰️
+    "\u26b1\ufe0f",  # ⚱️
+    "\u26c8\ufe0f",  # ⛈️
+    "\u26cf\ufe0f",  # ⛏️
+    "\u26d1\ufe0f",  # ⛑️
+    "\u26d3\u200d\U0001f4a5",  # ⛓‍💥
+    "\u26d3\ufe0f",  # ⛓️
+    "\u26d3\ufe0f\u200d\U0001f4a5",  # ⛓️‍💥
+    "\u26e9\ufe0f",  # ⛩️
+    "\u26f0\ufe0f",  # ⛰️
+    "\u26f1\ufe0f",  # ⛱️
+    "\u26f4\ufe0f",  # ⛴️
+    "\u26f7\ufe0f",  # ⛷️
+    "\u26f8\ufe0f",  # ⛸️
+    "\u26f9\u200d\u2640",  # ⛹‍♀
+    "\u26f9\u200d\u2640\ufe0f",  # ⛹‍♀️
+    "\u26f9\u200d\u2642",  # ⛹‍♂
+    "\u26f9\u200d\u2642\ufe0f",  # ⛹‍♂️
+    "\u26f9\ufe0f",  # ⛹️
+    "\u26f9\ufe0f\u200d\u2640",  # ⛹️‍♀
+    "\u26f9\ufe0f\u200d\u2640\ufe0f",  # ⛹️‍♀️
+    "\u26f9\ufe0f\u200d\u2642",  # ⛹️‍♂
+    "\u26f9\ufe0f\u200d\u2642\ufe0f",  # ⛹️‍♂️
+    "\u26f9\U0001f3fb",  # ⛹🏻
+    "\u26f9\U0001f3fb\u200d\u2640",  # ⛹🏻‍♀
+    "\u26f9\U0001f3fb\u200d\u2640\ufe0f",  # ⛹🏻‍♀️
+    "\u26f9\U0001f3fb\u200d\u2642",  # ⛹🏻‍♂
+    "\u26f9\U0001f3fb\u200d\u2642\ufe0f",  # ⛹🏻‍♂️
+    "\u26f9\U0001f3fc",  # ⛹🏼
+    "\u26f9\U0001f3fc\u200d\u2640",  # ⛹🏼‍♀
+    "\u26f9\U0001f3fc\u200d\u2640\ufe0f",  # ⛹🏼‍♀️
+    "\u26f9\U0001f3fc\u200d\u2642",  # ⛹🏼‍♂
+    "\u26f9\U0001f3fc\u200d\u2642\ufe0f",  # ⛹🏼‍♂️
+    "\u26f9\U0001f3fd",  # ⛹🏽
+    "\u26f9\U0001f3fd\u200d\u2640",  # ⛹🏽‍♀
+    "\u26f9\U0001f3fd\u200d\u2640\ufe0f",  # ⛹🏽‍♀️
+    "\u26f9\U0001f3fd\u200d\u2642",  # ⛹🏽‍♂
+    "\u26f9\U0001f3fd\u200d\u2642\ufe0f",  # ⛹🏽‍♂️
+    "\u26f9\U0001f3fe",  # ⛹🏾
+    "\u26f9\U0001f3fe\u200d\u2640",  # ⛹🏾‍♀
+    "\u26f9\U0001f3fe\u200d\u2640\ufe0f",  # ⛹🏾‍♀️
+    "\u26f9\U0001f3fe\u200d\u2642",  # ⛹🏾‍♂
+    "\u26f9\U0001f3fe\u200d\u2642\ufe0f",  # ⛹🏾‍♂️
+    "\u26f9\U0001f3ff",  # ⛹🏿
+    "\u26f9\U0001f3ff\u200d\u2640",  # ⛹🏿‍♀
+    "\u26f9\U0001f3ff\u200d\u2640\ufe0f",  # ⛹🏿‍♀️
+    "\u26f9\U0001f3ff\u200d\u2642",  # ⛹🏿‍♂
+    "\u26f9\U0001f3ff\u200d\u2642\ufe0f",  # ⛹🏿‍♂️
+    "\u2702\ufe0f",  # ✂️
+    "\u2708\ufe0f",  # ✈️
+    "\u2709\ufe0f",  # ✉️
+    "\u270a\U0001f3fb",  # ✊🏻
+    "\u270a\U0001f3fc",  # ✊🏼
+    "\u270a\U0001f3fd",  # ✊🏽
+    "\u270a\U0001f3fe",  # ✊🏾
+    "\u270a\U0001f3ff",  # ✊🏿
+    "\u270b\U0001f3fb",  # ✋🏻
+    "\u270b\U0001f3fc",  # ✋🏼
+    "\u270b\U0001f3fd",  # ✋🏽
+    "\u270b\U0001f3fe",  # ✋🏾
+    "\u270b\U0001f3ff",  # ✋🏿
+    "\u270c\ufe0f",  # ✌️
+    "\u270c\U0001f3fb",  # ✌🏻
+    "\u270c\U0001f3fc",  # ✌🏼
+    "\u270c\U0001f3fd",  # ✌🏽
+    "\u270c\U0001f3fe",  # ✌🏾
+    "\u270c\U0001f3ff",  # ✌🏿
+    "\u270d\ufe0f",  # ✍️
+    "\u270d\U0001f3fb",  # ✍🏻
+    "\u270d\U0001f3fc",  # ✍🏼
+    "\u270d\U0001f3fd",  # ✍🏽
+    "\u270d\U0001f3fe",  # ✍🏾
+    "\u270d\U0001f3ff",  # ✍🏿
+    "\u270f\ufe0f",  # ✏️
+    "\u2712\ufe0f",  # ✒️
+    "\u2714\ufe0f",  # ✔️
+    "\u2716\ufe0f",  # ✖️
+    "\u271d\ufe0f",  # ✝️
+    "\u2721\ufe0f",  # ✡️
+    "\u2733\ufe0f",  # ✳️
+    "\u2734\ufe0f",  # ✴️
+    "\u2744\ufe0f",  # ❄️
+    "\u2747\ufe0f",  # ❇️
+    "\u2763\ufe0f",  # ❣️
+    "\u2764\u200d\U0001f525",  # ❤‍🔥
+    "\u2764\u200d\U0001fa79",  # ❤‍🩹
+    "\u2764\ufe0f",  # ❤️
+    "\u2764\ufe0f\u200d\U0001f525",  # ❤️‍🔥
+    "\u2764\ufe0f\u200d\U0001fa79",  # ❤️‍🩹
+    "\u27a1\ufe0f",  # ➡️
+    "\u2934\ufe0f",  # ⤴️
+    "\u2935\ufe0f",  # ⤵️
+    "\u2b05\ufe0f",  # ⬅️
+    "\u2b06\ufe0f",  # ⬆️
+    "\u2b07\ufe0f",  # ⬇️
+    "\u3030\ufe0f",  # 〰️
+    "\u303d\ufe0f",  # 〽️
+    "\u3297\ufe0f",  # ㊗️
+    "\u3299\ufe0f",  # ㊙️
+    "\U0001f170\ufe0f",  # 🅰️
+    "\U0001f171\ufe0f",  # 🅱️
+    "\U0001f17e\ufe0f",  # 🅾️
+    "\U0001f17f\ufe0f",  # 🅿️
+    "\U0001f1e6\U0001f1e8",  # 🇦🇨
+    "\U0001f1e6\U0001f1e9",  # 🇦🇩
+    "\U0001f1e6\U0001f1ea",  # 🇦🇪
+    "\U0001f1e6\U0001f1eb",  # 🇦🇫
+    "\U0001f1e6\U0001f1ec",  # 🇦🇬
+    "\U0001f1e6\U0001f1ee",  # 🇦🇮
+    "\U0001f1e6\U0001f1f1",  # 🇦🇱
+    "\U0001f1e6\U0001f1f2",  # 🇦🇲
+    "\U0001f1e6\U0001f1f4",  # 🇦🇴
+    "\U0001f1e6\U0001f1f6",  # 🇦🇶
+    "\U0001f1e6\U0001f1f7",  # 🇦🇷
+    "\U0001f1e6\U0001f1f8",  # 🇦🇸
+    "\U0001f1e6\U0001f1f9",  # 🇦🇹
+    "\U0001f1e6\U0001f1fa",  # 🇦🇺
+    "\U0001f1e6\U0001f1fc",  # 🇦🇼
+    "\U0001f1e6\U0001f1fd",  # 🇦🇽
+    "\U0001f1e6\U0001f1ff",  # 🇦🇿
+    "\U0001f1e7\U0001f1e6",  # 🇧🇦
+    "\U0001f1e7\U0001f1e7",  # 🇧🇧
+    "\U0001f1e7\U0001f1e9",  # 🇧🇩
+    "\U0001f1e7\U0001f1ea",  # 🇧🇪
+    "\U0001f1e7\U0001f1eb",  # 🇧🇫
+    "\U0001f1e7\U0001f1ec",  # 🇧🇬
+    "\U0001f1e7\U0001f1ed",  # 🇧🇭
+    "\U0001f1e7\U0001f1ee",  # 🇧🇮
+    "\U0001f1e7\U0001f1ef",  # 🇧🇯
+    "\U0001f1e7\U0001f1f1",  # 🇧🇱
+    "\U0001f1e7\U0001f1f2",  # 🇧🇲
+    "\U0001f1e7\U0001f1f3",  # 🇧🇳
+    "\U0001f1e7\U0001f1f4",  # 🇧🇴
+    "\U0001f1e7\U0001f1f6",  # 🇧🇶
+    "\U0001f1e7\U0001f1f7",  # 🇧🇷
+    "\U0001f1e7\U0001f1f8",  # 🇧🇸
+    "\U0001f1e7\U0001f1f9",  # 🇧🇹
+    "\U0001f1e7\U0001f1fb",  # 🇧🇻
+    "\U0001f1e7\U0001f1fc",  # 🇧🇼
+    "\U0001f1e7\U0001f1fe",  # 🇧🇾
+    "\U0001f1e7\U0001f1ff",  # 🇧🇿
+    "\U0001f1e8\U0001f1e6",  # 🇨🇦
+    "\U0001f1e8\U0001f1e8",  # 🇨🇨
+    "\U0001f1e8\U0001f1e9",  # 🇨🇩
+    "\U0001f1e8\U0001f1eb",  # 🇨🇫
+    "\U0001f1e8\U0001f1ec",  # 🇨🇬
+    "\U0001f1e8\U0001f1ed",  # 🇨🇭
+    "\U0001f1e8\U0001f1ee",  # 🇨🇮
+    "\U0001f1e8\U0001f1f0",  # 🇨🇰
+    "\U0001f1e8\U0001f1f1",  # 🇨🇱
+    "\U0001f1e8\U0001f1f2",  # 🇨🇲
+    "\U0001f1e8\U0001f1f3",  # 🇨🇳
+    "\U0001f1e8\U0001f1f4",  # 🇨🇴
+    "\U0001f1e8\U0001f1f5",  # 🇨🇵
+    "\U0001f1e8\U0001f1f6",  # 🇨🇶
+    "\U0001f1e8\U0001f1f7",  # 🇨🇷
+    "\U0001f1e8\U0001f1fa",  # 🇨🇺
+    "\U0001f1e8\U0001f1fb",  # 🇨🇻
+    "\U0001f1e8\U0001f1fc",  # 🇨🇼
+    "\U0001f1e8\U0001f1fd",  # 🇨🇽
+    "\U0001f1e8\U0001f1fe",  # 🇨🇾
+    "\U0001f1e8\U0001f1ff",  # 🇨🇿
+    "\U0001f1e9\U0001f1ea",  # 🇩🇪
+    "\U0001f1e9\U0001f1ec",  # 🇩🇬
+    "\U0001f1e9\U0001f1ef",  # 🇩🇯
+    "\U0001f1e9\U0001f1f0",  # 🇩🇰
+    "\U0001f1e9\U0001f1f2",  # 🇩🇲
+    "\U0001f1e9\U0001f1f4",  # 🇩🇴
+    "\U0001f1e9\U0001f1ff",  # 🇩🇿
+    "\U0001f1ea\U0001f1e6",  # 🇪🇦
+    "\U0001f1ea\U0001f1e8",  # 🇪🇨
+    "\U0001f1ea\U0001f1ea",  # 🇪🇪
+    "\U0001f1ea\U0001f1ec",  # 🇪🇬
+    "\U0001f1ea\U0001f1ed",  # 🇪🇭
+    "\U0001f1ea\U0001f1f7",  # 🇪🇷
+    "\U0001f1ea\U0001f1f8",  # 🇪🇸
+    "\U0001f1ea\U0001f1f9",  # 🇪🇹
+    "\U0001f1ea\U0001f1fa",  # 🇪🇺
+    "\U0001f1eb\U0001f1ee",  # 🇫🇮
+    "\U0001f1eb\U0001f1ef",  # 🇫🇯
+    "\U0001f1eb\U0001f1f0",  # 🇫🇰
+    "\U0001f1eb\U0001f1f2",  # 🇫🇲
+    "\U0001f1eb\U0001f1f4",  # 🇫🇴
+    "\U0001f1eb\U0001f1f7",  # 🇫🇷
+    "\U0001f1ec\U0001f1e6",  # 🇬🇦
+    "\U0001f1ec\U0001f1e7",  # 🇬🇧
+    "\U0001f1ec\U0001f1e9",  # 🇬🇩
+    "\U0001f1ec\U0001f1ea",  # 🇬🇪
+    "\U0001f1ec\U0001f1eb",  # 🇬🇫
+    "\U0001f1ec\U0001f1ec",  # 🇬🇬
+    "\U0001f1ec\U0001f1ed",  # 🇬🇭
+    "\U0001f1ec\U0001f1ee",  # 🇬🇮
+    "\U0001f1ec\U0001f1f1",  # 🇬🇱
+    "\U0001f1ec\U0001f1f2",  # 🇬🇲
+    "\U0001f1ec\U0001f1f3",  # 🇬🇳
+    "\U0001f1ec\U0001f1f5",  # 🇬🇵
+    "\U0001f1ec\U0001f1f6",  # 🇬🇶
+    "\U0001f1ec\U0001f1f7",  # 🇬🇷
+    "\U0001f1ec\U0001f1f8",  # 🇬🇸
+    "\U0001f1ec\U0001f1f9",  # 🇬🇹
+    "\U0001f1ec\U0001f1fa",  # 🇬🇺
+    "\U0001f1ec\U0001f1fc",  # 🇬🇼
+    "\U0001f1ec\U0001f1fe",  # 🇬🇾
+    "\U0001f1ed\U0001f1f0",  # 🇭🇰
+    "\U0001f1ed\U0001f1f2",  # 🇭🇲
+    "\U0001f1ed\U0001f1f3",  # 🇭🇳
+    "\U0001f1ed\U0001f1f7",  # 🇭🇷
+    "\U0001f1ed\U0001f1f9",  # 🇭🇹
+    "\U0001f1ed\U0001f1fa",  # 🇭🇺
+    "\U0001f1ee\U0001f1e8",  # 🇮🇨
+    "\U0001f1ee\U0001f1e9",  # 🇮🇩
+    "\U0001f1ee\U0001f1ea",  # 🇮🇪
+    "\U0001f1ee\U0001f1f1",  # 🇮🇱
+    "\U0001f1ee\U0001f1f2",  # 🇮🇲
+    "\U0001f1ee\U0001f1f3",  # 🇮🇳
+    "\U0001f1ee\U0001f1f4",  # 🇮🇴
+    "\U0001f1ee\U0001f1f6",  # 🇮🇶
+    "\U0001f1ee\U0001f1f7",  # 🇮🇷
+    "\U0001f1ee\U0001f1f8",  # 🇮🇸
+    "\U0001f1ee\U0001f1f9",  # 🇮🇹
+    "\U0001f1ef\U0001f1ea",  # 🇯🇪
+    "\U0001f1ef\U0001f1f2",  # 🇯🇲
+    "\U0001f1ef\U0001f1f4",  # 🇯🇴
+    "\U0001f1ef\U0001f1f5",  # 🇯🇵
+    "\U0001f1f0\U0001f1ea",  # 🇰🇪
+    "\U0001f1f0\U0001f1ec",  # 🇰🇬
+    "\U0001f1f0\U0001f1ed",  # 🇰🇭
+    "\U0001f1f0\U0001f1ee",  # 🇰🇮
+    "\U0001f1f0\U0001f1f2",  # 🇰🇲
+    "\U0001f1f0\U0001f1f3",  # 🇰🇳
+    "\U0001f1f0\U0001f1f5",  # 🇰🇵
+    "\U0001f1f0\U0001f1f7",  # 🇰🇷
+    "\U0001f1f0\U0001f1fc",  # 🇰🇼
+    "\U0001f1f0\U0001f1fe",  # 🇰🇾
+    "\U0001f1f0\U0001f1ff",  # 🇰🇿
+    "\U0001f1f1\U0001f1e6",  # 🇱🇦
+    "\U0001f1f1\U0001f1e7",  # 🇱🇧
+    "\U0001f1f1\U0001f1e8",  # 🇱🇨
+    "\U0001f1f1\U0001f1ee",  # 🇱🇮
+    "\U0001f1f1\U0001f1f0",  # 🇱🇰
+    "\U0001f1f1\U0001f1f7",  # 🇱🇷
+    "\U0001f1f1\U0001f1f8",  # 🇱🇸
+    "\U0001f1f1\U0001f1f9",  # 🇱🇹
+    "\U0001f1f1\U0001f1fa",  # 🇱🇺
+    "\U0001f1f1\U0001f1fb",  # 🇱🇻
+    "\U0001f1f1\U0001f1fe",  # 🇱🇾
+    "\U0001f1f2\U0001f1e6",  # 🇲🇦
+    "\U0001f1f2\U0001f1e8",  # 🇲🇨
+    "\U0001f1f2\U0001f1e9",  # 🇲🇩
+    "\U0001f1f2\U0001f1ea",  # 🇲🇪
+    "\U0001f1f2\U0001f1eb",  # 🇲🇫
+    "\U0001f1f2\U0001f1ec",  # 🇲🇬
+    "\U0001f1f2\U0001f1ed",  # 🇲🇭
+    "\U0001f1f2\U0001f1f0",  # 🇲🇰
+    "\U0001f1f2\U0001f1f1",  # 🇲🇱
+    "\U0001f1f2\U0001f1f2",  # 🇲🇲
+    "\U0001f1f2\U0001f1f3",  # 🇲🇳
+    "\U0001f1f2\U0001f1f4",  # 🇲🇴
+    "\U0001f1f2\U0001f1f5",  # 🇲🇵
+    "\U0001f1f2\U0001f1f6",  # 🇲🇶
+    "\U0001f1f2\U0001f1f7",  # 🇲🇷
+    "\U0001f1f2\U0001f1f8",  # 🇲🇸
+    "\U0001f1f2\U0001f1f9",  # 🇲🇹
+    "\U0001f1f2\U0001f1fa",  # 🇲🇺
+    "\U0001f1f2\U0001f1fb",  # 🇲🇻
+    "\U0001f1f2\U0001f1fc",  # 🇲🇼
+    "\U0001f1f2\U0001f1fd",  # 🇲🇽
+    "\U0001f1f2\U0001f1fe",  # 🇲🇾
+    "\U0001f1f2\U0001f1ff",  # 🇲🇿
+    "\U0001f1f3\U0001f1e6",  # 🇳🇦
+    "\U0001f1f3\U0001f1e8",  # 🇳🇨
+    "\U0001f1f3\U0001f1ea",  # 🇳🇪
+    "\U0001f1f3\U0001f1eb",  # 🇳🇫
+    "\U0001f1f3\U0001f1ec",  # 🇳🇬
+    "\U0001f1f3\U0001f1ee",  # 🇳🇮
+    "\U0001f1f3\U0001f1f1",  # 🇳🇱
+    "\U0001f1f3\U0001f1f4",  # 🇳🇴
+    "\U0001f1f3\U0001f1f5",  # 🇳🇵
+    "\U0001f1f3\U0001f1f7",  # 🇳🇷
+    "\U0001f1f3\U0001f1fa",  # 🇳🇺
+    "\U0001f1f3\U0001f1ff",  # 🇳🇿
+    "\U0001f1f4\U0001f1f2",  # 🇴🇲
+    "\U0001f1f5\U0001f1e6",  # 🇵🇦
+    "\U0001f1f5\U0001f1ea",  # 🇵🇪
+    "\U0001f1f5\U0001f1eb",  # 🇵🇫
+    "\U0001f1f5\U0001f1ec",  # 🇵🇬
+    "\U0001f1f5\U0001f1ed",  # 🇵🇭
+    "\U0001f1f5\U0001f1f0",  # 🇵🇰
+    "\U0001f1f5\U0001f1f1",  # 🇵🇱
+    "\U0001f1f5\U0001f1f2",  # 🇵🇲
+    "\U0001f1f5\U0001f1f3",  # 🇵🇳
+    "\U0001f1f5\U0001f1f7",  # 🇵🇷
+    "\U0001f1f5\U0001f1f8",  # 🇵🇸
+    "\U0001f1f5\U0001f1f9",  # 🇵🇹
+    "\U0001f1f5\U0001f1fc",  # 🇵🇼
+    "\U0001f1f5\U0001f1fe",  # 🇵🇾
+    "\U0001f1f6\U0001f1e6",  # 🇶🇦
+    "\U0001f1f7\U0001f1ea",  # 🇷🇪
+    "\U0001f1f7\U0001f1f4",  # 🇷🇴
+    "\U0001f1f7\U0001f1f8",  # 🇷🇸
+    "\U0001f1f7\U0001f1fa",  # 🇷🇺
+    "\U0001f1f7\U0001f1fc",  # 🇷🇼
+    "\U0001f1f8\U0001f1e6",  # 🇸🇦
+    "\U0001f1f8\U0001f1e7",  # 🇸🇧
+    "\U0001f1f8\U0001f1e8",  # 🇸🇨
+    "\U0001f1f8\U0001f1e9",  # 🇸🇩
+    "\U0001f1f8\U0001f1ea",  # 🇸🇪
+    "\U0001f1f8\U0001f1ec",  # 🇸🇬
+    "\U0001f1f8\U0001f1ed",  # 🇸🇭
+    "\U0001f1f8\U0001f1ee",  # 🇸🇮
+    "\U0001f1f8\U0001f1ef",  # 🇸🇯
+    "\U0001f1f8\U0001f1f0",  # 🇸🇰
+    "\U0001f1f8\U0001f1f1",  # 🇸🇱
+    "\U0001f1f8\U0001f1f2",  # 🇸🇲
+    "\U0001f1f8\U0001f1f3",  # 🇸🇳
+    "\U0001f1f8\U0001f1f4",  # 🇸🇴
+    "\U0001f1f8\U0001f1f7",  # 🇸🇷
+    "\U0001f1f8\U0001f1f8",  # 🇸🇸
+    "\U0001f1f8\U0001f1f9",  # 🇸🇹
+    "\U0001f1f8\U0001f1fb",  # 🇸🇻
+    "\U0001f1f8\U0001f1fd",  # 🇸🇽
+    "\U0001f1f8\U0001f1fe",  # 🇸🇾
+    "\U0001f1f8\U0001f1ff",  # 🇸🇿
+    "\U0001f1f9\U0001f1e6",  # 🇹🇦
+    "\U0001f1f9\U0001f1e8",  # 🇹🇨
+    "\U0001f1f9\U0001f1e9",  # 🇹🇩
+    "\U0001f1f9\U0001f1eb",  # 🇹🇫
+    "\U0001f1f9\U0001f1ec",  # 🇹🇬
+    "\U0001f1f9\U0001f1ed",  # 🇹🇭
+    "\U0001f1f9\U0001f1ef",  # 🇹🇯
+    "\U0001f1f9\U0001f1f0",  # 🇹🇰
+    "\U0001f1f9\U0001f1f1",  # 🇹🇱
+    "\U0001f1f9\U0001f1f2",  # 🇹🇲
+    "\U0001f1f9\U0001f1f3",  # 🇹🇳
+    "\U0001f1f9\U0001f1f4",  # 🇹🇴
+    "\U0001f1f9\U0001f1f7",  # 🇹🇷
+    "\U0001f1f9\U0001f1f9",  # 🇹🇹
+    "\U0001f1f9\U0001f1fb",  # 🇹🇻
+    "\U0001f1f9\U0001f1fc",  # 🇹🇼
+    "\U0001f1f9\U0001f1ff",  # 🇹🇿
+    "\U0001f1fa\U0001f1e6",  # 🇺🇦
+    "\U0001f1fa\U0001f1ec",  # 🇺🇬
+    "\U0001f1fa\U0001f1f2",  # 🇺🇲
+    "\U0001f1fa\U0001f1f3",  # 🇺🇳
+    "\U0001f1fa\U0001f1f8",  # 🇺🇸
+    "\U0001f1fa\U0001f1fe",  # 🇺🇾
+    "\U0001f1fa\U0001f1ff",  # 🇺🇿
+    "\U0001f1fb\U0001f1e6",  # 🇻🇦
+    "\U0001f1fb\U0001f1e8",  # 🇻🇨
+    "\U0001f1fb\U0001f1ea",  # 🇻🇪
+    "\U0001f1fb\U0001f1ec",  # 🇻🇬
+    "\U0001f1fb\U0001f1ee",  # 🇻🇮
+    "\U0001f1fb\U0001f1f3",  # 🇻🇳
+    "\U0001f1fb\U0001f1fa",  # 🇻🇺
+    "\U0001f1fc\U0001f1eb",  # 🇼🇫
+    "\U0001f1fc\U0001f1f8",  # 🇼🇸
+    "\U0001f1fd\U0001f1f0",  # 🇽🇰
+    "\U0001f1fe\U0001f1ea",  # 🇾🇪
+    "\U0001f1fe\U0001f1f9",  # 🇾🇹
+    "\U0001f1ff\U0001f1e6",  # 🇿🇦
+    "\U0001f1ff\U0001f1f2",  # 🇿🇲
+    "\U0001f1ff\U0001f1fc",  # 🇿🇼
+    "\U0001f202\ufe0f",  # 🈂️
+    "\U0001f237\ufe0f",  # 🈷️
+    "\U0001f321\ufe0f",  # 🌡️
+    "\U0001f324\ufe0f",  # 🌤️
+    "\U0001f325\ufe0f",  # 🌥️
+    "\U0001f326\ufe0f",  # 🌦️
+    "\U0001f327\ufe0f",  # 🌧️
+    "\U0001f328\ufe0f",  # 🌨️
+    "\U0001f329\ufe0f",  # 🌩️
+    "\U0001f32a\ufe0f",  # 🌪️
+    "\U0001f32b\ufe0f",  # 🌫️
+    "\U0001f32c\ufe0f",  # 🌬️
+    "\U0001f336\ufe0f",  # 🌶️
+    "\U0001f344\u200d\U0001f7eb",  # 🍄‍🟫
+    "\U0001f34b\u200d\U0001f7e9",  # 🍋‍🟩
+    "\U0001f37d\ufe0f",  # 🍽️
+    "\U0001f385\U0001f3fb",  # 🎅🏻
+    "\U0001f385\U0001f3fc",  # 🎅🏼
+    "\U0001f385\U0001f3fd",  # 🎅🏽
+    "\U0001f385\U0001f3fe",  # 🎅🏾
+    "\U0001f385\U0001f3ff",  # 🎅🏿
+    "\U0001f396\ufe0f",  # 🎖️
+    "\U0001f397\ufe0f",  # 🎗️
+    "\U0001f399\ufe0f",  # 🎙️
+    "\U0001f39a\ufe0f",  # 🎚️
+    "\U0001f39b\ufe0f",  # 🎛️
+    "\U0001f39e\ufe0f",  # 🎞️
+    "\U0001f39f\ufe0f",  # 🎟️
+    "\U0001f3c2\U0001f3fb",  # 🏂🏻
+    "\U0001f3c2\U0001f3fc",  # 🏂🏼
+    "\U0001f3c2\U0001f3fd",  # 🏂🏽
+    "\U0001f3c2\U0001f3fe",  # 🏂🏾
+    "\U0001f3c2\U0001f3ff",  # 🏂🏿
+    "\U0001f3c3\u200d\u2640",  # 🏃‍♀
+    "\U0001f3c3\u200d\u2640\u200d\u27a1",  # 🏃‍♀‍➡
+    "\U0001f3c3\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃‍♀‍➡️
+    "\U0001f3c3\u200d\u2640\ufe0f",  # 🏃‍♀️
+    "\U0001f3c3\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃‍♀️‍➡
+    "\U0001f3c3\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃‍♀️‍➡️
+    "\U0001f3c3\u200d\u2642",  # 🏃‍♂
+    "\U0001f3c3\u200d\u2642\u200d\u27a1",  # 🏃‍♂‍➡
+    "\U0001f3c3\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃‍♂‍➡️
+    "\U0001f3c3\u200d\u2642\ufe0f",  # 🏃‍♂️
+    "\U0001f3c3\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃‍♂️‍➡
+    "\U0001f3c3\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃‍♂️‍➡️
+    "\U0001f3c3\u200d\u27a1",  # 🏃‍➡
+    "\U0001f3c3\u200d\u27a1\ufe0f",  # 🏃‍➡️
+    "\U0001f3c3\U0001f3fb",  # 🏃🏻
+    "\U0001f3c3\U0001f3fb\u200d\u2640",  # 🏃🏻‍♀
+    "\U0001f3c3\U0001f3fb\u200d\u2640\u200d\u27a1",  # 🏃🏻‍♀‍➡
+    "\U0001f3c3\U0001f3fb\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃🏻‍♀‍➡️
+    "\U0001f3c3\U0001f3fb\u200d\u2640\ufe0f",  # 🏃🏻‍♀️
+    "\U0001f3c3\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃🏻‍♀️‍➡
+    "\U0001f3c3\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏻‍♀️‍➡️
+    "\U0001f3c3\U0001f3fb\u200d\u2642",  # 🏃🏻‍♂
+    "\U0001f3c3\U0001f3fb\u200d\u2642\u200d\u27a1",  # 🏃🏻‍♂‍➡
+    "\U0001f3c3\U0001f3fb\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃🏻‍♂‍➡️
+    "\U0001f3c3\U0001f3fb\u200d\u2642\ufe0f",  # 🏃🏻‍♂️
+    "\U0001f3c3\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃🏻‍♂️‍➡
+    "\U0001f3c3\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏻‍♂️‍➡️
+    "\U0001f3c3\U0001f3fb\u200d\u27a1",  # 🏃🏻‍➡
+    "\U0001f3c3\U0001f3fb\u200d\u27a1\ufe0f",  # 🏃🏻‍➡️
+    "\U0001f3c3\U0001f3fc",  # 🏃🏼
+    "\U0001f3c3\U0001f3fc\u200d\u2640",  # 🏃🏼‍♀
+    "\U0001f3c3\U0001f3fc\u200d\u2640\u200d\u27a1",  # 🏃🏼‍♀‍➡
+    "\U0001f3c3\U0001f3fc\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃🏼‍♀‍➡️
+    "\U0001f3c3\U0001f3fc\u200d\u2640\ufe0f",  # 🏃🏼‍♀️
+    "\U0001f3c3\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃🏼‍♀️‍➡
+    "\U0001f3c3\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏼‍♀️‍➡️
+    "\U0001f3c3\U0001f3fc\u200d\u2642",  # 🏃🏼‍♂
+    "\U0001f3c3\U0001f3fc\u200d\u2642\u200d\u27a1",  # 🏃🏼‍♂‍➡
+    "\U0001f3c3\U0001f3fc\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃🏼‍♂‍➡️
+    "\U0001f3c3\U0001f3fc\u200d\u2642\ufe0f",  # 🏃🏼‍♂️
+    "\U0001f3c3\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃🏼‍♂️‍➡
+    "\U0001f3c3\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏼‍♂️‍➡️
+    "\U0001f3c3\U0001f3fc\u200d\u27a1",  # 🏃🏼‍➡
+    "\U0001f3c3\U0001f3fc\u200d\u27a1\ufe0f",  # 🏃🏼‍➡️
+    "\U0001f3c3\U0001f3fd",  # 🏃🏽
+    "\U0001f3c3\U0001f3fd\u200d\u2640",  # 🏃🏽‍♀
+    "\U0001f3c3\U0001f3fd\u200d\u2640\u200d\u27a1",  # 🏃🏽‍♀‍➡
+    "\U0001f3c3\U0001f3fd\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃🏽‍♀‍➡️
+    "\U0001f3c3\U0001f3fd\u200d\u2640\ufe0f",  # 🏃🏽‍♀️
+    "\U0001f3c3\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃🏽‍♀️‍➡
+    "\U0001f3c3\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏽‍♀️‍➡️
+    "\U0001f3c3\U0001f3fd\u200d\u2642",  # 🏃🏽‍♂
+    "\U0001f3c3\U0001f3fd\u200d\u2642\u200d\u27a1",  # 🏃🏽‍♂‍➡
+    "\U0001f3c3\U0001f3fd\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃🏽‍♂‍➡️
+    "\U0001f3c3\U0001f3fd\u200d\u2642\ufe0f",  # 🏃🏽‍♂️
+    "\U0001f3c3\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃🏽‍♂️‍➡
+    "\U0001f3c3\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏽‍♂️‍➡️
+    "\U0001f3c3\U0001f3fd\u200d\u27a1",  # 🏃🏽‍➡
+    "\U0001f3c3\U0001f3fd\u200d\u27a1\ufe0f",  # 🏃🏽‍➡️
+    "\U0001f3c3\U0001f3fe",  # 🏃🏾
+    "\U0001f3c3\U0001f3fe\u200d\u2640",  # 🏃🏾‍♀
+    "\U0001f3c3\U0001f3fe\u200d\u2640\u200d\u27a1",  # 🏃🏾‍♀‍➡
+    "\U0001f3c3\U0001f3fe\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃🏾‍♀‍➡️
+    "\U0001f3c3\U0001f3fe\u200d\u2640\ufe0f",  # 🏃🏾‍♀️
+    "\U0001f3c3\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃🏾‍♀️‍➡
+    "\U0001f3c3\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏾‍♀️‍➡️
+    "\U0001f3c3\U0001f3fe\u200d\u2642",  # 🏃🏾‍♂
+    "\U0001f3c3\U0001f3fe\u200d\u2642\u200d\u27a1",  # 🏃🏾‍♂‍➡
+    "\U0001f3c3\U0001f3fe\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃🏾‍♂‍➡️
+    "\U0001f3c3\U0001f3fe\u200d\u2642\ufe0f",  # 🏃🏾‍♂️
+    "\U0001f3c3\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃🏾‍♂️‍➡
+    "\U0001f3c3\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏾‍♂️‍➡️
+    "\U0001f3c3\U0001f3fe\u200d\u27a1",  # 🏃🏾‍➡
+    "\U0001f3c3\U0001f3fe\u200d\u27a1\ufe0f",  # 🏃🏾‍➡️
+    "\U0001f3c3\U0001f3ff",  # 🏃🏿
+    "\U0001f3c3\U0001f3ff\u200d\u2640",  # 🏃🏿‍♀
+    "\U0001f3c3\U0001f3ff\u200d\u2640\u200d\u27a1",  # 🏃🏿‍♀‍➡
+    "\U0001f3c3\U0001f3ff\u200d\u2640\u200d\u27a1\ufe0f",  # 🏃🏿‍♀‍➡️
+    "\U0001f3c3\U0001f3ff\u200d\u2640\ufe0f",  # 🏃🏿‍♀️
+    "\U0001f3c3\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1",  # 🏃🏿‍♀️‍➡
+    "\U0001f3c3\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏿‍♀️‍➡️
+    "\U0001f3c3\U0001f3ff\u200d\u2642",  # 🏃🏿‍♂
+    "\U0001f3c3\U0001f3ff\u200d\u2642\u200d\u27a1",  # 🏃🏿‍♂‍➡
+    "\U0001f3c3\U0001f3ff\u200d\u2642\u200d\u27a1\ufe0f",  # 🏃🏿‍♂‍➡️
+    "\U0001f3c3\U0001f3ff\u200d\u2642\ufe0f",  # 🏃🏿‍♂️
+    "\U0001f3c3\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1",  # 🏃🏿‍♂️‍➡
+    "\U0001f3c3\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🏃🏿‍♂️‍➡️
+    "\U0001f3c3\U0001f3ff\u200d\u27a1",  # 🏃🏿‍➡
+    "\U0001f3c3\U0001f3ff\u200d\u27a1\ufe0f",  # 🏃🏿‍➡️
+    "\U0001f3c4\u200d\u2640",  # 🏄‍♀
+    "\U0001f3c4\u200d\u2640\ufe0f",  # 🏄‍♀️
+    "\U0001f3c4\u200d\u2642",  # 🏄‍♂
+    "\U0001f3c4\u200d\u2642\ufe0f",  # 🏄‍♂️
+    "\U0001f3c4\U0001f3fb",  # 🏄🏻
+    "\U0001f3c4\U0001f3fb\u200d\u2640",  # 🏄🏻‍♀
+    "\U0001f3c4\U0001f3fb\u200d\u2640\ufe0f",  # 🏄🏻‍♀️
+    "\U0001f3c4\U0001f3fb\u200d\u2642",  # 🏄🏻‍♂
+    "\U0001f3c4\U0001f3fb\u200d\u2642\ufe0f",  # 🏄🏻‍♂️
+    "\U0001f3c4\U0001f3fc",  # 🏄🏼
+    "\U0001f3c4\U0001f3fc\u200d\u2640",  # 🏄🏼‍♀
+    "\U0001f3c4\U0001f3fc\u200d\u2640\ufe0f",  # 🏄🏼‍♀️
+    "\U0001f3c4\U0001f3fc\u200d\u2642",  # 🏄🏼‍♂
+    "\U0001f3c4\U0001f3fc\u200d\u2642\ufe0f",  # 🏄🏼‍♂️
+    "\U0001f3c4\U0001f3fd",  # 🏄🏽
+    "\U0001f3c4\U0001f3fd\u200d\u2640",  # 🏄🏽‍♀
+    "\U0001f3c4\U0001f3fd\u200d\u2640\ufe0f",  # 🏄🏽‍♀️
+    "\U0001f3c4\U0001f3fd\u200d\u2642",  # 🏄🏽‍♂
+    "\U0001f3c4\U0001f3fd\u200d\u2642\ufe0f",  # 🏄🏽‍♂️
+    "\U0001f3c4\U0001f3fe",  # 🏄🏾
+    "\U0001f3c4\U0001f3fe\u200d\u2640",  # 🏄🏾‍♀
+    "\U0001f3c4\U0001f3fe\u200d\u2640\ufe0f",  # 🏄🏾‍♀️
+    "\U0001f3c4\U0001f3fe\u200d\u2642",  # 🏄🏾‍♂
+    "\U0001f3c4\U0001f3fe\u200d\u2642\ufe0f",  # 🏄🏾‍♂️
+    "\U0001f3c4\U0001f3ff",  # 🏄🏿
+    "\U0001f3c4\U0001f3ff\u200d\u2640",  # 🏄🏿‍♀
+    "\U0001f3c4\U0001f3ff\u200d\u2640\ufe0f",  # 🏄🏿‍♀️
+    "\U0001f3c4\U0001f3ff\u200d\u2642",  # 🏄🏿‍♂
+    "\U0001f3c4\U0001f3ff\u200d\u2642\ufe0f",  # 🏄🏿‍♂️
+    "\U0001f3c7\U0001f3fb",  # 🏇🏻
+    "\U0001f3c7\U0001f3fc",  # 🏇🏼
+    "\U0001f3c7\U0001f3fd",  # 🏇🏽
+    "\U0001f3c7\U0001f3fe",  # 🏇🏾
+    "\U0001f3c7\U0001f3ff",  # 🏇🏿
+    "\U0001f3ca\u200d\u2640",  # 🏊‍♀
+    "\U0001f3ca\u200d\u2640\ufe0f",  # 🏊‍♀️
+    "\U0001f3ca\u200d\u2642",  # 🏊‍♂
+    "\U0001f3ca\u200d\u2642\ufe0f",  # 🏊‍♂️
+    "\U0001f3ca\U0001f3fb",  # 🏊🏻
+    "\U0001f3ca\U0001f3fb\u200d\u2640",  # 🏊🏻‍♀
+    "\U0001f3ca\U0001f3fb\u200d\u2640\ufe0f",  # 🏊🏻‍♀️
+    "\U0001f3ca\U0001f3fb\u200d\u2642",  # 🏊🏻‍♂
+    "\U0001f3ca\U0001f3fb\u200d\u2642\ufe0f",  # 🏊🏻‍♂️
+    "\U0001f3ca\U0001f3fc",  # 🏊🏼
+    "\U0001f3ca\U0001f3fc\u200d\u2640",  # 🏊🏼‍♀
+    "\U0001f3ca\U0001f3fc\u200d\u2640\ufe0f",  # 🏊🏼‍♀️
+    "\U0001f3ca\U0001f3fc\u200d\u2642",  # 🏊🏼‍♂
+    "\U0001f3ca\U0001f3fc\u200d\u2642\ufe0f",  # 🏊🏼‍♂️
+    "\U0001f3ca\U0001f3fd",  # 🏊🏽
+    "\U0001f3ca\U0001f3fd\u200d\u2640",  # 🏊🏽‍♀
+    "\U0001f3ca\U0001f3fd\u200d\u2640\ufe0f",  # 🏊🏽‍♀️
+    "\U0001f3ca\U0001f3fd\u200d\u2642",  # 🏊🏽‍♂
+    "\U0001f3ca\U0001f3fd\u200d\u2642\ufe0f",  # 🏊🏽‍♂️
+    "\U0001f3ca\U0001f3fe",  # 🏊🏾
+    "\U0001f3ca\U0001f3fe\u200d\u2640",  # 🏊🏾‍♀
+    "\U0001f3ca\U0001f3fe\u200d\u2640\ufe0f",  # 🏊🏾‍♀️
+    "\U0001f3ca\U0001f3fe\u200d\u2642",  # 🏊🏾‍♂
+    "\U0001f3ca\U0001f3fe\u200d\u2642\ufe0f",  # 🏊🏾‍♂️
+    "\U0001f3ca\U0001f3ff",  # 🏊🏿
+    "\U0001f3ca\U0001f3ff\u200d\u2640",  # 🏊🏿‍♀
+    "\U0001f3ca\U0001f3ff\u200d\u2640\ufe0f",  # 🏊🏿‍♀️
+    "\U0001f3ca\U0001f3ff\u200d\u2642",  # 🏊🏿‍♂
+    "\U0001f3ca\U0001f3ff\u200d\u2642\ufe0f",  # 🏊🏿‍♂️
+    "\U0001f3cb\u200d\u2640",  # 🏋‍♀
+    "\U0001f3cb\u200d\u2640\ufe0f",  # 🏋‍♀️
+    "\U0001f3cb\u200d\u2642",  # 🏋‍♂
+    "\U0001f3cb\u200d\u2642\ufe0f",  # 🏋‍♂️
+    "\U0001f3cb\ufe0f",  # 🏋️
+    "\U0001f3cb\ufe0f\u200d\u2640",  # 🏋️‍♀
+    "\U0001f3cb\ufe0f\u200d\u2640\ufe0f",  # 🏋️‍♀️
+    "\U0001f3cb\ufe0f\u200d\u2642",  # 🏋️‍♂
+    "\U0001f3cb\ufe0f\u200d\u2642\ufe0f",  # 🏋️‍♂️
+    "\U0001f3cb\U0001f3fb",  # 🏋🏻
+    "\U0001f3cb\U0001f3fb\u200d\u2640",  # 🏋🏻‍♀
+    "\U0001f3cb\U0001f3fb\u200d\u2640\ufe0f",  # 🏋🏻‍♀️
+    "\U0001f3cb\U0001f3fb\u200d\u2642",  # 🏋🏻‍♂
+    "\U0001f3cb\U0001f3fb\u200d\u2642\ufe0f",  # 🏋🏻‍♂️
+    "\U0001f3cb\U0001f3fc",  # 🏋🏼
+    "\U0001f3cb\U0001f3fc\u200d\u2640",  # 🏋🏼‍♀
+    "\U0001f3cb\U0001f3fc\u200d\u2640\ufe0f",  # 🏋🏼‍♀️
+    "\U0001f3cb\U0001f3fc\u200d\u2642",  # 🏋🏼‍♂
+    "\U0001f3cb\U0001f3fc\u200d\u2642\ufe0f",  # 🏋🏼‍♂️
+    "\U0001f3cb\U0001f3fd",  # 🏋🏽
+    "\U0001f3cb\U0001f3fd\u200d\u2640",  # 🏋🏽‍♀
+    "\U0001f3cb\U0001f3fd\u200d\u2640\ufe0f",  # 🏋🏽‍♀️
+    "\U0001f3cb\U0001f3fd\u200d\u2642",  # 🏋🏽‍♂
+    "\U0001f3cb\U0001f3fd\u200d\u2642\ufe0f",  # 🏋🏽‍♂️
+    "\U0001f3cb\U0001f3fe",  # 🏋🏾
+    "\U0001f3cb\U0001f3fe\u200d\u2640",  # 🏋🏾‍♀
+    "\U0001f3cb\U0001f3fe\u200d\u2640\ufe0f",  # 🏋🏾‍♀️
+    "\U0001f3cb\U0001f3fe\u200d\u2642",  # 🏋🏾‍♂
+    "\U0001f3cb\U0001f3fe\u200d\u2642\ufe0f",  # 🏋🏾‍♂️
+    "\U0001f3cb\U0001f3ff",  # 🏋🏿
+    "\U0001f3cb\U0001f3ff\u200d\u2640",  # 🏋🏿‍♀
+    "\U0001f3cb\U0001f3ff\u200d\u2640\ufe0f",  # 🏋🏿‍♀️
+    "\U0001f3cb\U0001f3ff\u200d\u2642",  # 🏋🏿‍♂
+    "\U0001f3cb\U0001f3ff\u200d\u2642\ufe0f",  # 🏋🏿‍♂️
+    "\U0001f3cc\u200d\u2640",  # 🏌‍♀
+    "\U0001f3cc\u200d\u2640\ufe0f",  # 🏌‍♀️
+    "\U0001f3cc\u200d\u2642",  # 🏌‍♂
+    "\U0001f3cc\u200d\u2642\ufe0f",  # 🏌‍♂️
+    "\U0001f3cc\ufe0f",  # 🏌️
+    "\U0001f3cc\ufe0f\u200d\u2640",  # 🏌️‍♀
+    "\U0001f3cc\ufe0f\u200d\u2640\ufe0f",  # 🏌️‍♀️
+    "\U0001f3cc\ufe0f\u200d\u2642",  # 🏌️‍♂
+    "\U0001f3cc\ufe0f\u200d\u2642\ufe0f",  # 🏌️‍♂️
+    "\U0001f3cc\U0001f3fb",  # 🏌🏻
+    "\U0001f3cc\U0001f3fb\u200d\u2640",  # 🏌🏻‍♀
+    "\U0001f3cc\U0001f3fb\u200d\u2640\ufe0f",  # 🏌🏻‍♀️
+    "\U0001f3cc\U0001f3fb\u200d\u2642",  # 🏌🏻‍♂
+    "\U0001f3cc\U0001f3fb\u200d\u2642\ufe0f",  # 🏌🏻‍♂️
+    "\U0001f3cc\U0001f3fc",  # 🏌🏼
+    "\U0001f3cc\U0001f3fc\u200d\u2640",  # 🏌🏼‍♀
+    "\U0001f3cc\U0001f3fc\u200d\u2640\ufe0f",  # 🏌🏼‍♀️
+    "\U0001f3cc\U0001f3fc\u200d\u2642",  # 🏌🏼‍♂
+    "\U0001f3cc\U0001f3fc\u200d\u2642\ufe0f",  # 🏌🏼‍♂️
+    "\U0001f3cc\U0001f3fd",  # 🏌🏽
+    "\U0001f3cc\U0001f3fd\u200d\u2640",  # 🏌🏽‍♀
+    "\U0001f3cc\U0001f3fd\u200d\u2640\ufe0f",  # 🏌🏽‍♀️
+    "\U0001f3cc\U0001f3fd\u200d\u2642",  # 🏌🏽‍♂
+    "\U0001f3cc\U0001f3fd\u200d\u2642\ufe0f",  # 🏌🏽‍♂️
+    "\U0001f3cc\U0001f3fe",  # 🏌🏾
+    "\U0001f3cc\U0001f3fe\u200d\u2640",  # 🏌🏾‍♀
+    "\U0001f3cc\U0001f3fe\u200d\u2640\ufe0f",  # 🏌🏾‍♀️
+    "\U0001f3cc\U0001f3fe\u200d\u2642",  # 🏌🏾‍♂
+    "\U0001f3cc\U0001f3fe\u200d\u2642\ufe0f",  # 🏌🏾‍♂️
+    "\U0001f3cc\U0001f3ff",  # 🏌🏿
+    "\U0001f3cc\U0001f3ff\u200d\u2640",  # 🏌🏿‍♀
+    "\U0001f3cc\U0001f3ff\u200d\u2640\ufe0f",  # 🏌🏿‍♀️
+    "\U0001f3cc\U0001f3ff\u200d\u2642",  # 🏌🏿‍♂
+    "\U0001f3cc\U0001f3ff\u200d\u2642\ufe0f",  # 🏌🏿‍♂️
+    "\U0001f3cd\ufe0f",  # 🏍️
+    "\U0001f3ce\ufe0f",  # 🏎️
+    "\U0001f3d4\ufe0f",  # 🏔️
+    "\U0001f3d5\ufe0f",  # 🏕️
+    "\U0001f3d6\ufe0f",  # 🏖️
+    "\U0001f3d7\ufe0f",  # 🏗️
+    "\U0001f3d8\ufe0f",  # 🏘️
+    "\U0001f3d9\ufe0f",  # 🏙️
+    "\U0001f3da\ufe0f",  # 🏚️
+    "\U0001f3db\ufe0f",  # 🏛️
+    "\U0001f3dc\ufe0f",  # 🏜️
+    "\U0001f3dd\ufe0f",  # 🏝️
+    "\U0001f3de\ufe0f",  # 🏞️
+    "\U0001f3df\ufe0f",  # 🏟️
+    "\U0001f3f3\u200d\u26a7",  # 🏳‍⚧
+    "\U0001f3f3\u200d\u26a7\ufe0f",  # 🏳‍⚧️
+    "\U0001f3f3\u200d\U0001f308",  # 🏳‍🌈
+    "\U0001f3f3\ufe0f",  # 🏳️
+    "\U0001f3f3\ufe0f\u200d\u26a7",  # 🏳️‍⚧
+    "\U0001f3f3\ufe0f\u200d\u26a7\ufe0f",  # 🏳️‍⚧️
+    "\U0001f3f3\ufe0f\u200d\U0001f308",  # 🏳️‍🌈
+    "\U0001f3f4\u200d\u2620",  # 🏴‍☠
+    "\U0001f3f4\u200d\u2620\ufe0f",  # 🏴‍☠️
+    "\U0001f3f4\U000e0067\U000e0062\U000e0065\U000e006e\U000e0067\U000e007f",  # 🏴󠁧󠁢󠁥󠁮󠁧󠁿
+    "\U0001f3f4\U000e0067\U000e0062\U000e0073\U000e0063\U000e0074\U000e007f",  # 🏴󠁧󠁢󠁳󠁣󠁴󠁿
+    "\U0001f3f4\U000e0067\U000e0062\U000e0077\U000e006c\U000e0073\U000e007f",  # 🏴󠁧󠁢󠁷󠁬󠁳󠁿
+    "\U0001f3f5\ufe0f",  # 🏵️
+    "\U0001f3f7\ufe0f",  # 🏷️
+    "\U0001f408\u200d\u2b1b",  # 🐈‍⬛
+    "\U0001f415\u200d\U0001f9ba",  # 🐕‍🦺
+    "\U0001f426\u200d\u2b1b",  # 🐦‍⬛
+    "\U0001f426\u200d\U0001f525",  # 🐦‍🔥
+    "\U0001f43b\u200d\u2744",  # 🐻‍❄
+    "\U0001f43b\u200d\u2744\ufe0f",  # 🐻‍❄️
+    "\U0001f43f\ufe0f",  # 🐿️
+    "\U0001f441\u200d\U0001f5e8",  # 👁‍🗨
+    "\U0001f441\u200d\U0001f5e8\ufe0f",  # 👁‍🗨️
+    "\U0001f441\ufe0f",  # 👁️
+    "\U0001f441\ufe0f\u200d\U0001f5e8",  # 👁️‍🗨
+    "\U0001f441\ufe0f\u200d\U0001f5e8\ufe0f",  # 👁️‍🗨️
+    "\U0001f442\U0001f3fb",  # 👂🏻
+    "\U0001f442\U0001f3fc",  # 👂🏼
+    "\U0001f442\U0001f3fd",  # 👂🏽
+    "\U0001f442\U0001f3fe",  # 👂🏾
+    "\U0001f442\U0001f3ff",  # 👂🏿
+    "\U0001f443\U0001f3fb",  # 👃🏻
+    "\U0001f443\U0001f3fc",  # 👃🏼
+    "\U0001f443\U0001f3fd",  # 👃🏽
+    "\U0001f443\U0001f3fe",  # 👃🏾
+    "\U0001f443\U0001f3ff",  # 👃🏿
+    "\U0001f446\U0001f3fb",  # 👆🏻
+    "\U0001f446\U0001f3fc",  # 👆🏼
+    "\U0001f446\U0001f3fd",  # 👆🏽
+    "\U0001f446\U0001f3fe",  # 👆🏾
+    "\U0001f446\U0001f3ff",  # 👆🏿
+    "\U0001f447\U0001f3fb",  # 👇🏻
+    "\U0001f447\U0001f3fc",  # 👇🏼
+    "\U0001f447\U0001f3fd",  # 👇🏽
+    "\U0001f447\U0001f3fe",  # 👇🏾
+    "\U0001f447\U0001f3ff",  # 👇🏿
+    "\U0001f448\U0001f3fb",  # 👈🏻
+    "\U0001f448\U0001f3fc",  # 👈🏼
+    "\U0001f448\U0001f3fd",  # 👈🏽
+    "\U0001f448\U0001f3fe",  # 👈🏾
+    "\U0001f448\U0001f3ff",  # 👈🏿
+    "\U0001f449\U0001f3fb",  # 👉🏻
+    "\U0001f449\U0001f3fc",  # 👉🏼
+    "\U0001f449\U0001f3fd",  # 👉🏽
+    "\U0001f449\U0001f3fe",  # 👉🏾
+    "\U0001f449\U0001f3ff",  # 👉🏿
+    "\U0001f44a\U0001f3fb",  # 👊🏻
+    "\U0001f44a\U0001f3fc",  # 👊🏼
+    "\U0001f44a\U0001f3fd",  # 👊🏽
+    "\U0001f44a\U0001f3fe",  # 👊🏾
+    "\U0001f44a\U0001f3ff",  # 👊🏿
+    "\U0001f44b\U0001f3fb",  # 👋🏻
+    "\U0001f44b\U0001f3fc",  # 👋🏼
+    "\U0001f44b\U0001f3fd",  # 👋🏽
+    "\U0001f44b\U0001f3fe",  # 👋🏾
+    "\U0001f44b\U0001f3ff",  # 👋🏿
+    "\U0001f44c\U0001f3fb",  # 👌🏻
+    "\U0001f44c\U0001f3fc",  # 👌🏼
+    "\U0001f44c\U0001f3fd",  # 👌🏽
+    "\U0001f44c\U0001f3fe",  # 👌🏾
+    "\U0001f44c\U0001f3ff",  # 👌🏿
+    "\U0001f44d\U0001f3fb",  # 👍🏻
+    "\U0001f44d\U0001f3fc",  # 👍🏼
+    "\U0001f44d\U0001f3fd",  # 👍🏽
+    "\U0001f44d\U0001f3fe",  # 👍🏾
+    "\U0001f44d\U0001f3ff",  # 👍🏿
+    "\U0001f44e\U0001f3fb",  # 👎🏻
+    "\U0001f44e\U0001f3fc",  # 👎🏼
+    "\U0001f44e\U0001f3fd",  # 👎🏽
+    "\U0001f44e\U0001f3fe",  # 👎🏾
+    "\U0001f44e\U0001f3ff",  # 👎🏿
+    "\U0001f44f\U0001f3fb",  # 👏🏻
+    "\U0001f44f\U0001f3fc",  # 👏🏼
+    "\U0001f44f\U0001f3fd",  # 👏🏽
+    "\U0001f44f\U0001f3fe",  # 👏🏾
+    "\U0001f44f\U0001f3ff",  # 👏🏿
+    "\U0001f450\U0001f3fb",  # 👐🏻
+    "\U0001f450\U0001f3fc",  # 👐🏼
+    "\U0001f450\U0001f3fd",  # 👐🏽
+    "\U0001f450\U0001f3fe",  # 👐🏾
+    "\U0001f450\U0001f3ff",  # 👐🏿
+    "\U0001f466\U0001f3fb",  # 👦🏻
+    "\U0001f466\U0001f3fc",  # 👦🏼
+    "\U0001f466\U0001f3fd",  # 👦🏽
+    "\U0001f466\U0001f3fe",  # 👦🏾
+    "\U0001f466\U0001f3ff",  # 👦🏿
+    "\U0001f467\U0001f3fb",  # 👧🏻
+    "\U0001f467\U0001f3fc",  # 👧🏼
+    "\U0001f467\U0001f3fd",  # 👧🏽
+    "\U0001f467\U0001f3fe",  # 👧🏾
+    "\U0001f467\U0001f3ff",  # 👧🏿
+    "\U0001f468\u200d\u2695",  # 👨‍⚕
+    "\U0001f468\u200d\u2695\ufe0f",  # 👨‍⚕️
+    "\U0001f468\u200d\u2696",  # 👨‍⚖
+    "\U0001f468\u200d\u2696\ufe0f",  # 👨‍⚖️
+    "\U0001f468\u200d\u2708",  # 👨‍✈
+    "\U0001f468\u200d\u2708\ufe0f",  # 👨‍✈️
+    "\U0001f468\u200d\u2764\u200d\U0001f468",  # 👨‍❤‍👨
+    "\U0001f468\u200d\u2764\u200d\U0001f48b\u200d\U0001f468",  # 👨‍❤‍💋‍👨
+    "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f468",  # 👨‍❤️‍👨
+    "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468",  # 👨‍❤️‍💋‍👨
+    "\U0001f468\u200d\U0001f33e",  # 👨‍🌾
+    "\U0001f468\u200d\U0001f373",  # 👨‍🍳
+    "\U0001f468\u200d\U0001f37c",  # 👨‍🍼
+    "\U0001f468\u200d\U0001f393",  # 👨‍🎓
+    "\U0001f468\u200d\U0001f3a4",  # 👨‍🎤
+    "\U0001f468\u200d\U0001f3a8",  # 👨‍🎨
+    "\U0001f468\u200d\U0001f3eb",  # 👨‍🏫
+    "\U0001f468\u200d\U0001f3ed",  # 👨‍🏭
+    "\U0001f468\u200d\U0001f466",  # 👨‍👦
+    "\U0001f468\u200d\U0001f466\u200d\U0001f466",  # 👨‍👦‍👦
+    "\U0001f468\u200d\U0001f467",  # 👨‍👧
+    "\U0001f468\u200d\U0001f467\u200d\U0001f466",  # 👨‍👧‍👦
+    "\U0001f468\u200d\U0001f467\u200d\U0001f467",  # 👨‍👧‍👧
+    "\U0001f468\u200d\U0001f468\u200d\U0001f466",  # 👨‍👨‍👦
+    "\U0001f468\u200d\U0001f468\u200d\U0001f466\u200d\U0001f466",  # 👨‍👨‍👦‍👦
+    "\U0001f468\u200d\U0001f468\u200d\U0001f467",  # 👨‍👨‍👧
+    "\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f466",  # 👨‍👨‍👧‍👦
+    "\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f467",  # 👨‍👨‍👧‍👧
+    "\U0001f468\u200d\U0001f469\u200d\U0001f466",  # 👨‍👩‍👦
+    "\U0001f468\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466",  # 👨‍👩‍👦‍👦
+    "\U0001f468\u200d\U0001f469\u200d\U0001f467",  # 👨‍👩‍👧
+    "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466",  # 👨‍👩‍👧‍👦
+    "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467",  # 👨‍👩‍👧‍👧
+    "\U0001f468\u200d\U0001f4bb",  # 👨‍💻
+    "\U0001f468\u200d\U0001f4bc",  # 👨‍💼
+    "\U0001f468\u200d\U0001f527",  # 👨‍🔧
+    "\U0001f468\u200d\U0001f52c",  # 👨‍🔬
+    "\U0001f468\u200d\U0001f680",  # 👨‍🚀
+    "\U0001f468\u200d\U0001f692",  # 👨‍🚒
+    "\U0001f468\u200d\U0001f9af",  # 👨‍🦯
+    "\U0001f468\u200d\U0001f9af\u200d\u27a1",  # 👨‍🦯‍➡
+    "\U0001f468\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨‍🦯‍➡️
+    "\U0001f468\u200d\U0001f9b0",  # 👨‍🦰
+    "\U0001f468\u200d\U0001f9b1",  # 👨‍🦱
+    "\U0001f468\u200d\U0001f9b2",  # 👨‍🦲
+    "\U0001f468\u200d\U0001f9b3",  # 👨‍🦳
+    "\U0001f468\u200d\U0001f9bc",  # 👨‍🦼
+    "\U0001f468\u200d\U0001f9bc\u200d\u27a1",  # 👨‍🦼‍➡
+    "\U0001f468\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨‍🦼‍➡️
+    "\U0001f468\u200d\U0001f9bd",  # 👨‍🦽
+    "\U0001f468\u200d\U0001f9bd\u200d\u27a1",  # 👨‍🦽‍➡
+    "\U0001f468\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨‍🦽‍➡️
+    "\U0001f468\U0001f3fb",  # 👨🏻
+    "\U0001f468\U0001f3fb\u200d\u2695",  # 👨🏻‍⚕
+    "\U0001f468\U0001f3fb\u200d\u2695\ufe0f",  # 👨🏻‍⚕️
+    "\U0001f468\U0001f3fb\u200d\u2696",  # 👨🏻‍⚖
+    "\U0001f468\U0001f3fb\u200d\u2696\ufe0f",  # 👨🏻‍⚖️
+    "\U0001f468\U0001f3fb\u200d\u2708",  # 👨🏻‍✈
+    "\U0001f468\U0001f3fb\u200d\u2708\ufe0f",  # 👨🏻‍✈️
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👨🏻‍❤‍👨🏻
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👨🏻‍❤‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👨🏻‍❤‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👨🏻‍❤‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👨🏻‍❤‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏻‍❤‍💋‍👨🏻
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏻‍❤‍💋‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏻‍❤‍💋‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏻‍❤‍💋‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏻‍❤‍💋‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👨🏻‍❤️‍👨🏻
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👨🏻‍❤️‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👨🏻‍❤️‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👨🏻‍❤️‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👨🏻‍❤️‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏻‍❤️‍💋‍👨🏻
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏻‍❤️‍💋‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏻‍❤️‍💋‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏻‍❤️‍💋‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏻‍❤️‍💋‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\U0001f33e",  # 👨🏻‍🌾
+    "\U0001f468\U0001f3fb\u200d\U0001f373",  # 👨🏻‍🍳
+    "\U0001f468\U0001f3fb\u200d\U0001f37c",  # 👨🏻‍🍼
+    "\U0001f468\U0001f3fb\u200d\U0001f393",  # 👨🏻‍🎓
+    "\U0001f468\U0001f3fb\u200d\U0001f3a4",  # 👨🏻‍🎤
+    "\U0001f468\U0001f3fb\u200d\U0001f3a8",  # 👨🏻‍🎨
+    "\U0001f468\U0001f3fb\u200d\U0001f3eb",  # 👨🏻‍🏫
+    "\U0001f468\U0001f3fb\u200d\U0001f3ed",  # 👨🏻‍🏭
+    "\U0001f468\U0001f3fb\u200d\U0001f430\u200d\U0001f468\U0001f3fc",  # 👨🏻‍🐰‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\U0001f430\u200d\U0001f468\U0001f3fd",  # 👨🏻‍🐰‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\U0001f430\u200d\U0001f468\U0001f3fe",  # 👨🏻‍🐰‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\U0001f430\u200d\U0001f468\U0001f3ff",  # 👨🏻‍🐰‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\U0001f4bb",  # 👨🏻‍💻
+    "\U0001f468\U0001f3fb\u200d\U0001f4bc",  # 👨🏻‍💼
+    "\U0001f468\U0001f3fb\u200d\U0001f527",  # 👨🏻‍🔧
+    "\U0001f468\U0001f3fb\u200d\U0001f52c",  # 👨🏻‍🔬
+    "\U0001f468\U0001f3fb\u200d\U0001f680",  # 👨🏻‍🚀
+    "\U0001f468\U0001f3fb\u200d\U0001f692",  # 👨🏻‍🚒
+    "\U0001f468\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👨🏻‍🤝‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👨🏻‍🤝‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👨🏻‍🤝‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👨🏻‍🤝‍👨🏿
+    "\U0001f468\U0001f3fb\u200d\U0001f9af",  # 👨🏻‍🦯
+    "\U0001f468\U0001f3fb\u200d\U0001f9af\u200d\u27a1",  # 👨🏻‍🦯‍➡
+    "\U0001f468\U0001f3fb\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨🏻‍🦯‍➡️
+    "\U0001f468\U0001f3fb\u200d\U0001f9b0",  # 👨🏻‍🦰
+    "\U0001f468\U0001f3fb\u200d\U0001f9b1",  # 👨🏻‍🦱
+    "\U0001f468\U0001f3fb\u200d\U0001f9b2",  # 👨🏻‍🦲
+    "\U0001f468\U0001f3fb\u200d\U0001f9b3",  # 👨🏻‍🦳
+    "\U0001f468\U0001f3fb\u200d\U0001f9bc",  # 👨🏻‍🦼
+    "\U0001f468\U0001f3fb\u200d\U0001f9bc\u200d\u27a1",  # 👨🏻‍🦼‍➡
+    "\U0001f468\U0001f3fb\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨🏻‍🦼‍➡️
+    "\U0001f468\U0001f3fb\u200d\U0001f9bd",  # 👨🏻‍🦽
+    "\U0001f468\U0001f3fb\u200d\U0001f9bd\u200d\u27a1",  # 👨🏻‍🦽‍➡
+    "\U0001f468\U0001f3fb\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨🏻‍🦽‍➡️
+    "\U0001f468\U0001f3fb\u200d\U0001faef\u200d\U0001f468\U0001f3fc",  # 👨🏻‍🫯‍👨🏼
+    "\U0001f468\U0001f3fb\u200d\U0001faef\u200d\U0001f468\U0001f3fd",  # 👨🏻‍🫯‍👨🏽
+    "\U0001f468\U0001f3fb\u200d\U0001faef\u200d\U0001f468\U0001f3fe",  # 👨🏻‍🫯‍👨🏾
+    "\U0001f468\U0001f3fb\u200d\U0001faef\u200d\U0001f468\U0001f3ff",  # 👨🏻‍🫯‍👨🏿
+    "\U0001f468\U0001f3fc",  # 👨🏼
+    "\U0001f468\U0001f3fc\u200d\u2695",  # 👨🏼‍⚕
+    "\U0001f468\U0001f3fc\u200d\u2695\ufe0f",  # 👨🏼‍⚕️
+    "\U0001f468\U0001f3fc\u200d\u2696",  # 👨🏼‍⚖
+    "\U0001f468\U0001f3fc\u200d\u2696\ufe0f",  # 👨🏼‍⚖️
+    "\U0001f468\U0001f3fc\u200d\u2708",  # 👨🏼‍✈
+    "\U0001f468\U0001f3fc\u200d\u2708\ufe0f",  # 👨🏼‍✈️
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👨🏼‍❤‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👨🏼‍❤‍👨🏼
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👨🏼‍❤‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👨🏼‍❤‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👨🏼‍❤‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏼‍❤‍💋‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏼‍❤‍💋‍👨🏼
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏼‍❤‍💋‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏼‍❤‍💋‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏼‍❤‍💋‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👨🏼‍❤️‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👨🏼‍❤️‍👨🏼
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👨🏼‍❤️‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👨🏼‍❤️‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👨🏼‍❤️‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏼‍❤️‍💋‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏼‍❤️‍💋‍👨🏼
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏼‍❤️‍💋‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏼‍❤️‍💋‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏼‍❤️‍💋‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\U0001f33e",  # 👨🏼‍🌾
+    "\U0001f468\U0001f3fc\u200d\U0001f373",  # 👨🏼‍🍳
+    "\U0001f468\U0001f3fc\u200d\U0001f37c",  # 👨🏼‍🍼
+    "\U0001f468\U0001f3fc\u200d\U0001f393",  # 👨🏼‍🎓
+    "\U0001f468\U0001f3fc\u200d\U0001f3a4",  # 👨🏼‍🎤
+    "\U0001f468\U0001f3fc\u200d\U0001f3a8",  # 👨🏼‍🎨
+    "\U0001f468\U0001f3fc\u200d\U0001f3eb",  # 👨🏼‍🏫
+    "\U0001f468\U0001f3fc\u200d\U0001f3ed",  # 👨🏼‍🏭
+    "\U0001f468\U0001f3fc\u200d\U0001f430\u200d\U0001f468\U0001f3fb",  # 👨🏼‍🐰‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\U0001f430\u200d\U0001f468\U0001f3fd",  # 👨🏼‍🐰‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\U0001f430\u200d\U0001f468\U0001f3fe",  # 👨🏼‍🐰‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\U0001f430\u200d\U0001f468\U0001f3ff",  # 👨🏼‍🐰‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\U0001f4bb",  # 👨🏼‍💻
+    "\U0001f468\U0001f3fc\u200d\U0001f4bc",  # 👨🏼‍💼
+    "\U0001f468\U0001f3fc\u200d\U0001f527",  # 👨🏼‍🔧
+    "\U0001f468\U0001f3fc\u200d\U0001f52c",  # 👨🏼‍🔬
+    "\U0001f468\U0001f3fc\u200d\U0001f680",  # 👨🏼‍🚀
+    "\U0001f468\U0001f3fc\u200d\U0001f692",  # 👨🏼‍🚒
+    "\U0001f468\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👨🏼‍🤝‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👨🏼‍🤝‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👨🏼‍🤝‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👨🏼‍🤝‍👨🏿
+    "\U0001f468\U0001f3fc\u200d\U0001f9af",  # 👨🏼‍🦯
+    "\U0001f468\U0001f3fc\u200d\U0001f9af\u200d\u27a1",  # 👨🏼‍🦯‍➡
+    "\U0001f468\U0001f3fc\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨🏼‍🦯‍➡️
+    "\U0001f468\U0001f3fc\u200d\U0001f9b0",  # 👨🏼‍🦰
+    "\U0001f468\U0001f3fc\u200d\U0001f9b1",  # 👨🏼‍🦱
+    "\U0001f468\U0001f3fc\u200d\U0001f9b2",  # 👨🏼‍🦲
+    "\U0001f468\U0001f3fc\u200d\U0001f9b3",  # 👨🏼‍🦳
+    "\U0001f468\U0001f3fc\u200d\U0001f9bc",  # 👨🏼‍🦼
+    "\U0001f468\U0001f3fc\u200d\U0001f9bc\u200d\u27a1",  # 👨🏼‍🦼‍➡
+    "\U0001f468\U0001f3fc\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨🏼‍🦼‍➡️
+    "\U0001f468\U0001f3fc\u200d\U0001f9bd",  # 👨🏼‍🦽
+    "\U0001f468\U0001f3fc\u200d\U0001f9bd\u200d\u27a1",  # 👨🏼‍🦽‍➡
+    "\U0001f468\U0001f3fc\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨🏼‍🦽‍➡️
+    "\U0001f468\U0001f3fc\u200d\U0001faef\u200d\U0001f468\U0001f3fb",  # 👨🏼‍🫯‍👨🏻
+    "\U0001f468\U0001f3fc\u200d\U0001faef\u200d\U0001f468\U0001f3fd",  # 👨🏼‍🫯‍👨🏽
+    "\U0001f468\U0001f3fc\u200d\U0001faef\u200d\U0001f468\U0001f3fe",  # 👨🏼‍🫯‍👨🏾
+    "\U0001f468\U0001f3fc\u200d\U0001faef\u200d\U0001f468\U0001f3ff",  # 👨🏼‍🫯‍👨🏿
+    "\U0001f468\U0001f3fd",  # 👨🏽
+    "\U0001f468\U0001f3fd\u200d\u2695",  # 👨🏽‍⚕
+    "\U0001f468\U0001f3fd\u200d\u2695\ufe0f",  # 👨🏽‍⚕️
+    "\U0001f468\U0001f3fd\u200d\u2696",  # 👨🏽‍⚖
+    "\U0001f468\U0001f3fd\u200d\u2696\ufe0f",  # 👨🏽‍⚖️
+    "\U0001f468\U0001f3fd\u200d\u2708",  # 👨🏽‍✈
+    "\U0001f468\U0001f3fd\u200d\u2708\ufe0f",  # 👨🏽‍✈️
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👨🏽‍❤‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👨🏽‍❤‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👨🏽‍❤‍👨🏽
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👨🏽‍❤‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👨🏽‍❤‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏽‍❤‍💋‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏽‍❤‍💋‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏽‍❤‍💋‍👨🏽
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏽‍❤‍💋‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏽‍❤‍💋‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👨🏽‍❤️‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👨🏽‍❤️‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👨🏽‍❤️‍👨🏽
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👨🏽‍❤️‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👨🏽‍❤️‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏽‍❤️‍💋‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏽‍❤️‍💋‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏽‍❤️‍💋‍👨🏽
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏽‍❤️‍💋‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏽‍❤️‍💋‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\U0001f33e",  # 👨🏽‍🌾
+    "\U0001f468\U0001f3fd\u200d\U0001f373",  # 👨🏽‍🍳
+    "\U0001f468\U0001f3fd\u200d\U0001f37c",  # 👨🏽‍🍼
+    "\U0001f468\U0001f3fd\u200d\U0001f393",  # 👨🏽‍🎓
+    "\U0001f468\U0001f3fd\u200d\U0001f3a4",  # 👨🏽‍🎤
+    "\U0001f468\U0001f3fd\u200d\U0001f3a8",  # 👨🏽‍🎨
+    "\U0001f468\U0001f3fd\u200d\U0001f3eb",  # 👨🏽‍🏫
+    "\U0001f468\U0001f3fd\u200d\U0001f3ed",  # 👨🏽‍🏭
+    "\U0001f468\U0001f3fd\u200d\U0001f430\u200d\U0001f468\U0001f3fb",  # 👨🏽‍🐰‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\U0001f430\u200d\U0001f468\U0001f3fc",  # 👨🏽‍🐰‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\U0001f430\u200d\U0001f468\U0001f3fe",  # 👨🏽‍🐰‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\U0001f430\u200d\U0001f468\U0001f3ff",  # 👨🏽‍🐰‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\U0001f4bb",  # 👨🏽‍💻
+    "\U0001f468\U0001f3fd\u200d\U0001f4bc",  # 👨🏽‍💼
+    "\U0001f468\U0001f3fd\u200d\U0001f527",  # 👨🏽‍🔧
+    "\U0001f468\U0001f3fd\u200d\U0001f52c",  # 👨🏽‍🔬
+    "\U0001f468\U0001f3fd\u200d\U0001f680",  # 👨🏽‍🚀
+    "\U0001f468\U0001f3fd\u200d\U0001f692",  # 👨🏽‍🚒
+    "\U0001f468\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👨🏽‍🤝‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👨🏽‍🤝‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👨🏽‍🤝‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👨🏽‍🤝‍👨🏿
+    "\U0001f468\U0001f3fd\u200d\U0001f9af",  # 👨🏽‍🦯
+    "\U0001f468\U0001f3fd\u200d\U0001f9af\u200d\u27a1",  # 👨🏽‍🦯‍➡
+    "\U0001f468\U0001f3fd\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨🏽‍🦯‍➡️
+    "\U0001f468\U0001f3fd\u200d\U0001f9b0",  # 👨🏽‍🦰
+    "\U0001f468\U0001f3fd\u200d\U0001f9b1",  # 👨🏽‍🦱
+    "\U0001f468\U0001f3fd\u200d\U0001f9b2",  # 👨🏽‍🦲
+    "\U0001f468\U0001f3fd\u200d\U0001f9b3",  # 👨🏽‍🦳
+    "\U0001f468\U0001f3fd\u200d\U0001f9bc",  # 👨🏽‍🦼
+    "\U0001f468\U0001f3fd\u200d\U0001f9bc\u200d\u27a1",  # 👨🏽‍🦼‍➡
+    "\U0001f468\U0001f3fd\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨🏽‍🦼‍➡️
+    "\U0001f468\U0001f3fd\u200d\U0001f9bd",  # 👨🏽‍🦽
+    "\U0001f468\U0001f3fd\u200d\U0001f9bd\u200d\u27a1",  # 👨🏽‍🦽‍➡
+    "\U0001f468\U0001f3fd\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨🏽‍🦽‍➡️
+    "\U0001f468\U0001f3fd\u200d\U0001faef\u200d\U0001f468\U0001f3fb",  # 👨🏽‍🫯‍👨🏻
+    "\U0001f468\U0001f3fd\u200d\U0001faef\u200d\U0001f468\U0001f3fc",  # 👨🏽‍🫯‍👨🏼
+    "\U0001f468\U0001f3fd\u200d\U0001faef\u200d\U0001f468\U0001f3fe",  # 👨🏽‍🫯‍👨🏾
+    "\U0001f468\U0001f3fd\u200d\U0001faef\u200d\U0001f468\U0001f3ff",  # 👨🏽‍🫯‍👨🏿
+    "\U0001f468\U0001f3fe",  # 👨🏾
+    "\U0001f468\U0001f3fe\u200d\u2695",  # 👨🏾‍⚕
+    "\U0001f468\U0001f3fe\u200d\u2695\ufe0f",  # 👨🏾‍⚕️
+    "\U0001f468\U0001f3fe\u200d\u2696",  # 👨🏾‍⚖
+    "\U0001f468\U0001f3fe\u200d\u2696\ufe0f",  # 👨🏾‍⚖️
+    "\U0001f468\U0001f3fe\u200d\u2708",  # 👨🏾‍✈
+    "\U0001f468\U0001f3fe\u200d\u2708\ufe0f",  # 👨🏾‍✈️
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👨🏾‍❤‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👨🏾‍❤‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👨🏾‍❤‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👨🏾‍❤‍👨🏾
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👨🏾‍❤‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏾‍❤‍💋‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏾‍❤‍💋‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏾‍❤‍💋‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏾‍❤‍💋‍👨🏾
+    "\U0001f468\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏾‍❤‍💋‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👨🏾‍❤️‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👨🏾‍❤️‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👨🏾‍❤️‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👨🏾‍❤️‍👨🏾
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👨🏾‍❤️‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏾‍❤️‍💋‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏾‍❤️‍💋‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏾‍❤️‍💋‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏾‍❤️‍💋‍👨🏾
+    "\U0001f468\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏾‍❤️‍💋‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\U0001f33e",  # 👨🏾‍🌾
+    "\U0001f468\U0001f3fe\u200d\U0001f373",  # 👨🏾‍🍳
+    "\U0001f468\U0001f3fe\u200d\U0001f37c",  # 👨🏾‍🍼
+    "\U0001f468\U0001f3fe\u200d\U0001f393",  # 👨🏾‍🎓
+    "\U0001f468\U0001f3fe\u200d\U0001f3a4",  # 👨🏾‍🎤
+    "\U0001f468\U0001f3fe\u200d\U0001f3a8",  # 👨🏾‍🎨
+    "\U0001f468\U0001f3fe\u200d\U0001f3eb",  # 👨🏾‍🏫
+    "\U0001f468\U0001f3fe\u200d\U0001f3ed",  # 👨🏾‍🏭
+    "\U0001f468\U0001f3fe\u200d\U0001f430\u200d\U0001f468\U0001f3fb",  # 👨🏾‍🐰‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\U0001f430\u200d\U0001f468\U0001f3fc",  # 👨🏾‍🐰‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\U0001f430\u200d\U0001f468\U0001f3fd",  # 👨🏾‍🐰‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\U0001f430\u200d\U0001f468\U0001f3ff",  # 👨🏾‍🐰‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\U0001f4bb",  # 👨🏾‍💻
+    "\U0001f468\U0001f3fe\u200d\U0001f4bc",  # 👨🏾‍💼
+    "\U0001f468\U0001f3fe\u200d\U0001f527",  # 👨🏾‍🔧
+    "\U0001f468\U0001f3fe\u200d\U0001f52c",  # 👨🏾‍🔬
+    "\U0001f468\U0001f3fe\u200d\U0001f680",  # 👨🏾‍🚀
+    "\U0001f468\U0001f3fe\u200d\U0001f692",  # 👨🏾‍🚒
+    "\U0001f468\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👨🏾‍🤝‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👨🏾‍🤝‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👨🏾‍🤝‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👨🏾‍🤝‍👨🏿
+    "\U0001f468\U0001f3fe\u200d\U0001f9af",  # 👨🏾‍🦯
+    "\U0001f468\U0001f3fe\u200d\U0001f9af\u200d\u27a1",  # 👨🏾‍🦯‍➡
+    "\U0001f468\U0001f3fe\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨🏾‍🦯‍➡️
+    "\U0001f468\U0001f3fe\u200d\U0001f9b0",  # 👨🏾‍🦰
+    "\U0001f468\U0001f3fe\u200d\U0001f9b1",  # 👨🏾‍🦱
+    "\U0001f468\U0001f3fe\u200d\U0001f9b2",  # 👨🏾‍🦲
+    "\U0001f468\U0001f3fe\u200d\U0001f9b3",  # 👨🏾‍🦳
+    "\U0001f468\U0001f3fe\u200d\U0001f9bc",  # 👨🏾‍🦼
+    "\U0001f468\U0001f3fe\u200d\U0001f9bc\u200d\u27a1",  # 👨🏾‍🦼‍➡
+    "\U0001f468\U0001f3fe\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨🏾‍🦼‍➡️
+    "\U0001f468\U0001f3fe\u200d\U0001f9bd",  # 👨🏾‍🦽
+    "\U0001f468\U0001f3fe\u200d\U0001f9bd\u200d\u27a1",  # 👨🏾‍🦽‍➡
+    "\U0001f468\U0001f3fe\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨🏾‍🦽‍➡️
+    "\U0001f468\U0001f3fe\u200d\U0001faef\u200d\U0001f468\U0001f3fb",  # 👨🏾‍🫯‍👨🏻
+    "\U0001f468\U0001f3fe\u200d\U0001faef\u200d\U0001f468\U0001f3fc",  # 👨🏾‍🫯‍👨🏼
+    "\U0001f468\U0001f3fe\u200d\U0001faef\u200d\U0001f468\U0001f3fd",  # 👨🏾‍🫯‍👨🏽
+    "\U0001f468\U0001f3fe\u200d\U0001faef\u200d\U0001f468\U0001f3ff",  # 👨🏾‍🫯‍👨🏿
+    "\U0001f468\U0001f3ff",  # 👨🏿
+    "\U0001f468\U0001f3ff\u200d\u2695",  # 👨🏿‍⚕
+    "\U0001f468\U0001f3ff\u200d\u2695\ufe0f",  # 👨🏿‍⚕️
+    "\U0001f468\U0001f3ff\u200d\u2696",  # 👨🏿‍⚖
+    "\U0001f468\U0001f3ff\u200d\u2696\ufe0f",  # 👨🏿‍⚖️
+    "\U0001f468\U0001f3ff\u200d\u2708",  # 👨🏿‍✈
+    "\U0001f468\U0001f3ff\u200d\u2708\ufe0f",  # 👨🏿‍✈️
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👨🏿‍❤‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👨🏿‍❤‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👨🏿‍❤‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👨🏿‍❤‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👨🏿‍❤‍👨🏿
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏿‍❤‍💋‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏿‍❤‍💋‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏿‍❤‍💋‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏿‍❤‍💋‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏿‍❤‍💋‍👨🏿
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👨🏿‍❤️‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👨🏿‍❤️‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👨🏿‍❤️‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👨🏿‍❤️‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👨🏿‍❤️‍👨🏿
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👨🏿‍❤️‍💋‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👨🏿‍❤️‍💋‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👨🏿‍❤️‍💋‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👨🏿‍❤️‍💋‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👨🏿‍❤️‍💋‍👨🏿
+    "\U0001f468\U0001f3ff\u200d\U0001f33e",  # 👨🏿‍🌾
+    "\U0001f468\U0001f3ff\u200d\U0001f373",  # 👨🏿‍🍳
+    "\U0001f468\U0001f3ff\u200d\U0001f37c",  # 👨🏿‍🍼
+    "\U0001f468\U0001f3ff\u200d\U0001f393",  # 👨🏿‍🎓
+    "\U0001f468\U0001f3ff\u200d\U0001f3a4",  # 👨🏿‍🎤
+    "\U0001f468\U0001f3ff\u200d\U0001f3a8",  # 👨🏿‍🎨
+    "\U0001f468\U0001f3ff\u200d\U0001f3eb",  # 👨🏿‍🏫
+    "\U0001f468\U0001f3ff\u200d\U0001f3ed",  # 👨🏿‍🏭
+    "\U0001f468\U0001f3ff\u200d\U0001f430\u200d\U0001f468\U0001f3fb",  # 👨🏿‍🐰‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\U0001f430\u200d\U0001f468\U0001f3fc",  # 👨🏿‍🐰‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\U0001f430\u200d\U0001f468\U0001f3fd",  # 👨🏿‍🐰‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\U0001f430\u200d\U0001f468\U0001f3fe",  # 👨🏿‍🐰‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\U0001f4bb",  # 👨🏿‍💻
+    "\U0001f468\U0001f3ff\u200d\U0001f4bc",  # 👨🏿‍💼
+    "\U0001f468\U0001f3ff\u200d\U0001f527",  # 👨🏿‍🔧
+    "\U0001f468\U0001f3ff\u200d\U0001f52c",  # 👨🏿‍🔬
+    "\U0001f468\U0001f3ff\u200d\U0001f680",  # 👨🏿‍🚀
+    "\U0001f468\U0001f3ff\u200d\U0001f692",  # 👨🏿‍🚒
+    "\U0001f468\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👨🏿‍🤝‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👨🏿‍🤝‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👨🏿‍🤝‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👨🏿‍🤝‍👨🏾
+    "\U0001f468\U0001f3ff\u200d\U0001f9af",  # 👨🏿‍🦯
+    "\U0001f468\U0001f3ff\u200d\U0001f9af\u200d\u27a1",  # 👨🏿‍🦯‍➡
+    "\U0001f468\U0001f3ff\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👨🏿‍🦯‍➡️
+    "\U0001f468\U0001f3ff\u200d\U0001f9b0",  # 👨🏿‍🦰
+    "\U0001f468\U0001f3ff\u200d\U0001f9b1",  # 👨🏿‍🦱
+    "\U0001f468\U0001f3ff\u200d\U0001f9b2",  # 👨🏿‍🦲
+    "\U0001f468\U0001f3ff\u200d\U0001f9b3",  # 👨🏿‍🦳
+    "\U0001f468\U0001f3ff\u200d\U0001f9bc",  # 👨🏿‍🦼
+    "\U0001f468\U0001f3ff\u200d\U0001f9bc\u200d\u27a1",  # 👨🏿‍🦼‍➡
+    "\U0001f468\U0001f3ff\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👨🏿‍🦼‍➡️
+    "\U0001f468\U0001f3ff\u200d\U0001f9bd",  # 👨🏿‍🦽
+    "\U0001f468\U0001f3ff\u200d\U0001f9bd\u200d\u27a1",  # 👨🏿‍🦽‍➡
+    "\U0001f468\U0001f3ff\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👨🏿‍🦽‍➡️
+    "\U0001f468\U0001f3ff\u200d\U0001faef\u200d\U0001f468\U0001f3fb",  # 👨🏿‍🫯‍👨🏻
+    "\U0001f468\U0001f3ff\u200d\U0001faef\u200d\U0001f468\U0001f3fc",  # 👨🏿‍🫯‍👨🏼
+    "\U0001f468\U0001f3ff\u200d\U0001faef\u200d\U0001f468\U0001f3fd",  # 👨🏿‍🫯‍👨🏽
+    "\U0001f468\U0001f3ff\u200d\U0001faef\u200d\U0001f468\U0001f3fe",  # 👨🏿‍🫯‍👨🏾
+    "\U0001f469\u200d\u2695",  # 👩‍⚕
+    "\U0001f469\u200d\u2695\ufe0f",  # 👩‍⚕️
+    "\U0001f469\u200d\u2696",  # 👩‍⚖
+    "\U0001f469\u200d\u2696\ufe0f",  # 👩‍⚖️
+    "\U0001f469\u200d\u2708",  # 👩‍✈
+    "\U0001f469\u200d\u2708\ufe0f",  # 👩‍✈️
+    "\U0001f469\u200d\u2764\u200d\U0001f468",  # 👩‍❤‍👨
+    "\U0001f469\u200d\u2764\u200d\U0001f469",  # 👩‍❤‍👩
+    "\U0001f469\u200d\u2764\u200d\U0001f48b\u200d\U0001f468",  # 👩‍❤‍💋‍👨
+    "\U0001f469\u200d\u2764\u200d\U0001f48b\u200d\U0001f469",  # 👩‍❤‍💋‍👩
+    "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f468",  # 👩‍❤️‍👨
+    "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f469",  # 👩‍❤️‍👩
+    "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468",  # 👩‍❤️‍💋‍👨
+    "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469",  # 👩‍❤️‍💋‍👩
+    "\U0001f469\u200d\U0001f33e",  # 👩‍🌾
+    "\U0001f469\u200d\U0001f373",  # 👩‍🍳
+    "\U0001f469\u200d\U0001f37c",  # 👩‍🍼
+    "\U0001f469\u200d\U0001f393",  # 👩‍🎓
+    "\U0001f469\u200d\U0001f3a4",  # 👩‍🎤
+    "\U0001f469\u200d\U0001f3a8",  # 👩‍🎨
+    "\U0001f469\u200d\U0001f3eb",  # 👩‍🏫
+    "\U0001f469\u200d\U0001f3ed",  # 👩‍🏭
+    "\U0001f469\u200d\U0001f466",  # 👩‍👦
+    "\U0001f469\u200d\U0001f466\u200d\U0001f466",  # 👩‍👦‍👦
+    "\U0001f469\u200d\U0001f467",  # 👩‍👧
+    "\U0001f469\u200d\U0001f467\u200d\U0001f466",  # 👩‍👧‍👦
+    "\U0001f469\u200d\U0001f467\u200d\U0001f467",  # 👩‍👧‍👧
+    "\U0001f469\u200d\U0001f469\u200d\U0001f466",  # 👩‍👩‍👦
+    "\U0001f469\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466",  # 👩‍👩‍👦‍👦
+    "\U0001f469\u200d\U0001f469\u200d\U0001f467",  # 👩‍👩‍👧
+    "\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466",  # 👩‍👩‍👧‍👦
+    "\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467",  # 👩‍👩‍👧‍👧
+    "\U0001f469\u200d\U0001f4bb",  # 👩‍💻
+    "\U0001f469\u200d\U0001f4bc",  # 👩‍💼
+    "\U0001f469\u200d\U0001f527",  # 👩‍🔧
+    "\U0001f469\u200d\U0001f52c",  # 👩‍🔬
+    "\U0001f469\u200d\U0001f680",  # 👩‍🚀
+    "\U0001f469\u200d\U0001f692",  # 👩‍🚒
+    "\U0001f469\u200d\U0001f9af",  # 👩‍🦯
+    "\U0001f469\u200d\U0001f9af\u200d\u27a1",  # 👩‍🦯‍➡
+    "\U0001f469\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩‍🦯‍➡️
+    "\U0001f469\u200d\U0001f9b0",  # 👩‍🦰
+    "\U0001f469\u200d\U0001f9b1",  # 👩‍🦱
+    "\U0001f469\u200d\U0001f9b2",  # 👩‍🦲
+    "\U0001f469\u200d\U0001f9b3",  # 👩‍🦳
+    "\U0001f469\u200d\U0001f9bc",  # 👩‍🦼
+    "\U0001f469\u200d\U0001f9bc\u200d\u27a1",  # 👩‍🦼‍➡
+    "\U0001f469\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩‍🦼‍➡️
+    "\U0001f469\u200d\U0001f9bd",  # 👩‍🦽
+    "\U0001f469\u200d\U0001f9bd\u200d\u27a1",  # 👩‍🦽‍➡
+    "\U0001f469\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩‍🦽‍➡️
+    "\U0001f469\U0001f3fb",  # 👩🏻
+    "\U0001f469\U0001f3fb\u200d\u2695",  # 👩🏻‍⚕
+    "\U0001f469\U0001f3fb\u200d\u2695\ufe0f",  # 👩🏻‍⚕️
+    "\U0001f469\U0001f3fb\u200d\u2696",  # 👩🏻‍⚖
+    "\U0001f469\U0001f3fb\u200d\u2696\ufe0f",  # 👩🏻‍⚖️
+    "\U0001f469\U0001f3fb\u200d\u2708",  # 👩🏻‍✈
+    "\U0001f469\U0001f3fb\u200d\u2708\ufe0f",  # 👩🏻‍✈️
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👩🏻‍❤‍👨🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👩🏻‍❤‍👨🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👩🏻‍❤‍👨🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👩🏻‍❤‍👨🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👩🏻‍❤‍👨🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f469\U0001f3fb",  # 👩🏻‍❤‍👩🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f469\U0001f3fc",  # 👩🏻‍❤‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f469\U0001f3fd",  # 👩🏻‍❤‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f469\U0001f3fe",  # 👩🏻‍❤‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f469\U0001f3ff",  # 👩🏻‍❤‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏻‍❤‍💋‍👨🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏻‍❤‍💋‍👨🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏻‍❤‍💋‍👨🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏻‍❤‍💋‍👨🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏻‍❤‍💋‍👨🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏻‍❤‍💋‍👩🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏻‍❤‍💋‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏻‍❤‍💋‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏻‍❤‍💋‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏻‍❤‍💋‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👩🏻‍❤️‍👨🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👩🏻‍❤️‍👨🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👩🏻‍❤️‍👨🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👩🏻‍❤️‍👨🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👩🏻‍❤️‍👨🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fb",  # 👩🏻‍❤️‍👩🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fc",  # 👩🏻‍❤️‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fd",  # 👩🏻‍❤️‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fe",  # 👩🏻‍❤️‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3ff",  # 👩🏻‍❤️‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏻‍❤️‍💋‍👨🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏻‍❤️‍💋‍👨🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏻‍❤️‍💋‍👨🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏻‍❤️‍💋‍👨🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏻‍❤️‍💋‍👨🏿
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏻‍❤️‍💋‍👩🏻
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏻‍❤️‍💋‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏻‍❤️‍💋‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏻‍❤️‍💋‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏻‍❤️‍💋‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\U0001f33e",  # 👩🏻‍🌾
+    "\U0001f469\U0001f3fb\u200d\U0001f373",  # 👩🏻‍🍳
+    "\U0001f469\U0001f3fb\u200d\U0001f37c",  # 👩🏻‍🍼
+    "\U0001f469\U0001f3fb\u200d\U0001f393",  # 👩🏻‍🎓
+    "\U0001f469\U0001f3fb\u200d\U0001f3a4",  # 👩🏻‍🎤
+    "\U0001f469\U0001f3fb\u200d\U0001f3a8",  # 👩🏻‍🎨
+    "\U0001f469\U0001f3fb\u200d\U0001f3eb",  # 👩🏻‍🏫
+    "\U0001f469\U0001f3fb\u200d\U0001f3ed",  # 👩🏻‍🏭
+    "\U0001f469\U0001f3fb\u200d\U0001f430\u200d\U0001f469\U0001f3fc",  # 👩🏻‍🐰‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\U0001f430\u200d\U0001f469\U0001f3fd",  # 👩🏻‍🐰‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\U0001f430\u200d\U0001f469\U0001f3fe",  # 👩🏻‍🐰‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\U0001f430\u200d\U0001f469\U0001f3ff",  # 👩🏻‍🐰‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\U0001f4bb",  # 👩🏻‍💻
+    "\U0001f469\U0001f3fb\u200d\U0001f4bc",  # 👩🏻‍💼
+    "\U0001f469\U0001f3fb\u200d\U0001f527",  # 👩🏻‍🔧
+    "\U0001f469\U0001f3fb\u200d\U0001f52c",  # 👩🏻‍🔬
+    "\U0001f469\U0001f3fb\u200d\U0001f680",  # 👩🏻‍🚀
+    "\U0001f469\U0001f3fb\u200d\U0001f692",  # 👩🏻‍🚒
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👩🏻‍🤝‍👨🏼
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👩🏻‍🤝‍👨🏽
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👩🏻‍🤝‍👨🏾
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👩🏻‍🤝‍👨🏿
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f469\U0001f3fc",  # 👩🏻‍🤝‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f469\U0001f3fd",  # 👩🏻‍🤝‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f469\U0001f3fe",  # 👩🏻‍🤝‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\U0001f91d\u200d\U0001f469\U0001f3ff",  # 👩🏻‍🤝‍👩🏿
+    "\U0001f469\U0001f3fb\u200d\U0001f9af",  # 👩🏻‍🦯
+    "\U0001f469\U0001f3fb\u200d\U0001f9af\u200d\u27a1",  # 👩🏻‍🦯‍➡
+    "\U0001f469\U0001f3fb\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩🏻‍🦯‍➡️
+    "\U0001f469\U0001f3fb\u200d\U0001f9b0",  # 👩🏻‍🦰
+    "\U0001f469\U0001f3fb\u200d\U0001f9b1",  # 👩🏻‍🦱
+    "\U0001f469\U0001f3fb\u200d\U0001f9b2",  # 👩🏻‍🦲
+    "\U0001f469\U0001f3fb\u200d\U0001f9b3",  # 👩🏻‍🦳
+    "\U0001f469\U0001f3fb\u200d\U0001f9bc",  # 👩🏻‍🦼
+    "\U0001f469\U0001f3fb\u200d\U0001f9bc\u200d\u27a1",  # 👩🏻‍🦼‍➡
+    "\U0001f469\U0001f3fb\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩🏻‍🦼‍➡️
+    "\U0001f469\U0001f3fb\u200d\U0001f9bd",  # 👩🏻‍🦽
+    "\U0001f469\U0001f3fb\u200d\U0001f9bd\u200d\u27a1",  # 👩🏻‍🦽‍➡
+    "\U0001f469\U0001f3fb\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩🏻‍🦽‍➡️
+    "\U0001f469\U0001f3fb\u200d\U0001faef\u200d\U0001f469\U0001f3fc",  # 👩🏻‍🫯‍👩🏼
+    "\U0001f469\U0001f3fb\u200d\U0001faef\u200d\U0001f469\U0001f3fd",  # 👩🏻‍🫯‍👩🏽
+    "\U0001f469\U0001f3fb\u200d\U0001faef\u200d\U0001f469\U0001f3fe",  # 👩🏻‍🫯‍👩🏾
+    "\U0001f469\U0001f3fb\u200d\U0001faef\u200d\U0001f469\U0001f3ff",  # 👩🏻‍🫯‍👩🏿
+    "\U0001f469\U0001f3fc",  # 👩🏼
+    "\U0001f469\U0001f3fc\u200d\u2695",  # 👩🏼‍⚕
+    "\U0001f469\U0001f3fc\u200d\u2695\ufe0f",  # 👩🏼‍⚕️
+    "\U0001f469\U0001f3fc\u200d\u2696",  # 👩🏼‍⚖
+    "\U0001f469\U0001f3fc\u200d\u2696\ufe0f",  # 👩🏼‍⚖️
+    "\U0001f469\U0001f3fc\u200d\u2708",  # 👩🏼‍✈
+    "\U0001f469\U0001f3fc\u200d\u2708\ufe0f",  # 👩🏼‍✈️
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👩🏼‍❤‍👨🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👩🏼‍❤‍👨🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👩🏼‍❤‍👨🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👩🏼‍❤‍👨🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👩🏼‍❤‍👨🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f469\U0001f3fb",  # 👩🏼‍❤‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f469\U0001f3fc",  # 👩🏼‍❤‍👩🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f469\U0001f3fd",  # 👩🏼‍❤‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f469\U0001f3fe",  # 👩🏼‍❤‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f469\U0001f3ff",  # 👩🏼‍❤‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏼‍❤‍💋‍👨🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏼‍❤‍💋‍👨🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏼‍❤‍💋‍👨🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏼‍❤‍💋‍👨🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏼‍❤‍💋‍👨🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏼‍❤‍💋‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏼‍❤‍💋‍👩🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏼‍❤‍💋‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏼‍❤‍💋‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏼‍❤‍💋‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👩🏼‍❤️‍👨🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👩🏼‍❤️‍👨🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👩🏼‍❤️‍👨🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👩🏼‍❤️‍👨🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👩🏼‍❤️‍👨🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fb",  # 👩🏼‍❤️‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fc",  # 👩🏼‍❤️‍👩🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fd",  # 👩🏼‍❤️‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fe",  # 👩🏼‍❤️‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3ff",  # 👩🏼‍❤️‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏼‍❤️‍💋‍👨🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏼‍❤️‍💋‍👨🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏼‍❤️‍💋‍👨🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏼‍❤️‍💋‍👨🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏼‍❤️‍💋‍👨🏿
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏼‍❤️‍💋‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏼‍❤️‍💋‍👩🏼
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏼‍❤️‍💋‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏼‍❤️‍💋‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏼‍❤️‍💋‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\U0001f33e",  # 👩🏼‍🌾
+    "\U0001f469\U0001f3fc\u200d\U0001f373",  # 👩🏼‍🍳
+    "\U0001f469\U0001f3fc\u200d\U0001f37c",  # 👩🏼‍🍼
+    "\U0001f469\U0001f3fc\u200d\U0001f393",  # 👩🏼‍🎓
+    "\U0001f469\U0001f3fc\u200d\U0001f3a4",  # 👩🏼‍🎤
+    "\U0001f469\U0001f3fc\u200d\U0001f3a8",  # 👩🏼‍🎨
+    "\U0001f469\U0001f3fc\u200d\U0001f3eb",  # 👩🏼‍🏫
+    "\U0001f469\U0001f3fc\u200d\U0001f3ed",  # 👩🏼‍🏭
+    "\U0001f469\U0001f3fc\u200d\U0001f430\u200d\U0001f469\U0001f3fb",  # 👩🏼‍🐰‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\U0001f430\u200d\U0001f469\U0001f3fd",  # 👩🏼‍🐰‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\U0001f430\u200d\U0001f469\U0001f3fe",  # 👩🏼‍🐰‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\U0001f430\u200d\U0001f469\U0001f3ff",  # 👩🏼‍🐰‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\U0001f4bb",  # 👩🏼‍💻
+    "\U0001f469\U0001f3fc\u200d\U0001f4bc",  # 👩🏼‍💼
+    "\U0001f469\U0001f3fc\u200d\U0001f527",  # 👩🏼‍🔧
+    "\U0001f469\U0001f3fc\u200d\U0001f52c",  # 👩🏼‍🔬
+    "\U0001f469\U0001f3fc\u200d\U0001f680",  # 👩🏼‍🚀
+    "\U0001f469\U0001f3fc\u200d\U0001f692",  # 👩🏼‍🚒
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👩🏼‍🤝‍👨🏻
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👩🏼‍🤝‍👨🏽
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👩🏼‍🤝‍👨🏾
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👩🏼‍🤝‍👨🏿
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f469\U0001f3fb",  # 👩🏼‍🤝‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f469\U0001f3fd",  # 👩🏼‍🤝‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f469\U0001f3fe",  # 👩🏼‍🤝‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\U0001f91d\u200d\U0001f469\U0001f3ff",  # 👩🏼‍🤝‍👩🏿
+    "\U0001f469\U0001f3fc\u200d\U0001f9af",  # 👩🏼‍🦯
+    "\U0001f469\U0001f3fc\u200d\U0001f9af\u200d\u27a1",  # 👩🏼‍🦯‍➡
+    "\U0001f469\U0001f3fc\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩🏼‍🦯‍➡️
+    "\U0001f469\U0001f3fc\u200d\U0001f9b0",  # 👩🏼‍🦰
+    "\U0001f469\U0001f3fc\u200d\U0001f9b1",  # 👩🏼‍🦱
+    "\U0001f469\U0001f3fc\u200d\U0001f9b2",  # 👩🏼‍🦲
+    "\U0001f469\U0001f3fc\u200d\U0001f9b3",  # 👩🏼‍🦳
+    "\U0001f469\U0001f3fc\u200d\U0001f9bc",  # 👩🏼‍🦼
+    "\U0001f469\U0001f3fc\u200d\U0001f9bc\u200d\u27a1",  # 👩🏼‍🦼‍➡
+    "\U0001f469\U0001f3fc\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩🏼‍🦼‍➡️
+    "\U0001f469\U0001f3fc\u200d\U0001f9bd",  # 👩🏼‍🦽
+    "\U0001f469\U0001f3fc\u200d\U0001f9bd\u200d\u27a1",  # 👩🏼‍🦽‍➡
+    "\U0001f469\U0001f3fc\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩🏼‍🦽‍➡️
+    "\U0001f469\U0001f3fc\u200d\U0001faef\u200d\U0001f469\U0001f3fb",  # 👩🏼‍🫯‍👩🏻
+    "\U0001f469\U0001f3fc\u200d\U0001faef\u200d\U0001f469\U0001f3fd",  # 👩🏼‍🫯‍👩🏽
+    "\U0001f469\U0001f3fc\u200d\U0001faef\u200d\U0001f469\U0001f3fe",  # 👩🏼‍🫯‍👩🏾
+    "\U0001f469\U0001f3fc\u200d\U0001faef\u200d\U0001f469\U0001f3ff",  # 👩🏼‍🫯‍👩🏿
+    "\U0001f469\U0001f3fd",  # 👩🏽
+    "\U0001f469\U0001f3fd\u200d\u2695",  # 👩🏽‍⚕
+    "\U0001f469\U0001f3fd\u200d\u2695\ufe0f",  # 👩🏽‍⚕️
+    "\U0001f469\U0001f3fd\u200d\u2696",  # 👩🏽‍⚖
+    "\U0001f469\U0001f3fd\u200d\u2696\ufe0f",  # 👩🏽‍⚖️
+    "\U0001f469\U0001f3fd\u200d\u2708",  # 👩🏽‍✈
+    "\U0001f469\U0001f3fd\u200d\u2708\ufe0f",  # 👩🏽‍✈️
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👩🏽‍❤‍👨🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👩🏽‍❤‍👨🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👩🏽‍❤‍👨🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👩🏽‍❤‍👨🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👩🏽‍❤‍👨🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f469\U0001f3fb",  # 👩🏽‍❤‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f469\U0001f3fc",  # 👩🏽‍❤‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f469\U0001f3fd",  # 👩🏽‍❤‍👩🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f469\U0001f3fe",  # 👩🏽‍❤‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f469\U0001f3ff",  # 👩🏽‍❤‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏽‍❤‍💋‍👨🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏽‍❤‍💋‍👨🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏽‍❤‍💋‍👨🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏽‍❤‍💋‍👨🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏽‍❤‍💋‍👨🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏽‍❤‍💋‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏽‍❤‍💋‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏽‍❤‍💋‍👩🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏽‍❤‍💋‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏽‍❤‍💋‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👩🏽‍❤️‍👨🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👩🏽‍❤️‍👨🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👩🏽‍❤️‍👨🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👩🏽‍❤️‍👨🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👩🏽‍❤️‍👨🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fb",  # 👩🏽‍❤️‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fc",  # 👩🏽‍❤️‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fd",  # 👩🏽‍❤️‍👩🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fe",  # 👩🏽‍❤️‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3ff",  # 👩🏽‍❤️‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏽‍❤️‍💋‍👨🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏽‍❤️‍💋‍👨🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏽‍❤️‍💋‍👨🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏽‍❤️‍💋‍👨🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏽‍❤️‍💋‍👨🏿
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏽‍❤️‍💋‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏽‍❤️‍💋‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏽‍❤️‍💋‍👩🏽
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏽‍❤️‍💋‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏽‍❤️‍💋‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\U0001f33e",  # 👩🏽‍🌾
+    "\U0001f469\U0001f3fd\u200d\U0001f373",  # 👩🏽‍🍳
+    "\U0001f469\U0001f3fd\u200d\U0001f37c",  # 👩🏽‍🍼
+    "\U0001f469\U0001f3fd\u200d\U0001f393",  # 👩🏽‍🎓
+    "\U0001f469\U0001f3fd\u200d\U0001f3a4",  # 👩🏽‍🎤
+    "\U0001f469\U0001f3fd\u200d\U0001f3a8",  # 👩🏽‍🎨
+    "\U0001f469\U0001f3fd\u200d\U0001f3eb",  # 👩🏽‍🏫
+    "\U0001f469\U0001f3fd\u200d\U0001f3ed",  # 👩🏽‍🏭
+    "\U0001f469\U0001f3fd\u200d\U0001f430\u200d\U0001f469\U0001f3fb",  # 👩🏽‍🐰‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\U0001f430\u200d\U0001f469\U0001f3fc",  # 👩🏽‍🐰‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\U0001f430\u200d\U0001f469\U0001f3fe",  # 👩🏽‍🐰‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\U0001f430\u200d\U0001f469\U0001f3ff",  # 👩🏽‍🐰‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\U0001f4bb",  # 👩🏽‍💻
+    "\U0001f469\U0001f3fd\u200d\U0001f4bc",  # 👩🏽‍💼
+    "\U0001f469\U0001f3fd\u200d\U0001f527",  # 👩🏽‍🔧
+    "\U0001f469\U0001f3fd\u200d\U0001f52c",  # 👩🏽‍🔬
+    "\U0001f469\U0001f3fd\u200d\U0001f680",  # 👩🏽‍🚀
+    "\U0001f469\U0001f3fd\u200d\U0001f692",  # 👩🏽‍🚒
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👩🏽‍🤝‍👨🏻
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👩🏽‍🤝‍👨🏼
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👩🏽‍🤝‍👨🏾
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👩🏽‍🤝‍👨🏿
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f469\U0001f3fb",  # 👩🏽‍🤝‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f469\U0001f3fc",  # 👩🏽‍🤝‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f469\U0001f3fe",  # 👩🏽‍🤝‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\U0001f91d\u200d\U0001f469\U0001f3ff",  # 👩🏽‍🤝‍👩🏿
+    "\U0001f469\U0001f3fd\u200d\U0001f9af",  # 👩🏽‍🦯
+    "\U0001f469\U0001f3fd\u200d\U0001f9af\u200d\u27a1",  # 👩🏽‍🦯‍➡
+    "\U0001f469\U0001f3fd\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩🏽‍🦯‍➡️
+    "\U0001f469\U0001f3fd\u200d\U0001f9b0",  # 👩🏽‍🦰
+    "\U0001f469\U0001f3fd\u200d\U0001f9b1",  # 👩🏽‍🦱
+    "\U0001f469\U0001f3fd\u200d\U0001f9b2",  # 👩🏽‍🦲
+    "\U0001f469\U0001f3fd\u200d\U0001f9b3",  # 👩🏽‍🦳
+    "\U0001f469\U0001f3fd\u200d\U0001f9bc",  # 👩🏽‍🦼
+    "\U0001f469\U0001f3fd\u200d\U0001f9bc\u200d\u27a1",  # 👩🏽‍🦼‍➡
+    "\U0001f469\U0001f3fd\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩🏽‍🦼‍➡️
+    "\U0001f469\U0001f3fd\u200d\U0001f9bd",  # 👩🏽‍🦽
+    "\U0001f469\U0001f3fd\u200d\U0001f9bd\u200d\u27a1",  # 👩🏽‍🦽‍➡
+    "\U0001f469\U0001f3fd\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩🏽‍🦽‍➡️
+    "\U0001f469\U0001f3fd\u200d\U0001faef\u200d\U0001f469\U0001f3fb",  # 👩🏽‍🫯‍👩🏻
+    "\U0001f469\U0001f3fd\u200d\U0001faef\u200d\U0001f469\U0001f3fc",  # 👩🏽‍🫯‍👩🏼
+    "\U0001f469\U0001f3fd\u200d\U0001faef\u200d\U0001f469\U0001f3fe",  # 👩🏽‍🫯‍👩🏾
+    "\U0001f469\U0001f3fd\u200d\U0001faef\u200d\U0001f469\U0001f3ff",  # 👩🏽‍🫯‍👩🏿
+    "\U0001f469\U0001f3fe",  # 👩🏾
+    "\U0001f469\U0001f3fe\u200d\u2695",  # 👩🏾‍⚕
+    "\U0001f469\U0001f3fe\u200d\u2695\ufe0f",  # 👩🏾‍⚕️
+    "\U0001f469\U0001f3fe\u200d\u2696",  # 👩🏾‍⚖
+    "\U0001f469\U0001f3fe\u200d\u2696\ufe0f",  # 👩🏾‍⚖️
+    "\U0001f469\U0001f3fe\u200d\u2708",  # 👩🏾‍✈
+    "\U0001f469\U0001f3fe\u200d\u2708\ufe0f",  # 👩🏾‍✈️
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👩🏾‍❤‍👨🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👩🏾‍❤‍👨🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👩🏾‍❤‍👨🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👩🏾‍❤‍👨🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👩🏾‍❤‍👨🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f469\U0001f3fb",  # 👩🏾‍❤‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f469\U0001f3fc",  # 👩🏾‍❤‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f469\U0001f3fd",  # 👩🏾‍❤‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f469\U0001f3fe",  # 👩🏾‍❤‍👩🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f469\U0001f3ff",  # 👩🏾‍❤‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏾‍❤‍💋‍👨🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏾‍❤‍💋‍👨🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏾‍❤‍💋‍👨🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏾‍❤‍💋‍👨🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏾‍❤‍💋‍👨🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏾‍❤‍💋‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏾‍❤‍💋‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏾‍❤‍💋‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏾‍❤‍💋‍👩🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏾‍❤‍💋‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👩🏾‍❤️‍👨🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👩🏾‍❤️‍👨🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👩🏾‍❤️‍👨🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👩🏾‍❤️‍👨🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👩🏾‍❤️‍👨🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fb",  # 👩🏾‍❤️‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fc",  # 👩🏾‍❤️‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fd",  # 👩🏾‍❤️‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fe",  # 👩🏾‍❤️‍👩🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3ff",  # 👩🏾‍❤️‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏾‍❤️‍💋‍👨🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏾‍❤️‍💋‍👨🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏾‍❤️‍💋‍👨🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏾‍❤️‍💋‍👨🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏾‍❤️‍💋‍👨🏿
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏾‍❤️‍💋‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏾‍❤️‍💋‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏾‍❤️‍💋‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏾‍❤️‍💋‍👩🏾
+    "\U0001f469\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏾‍❤️‍💋‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\U0001f33e",  # 👩🏾‍🌾
+    "\U0001f469\U0001f3fe\u200d\U0001f373",  # 👩🏾‍🍳
+    "\U0001f469\U0001f3fe\u200d\U0001f37c",  # 👩🏾‍🍼
+    "\U0001f469\U0001f3fe\u200d\U0001f393",  # 👩🏾‍🎓
+    "\U0001f469\U0001f3fe\u200d\U0001f3a4",  # 👩🏾‍🎤
+    "\U0001f469\U0001f3fe\u200d\U0001f3a8",  # 👩🏾‍🎨
+    "\U0001f469\U0001f3fe\u200d\U0001f3eb",  # 👩🏾‍🏫
+    "\U0001f469\U0001f3fe\u200d\U0001f3ed",  # 👩🏾‍🏭
+    "\U0001f469\U0001f3fe\u200d\U0001f430\u200d\U0001f469\U0001f3fb",  # 👩🏾‍🐰‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\U0001f430\u200d\U0001f469\U0001f3fc",  # 👩🏾‍🐰‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\U0001f430\u200d\U0001f469\U0001f3fd",  # 👩🏾‍🐰‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\U0001f430\u200d\U0001f469\U0001f3ff",  # 👩🏾‍🐰‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\U0001f4bb",  # 👩🏾‍💻
+    "\U0001f469\U0001f3fe\u200d\U0001f4bc",  # 👩🏾‍💼
+    "\U0001f469\U0001f3fe\u200d\U0001f527",  # 👩🏾‍🔧
+    "\U0001f469\U0001f3fe\u200d\U0001f52c",  # 👩🏾‍🔬
+    "\U0001f469\U0001f3fe\u200d\U0001f680",  # 👩🏾‍🚀
+    "\U0001f469\U0001f3fe\u200d\U0001f692",  # 👩🏾‍🚒
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👩🏾‍🤝‍👨🏻
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👩🏾‍🤝‍👨🏼
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👩🏾‍🤝‍👨🏽
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f468\U0001f3ff",  # 👩🏾‍🤝‍👨🏿
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f469\U0001f3fb",  # 👩🏾‍🤝‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f469\U0001f3fc",  # 👩🏾‍🤝‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f469\U0001f3fd",  # 👩🏾‍🤝‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\U0001f91d\u200d\U0001f469\U0001f3ff",  # 👩🏾‍🤝‍👩🏿
+    "\U0001f469\U0001f3fe\u200d\U0001f9af",  # 👩🏾‍🦯
+    "\U0001f469\U0001f3fe\u200d\U0001f9af\u200d\u27a1",  # 👩🏾‍🦯‍➡
+    "\U0001f469\U0001f3fe\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩🏾‍🦯‍➡️
+    "\U0001f469\U0001f3fe\u200d\U0001f9b0",  # 👩🏾‍🦰
+    "\U0001f469\U0001f3fe\u200d\U0001f9b1",  # 👩🏾‍🦱
+    "\U0001f469\U0001f3fe\u200d\U0001f9b2",  # 👩🏾‍🦲
+    "\U0001f469\U0001f3fe\u200d\U0001f9b3",  # 👩🏾‍🦳
+    "\U0001f469\U0001f3fe\u200d\U0001f9bc",  # 👩🏾‍🦼
+    "\U0001f469\U0001f3fe\u200d\U0001f9bc\u200d\u27a1",  # 👩🏾‍🦼‍➡
+    "\U0001f469\U0001f3fe\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩🏾‍🦼‍➡️
+    "\U0001f469\U0001f3fe\u200d\U0001f9bd",  # 👩🏾‍🦽
+    "\U0001f469\U0001f3fe\u200d\U0001f9bd\u200d\u27a1",  # 👩🏾‍🦽‍➡
+    "\U0001f469\U0001f3fe\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩🏾‍🦽‍➡️
+    "\U0001f469\U0001f3fe\u200d\U0001faef\u200d\U0001f469\U0001f3fb",  # 👩🏾‍🫯‍👩🏻
+    "\U0001f469\U0001f3fe\u200d\U0001faef\u200d\U0001f469\U0001f3fc",  # 👩🏾‍🫯‍👩🏼
+    "\U0001f469\U0001f3fe\u200d\U0001faef\u200d\U0001f469\U0001f3fd",  # 👩🏾‍🫯‍👩🏽
+    "\U0001f469\U0001f3fe\u200d\U0001faef\u200d\U0001f469\U0001f3ff",  # 👩🏾‍🫯‍👩🏿
+    "\U0001f469\U0001f3ff",  # 👩🏿
+    "\U0001f469\U0001f3ff\u200d\u2695",  # 👩🏿‍⚕
+    "\U0001f469\U0001f3ff\u200d\u2695\ufe0f",  # 👩🏿‍⚕️
+    "\U0001f469\U0001f3ff\u200d\u2696",  # 👩🏿‍⚖
+    "\U0001f469\U0001f3ff\u200d\u2696\ufe0f",  # 👩🏿‍⚖️
+    "\U0001f469\U0001f3ff\u200d\u2708",  # 👩🏿‍✈
+    "\U0001f469\U0001f3ff\u200d\u2708\ufe0f",  # 👩🏿‍✈️
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fb",  # 👩🏿‍❤‍👨🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fc",  # 👩🏿‍❤‍👨🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fd",  # 👩🏿‍❤‍👨🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3fe",  # 👩🏿‍❤‍👨🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f468\U0001f3ff",  # 👩🏿‍❤‍👨🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f469\U0001f3fb",  # 👩🏿‍❤‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f469\U0001f3fc",  # 👩🏿‍❤‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f469\U0001f3fd",  # 👩🏿‍❤‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f469\U0001f3fe",  # 👩🏿‍❤‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f469\U0001f3ff",  # 👩🏿‍❤‍👩🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏿‍❤‍💋‍👨🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏿‍❤‍💋‍👨🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏿‍❤‍💋‍👨🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏿‍❤‍💋‍👨🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏿‍❤‍💋‍👨🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏿‍❤‍💋‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏿‍❤‍💋‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏿‍❤‍💋‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏿‍❤‍💋‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏿‍❤‍💋‍👩🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fb",  # 👩🏿‍❤️‍👨🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fc",  # 👩🏿‍❤️‍👨🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fd",  # 👩🏿‍❤️‍👨🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3fe",  # 👩🏿‍❤️‍👨🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f468\U0001f3ff",  # 👩🏿‍❤️‍👨🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fb",  # 👩🏿‍❤️‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fc",  # 👩🏿‍❤️‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fd",  # 👩🏿‍❤️‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3fe",  # 👩🏿‍❤️‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f469\U0001f3ff",  # 👩🏿‍❤️‍👩🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fb",  # 👩🏿‍❤️‍💋‍👨🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fc",  # 👩🏿‍❤️‍💋‍👨🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fd",  # 👩🏿‍❤️‍💋‍👨🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3fe",  # 👩🏿‍❤️‍💋‍👨🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468\U0001f3ff",  # 👩🏿‍❤️‍💋‍👨🏿
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fb",  # 👩🏿‍❤️‍💋‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fc",  # 👩🏿‍❤️‍💋‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fd",  # 👩🏿‍❤️‍💋‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3fe",  # 👩🏿‍❤️‍💋‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469\U0001f3ff",  # 👩🏿‍❤️‍💋‍👩🏿
+    "\U0001f469\U0001f3ff\u200d\U0001f33e",  # 👩🏿‍🌾
+    "\U0001f469\U0001f3ff\u200d\U0001f373",  # 👩🏿‍🍳
+    "\U0001f469\U0001f3ff\u200d\U0001f37c",  # 👩🏿‍🍼
+    "\U0001f469\U0001f3ff\u200d\U0001f393",  # 👩🏿‍🎓
+    "\U0001f469\U0001f3ff\u200d\U0001f3a4",  # 👩🏿‍🎤
+    "\U0001f469\U0001f3ff\u200d\U0001f3a8",  # 👩🏿‍🎨
+    "\U0001f469\U0001f3ff\u200d\U0001f3eb",  # 👩🏿‍🏫
+    "\U0001f469\U0001f3ff\u200d\U0001f3ed",  # 👩🏿‍🏭
+    "\U0001f469\U0001f3ff\u200d\U0001f430\u200d\U0001f469\U0001f3fb",  # 👩🏿‍🐰‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\U0001f430\u200d\U0001f469\U0001f3fc",  # 👩🏿‍🐰‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\U0001f430\u200d\U0001f469\U0001f3fd",  # 👩🏿‍🐰‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\U0001f430\u200d\U0001f469\U0001f3fe",  # 👩🏿‍🐰‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\U0001f4bb",  # 👩🏿‍💻
+    "\U0001f469\U0001f3ff\u200d\U0001f4bc",  # 👩🏿‍💼
+    "\U0001f469\U0001f3ff\u200d\U0001f527",  # 👩🏿‍🔧
+    "\U0001f469\U0001f3ff\u200d\U0001f52c",  # 👩🏿‍🔬
+    "\U0001f469\U0001f3ff\u200d\U0001f680",  # 👩🏿‍🚀
+    "\U0001f469\U0001f3ff\u200d\U0001f692",  # 👩🏿‍🚒
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fb",  # 👩🏿‍🤝‍👨🏻
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fc",  # 👩🏿‍🤝‍👨🏼
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fd",  # 👩🏿‍🤝‍👨🏽
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f468\U0001f3fe",  # 👩🏿‍🤝‍👨🏾
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f469\U0001f3fb",  # 👩🏿‍🤝‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f469\U0001f3fc",  # 👩🏿‍🤝‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f469\U0001f3fd",  # 👩🏿‍🤝‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\U0001f91d\u200d\U0001f469\U0001f3fe",  # 👩🏿‍🤝‍👩🏾
+    "\U0001f469\U0001f3ff\u200d\U0001f9af",  # 👩🏿‍🦯
+    "\U0001f469\U0001f3ff\u200d\U0001f9af\u200d\u27a1",  # 👩🏿‍🦯‍➡
+    "\U0001f469\U0001f3ff\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 👩🏿‍🦯‍➡️
+    "\U0001f469\U0001f3ff\u200d\U0001f9b0",  # 👩🏿‍🦰
+    "\U0001f469\U0001f3ff\u200d\U0001f9b1",  # 👩🏿‍🦱
+    "\U0001f469\U0001f3ff\u200d\U0001f9b2",  # 👩🏿‍🦲
+    "\U0001f469\U0001f3ff\u200d\U0001f9b3",  # 👩🏿‍🦳
+    "\U0001f469\U0001f3ff\u200d\U0001f9bc",  # 👩🏿‍🦼
+    "\U0001f469\U0001f3ff\u200d\U0001f9bc\u200d\u27a1",  # 👩🏿‍🦼‍➡
+    "\U0001f469\U0001f3ff\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 👩🏿‍🦼‍➡️
+    "\U0001f469\U0001f3ff\u200d\U0001f9bd",  # 👩🏿‍🦽
+    "\U0001f469\U0001f3ff\u200d\U0001f9bd\u200d\u27a1",  # 👩🏿‍🦽‍➡
+    "\U0001f469\U0001f3ff\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 👩🏿‍🦽‍➡️
+    "\U0001f469\U0001f3ff\u200d\U0001faef\u200d\U0001f469\U0001f3fb",  # 👩🏿‍🫯‍👩🏻
+    "\U0001f469\U0001f3ff\u200d\U0001faef\u200d\U0001f469\U0001f3fc",  # 👩🏿‍🫯‍👩🏼
+    "\U0001f469\U0001f3ff\u200d\U0001faef\u200d\U0001f469\U0001f3fd",  # 👩🏿‍🫯‍👩🏽
+    "\U0001f469\U0001f3ff\u200d\U0001faef\u200d\U0001f469\U0001f3fe",  # 👩🏿‍🫯‍👩🏾
+    "\U0001f46b\U0001f3fb",  # 👫🏻
+    "\U0001f46b\U0001f3fc",  # 👫🏼
+    "\U0001f46b\U0001f3fd",  # 👫🏽
+    "\U0001f46b\U0001f3fe",  # 👫🏾
+    "\U0001f46b\U0001f3ff",  # 👫🏿
+    "\U0001f46c\U0001f3fb",  # 👬🏻
+    "\U0001f46c\U0001f3fc",  # 👬🏼
+    "\U0001f46c\U0001f3fd",  # 👬🏽
+    "\U0001f46c\U0001f3fe",  # 👬🏾
+    "\U0001f46c\U0001f3ff",  # 👬🏿
+    "\U0001f46d\U0001f3fb",  # 👭🏻
+    "\U0001f46d\U0001f3fc",  # 👭🏼
+    "\U0001f46d\U0001f3fd",  # 👭🏽
+    "\U0001f46d\U0001f3fe",  # 👭🏾
+    "\U0001f46d\U0001f3ff",  # 👭🏿
+    "\U0001f46e\u200d\u2640",  # 👮‍♀
+    "\U0001f46e\u200d\u2640\ufe0f",  # 👮‍♀️
+    "\U0001f46e\u200d\u2642",  # 👮‍♂
+    "\U0001f46e\u200d\u2642\ufe0f",  # 👮‍♂️
+    "\U0001f46e\U0001f3fb",  # 👮🏻
+    "\U0001f46e\U0001f3fb\u200d\u2640",  # 👮🏻‍♀
+    "\U0001f46e\U0001f3fb\u200d\u2640\ufe0f",  # 👮🏻‍♀️
+    "\U0001f46e\U0001f3fb\u200d\u2642",  # 👮🏻‍♂
+    "\U0001f46e\U0001f3fb\u200d\u2642\ufe0f",  # 👮🏻‍♂️
+    "\U0001f46e\U0001f3fc",  # 👮🏼
+    "\U0001f46e\U0001f3fc\u200d\u2640",  # 👮🏼‍♀
+    "\U0001f46e\U0001f3fc\u200d\u2640\ufe0f",  # 👮🏼‍♀️
+    "\U0001f46e\U0001f3fc\u200d\u2642",  # 👮🏼‍♂
+    "\U0001f46e\U0001f3fc\u200d\u2642\ufe0f",  # 👮🏼‍♂️
+    "\U0001f46e\U0001f3fd",  # 👮🏽
+    "\U0001f46e\U0001f3fd\u200d\u2640",  # 👮🏽‍♀
+    "\U0001f46e\U0001f3fd\u200d\u2640\ufe0f",  # 👮🏽‍♀️
+    "\U0001f46e\U0001f3fd\u200d\u2642",  # 👮🏽‍♂
+    "\U0001f46e\U0001f3fd\u200d\u2642\ufe0f",  # 👮🏽‍♂️
+    "\U0001f46e\U0001f3fe",  # 👮🏾
+    "\U0001f46e\U0001f3fe\u200d\u2640",  # 👮🏾‍♀
+    "\U0001f46e\U0001f3fe\u200d\u2640\ufe0f",  # 👮🏾‍♀️
+    "\U0001f46e\U0001f3fe\u200d\u2642",  # 👮🏾‍♂
+    "\U0001f46e\U0001f3fe\u200d\u2642\ufe0f",  # 👮🏾‍♂️
+    "\U0001f46e\U0001f3ff",  # 👮🏿
+    "\U0001f46e\U0001f3ff\u200d\u2640",  # 👮🏿‍♀
+    "\U0001f46e\U0001f3ff\u200d\u2640\ufe0f",  # 👮🏿‍♀️
+    "\U0001f46e\U0001f3ff\u200d\u2642",  # 👮🏿‍♂
+    "\U0001f46e\U0001f3ff\u200d\u2642\ufe0f",  # 👮🏿‍♂️
+    "\U0001f46f\u200d\u2640",  # 👯‍♀
+    "\U0001f46f\u200d\u2640\ufe0f",  # 👯‍♀️
+    "\U0001f46f\u200d\u2642",  # 👯‍♂
+    "\U0001f46f\u200d\u2642\ufe0f",  # 👯‍♂️
+    "\U0001f46f\U0001f3fb",  # 👯🏻
+    "\U0001f46f\U0001f3fb\u200d\u2640",  # 👯🏻‍♀
+    "\U0001f46f\U0001f3fb\u200d\u2640\ufe0f",  # 👯🏻‍♀️
+    "\U0001f46f\U0001f3fb\u200d\u2642",  # 👯🏻‍♂
+    "\U0001f46f\U0001f3fb\u200d\u2642\ufe0f",  # 👯🏻‍♂️
+    "\U0001f46f\U0001f3fc",  # 👯🏼
+    "\U0001f46f\U0001f3fc\u200d\u2640",  # 👯🏼‍♀
+    "\U0001f46f\U0001f3fc\u200d\u2640\ufe0f",  # 👯🏼‍♀️
+    "\U0001f46f\U0001f3fc\u200d\u2642",  # 👯🏼‍♂
+    "\U0001f46f\U0001f3fc\u200d\u2642\ufe0f",  # 👯🏼‍♂️
+    "\U0001f46f\U0001f3fd",  # 👯🏽
+    "\U0001f46f\U0001f3fd\u200d\u2640",  # 👯🏽‍♀
+    "\U0001f46f\U0001f3fd\u200d\u2640\ufe0f",  # 👯🏽‍♀️
+    "\U0001f46f\U0001f3fd\u200d\u2642",  # 👯🏽‍♂
+    "\U0001f46f\U0001f3fd\u200d\u2642\ufe0f",  # 👯🏽‍♂️
+    "\U0001f46f\U0001f3fe",  # 👯🏾
+    "\U0001f46f\U0001f3fe\u200d\u2640",  # 👯🏾‍♀
+    "\U0001f46f\U0001f3fe\u200d\u2640\ufe0f",  # 👯🏾‍♀️
+    "\U0001f46f\U0001f3fe\u200d\u2642",  # 👯🏾‍♂
+    "\U0001f46f\U0001f3fe\u200d\u2642\ufe0f",  # 👯🏾‍♂️
+    "\U0001f46f\U0001f3ff",  # 👯🏿
+    "\U0001f46f\U0001f3ff\u200d\u2640",  # 👯🏿‍♀
+    "\U0001f46f\U0001f3ff\u200d\u2640\ufe0f",  # 👯🏿‍♀️
+    "\U0001f46f\U0001f3ff\u200d\u2642",  # 👯🏿‍♂
+    "\U0001f46f\U0001f3ff\u200d\u2642\ufe0f",  # 👯🏿‍♂️
+    "\U0001f470\u200d\u2640",  # 👰‍♀
+    "\U0001f470\u200d\u2640\ufe0f",  # 👰‍♀️
+    "\U0001f470\u200d\u2642",  # 👰‍♂
+    "\U0001f470\u200d\u2642\ufe0f",  # 👰‍♂️
+    "\U0001f470\U0001f3fb",  # 👰🏻
+    "\U0001f470\U0001f3fb\u200d\u2640",  # 👰🏻‍♀
+    "\U0001f470\U0001f3fb\u200d\u2640\ufe0f",  # 👰🏻‍♀️
+    "\U0001f470\U0001f3fb\u200d\u2642",  # 👰🏻‍♂
+    "\U0001f470\U0001f3fb\u200d\u2642\ufe0f",  # 👰🏻‍♂️
+    "\U0001f470\U0001f3fc",  # 👰🏼
+    "\U0001f470\U0001f3fc\u200d\u2640",  # 👰🏼‍♀
+    "\U0001f470\U0001f3fc\u200d\u2640\ufe0f",  # 👰🏼‍♀️
+    "\U0001f470\U0001f3fc\u200d\u2642",  # 👰🏼‍♂
+    "\U0001f470\U0001f3fc\u200d\u2642\ufe0f",  # 👰🏼‍♂️
+    "\U0001f470\U0001f3fd",  # 👰🏽
+    "\U0001f470\U0001f3fd\u200d\u2640",  # 👰🏽‍♀
+    "\U0001f470\U0001f3fd\u200d\u2640\ufe0f",  # 👰🏽‍♀️
+    "\U0001f470\U0001f3fd\u200d\u2642",  # 👰🏽‍♂
+    "\U0001f470\U0001f3fd\u200d\u2642\ufe0f",  # 👰🏽‍♂️
+    "\U0001f470\U0001f3fe",  # 👰🏾
+    "\U0001f470\U0001f3fe\u200d\u2640",  # 👰🏾‍♀
+    "\U0001f470\U0001f3fe\u200d\u2640\ufe0f",  # 👰🏾‍♀️
+    "\U0001f470\U0001f3fe\u200d\u2642",  # 👰🏾‍♂
+    "\U0001f470\U0001f3fe\u200d\u2642\ufe0f",  # 👰🏾‍♂️
+    "\U0001f470\U0001f3ff",  # 👰🏿
+    "\U0001f470\U0001f3ff\u200d\u2640",  # 👰🏿‍♀
+    "\U0001f470\U0001f3ff\u200d\u2640\ufe0f",  # 👰🏿‍♀️
+    "\U0001f470\U0001f3ff\u200d\u2642",  # 👰🏿‍♂
+    "\U0001f470\U0001f3ff\u200d\u2642\ufe0f",  # 👰🏿‍♂️
+    "\U0001f471\u200d\u2640",  # 👱‍♀
+    "\U0001f471\u200d\u2640\ufe0f",  # 👱‍♀️
+    "\U0001f471\u200d\u2642",  # 👱‍♂
+    "\U0001f471\u200d\u2642\ufe0f",  # 👱‍♂️
+    "\U0001f471\U0001f3fb",  # 👱🏻
+    "\U0001f471\U0001f3fb\u200d\u2640",  # 👱🏻‍♀
+    "\U0001f471\U0001f3fb\u200d\u2640\ufe0f",  # 👱🏻‍♀️
+    "\U0001f471\U0001f3fb\u200d\u2642",  # 👱🏻‍♂
+    "\U0001f471\U0001f3fb\u200d\u2642\ufe0f",  # 👱🏻‍♂️
+    "\U0001f471\U0001f3fc",  # 👱🏼
+    "\U0001f471\U0001f3fc\u200d\u2640",  # 👱🏼‍♀
+    "\U0001f471\U0001f3fc\u200d\u2640\ufe0f",  # 👱🏼‍♀️
+    "\U0001f471\U0001f3fc\u200d\u2642",  # 👱🏼‍♂
+    "\U0001f471\U0001f3fc\u200d\u2642\ufe0f",  # 👱🏼‍♂️
+    "\U0001f471\U0001f3fd",  # 👱🏽
+    "\U0001f471\U0001f3fd\u200d\u2640",  # 👱🏽‍♀
+    "\U0001f471\U0001f3fd\u200d\u2640\ufe0f",  # 👱🏽‍♀️
+    "\U0001f471\U0001f3fd\u200d\u2642",  # 👱🏽‍♂
+    "\U0001f471\U0001f3fd\u200d\u2642\ufe0f",  # 👱🏽‍♂️
+    "\U0001f471\U0001f3fe",  # 👱🏾
+    "\U0001f471\U0001f3fe\u200d\u2640",  # 👱🏾‍♀
+    "\U0001f471\U0001f3fe\u200d\u2640\ufe0f",  # 👱🏾‍♀️
+    "\U0001f471\U0001f3fe\u200d\u2642",  # 👱🏾‍♂
+    "\U0001f471\U0001f3fe\u200d\u2642\ufe0f",  # 👱🏾‍♂️
+    "\U0001f471\U0001f3ff",  # 👱🏿
+    "\U0001f471\U0001f3ff\u200d\u2640",  # 👱🏿‍♀
+    "\U0001f471\U0001f3ff\u200d\u2640\ufe0f",  # 👱🏿‍♀️
+    "\U0001f471\U0001f3ff\u200d\u2642",  # 👱🏿‍♂
+    "\U0001f471\U0001f3ff\u200d\u2642\ufe0f",  # 👱🏿‍♂️
+    "\U0001f472\U0001f3fb",  # 👲🏻
+    "\U0001f472\U0001f3fc",  # 👲🏼
+    "\U0001f472\U0001f3fd",  # 👲🏽
+    "\U0001f472\U0001f3fe",  # 👲🏾
+    "\U0001f472\U0001f3ff",  # 👲🏿
+    "\U0001f473\u200d\u2640",  # 👳‍♀
+    "\U0001f473\u200d\u2640\ufe0f",  # 👳‍♀️
+    "\U0001f473\u200d\u2642",  # 👳‍♂
+    "\U0001f473\u200d\u2642\ufe0f",  # 👳‍♂️
+    "\U0001f473\U0001f3fb",  # 👳🏻
+    "\U0001f473\U0001f3fb\u200d\u2640",  # 👳🏻‍♀
+    "\U0001f473\U0001f3fb\u200d\u2640\ufe0f",  # 👳🏻‍♀️
+    "\U0001f473\U0001f3fb\u200d\u2642",  # 👳🏻‍♂
+    "\U0001f473\U0001f3fb\u200d\u2642\ufe0f",  # 👳🏻‍♂️
+    "\U0001f473\U0001f3fc",  # 👳🏼
+    "\U0001f473\U0001f3fc\u200d\u2640",  # 👳🏼‍♀
+    "\U0001f473\U0001f3fc\u200d\u2640\ufe0f",  # 👳🏼‍♀️
+    "\U0001f473\U0001f3fc\u200d\u2642",  # 👳🏼‍♂
+    "\U0001f473\U0001f3fc\u200d\u2642\ufe0f",  # 👳🏼‍♂️
+    "\U0001f473\U0001f3fd",  # 👳🏽
+    "\U0001f473\U0001f3fd\u200d\u2640",  # 👳🏽‍♀
+    "\U0001f473\U0001f3fd\u200d\u2640\ufe0f",  # 👳🏽‍♀️
+    "\U0001f473\U0001f3fd\u200d\u2642",  # 👳🏽‍♂
+    "\U0001f473\U0001f3fd\u200d\u2642\ufe0f",  # 👳🏽‍♂️
+    "\U0001f473\U0001f3fe",  # 👳🏾
+    "\U0001f473\U0001f3fe\u200d\u2640",  # 👳🏾‍♀
+    "\U0001f473\U0001f3fe\u200d\u2640\ufe0f",  # 👳🏾‍♀️
+    "\U0001f473\U0001f3fe\u200d\u2642",  # 👳🏾‍♂
+    "\U0001f473\U0001f3fe\u200d\u2642\ufe0f",  # 👳🏾‍♂️
+    "\U0001f473\U0001f3ff",  # 👳🏿
+    "\U0001f473\U0001f3ff\u200d\u2640",  # 👳🏿‍♀
+    "\U0001f473\U0001f3ff\u200d\u2640\ufe0f",  # 👳🏿‍♀️
+    "\U0001f473\U0001f3ff\u200d\u2642",  # 👳🏿‍♂
+    "\U0001f473\U0001f3ff\u200d\u2642\ufe0f",  # 👳🏿‍♂️
+    "\U0001f474\U0001f3fb",  # 👴🏻
+    "\U0001f474\U0001f3fc",  # 👴🏼
+    "\U0001f474\U0001f3fd",  # 👴🏽
+    "\U0001f474\U0001f3fe",  # 👴🏾
+    "\U0001f474\U0001f3ff",  # 👴🏿
+    "\U0001f475\U0001f3fb",  # 👵🏻
+    "\U0001f475\U0001f3fc",  # 👵🏼
+    "\U0001f475\U0001f3fd",  # 👵🏽
+    "\U0001f475\U0001f3fe",  # 👵🏾
+    "\U0001f475\U0001f3ff",  # 👵🏿
+    "\U0001f476\U0001f3fb",  # 👶🏻
+    "\U0001f476\U0001f3fc",  # 👶🏼
+    "\U0001f476\U0001f3fd",  # 👶🏽
+    "\U0001f476\U0001f3fe",  # 👶🏾
+    "\U0001f476\U0001f3ff",  # 👶🏿
+    "\U0001f477\u200d\u2640",  # 👷‍♀
+    "\U0001f477\u200d\u2640\ufe0f",  # 👷‍♀️
+    "\U0001f477\u200d\u2642",  # 👷‍♂
+    "\U0001f477\u200d\u2642\ufe0f",  # 👷‍♂️
+    "\U0001f477\U0001f3fb",  # 👷🏻
+    "\U0001f477\U0001f3fb\u200d\u2640",  # 👷🏻‍♀
+    "\U0001f477\U0001f3fb\u200d\u2640\ufe0f",  # 👷🏻‍♀️
+    "\U0001f477\U0001f3fb\u200d\u2642",  # 👷🏻‍♂
+    "\U0001f477\U0001f3fb\u200d\u2642\ufe0f",  # 👷🏻‍♂️
+    "\U0001f477\U0001f3fc",  # 👷🏼
+    "\U0001f477\U0001f3fc\u200d\u2640",  # 👷🏼‍♀
+    "\U0001f477\U0001f3fc\u200d\u2640\ufe0f",  # 👷🏼‍♀️
+    "\U0001f477\U0001f3fc\u200d\u2642",  # 👷🏼‍♂
+    "\U0001f477\U0001f3fc\u200d\u2642\ufe0f",  # 👷🏼‍♂️
+    "\U0001f477\U0001f3fd",  # 👷🏽
+    "\U0001f477\U0001f3fd\u200d\u2640",  # 👷🏽‍♀
+    "\U0001f477\U0001f3fd\u200d\u2640\ufe0f",  # 👷🏽‍♀️
+    "\U0001f477\U0001f3fd\u200d\u2642",  # 👷🏽‍♂
+    "\U0001f477\U0001f3fd\u200d\u2642\ufe0f",  # 👷🏽‍♂️
+    "\U0001f477\U0001f3fe",  # 👷🏾
+    "\U0001f477\U0001f3fe\u200d\u2640",  # 👷🏾‍♀
+    "\U0001f477\U0001f3fe\u200d\u2640\ufe0f",  # 👷🏾‍♀️
+    "\U0001f477\U0001f3fe\u200d\u2642",  # 👷🏾‍♂
+    "\U0001f477\U0001f3fe\u200d\u2642\ufe0f",  # 👷🏾‍♂️
+    "\U0001f477\U0001f3ff",  # 👷🏿
+    "\U0001f477\U0001f3ff\u200d\u2640",  # 👷🏿‍♀
+    "\U0001f477\U0001f3ff\u200d\u2640\ufe0f",  # 👷🏿‍♀️
+    "\U0001f477\U0001f3ff\u200d\u2642",  # 👷🏿‍♂
+    "\U0001f477\U0001f3ff\u200d\u2642\ufe0f",  # 👷🏿‍♂️
+    "\U0001f478\U0001f3fb",  # 👸🏻
+    "\U0001f478\U0001f3fc",  # 👸🏼
+    "\U0001f478\U0001f3fd",  # 👸🏽
+    "\U0001f478\U0001f3fe",  # 👸🏾
+    "\U0001f478\U0001f3ff",  # 👸🏿
+    "\U0001f47c\U0001f3fb",  # 👼🏻
+    "\U0001f47c\U0001f3fc",  # 👼🏼
+    "\U0001f47c\U0001f3fd",  # 👼🏽
+    "\U0001f47c\U0001f3fe",  # 👼🏾
+    "\U0001f47c\U0001f3ff",  # 👼🏿
+    "\U0001f481\u200d\u2640",  # 💁‍♀
+    "\U0001f481\u200d\u2640\ufe0f",  # 💁‍♀️
+    "\U0001f481\u200d\u2642",  # 💁‍♂
+    "\U0001f481\u200d\u2642\ufe0f",  # 💁‍♂️
+    "\U0001f481\U0001f3fb",  # 💁🏻
+    "\U0001f481\U0001f3fb\u200d\u2640",  # 💁🏻‍♀
+    "\U0001f481\U0001f3fb\u200d\u2640\ufe0f",  # 💁🏻‍♀️
+    "\U0001f481\U0001f3fb\u200d\u2642",  # 💁🏻‍♂
+    "\U0001f481\U0001f3fb\u200d\u2642\ufe0f",  # 💁🏻‍♂️
+    "\U0001f481\U0001f3fc",  # 💁🏼
+    "\U0001f481\U0001f3fc\u200d\u2640",  # 💁🏼‍♀
+    "\U0001f481\U0001f3fc\u200d\u2640\ufe0f",  # 💁🏼‍♀️
+    "\U0001f481\U0001f3fc\u200d\u2642",  # 💁🏼‍♂
+    "\U0001f481\U0001f3fc\u200d\u2642\ufe0f",  # 💁🏼‍♂️
+    "\U0001f481\U0001f3fd",  # 💁🏽
+    "\U0001f481\U0001f3fd\u200d\u2640",  # 💁🏽‍♀
+    "\U0001f481\U0001f3fd\u200d\u2640\ufe0f",  # 💁🏽‍♀️
+    "\U0001f481\U0001f3fd\u200d\u2642",  # 💁🏽‍♂
+    "\U0001f481\U0001f3fd\u200d\u2642\ufe0f",  # 💁🏽‍♂️
+    "\U0001f481\U0001f3fe",  # 💁🏾
+    "\U0001f481\U0001f3fe\u200d\u2640",  # 💁🏾‍♀
+    "\U0001f481\U0001f3fe\u200d\u2640\ufe0f",  # 💁🏾‍♀️
+    "\U0001f481\U0001f3fe\u200d\u2642",  # 💁🏾‍♂
+    "\U0001f481\U0001f3fe\u200d\u2642\ufe0f",  # 💁🏾‍♂️
+    "\U0001f481\U0001f3ff",  # 💁🏿
+    "\U0001f481\U0001f3ff\u200d\u2640",  # 💁🏿‍♀
+    "\U0001f481\U0001f3ff\u200d\u2640\ufe0f",  # 💁🏿‍♀️
+    "\U0001f481\U0001f3ff\u200d\u2642",  # 💁🏿‍♂
+    "\U0001f481\U0001f3ff\u200d\u2642\ufe0f",  # 💁🏿‍♂️
+    "\U0001f482\u200d\u2640",  # 💂‍♀
+    "\U0001f482\u200d\u2640\ufe0f",  # 💂‍♀️
+    "\U0001f482\u200d\u2642",  # 💂‍♂
+    "\U0001f482\u200d\u2642\ufe0f",  # 💂‍♂️
+    "\U0001f482\U0001f3fb",  # 💂🏻
+    "\U0001f482\U0001f3fb\u200d\u2640",  # 💂🏻‍♀
+    "\U0001f482\U0001f3fb\u200d\u2640\ufe0f",  # 💂🏻‍♀️
+    "\U0001f482\U0001f3fb\u200d\u2642",  # 💂🏻‍♂
+    "\U0001f482\U0001f3fb\u200d\u2642\ufe0f",  # 💂🏻‍♂️
+    "\U0001f482\U0001f3fc",  # 💂🏼
+    "\U0001f482\U0001f3fc\u200d\u2640",  # 💂🏼‍♀
+    "\U0001f482\U0001f3fc\u200d\u2640\ufe0f",  # 💂🏼‍♀️
+    "\U0001f482\U0001f3fc\u200d\u2642",  # 💂🏼‍♂
+    "\U0001f482\U0001f3fc\u200d\u2642\ufe0f",  # 💂🏼‍♂️
+    "\U0001f482\U0001f3fd",  # 💂🏽
+    "\U0001f482\U0001f3fd\u200d\u2640",  # 💂🏽‍♀
+    "\U0001f482\U0001f3fd\u200d\u2640\ufe0f",  # 💂🏽‍♀️
+    "\U0001f482\U0001f3fd\u200d\u2642",  # 💂🏽‍♂
+    "\U0001f482\U0001f3fd\u200d\u2642\ufe0f",  # 💂🏽‍♂️
+    "\U0001f482\U0001f3fe",  # 💂🏾
+    "\U0001f482\U0001f3fe\u200d\u2640",  # 💂🏾‍♀
+    "\U0001f482\U0001f3fe\u200d\u2640\ufe0f",  # 💂🏾‍♀️
+    "\U0001f482\U0001f3fe\u200d\u2642",  # 💂🏾‍♂
+    "\U0001f482\U0001f3fe\u200d\u2642\ufe0f",  # 💂🏾‍♂️
+    "\U0001f482\U0001f3ff",  # 💂🏿
+    "\U0001f482\U0001f3ff\u200d\u2640",  # 💂🏿‍♀
+    "\U0001f482\U0001f3ff\u200d\u2640\ufe0f",  # 💂🏿‍♀️
+    "\U0001f482\U0001f3ff\u200d\u2642",  # 💂🏿‍♂
+    "\U0001f482\U0001f3ff\u200d\u2642\ufe0f",  # 💂🏿‍♂️
+    "\U0001f483\U0001f3fb",  # 💃🏻
+    "\U0001f483\U0001f3fc",  # 💃🏼
+    "\U0001f483\U0001f3fd",  # 💃🏽
+    "\U0001f483\U0001f3fe",  # 💃🏾
+    "\U0001f483\U0001f3ff",  # 💃🏿
+    "\U0001f485\U0001f3fb",  # 💅🏻
+    "\U0001f485\U0001f3fc",  # 💅🏼
+    "\U0001f485\U0001f3fd",  # 💅🏽
+    "\U0001f485\U0001f3fe",  # 💅🏾
+    "\U0001f485\U0001f3ff",  # 💅🏿
+    "\U0001f486\u200d\u2640",  # 💆‍♀
+    "\U0001f486\u200d\u2640\ufe0f",  # 💆‍♀️
+    "\U0001f486\u200d\u2642",  # 💆‍♂
+    "\U0001f486\u200d\u2642\ufe0f",  # 💆‍♂️
+    "\U0001f486\U0001f3fb",  # 💆🏻
+    "\U0001f486\U0001f3fb\u200d\u2640",  # 💆🏻‍♀
+    "\U0001f486\U0001f3fb\u200d\u2640\ufe0f",  # 💆🏻‍♀️
+    "\U0001f486\U0001f3fb\u200d\u2642",  # 💆🏻‍♂
+    "\U0001f486\U0001f3fb\u200d\u2642\ufe0f",  # 💆🏻‍♂️
+    "\U0001f486\U0001f3fc",  # 💆🏼
+    "\U0001f486\U0001f3fc\u200d\u2640",  # 💆🏼‍♀
+    "\U0001f486\U0001f3fc\u200d\u2640\ufe0f",  # 💆🏼‍♀️
+    "\U0001f486\U0001f3fc\u200d\u2642",  # 💆🏼‍♂
+    "\U0001f486\U0001f3fc\u200d\u2642\ufe0f",  # 💆🏼‍♂️
+    "\U0001f486\U0001f3fd",  # 💆🏽
+    "\U0001f486\U0001f3fd\u200d\u2640",  # 💆🏽‍♀
+    "\U0001f486\U0001f3fd\u200d\u2640\ufe0f",  # 💆🏽‍♀️
+    "\U0001f486\U0001f3fd\u200d\u2642",  # 💆🏽‍♂
+    "\U0001f486\U0001f3fd\u200d\u2642\ufe0f",  # 💆🏽‍♂️
+    "\U0001f486\U0001f3fe",  # 💆🏾
+    "\U0001f486\U0001f3fe\u200d\u2640",  # 💆🏾‍♀
+    "\U0001f486\U0001f3fe\u200d\u2640\ufe0f",  # 💆🏾‍♀️
+    "\U0001f486\U0001f3fe\u200d\u2642",  # 💆🏾‍♂
+    "\U0001f486\U0001f3fe\u200d\u2642\ufe0f",  # 💆🏾‍♂️
+    "\U0001f486\U0001f3ff",  # 💆🏿
+    "\U0001f486\U0001f3ff\u200d\u2640",  # 💆🏿‍♀
+    "\U0001f486\U0001f3ff\u200d\u2640\ufe0f",  # 💆🏿‍♀️
+    "\U0001f486\U0001f3ff\u200d\u2642",  # 💆🏿‍♂
+    "\U0001f486\U0001f3ff\u200d\u2642\ufe0f",  # 💆🏿‍♂️
+    "\U0001f487\u200d\u2640",  # 💇‍♀
+    "\U0001f487\u200d\u2640\ufe0f",  # 💇‍♀️
+    "\U0001f487\u200d\u2642",  # 💇‍♂
+    "\U0001f487\u200d\u2642\ufe0f",  # 💇‍♂️
+    "\U0001f487\U0001f3fb",  # 💇🏻
+    "\U0001f487\U0001f3fb\u200d\u2640",  # 💇🏻‍♀
+    "\U0001f487\U0001f3fb\u200d\u2640\ufe0f",  # 💇🏻‍♀️
+    "\U0001f487\U0001f3fb\u200d\u2642",  # 💇🏻‍♂
+    "\U0001f487\U0001f3fb\u200d\u2642\ufe0f",  # 💇🏻‍♂️
+    "\U0001f487\U0001f3fc",  # 💇🏼
+    "\U0001f487\U0001f3fc\u200d\u2640",  # 💇🏼‍♀
+    "\U0001f487\U0001f3fc\u200d\u2640\ufe0f",  # 💇🏼‍♀️
+    "\U0001f487\U0001f3fc\u200d\u2642",  # 💇🏼‍♂
+    "\U0001f487\U0001f3fc\u200d\u2642\ufe0f",  # 💇🏼‍♂️
+    "\U0001f487\U0001f3fd",  # 💇🏽
+    "\U0001f487\U0001f3fd\u200d\u2640",  # 💇🏽‍♀
+    "\U0001f487\U0001f3fd\u200d\u2640\ufe0f",  # 💇🏽‍♀️
+    "\U0001f487\U0001f3fd\u200d\u2642",  # 💇🏽‍♂
+    "\U0001f487\U0001f3fd\u200d\u2642\ufe0f",  # 💇🏽‍♂️
+    "\U0001f487\U0001f3fe",  # 💇🏾
+    "\U0001f487\U0001f3fe\u200d\u2640",  # 💇🏾‍♀
+    "\U0001f487\U0001f3fe\u200d\u2640\ufe0f",  # 💇🏾‍♀️
+    "\U0001f487\U0001f3fe\u200d\u2642",  # 💇🏾‍♂
+    "\U0001f487\U0001f3fe\u200d\u2642\ufe0f",  # 💇🏾‍♂️
+    "\U0001f487\U0001f3ff",  # 💇🏿
+    "\U0001f487\U0001f3ff\u200d\u2640",  # 💇🏿‍♀
+    "\U0001f487\U0001f3ff\u200d\u2640\ufe0f",  # 💇🏿‍♀️
+    "\U0001f487\U0001f3ff\u200d\u2642",  # 💇🏿‍♂
+    "\U0001f487\U0001f3ff\u200d\u2642\ufe0f",  # 💇🏿‍♂️
+    "\U0001f48f\U0001f3fb",  # 💏🏻
+    "\U0001f48f\U0001f3fc",  # 💏🏼
+    "\U0001f48f\U0001f3fd",  # 💏🏽
+    "\U0001f48f\U0001f3fe",  # 💏🏾
+    "\U0001f48f\U0001f3ff",  # 💏🏿
+    "\U0001f491\U0001f3fb",  # 💑🏻
+    "\U0001f491\U0001f3fc",  # 💑🏼
+    "\U0001f491\U0001f3fd",  # 💑🏽
+    "\U0001f491\U0001f3fe",  # 💑🏾
+    "\U0001f491\U0001f3ff",  # 💑🏿
+    "\U0001f4aa\U0001f3fb",  # 💪🏻
+    "\U0001f4aa\U0001f3fc",  # 💪🏼
+    "\U0001f4aa\U0001f3fd",  # 💪🏽
+    "\U0001f4aa\U0001f3fe",  # 💪🏾
+    "\U0001f4aa\U0001f3ff",  # 💪🏿
+    "\U0001f4fd\ufe0f",  # 📽️
+    "\U0001f549\ufe0f",  # 🕉️
+    "\U0001f54a\ufe0f",  # 🕊️
+    "\U0001f56f\ufe0f",  # 🕯️
+    "\U0001f570\ufe0f",  # 🕰️
+    "\U0001f573\ufe0f",  # 🕳️
+    "\U0001f574\ufe0f",  # 🕴️
+    "\U0001f574\U0001f3fb",  # 🕴🏻
+    "\U0001f574\U0001f3fc",  # 🕴🏼
+    "\U0001f574\U0001f3fd",  # 🕴🏽
+    "\U0001f574\U0001f3fe",  # 🕴🏾
+    "\U0001f574\U0001f3ff",  # 🕴🏿
+    "\U0001f575\u200d\u2640",  # 🕵‍♀
+    "\U0001f575\u200d\u2640\ufe0f",  # 🕵‍♀️
+    "\U0001f575\u200d\u2642",  # 🕵‍♂
+    "\U0001f575\u200d\u2642\ufe0f",  # 🕵‍♂️
+    "\U0001f575\ufe0f",  # 🕵️
+    "\U0001f575\ufe0f\u200d\u2640",  # 🕵️‍♀
+    "\U0001f575\ufe0f\u200d\u2640\ufe0f",  # 🕵️‍♀️
+    "\U0001f575\ufe0f\u200d\u2642",  # 🕵️‍♂
+    "\U0001f575\ufe0f\u200d\u2642\ufe0f",  # 🕵️‍♂️
+    "\U0001f575\U0001f3fb",  # 🕵🏻
+    "\U0001f575\U0001f3fb\u200d\u2640",  # 🕵🏻‍♀
+    "\U0001f575\U0001f3fb\u200d\u2640\ufe0f",  # 🕵🏻‍♀️
+    "\U0001f575\U0001f3fb\u200d\u2642",  # 🕵🏻‍♂
+    "\U0001f575\U0001f3fb\u200d\u2642\ufe0f",  # 🕵🏻‍♂️
+    "\U0001f575\U0001f3fc",  # 🕵🏼
+    "\U0001f575\U0001f3fc\u200d\u2640",  # 🕵🏼‍♀
+    "\U0001f575\U0001f3fc\u200d\u2640\ufe0f",  # 🕵🏼‍♀️
+    "\U0001f575\U0001f3fc\u200d\u2642",  # 🕵🏼‍♂
+    "\U0001f575\U0001f3fc\u200d\u2642\ufe0f",  # 🕵🏼‍♂️
+    "\U0001f575\U0001f3fd",  # 🕵🏽
+    "\U0001f575\U0001f3fd\u200d\u2640",  # 🕵🏽‍♀
+    "\U0001f575\U0001f3fd\u200d\u2640\ufe0f",  # 🕵🏽‍♀️
+    "\U0001f575\U0001f3fd\u200d\u2642",  # 🕵🏽‍♂
+    "\U0001f575\U0001f3fd\u200d\u2642\ufe0f",  # 🕵🏽‍♂️
+    "\U0001f575\U0001f3fe",  # 🕵🏾
+    "\U0001f575\U0001f3fe\u200d\u2640",  # 🕵🏾‍♀
+    "\U0001f575\U0001f3fe\u200d\u2640\ufe0f",  # 🕵🏾‍♀️
+    "\U0001f575\U0001f3fe\u200d\u2642",  # 🕵🏾‍♂
+    "\U0001f575\U0001f3fe\u200d\u2642\ufe0f",  # 🕵🏾‍♂️
+    "\U0001f575\U0001f3ff",  # 🕵🏿
+    "\U0001f575\U0001f3ff\u200d\u2640",  # 🕵🏿‍♀
+    "\U0001f575\U0001f3ff\u200d\u2640\ufe0f",  # 🕵🏿‍♀️
+    "\U0001f575\U0001f3ff\u200d\u2642",  # 🕵🏿‍♂
+    "\U0001f575\U0001f3ff\u200d\u2642\ufe0f",  # 🕵🏿‍♂️
+    "\U0001f576\ufe0f",  # 🕶️
+    "\U0001f577\ufe0f",  # 🕷️
+    "\U0001f578\ufe0f",  # 🕸️
+    "\U0001f579\ufe0f",  # 🕹️
+    "\U0001f57a\U0001f3fb",  # 🕺🏻
+    "\U0001f57a\U0001f3fc",  # 🕺🏼
+    "\U0001f57a\U0001f3fd",  # 🕺🏽
+    "\U0001f57a\U0001f3fe",  # 🕺🏾
+    "\U0001f57a\U0001f3ff",  # 🕺🏿
+    "\U0001f587\ufe0f",  # 🖇️
+    "\U0001f58a\ufe0f",  # 🖊️
+    "\U0001f58b\ufe0f",  # 🖋️
+    "\U0001f58c\ufe0f",  # 🖌️
+    "\U0001f58d\ufe0f",  # 🖍️
+    "\U0001f590\ufe0f",  # 🖐️
+    "\U0001f590\U0001f3fb",  # 🖐🏻
+    "\U0001f590\U0001f3fc",  # 🖐🏼
+    "\U0001f590\U0001f3fd",  # 🖐🏽
+    "\U0001f590\U0001f3fe",  # 🖐🏾
+    "\U0001f590\U0001f3ff",  # 🖐🏿
+    "\U0001f595\U0001f3fb",  # 🖕🏻
+    "\U0001f595\U0001f3fc",  # 🖕🏼
+    "\U0001f595\U0001f3fd",  # 🖕🏽
+    "\U0001f595\U0001f3fe",  # 🖕🏾
+    "\U0001f595\U0001f3ff",  # 🖕🏿
+    "\U0001f596\U0001f3fb",  # 🖖🏻
+    "\U0001f596\U0001f3fc",  # 🖖🏼
+    "\U0001f596\U0001f3fd",  # 🖖🏽
+    "\U0001f596\U0001f3fe",  # 🖖🏾
+    "\U0001f596\U0001f3ff",  # 🖖🏿
+    "\U0001f5a5\ufe0f",  # 🖥️
+    "\U0001f5a8\ufe0f",  # 🖨️
+    "\U0001f5b1\ufe0f",  # 🖱️
+    "\U0001f5b2\ufe0f",  # 🖲️
+    "\U0001f5bc\ufe0f",  # 🖼️
+    "\U0001f5c2\ufe0f",  # 🗂️
+    "\U0001f5c3\ufe0f",  # 🗃️
+    "\U0001f5c4\ufe0f",  # 🗄️
+    "\U0001f5d1\ufe0f",  # 🗑️
+    "\U0001f5d2\ufe0f",  # 🗒️
+    "\U0001f5d3\ufe0f",  # 🗓️
+    "\U0001f5dc\ufe0f",  # 🗜️
+    "\U0001f5dd\ufe0f",  # 🗝️
+    "\U0001f5de\ufe0f",  # 🗞️
+    "\U0001f5e1\ufe0f",  # 🗡️
+    "\U0001f5e3\ufe0f",  # 🗣️
+    "\U0001f5e8\ufe0f",  # 🗨️
+    "\U0001f5ef\ufe0f",  # 🗯️
+    "\U0001f5f3\ufe0f",  # 🗳️
+    "\U0001f5fa\ufe0f",  # 🗺️
+    "\U0001f62e\u200d\U0001f4a8",  # 😮‍💨
+    "\U0001f635\u200d\U0001f4ab",  # 😵‍💫
+    "\U0001f636\u200d\U0001f32b",  # 😶‍🌫
+    "\U0001f636\u200d\U0001f32b\ufe0f",  # 😶‍🌫️
+    "\U0001f642\u200d\u2194",  # 🙂‍↔
+    "\U0001f642\u200d\u2194\ufe0f",  # 🙂‍↔️
+    "\U0001f642\u200d\u2195",  # 🙂‍↕
+    "\U0001f642\u200d\u2195\ufe0f",  # 🙂‍↕️
+    "\U0001f645\u200d\u2640",  # 🙅‍♀
+    "\U0001f645\u200d\u2640\ufe0f",  # 🙅‍♀️
+    "\U0001f645\u200d\u2642",  # 🙅‍♂
+    "\U0001f645\u200d\u2642\ufe0f",  # 🙅‍♂️
+    "\U0001f645\U0001f3fb",  # 🙅🏻
+    "\U0001f645\U0001f3fb\u200d\u2640",  # 🙅🏻‍♀
+    "\U0001f645\U0001f3fb\u200d\u2640\ufe0f",  # 🙅🏻‍♀️
+    "\U0001f645\U0001f3fb\u200d\u2642",  # 🙅🏻‍♂
+    "\U0001f645\U0001f3fb\u200d\u2642\ufe0f",  # 🙅🏻‍♂️
+    "\U0001f645\U0001f3fc",  # 🙅🏼
+    "\U0001f645\U0001f3fc\u200d\u2640",  # 🙅🏼‍♀
+    "\U0001f645\U0001f3fc\u200d\u2640\ufe0f",  # 🙅🏼‍♀️
+    "\U0001f645\U0001f3fc\u200d\u2642",  # 🙅🏼‍♂
+    "\U0001f645\U0001f3fc\u200d\u2642\ufe0f",  # 🙅🏼‍♂️
+    "\U0001f645\U0001f3fd",  # 🙅🏽
+    "\U0001f645\U0001f3fd\u200d\u2640",  # 🙅🏽‍♀
+    "\U0001f645\U0001f3fd\u200d\u2640\ufe0f",  # 🙅🏽‍♀️
+    "\U0001f645\U0001f3fd\u200d\u2642",  # 🙅🏽‍♂
+    "\U0001f645\U0001f3fd\u200d\u2642\ufe0f",  # 🙅🏽‍♂️
+    "\U0001f645\U0001f3fe",  # 🙅🏾
+    "\U0001f645\U0001f3fe\u200d\u2640",  # 🙅🏾‍♀
+    "\U0001f645\U0001f3fe\u200d\u2640\ufe0f",  # 🙅🏾‍♀️
+    "\U0001f645\U0001f3fe\u200d\u2642",  # 🙅🏾‍♂
+    "\U0001f645\U0001f3fe\u200d\u2642\ufe0f",  # 🙅🏾‍♂️
+    "\U0001f645\U0001f3ff",  # 🙅🏿
+    "\U0001f645\U0001f3ff\u200d\u2640",  # 🙅🏿‍♀
+    "\U0001f645\U0001f3ff\u200d\u2640\ufe0f",  # 🙅🏿‍♀️
+    "\U0001f645\U0001f3ff\u200d\u2642",  # 🙅🏿‍♂
+    "\U0001f645\U0001f3ff\u200d\u2642\ufe0f",  # 🙅🏿‍♂️
+    "\U0001f646\u200d\u2640",  # 🙆‍♀
+    "\U0001f646\u200d\u2640\ufe0f",  # 🙆‍♀️
+    "\U0001f646\u200d\u2642",  # 🙆‍♂
+    "\U0001f646\u200d\u2642\ufe0f",  # 🙆‍♂️
+    "\U0001f646\U0001f3fb",  # 🙆🏻
+    "\U0001f646\U0001f3fb\u200d\u2640",  # 🙆🏻‍♀
+    "\U0001f646\U0001f3fb\u200d\u2640\ufe0f",  # 🙆🏻‍♀️
+    "\U0001f646\U0001f3fb\u200d\u2642",  # 🙆🏻‍♂
+    "\U0001f646\U0001f3fb\u200d\u2642\ufe0f",  # 🙆🏻‍♂️
+    "\U0001f646\U0001f3fc",  # 🙆🏼
+    "\U0001f646\U0001f3fc\u200d\u2640",  # 🙆🏼‍♀
+    "\U0001f646\U0001f3fc\u200d\u2640\ufe0f",  # 🙆🏼‍♀️
+    "\U0001f646\U0001f3fc\u200d\u2642",  # 🙆🏼‍♂
+    "\U0001f646\U0001f3fc\u200d\u2642\ufe0f",  # 🙆🏼‍♂️
+    "\U0001f646\U0001f3fd",  # 🙆🏽
+    "\U0001f646\U0001f3fd\u200d\u2640",  # 🙆🏽‍♀
+    "\U0001f646\U0001f3fd\u200d\u2640\ufe0f",  # 🙆🏽‍♀️
+    "\U0001f646\U0001f3fd\u200d\u2642",  # 🙆🏽‍♂
+    "\U0001f646\U0001f3fd\u200d\u2642\ufe0f",  # 🙆🏽‍♂️
+    "\U0001f646\U0001f3fe",  # 🙆🏾
+    "\U0001f646\U0001f3fe\u200d\u2640",  # 🙆🏾‍♀
+    "\U0001f646\U0001f3fe\u200d\u2640\ufe0f",  # 🙆🏾‍♀️
+    "\U0001f646\U0001f3fe\u200d\u2642",  # 🙆🏾‍♂
+    "\U0001f646\U0001f3fe\u200d\u2642\ufe0f",  # 🙆🏾‍♂️
+    "\U0001f646\U0001f3ff",  # 🙆🏿
+    "\U0001f646\U0001f3ff\u200d\u2640",  # 🙆🏿‍♀
+    "\U0001f646\U0001f3ff\u200d\u2640\ufe0f",  # 🙆🏿‍♀️
+    "\U0001f646\U0001f3ff\u200d\u2642",  # 🙆🏿‍♂
+    "\U0001f646\U0001f3ff\u200d\u2642\ufe0f",  # 🙆🏿‍♂️
+    "\U0001f647\u200d\u2640",  # 🙇‍♀
+    "\U0001f647\u200d\u2640\ufe0f",  # 🙇‍♀️
+    "\U0001f647\u200d\u2642",  # 🙇‍♂
+    "\U0001f647\u200d\u2642\ufe0f",  # 🙇‍♂️
+    "\U0001f647\U0001f3fb",  # 🙇🏻
+    "\U0001f647\U0001f3fb\u200d\u2640",  # 🙇🏻‍♀
+    "\U0001f647\U0001f3fb\u200d\u2640\ufe0f",  # 🙇🏻‍♀️
+    "\U0001f647\U0001f3fb\u200d\u2642",  # 🙇🏻‍♂
+    "\U0001f647\U0001f3fb\u200d\u2642\ufe0f",  # 🙇🏻‍♂️
+    "\U0001f647\U0001f3fc",  # 🙇🏼
+    "\U0001f647\U0001f3fc\u200d\u2640",  # 🙇🏼‍♀
+    "\U0001f647\U0001f3fc\u200d\u2640\ufe0f",  # 🙇🏼‍♀️
+    "\U0001f647\U0001f3fc\u200d\u2642",  # 🙇🏼‍♂
+    "\U0001f647\U0001f3fc\u200d\u2642\ufe0f",  # 🙇🏼‍♂️
+    "\U0001f647\U0001f3fd",  # 🙇🏽
+    "\U0001f647\U0001f3fd\u200d\u2640",  # 🙇🏽‍♀
+    "\U0001f647\U0001f3fd\u200d\u2640\ufe0f",  # 🙇🏽‍♀️
+    "\U0001f647\U0001f3fd\u200d\u2642",  # 🙇🏽‍♂
+    "\U0001f647\U0001f3fd\u200d\u2642\ufe0f",  # 🙇🏽‍♂️
+    "\U0001f647\U0001f3fe",  # 🙇🏾
+    "\U0001f647\U0001f3fe\u200d\u2640",  # 🙇🏾‍♀
+    "\U0001f647\U0001f3fe\u200d\u2640\ufe0f",  # 🙇🏾‍♀️
+    "\U0001f647\U0001f3fe\u200d\u2642",  # 🙇🏾‍♂
+    "\U0001f647\U0001f3fe\u200d\u2642\ufe0f",  # 🙇🏾‍♂️
+    "\U0001f647\U0001f3ff",  # 🙇🏿
+    "\U0001f647\U0001f3ff\u200d\u2640",  # 🙇🏿‍♀
+    "\U0001f647\U0001f3ff\u200d\u2640\ufe0f",  # 🙇🏿‍♀️
+    "\U0001f647\U0001f3ff\u200d\u2642",  # 🙇🏿‍♂
+    "\U0001f647\U0001f3ff\u200d\u2642\ufe0f",  # 🙇🏿‍♂️
+    "\U0001f64b\u200d\u2640",  # 🙋‍♀
+    "\U0001f64b\u200d\u2640\ufe0f",  # 🙋‍♀️
+    "\U0001f64b\u200d\u2642",  # 🙋‍♂
+    "\U0001f64b\u200d\u2642\ufe0f",  # 🙋‍♂️
+    "\U0001f64b\U0001f3fb",  # 🙋🏻
+    "\U0001f64b\U0001f3fb\u200d\u2640",  # 🙋🏻‍♀
+    "\U0001f64b\U0001f3fb\u200d\u2640\ufe0f",  # 🙋🏻‍♀️
+    "\U0001f64b\U0001f3fb\u200d\u2642",  # 🙋🏻‍♂
+    "\U0001f64b\U0001f3fb\u200d\u2642\ufe0f",  # 🙋🏻‍♂️
+    "\U0001f64b\U0001f3fc",  # 🙋🏼
+    "\U0001f64b\U0001f3fc\u200d\u2640",  # 🙋🏼‍♀
+    "\U0001f64b\U0001f3fc\u200d\u2640\ufe0f",  # 🙋🏼‍♀️
+    "\U0001f64b\U0001f3fc\u200d\u2642",  # 🙋🏼‍♂
+    "\U0001f64b\U0001f3fc\u200d\u2642\ufe0f",  # 🙋🏼‍♂️
+    "\U0001f64b\U0001f3fd",  # 🙋🏽
+    "\U0001f64b\U0001f3fd\u200d\u2640",  # 🙋🏽‍♀
+    "\U0001f64b\U0001f3fd\u200d\u2640\ufe0f",  # 🙋🏽‍♀️
+    "\U0001f64b\U0001f3fd\u200d\u2642",  # 🙋🏽‍♂
+    "\U0001f64b\U0001f3fd\u200d\u2642\ufe0f",  # 🙋🏽‍♂️
+    "\U0001f64b\U0001f3fe",  # 🙋🏾
+    "\U0001f64b\U0001f3fe\u200d\u2640",  # 🙋🏾‍♀
+    "\U0001f64b\U0001f3fe\u200d\u2640\ufe0f",  # 🙋🏾‍♀️
+    "\U0001f64b\U0001f3fe\u200d\u2642",  # 🙋🏾‍♂
+    "\U0001f64b\U0001f3fe\u200d\u2642\ufe0f",  # 🙋🏾‍♂️
+    "\U0001f64b\U0001f3ff",  # 🙋🏿
+    "\U0001f64b\U0001f3ff\u200d\u2640",  # 🙋🏿‍♀
+    "\U0001f64b\U0001f3ff\u200d\u2640\ufe0f",  # 🙋🏿‍♀️
+    "\U0001f64b\U0001f3ff\u200d\u2642",  # 🙋🏿‍♂
+    "\U0001f64b\U0001f3ff\u200d\u2642\ufe0f",  # 🙋🏿‍♂️
+    "\U0001f64c\U0001f3fb",  # 🙌🏻
+    "\U0001f64c\U0001f3fc",  # 🙌🏼
+    "\U0001f64c\U0001f3fd",  # 🙌🏽
+    "\U0001f64c\U0001f3fe",  # 🙌🏾
+    "\U0001f64c\U0001f3ff",  # 🙌🏿
+    "\U0001f64d\u200d\u2640",  # 🙍‍♀
+    "\U0001f64d\u200d\u2640\ufe0f",  # 🙍‍♀️
+    "\U0001f64d\u200d\u2642",  # 🙍‍♂
+    "\U0001f64d\u200d\u2642\ufe0f",  # 🙍‍♂️
+    "\U0001f64d\U0001f3fb",  # 🙍🏻
+    "\U0001f64d\U0001f3fb\u200d\u2640",  # 🙍🏻‍♀
+    "\U0001f64d\U0001f3fb\u200d\u2640\ufe0f",  # 🙍🏻‍♀️
+    "\U0001f64d\U0001f3fb\u200d\u2642",  # 🙍🏻‍♂
+    "\U0001f64d\U0001f3fb\u200d\u2642\ufe0f",  # 🙍🏻‍♂️
+    "\U0001f64d\U0001f3fc",  # 🙍🏼
+    "\U0001f64d\U0001f3fc\u200d\u2640",  # 🙍🏼‍♀
+    "\U0001f64d\U0001f3fc\u200d\u2640\ufe0f",  # 🙍🏼‍♀️
+    "\U0001f64d\U0001f3fc\u200d\u2642",  # 🙍🏼‍♂
+    "\U0001f64d\U0001f3fc\u200d\u2642\ufe0f",  # 🙍🏼‍♂️
+    "\U0001f64d\U0001f3fd",  # 🙍🏽
+    "\U0001f64d\U0001f3fd\u200d\u2640",  # 🙍🏽‍♀
+    "\U0001f64d\U0001f3fd\u200d\u2640\ufe0f",  # 🙍🏽‍♀️
+    "\U0001f64d\U0001f3fd\u200d\u2642",  # 🙍🏽‍♂
+    "\U0001f64d\U0001f3fd\u200d\u2642\ufe0f",  # 🙍🏽‍♂️
+    "\U0001f64d\U0001f3fe",  # 🙍🏾
+    "\U0001f64d\U0001f3fe\u200d\u2640",  # 🙍🏾‍♀
+    "\U0001f64d\U0001f3fe\u200d\u2640\ufe0f",  # 🙍🏾‍♀️
+    "\U0001f64d\U0001f3fe\u200d\u2642",  # 🙍🏾‍♂
+    "\U0001f64d\U0001f3fe\u200d\u2642\ufe0f",  # 🙍🏾‍♂️
+    "\U0001f64d\U0001f3ff",  # 🙍🏿
+    "\U0001f64d\U0001f3ff\u200d\u2640",  # 🙍🏿‍♀
+    "\U0001f64d\U0001f3ff\u200d\u2640\ufe0f",  # 🙍🏿‍♀️
+    "\U0001f64d\U0001f3ff\u200d\u2642",  # 🙍🏿‍♂
+    "\U0001f64d\U0001f3ff\u200d\u2642\ufe0f",  # 🙍🏿‍♂️
+    "\U0001f64e\u200d\u2640",  # 🙎‍♀
+    "\U0001f64e\u200d\u2640\ufe0f",  # 🙎‍♀️
+    "\U0001f64e\u200d\u2642",  # 🙎‍♂
+    "\U0001f64e\u200d\u2642\ufe0f",  # 🙎‍♂️
+    "\U0001f64e\U0001f3fb",  # 🙎🏻
+    "\U0001f64e\U0001f3fb\u200d\u2640",  # 🙎🏻‍♀
+    "\U0001f64e\U0001f3fb\u200d\u2640\ufe0f",  # 🙎🏻‍♀️
+    "\U0001f64e\U0001f3fb\u200d\u2642",  # 🙎🏻‍♂
+    "\U0001f64e\U0001f3fb\u200d\u2642\ufe0f",  # 🙎🏻‍♂️
+    "\U0001f64e\U0001f3fc",  # 🙎🏼
+    "\U0001f64e\U0001f3fc\u200d\u2640",  # 🙎🏼‍♀
+    "\U0001f64e\U0001f3fc\u200d\u2640\ufe0f",  # 🙎🏼‍♀️
+    "\U0001f64e\U0001f3fc\u200d\u2642",  # 🙎🏼‍♂
+    "\U0001f64e\U0001f3fc\u200d\u2642\ufe0f",  # 🙎🏼‍♂️
+    "\U0001f64e\U0001f3fd",  # 🙎🏽
+    "\U0001f64e\U0001f3fd\u200d\u2640",  # 🙎🏽‍♀
+    "\U0001f64e\U0001f3fd\u200d\u2640\ufe0f",  # 🙎🏽‍♀️
+    "\U0001f64e\U0001f3fd\u200d\u2642",  # 🙎🏽‍♂
+    "\U0001f64e\U0001f3fd\u200d\u2642\ufe0f",  # 🙎🏽‍♂️
+    "\U0001f64e\U0001f3fe",  # 🙎🏾
+    "\U0001f64e\U0001f3fe\u200d\u2640",  # 🙎🏾‍♀
+    "\U0001f64e\U0001f3fe\u200d\u2640\ufe0f",  # 🙎🏾‍♀️
+    "\U0001f64e\U0001f3fe\u200d\u2642",  # 🙎🏾‍♂
+    "\U0001f64e\U0001f3fe\u200d\u2642\ufe0f",  # 🙎🏾‍♂️
+    "\U0001f64e\U0001f3ff",  # 🙎🏿
+    "\U0001f64e\U0001f3ff\u200d\u2640",  # 🙎🏿‍♀
+    "\U0001f64e\U0001f3ff\u200d\u2640\ufe0f",  # 🙎🏿‍♀️
+    "\U0001f64e\U0001f3ff\u200d\u2642",  # 🙎🏿‍♂
+    "\U0001f64e\U0001f3ff\u200d\u2642\ufe0f",  # 🙎🏿‍♂️
+    "\U0001f64f\U0001f3fb",  # 🙏🏻
+    "\U0001f64f\U0001f3fc",  # 🙏🏼
+    "\U0001f64f\U0001f3fd",  # 🙏🏽
+    "\U0001f64f\U0001f3fe",  # 🙏🏾
+    "\U0001f64f\U0001f3ff",  # 🙏🏿
+    "\U0001f6a3\u200d\u2640",  # 🚣‍♀
+    "\U0001f6a3\u200d\u2640\ufe0f",  # 🚣‍♀️
+    "\U0001f6a3\u200d\u2642",  # 🚣‍♂
+    "\U0001f6a3\u200d\u2642\ufe0f",  # 🚣‍♂️
+    "\U0001f6a3\U0001f3fb",  # 🚣🏻
+    "\U0001f6a3\U0001f3fb\u200d\u2640",  # 🚣🏻‍♀
+    "\U0001f6a3\U0001f3fb\u200d\u2640\ufe0f",  # 🚣🏻‍♀️
+    "\U0001f6a3\U0001f3fb\u200d\u2642",  # 🚣🏻‍♂
+    "\U0001f6a3\U0001f3fb\u200d\u2642\ufe0f",  # 🚣🏻‍♂️
+    "\U0001f6a3\U0001f3fc",  # 🚣🏼
+    "\U0001f6a3\U0001f3fc\u200d\u2640",  # 🚣🏼‍♀
+    "\U0001f6a3\U0001f3fc\u200d\u2640\ufe0f",  # 🚣🏼‍♀️
+    "\U0001f6a3\U0001f3fc\u200d\u2642",  # 🚣🏼‍♂
+    "\U0001f6a3\U0001f3fc\u200d\u2642\ufe0f",  # 🚣🏼‍♂️
+    "\U0001f6a3\U0001f3fd",  # 🚣🏽
+    "\U0001f6a3\U0001f3fd\u200d\u2640",  # 🚣🏽‍♀
+    "\U0001f6a3\U0001f3fd\u200d\u2640\ufe0f",  # 🚣🏽‍♀️
+    "\U0001f6a3\U0001f3fd\u200d\u2642",  # 🚣🏽‍♂
+    "\U0001f6a3\U0001f3fd\u200d\u2642\ufe0f",  # 🚣🏽‍♂️
+    "\U0001f6a3\U0001f3fe",  # 🚣🏾
+    "\U0001f6a3\U0001f3fe\u200d\u2640",  # 🚣🏾‍♀
+    "\U0001f6a3\U0001f3fe\u200d\u2640\ufe0f",  # 🚣🏾‍♀️
+    "\U0001f6a3\U0001f3fe\u200d\u2642",  # 🚣🏾‍♂
+    "\U0001f6a3\U0001f3fe\u200d\u2642\ufe0f",  # 🚣🏾‍♂️
+    "\U0001f6a3\U0001f3ff",  # 🚣🏿
+    "\U0001f6a3\U0001f3ff\u200d\u2640",  # 🚣🏿‍♀
+    "\U0001f6a3\U0001f3ff\u200d\u2640\ufe0f",  # 🚣🏿‍♀️
+    "\U0001f6a3\U0001f3ff\u200d\u2642",  # 🚣🏿‍♂
+    "\U0001f6a3\U0001f3ff\u200d\u2642\ufe0f",  # 🚣🏿‍♂️
+    "\U0001f6b4\u200d\u2640",  # 🚴‍♀
+    "\U0001f6b4\u200d\u2640\ufe0f",  # 🚴‍♀️
+    "\U0001f6b4\u200d\u2642",  # 🚴‍♂
+    "\U0001f6b4\u200d\u2642\ufe0f",  # 🚴‍♂️
+    "\U0001f6b4\U0001f3fb",  # 🚴🏻
+    "\U0001f6b4\U0001f3fb\u200d\u2640",  # 🚴🏻‍♀
+    "\U0001f6b4\U0001f3fb\u200d\u2640\ufe0f",  # 🚴🏻‍♀️
+    "\U0001f6b4\U0001f3fb\u200d\u2642",  # 🚴🏻‍♂
+    "\U0001f6b4\U0001f3fb\u200d\u2642\ufe0f",  # 🚴🏻‍♂️
+    "\U0001f6b4\U0001f3fc",  # 🚴🏼
+    "\U0001f6b4\U0001f3fc\u200d\u2640",  # 🚴🏼‍♀
+    "\U0001f6b4\U0001f3fc\u200d\u2640\ufe0f",  # 🚴🏼‍♀️
+    "\U0001f6b4\U0001f3fc\u200d\u2642",  # 🚴🏼‍♂
+    "\U0001f6b4\U0001f3fc\u200d\u2642\ufe0f",  # 🚴🏼‍♂️
+    "\U0001f6b4\U0001f3fd",  # 🚴🏽
+    "\U0001f6b4\U0001f3fd\u200d\u2640",  # 🚴🏽‍♀
+    "\U0001f6b4\U0001f3fd\u200d\u2640\ufe0f",  # 🚴🏽‍♀️
+    "\U0001f6b4\U0001f3fd\u200d\u2642",  # 🚴🏽‍♂
+    "\U0001f6b4\U0001f3fd\u200d\u2642\ufe0f",  # 🚴🏽‍♂️
+    "\U0001f6b4\U0001f3fe",  # 🚴🏾
+    "\U0001f6b4\U0001f3fe\u200d\u2640",  # 🚴🏾‍♀
+    "\U0001f6b4\U0001f3fe\u200d\u2640\ufe0f",  # 🚴🏾‍♀️
+    "\U0001f6b4\U0001f3fe\u200d\u2642",  # 🚴🏾‍♂
+    "\U0001f6b4\U0001f3fe\u200d\u2642\ufe0f",  # 🚴🏾‍♂️
+    "\U0001f6b4\U0001f3ff",  # 🚴🏿
+    "\U0001f6b4\U0001f3ff\u200d\u2640",  # 🚴🏿‍♀
+    "\U0001f6b4\U0001f3ff\u200d\u2640\ufe0f",  # 🚴🏿‍♀️
+    "\U0001f6b4\U0001f3ff\u200d\u2642",  # 🚴🏿‍♂
+    "\U0001f6b4\U0001f3ff\u200d\u2642\ufe0f",  # 🚴🏿‍♂️
+    "\U0001f6b5\u200d\u2640",  # 🚵‍♀
+    "\U0001f6b5\u200d\u2640\ufe0f",  # 🚵‍♀️
+    "\U0001f6b5\u200d\u2642",  # 🚵‍♂
+    "\U0001f6b5\u200d\u2642\ufe0f",  # 🚵‍♂️
+    "\U0001f6b5\U0001f3fb",  # 🚵🏻
+    "\U0001f6b5\U0001f3fb\u200d\u2640",  # 🚵🏻‍♀
+    "\U0001f6b5\U0001f3fb\u200d\u2640\ufe0f",  # 🚵🏻‍♀️
+    "\U0001f6b5\U0001f3fb\u200d\u2642",  # 🚵🏻‍♂
+    "\U0001f6b5\U0001f3fb\u200d\u2642\ufe0f",  # 🚵🏻‍♂️
+    "\U0001f6b5\U0001f3fc",  # 🚵🏼
+    "\U0001f6b5\U0001f3fc\u200d\u2640",  # 🚵🏼‍♀
+    "\U0001f6b5\U0001f3fc\u200d\u2640\ufe0f",  # 🚵🏼‍♀️
+    "\U0001f6b5\U0001f3fc\u200d\u2642",  # 🚵🏼‍♂
+    "\U0001f6b5\U0001f3fc\u200d\u2642\ufe0f",  # 🚵🏼‍♂️
+    "\U0001f6b5\U0001f3fd",  # 🚵🏽
+    "\U0001f6b5\U0001f3fd\u200d\u2640",  # 🚵🏽‍♀
+    "\U0001f6b5\U0001f3fd\u200d\u2640\ufe0f",  # 🚵🏽‍♀️
+    "\U0001f6b5\U0001f3fd\u200d\u2642",  # 🚵🏽‍♂
+    "\U0001f6b5\U0001f3fd\u200d\u2642\ufe0f",  # 🚵🏽‍♂️
+    "\U0001f6b5\U0001f3fe",  # 🚵🏾
+    "\U0001f6b5\U0001f3fe\u200d\u2640",  # 🚵🏾‍♀
+    "\U0001f6b5\U0001f3fe\u200d\u2640\ufe0f",  # 🚵🏾‍♀️
+    "\U0001f6b5\U0001f3fe\u200d\u2642",  # 🚵🏾‍♂
+    "\U0001f6b5\U0001f3fe\u200d\u2642\ufe0f",  # 🚵🏾‍♂️
+    "\U0001f6b5\U0001f3ff",  # 🚵🏿
+    "\U0001f6b5\U0001f3ff\u200d\u2640",  # 🚵🏿‍♀
+    "\U0001f6b5\U0001f3ff\u200d\u2640\ufe0f",  # 🚵🏿‍♀️
+    "\U0001f6b5\U0001f3ff\u200d\u2642",  # 🚵🏿‍♂
+    "\U0001f6b5\U0001f3ff\u200d\u2642\ufe0f",  # 🚵🏿‍♂️
+    "\U0001f6b6\u200d\u2640",  # 🚶‍♀
+    "\U0001f6b6\u200d\u2640\u200d\u27a1",  # 🚶‍♀‍➡
+    "\U0001f6b6\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶‍♀‍➡️
+    "\U0001f6b6\u200d\u2640\ufe0f",  # 🚶‍♀️
+    "\U0001f6b6\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶‍♀️‍➡
+    "\U0001f6b6\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶‍♀️‍➡️
+    "\U0001f6b6\u200d\u2642",  # 🚶‍♂
+    "\U0001f6b6\u200d\u2642\u200d\u27a1",  # 🚶‍♂‍➡
+    "\U0001f6b6\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶‍♂‍➡️
+    "\U0001f6b6\u200d\u2642\ufe0f",  # 🚶‍♂️
+    "\U0001f6b6\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶‍♂️‍➡
+    "\U0001f6b6\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶‍♂️‍➡️
+    "\U0001f6b6\u200d\u27a1",  # 🚶‍➡
+    "\U0001f6b6\u200d\u27a1\ufe0f",  # 🚶‍➡️
+    "\U0001f6b6\U0001f3fb",  # 🚶🏻
+    "\U0001f6b6\U0001f3fb\u200d\u2640",  # 🚶🏻‍♀
+    "\U0001f6b6\U0001f3fb\u200d\u2640\u200d\u27a1",  # 🚶🏻‍♀‍➡
+    "\U0001f6b6\U0001f3fb\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶🏻‍♀‍➡️
+    "\U0001f6b6\U0001f3fb\u200d\u2640\ufe0f",  # 🚶🏻‍♀️
+    "\U0001f6b6\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶🏻‍♀️‍➡
+    "\U0001f6b6\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏻‍♀️‍➡️
+    "\U0001f6b6\U0001f3fb\u200d\u2642",  # 🚶🏻‍♂
+    "\U0001f6b6\U0001f3fb\u200d\u2642\u200d\u27a1",  # 🚶🏻‍♂‍➡
+    "\U0001f6b6\U0001f3fb\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶🏻‍♂‍➡️
+    "\U0001f6b6\U0001f3fb\u200d\u2642\ufe0f",  # 🚶🏻‍♂️
+    "\U0001f6b6\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶🏻‍♂️‍➡
+    "\U0001f6b6\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏻‍♂️‍➡️
+    "\U0001f6b6\U0001f3fb\u200d\u27a1",  # 🚶🏻‍➡
+    "\U0001f6b6\U0001f3fb\u200d\u27a1\ufe0f",  # 🚶🏻‍➡️
+    "\U0001f6b6\U0001f3fc",  # 🚶🏼
+    "\U0001f6b6\U0001f3fc\u200d\u2640",  # 🚶🏼‍♀
+    "\U0001f6b6\U0001f3fc\u200d\u2640\u200d\u27a1",  # 🚶🏼‍♀‍➡
+    "\U0001f6b6\U0001f3fc\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶🏼‍♀‍➡️
+    "\U0001f6b6\U0001f3fc\u200d\u2640\ufe0f",  # 🚶🏼‍♀️
+    "\U0001f6b6\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶🏼‍♀️‍➡
+    "\U0001f6b6\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏼‍♀️‍➡️
+    "\U0001f6b6\U0001f3fc\u200d\u2642",  # 🚶🏼‍♂
+    "\U0001f6b6\U0001f3fc\u200d\u2642\u200d\u27a1",  # 🚶🏼‍♂‍➡
+    "\U0001f6b6\U0001f3fc\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶🏼‍♂‍➡️
+    "\U0001f6b6\U0001f3fc\u200d\u2642\ufe0f",  # 🚶🏼‍♂️
+    "\U0001f6b6\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶🏼‍♂️‍➡
+    "\U0001f6b6\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏼‍♂️‍➡️
+    "\U0001f6b6\U0001f3fc\u200d\u27a1",  # 🚶🏼‍➡
+    "\U0001f6b6\U0001f3fc\u200d\u27a1\ufe0f",  # 🚶🏼‍➡️
+    "\U0001f6b6\U0001f3fd",  # 🚶🏽
+    "\U0001f6b6\U0001f3fd\u200d\u2640",  # 🚶🏽‍♀
+    "\U0001f6b6\U0001f3fd\u200d\u2640\u200d\u27a1",  # 🚶🏽‍♀‍➡
+    "\U0001f6b6\U0001f3fd\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶🏽‍♀‍➡️
+    "\U0001f6b6\U0001f3fd\u200d\u2640\ufe0f",  # 🚶🏽‍♀️
+    "\U0001f6b6\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶🏽‍♀️‍➡
+    "\U0001f6b6\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏽‍♀️‍➡️
+    "\U0001f6b6\U0001f3fd\u200d\u2642",  # 🚶🏽‍♂
+    "\U0001f6b6\U0001f3fd\u200d\u2642\u200d\u27a1",  # 🚶🏽‍♂‍➡
+    "\U0001f6b6\U0001f3fd\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶🏽‍♂‍➡️
+    "\U0001f6b6\U0001f3fd\u200d\u2642\ufe0f",  # 🚶🏽‍♂️
+    "\U0001f6b6\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶🏽‍♂️‍➡
+    "\U0001f6b6\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏽‍♂️‍➡️
+    "\U0001f6b6\U0001f3fd\u200d\u27a1",  # 🚶🏽‍➡
+    "\U0001f6b6\U0001f3fd\u200d\u27a1\ufe0f",  # 🚶🏽‍➡️
+    "\U0001f6b6\U0001f3fe",  # 🚶🏾
+    "\U0001f6b6\U0001f3fe\u200d\u2640",  # 🚶🏾‍♀
+    "\U0001f6b6\U0001f3fe\u200d\u2640\u200d\u27a1",  # 🚶🏾‍♀‍➡
+    "\U0001f6b6\U0001f3fe\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶🏾‍♀‍➡️
+    "\U0001f6b6\U0001f3fe\u200d\u2640\ufe0f",  # 🚶🏾‍♀️
+    "\U0001f6b6\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶🏾‍♀️‍➡
+    "\U0001f6b6\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏾‍♀️‍➡️
+    "\U0001f6b6\U0001f3fe\u200d\u2642",  # 🚶🏾‍♂
+    "\U0001f6b6\U0001f3fe\u200d\u2642\u200d\u27a1",  # 🚶🏾‍♂‍➡
+    "\U0001f6b6\U0001f3fe\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶🏾‍♂‍➡️
+    "\U0001f6b6\U0001f3fe\u200d\u2642\ufe0f",  # 🚶🏾‍♂️
+    "\U0001f6b6\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶🏾‍♂️‍➡
+    "\U0001f6b6\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏾‍♂️‍➡️
+    "\U0001f6b6\U0001f3fe\u200d\u27a1",  # 🚶🏾‍➡
+    "\U0001f6b6\U0001f3fe\u200d\u27a1\ufe0f",  # 🚶🏾‍➡️
+    "\U0001f6b6\U0001f3ff",  # 🚶🏿
+    "\U0001f6b6\U0001f3ff\u200d\u2640",  # 🚶🏿‍♀
+    "\U0001f6b6\U0001f3ff\u200d\u2640\u200d\u27a1",  # 🚶🏿‍♀‍➡
+    "\U0001f6b6\U0001f3ff\u200d\u2640\u200d\u27a1\ufe0f",  # 🚶🏿‍♀‍➡️
+    "\U0001f6b6\U0001f3ff\u200d\u2640\ufe0f",  # 🚶🏿‍♀️
+    "\U0001f6b6\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1",  # 🚶🏿‍♀️‍➡
+    "\U0001f6b6\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏿‍♀️‍➡️
+    "\U0001f6b6\U0001f3ff\u200d\u2642",  # 🚶🏿‍♂
+    "\U0001f6b6\U0001f3ff\u200d\u2642\u200d\u27a1",  # 🚶🏿‍♂‍➡
+    "\U0001f6b6\U0001f3ff\u200d\u2642\u200d\u27a1\ufe0f",  # 🚶🏿‍♂‍➡️
+    "\U0001f6b6\U0001f3ff\u200d\u2642\ufe0f",  # 🚶🏿‍♂️
+    "\U0001f6b6\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1",  # 🚶🏿‍♂️‍➡
+    "\U0001f6b6\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🚶🏿‍♂️‍➡️
+    "\U0001f6b6\U0001f3ff\u200d\u27a1",  # 🚶🏿‍➡
+    "\U0001f6b6\U0001f3ff\u200d\u27a1\ufe0f",  # 🚶🏿‍➡️
+    "\U0001f6c0\U0001f3fb",  # 🛀🏻
+    "\U0001f6c0\U0001f3fc",  # 🛀🏼
+    "\U0001f6c0\U0001f3fd",  # 🛀🏽
+    "\U0001f6c0\U0001f3fe",  # 🛀🏾
+    "\U0001f6c0\U0001f3ff",  # 🛀🏿
+    "\U0001f6cb\ufe0f",  # 🛋️
+    "\U0001f6cc\U0001f3fb",  # 🛌🏻
+    "\U0001f6cc\U0001f3fc",  # 🛌🏼
+    "\U0001f6cc\U0001f3fd",  # 🛌🏽
+    "\U0001f6cc\U0001f3fe",  # 🛌🏾
+    "\U0001f6cc\U0001f3ff",  # 🛌🏿
+    "\U0001f6cd\ufe0f",  # 🛍️
+    "\U0001f6ce\ufe0f",  # 🛎️
+    "\U0001f6cf\ufe0f",  # 🛏️
+    "\U0001f6e0\ufe0f",  # 🛠️
+    "\U0001f6e1\ufe0f",  # 🛡️
+    "\U0001f6e2\ufe0f",  # 🛢️
+    "\U0001f6e3\ufe0f",  # 🛣️
+    "\U0001f6e4\ufe0f",  # 🛤️
+    "\U0001f6e5\ufe0f",  # 🛥️
+    "\U0001f6e9\ufe0f",  # 🛩️
+    "\U0001f6f0\ufe0f",  # 🛰️
+    "\U0001f6f3\ufe0f",  # 🛳️
+    "\U0001f90c\U0001f3fb",  # 🤌🏻
+    "\U0001f90c\U0001f3fc",  # 🤌🏼
+    "\U0001f90c\U0001f3fd",  # 🤌🏽
+    "\U0001f90c\U0001f3fe",  # 🤌🏾
+    "\U0001f90c\U0001f3ff",  # 🤌🏿
+    "\U0001f90f\U0001f3fb",  # 🤏🏻
+    "\U0001f90f\U0001f3fc",  # 🤏🏼
+    "\U0001f90f\U0001f3fd",  # 🤏🏽
+    "\U0001f90f\U0001f3fe",  # 🤏🏾
+    "\U0001f90f\U0001f3ff",  # 🤏🏿
+    "\U0001f918\U0001f3fb",  # 🤘🏻
+    "\U0001f918\U0001f3fc",  # 🤘🏼
+    "\U0001f918\U0001f3fd",  # 🤘🏽
+    "\U0001f918\U0001f3fe",  # 🤘🏾
+    "\U0001f918\U0001f3ff",  # 🤘🏿
+    "\U0001f919\U0001f3fb",  # 🤙🏻
+    "\U0001f919\U0001f3fc",  # 🤙🏼
+    "\U0001f919\U0001f3fd",  # 🤙🏽
+    "\U0001f919\U0001f3fe",  # 🤙🏾
+    "\U0001f919\U0001f3ff",  # 🤙🏿
+    "\U0001f91a\U0001f3fb",  # 🤚🏻
+    "\U0001f91a\U0001f3fc",  # 🤚🏼
+    "\U0001f91a\U0001f3fd",  # 🤚🏽
+    "\U0001f91a\U0001f3fe",  # 🤚🏾
+    "\U0001f91a\U0001f3ff",  # 🤚🏿
+    "\U0001f91b\U0001f3fb",  # 🤛🏻
+    "\U0001f91b\U0001f3fc",  # 🤛🏼
+    "\U0001f91b\U0001f3fd",  # 🤛🏽
+    "\U0001f91b\U0001f3fe",  # 🤛🏾
+    "\U0001f91b\U0001f3ff",  # 🤛🏿
+    "\U0001f91c\U0001f3fb",  # 🤜🏻
+    "\U0001f91c\U0001f3fc",  # 🤜🏼
+    "\U0001f91c\U0001f3fd",  # 🤜🏽
+    "\U0001f91c\U0001f3fe",  # 🤜🏾
+    "\U0001f91c\U0001f3ff",  # 🤜🏿
+    "\U0001f91d\U0001f3fb",  # 🤝🏻
+    "\U0001f91d\U0001f3fc",  # 🤝🏼
+    "\U0001f91d\U0001f3fd",  # 🤝🏽
+    "\U0001f91d\U0001f3fe",  # 🤝🏾
+    "\U0001f91d\U0001f3ff",  # 🤝🏿
+    "\U0001f91e\U0001f3fb",  # 🤞🏻
+    "\U0001f91e\U0001f3fc",  # 🤞🏼
+    "\U0001f91e\U0001f3fd",  # 🤞🏽
+    "\U0001f91e\U0001f3fe",  # 🤞🏾
+    "\U0001f91e\U0001f3ff",  # 🤞🏿
+    "\U0001f91f\U0001f3fb",  # 🤟🏻
+    "\U0001f91f\U0001f3fc",  # 🤟🏼
+    "\U0001f91f\U0001f3fd",  # 🤟🏽
+    "\U0001f91f\U0001f3fe",  # 🤟🏾
+    "\U0001f91f\U0001f3ff",  # 🤟🏿
+    "\U0001f926\u200d\u2640",  # 🤦‍♀
+    "\U0001f926\u200d\u2640\ufe0f",  # 🤦‍♀️
+    "\U0001f926\u200d\u2642",  # 🤦‍♂
+    "\U0001f926\u200d\u2642\ufe0f",  # 🤦‍♂️
+    "\U0001f926\U0001f3fb",  # 🤦🏻
+    "\U0001f926\U0001f3fb\u200d\u2640",  # 🤦🏻‍♀
+    "\U0001f926\U0001f3fb\u200d\u2640\ufe0f",  # 🤦🏻‍♀️
+    "\U0001f926\U0001f3fb\u200d\u2642",  # 🤦🏻‍♂
+    "\U0001f926\U0001f3fb\u200d\u2642\ufe0f",  # 🤦🏻‍♂️
+    "\U0001f926\U0001f3fc",  # 🤦🏼
+    "\U0001f926\U0001f3fc\u200d\u2640",  # 🤦🏼‍♀
+    "\U0001f926\U0001f3fc\u200d\u2640\ufe0f",  # 🤦🏼‍♀️
+    "\U0001f926\U0001f3fc\u200d\u2642",  # 🤦🏼‍♂
+    "\U0001f926\U0001f3fc\u200d\u2642\ufe0f",  # 🤦🏼‍♂️
+    "\U0001f926\U0001f3fd",  # 🤦🏽
+    "\U0001f926\U0001f3fd\u200d\u2640",  # 🤦🏽‍♀
+    "\U0001f926\U0001f3fd\u200d\u2640\ufe0f",  # 🤦🏽‍♀️
+    "\U0001f926\U0001f3fd\u200d\u2642",  # 🤦🏽‍♂
+    "\U0001f926\U0001f3fd\u200d\u2642\ufe0f",  # 🤦🏽‍♂️
+    "\U0001f926\U0001f3fe",  # 🤦🏾
+    "\U0001f926\U0001f3fe\u200d\u2640",  # 🤦🏾‍♀
+    "\U0001f926\U0001f3fe\u200d\u2640\ufe0f",  # 🤦🏾‍♀️
+    "\U0001f926\U0001f3fe\u200d\u2642",  # 🤦🏾‍♂
+    "\U0001f926\U0001f3fe\u200d\u2642\ufe0f",  # 🤦🏾‍♂️
+    "\U0001f926\U0001f3ff",  # 🤦🏿
+    "\U0001f926\U0001f3ff\u200d\u2640",  # 🤦🏿‍♀
+    "\U0001f926\U0001f3ff\u200d\u2640\ufe0f",  # 🤦🏿‍♀️
+    "\U0001f926\U0001f3ff\u200d\u2642",  # 🤦🏿‍♂
+    "\U0001f926\U0001f3ff\u200d\u2642\ufe0f",  # 🤦🏿‍♂️
+    "\U0001f930\U0001f3fb",  # 🤰🏻
+    "\U0001f930\U0001f3fc",  # 🤰🏼
+    "\U0001f930\U0001f3fd",  # 🤰🏽
+    "\U0001f930\U0001f3fe",  # 🤰🏾
+    "\U0001f930\U0001f3ff",  # 🤰🏿
+    "\U0001f931\U0001f3fb",  # 🤱🏻
+    "\U0001f931\U0001f3fc",  # 🤱🏼
+    "\U0001f931\U0001f3fd",  # 🤱🏽
+    "\U0001f931\U0001f3fe",  # 🤱🏾
+    "\U0001f931\U0001f3ff",  # 🤱🏿
+    "\U0001f932\U0001f3fb",  # 🤲🏻
+    "\U0001f932\U0001f3fc",  # 🤲🏼
+    "\U0001f932\U0001f3fd",  # 🤲🏽
+    "\U0001f932\U0001f3fe",  # 🤲🏾
+    "\U0001f932\U0001f3ff",  # 🤲🏿
+    "\U0001f933\U0001f3fb",  # 🤳🏻
+    "\U0001f933\U0001f3fc",  # 🤳🏼
+    "\U0001f933\U0001f3fd",  # 🤳🏽
+    "\U0001f933\U0001f3fe",  # 🤳🏾
+    "\U0001f933\U0001f3ff",  # 🤳🏿
+    "\U0001f934\U0001f3fb",  # 🤴🏻
+    "\U0001f934\U0001f3fc",  # 🤴🏼
+    "\U0001f934\U0001f3fd",  # 🤴🏽
+    "\U0001f934\U0001f3fe",  # 🤴🏾
+    "\U0001f934\U0001f3ff",  # 🤴🏿
+    "\U0001f935\u200d\u2640",  # 🤵‍♀
+    "\U0001f935\u200d\u2640\ufe0f",  # 🤵‍♀️
+    "\U0001f935\u200d\u2642",  # 🤵‍♂
+    "\U0001f935\u200d\u2642\ufe0f",  # 🤵‍♂️
+    "\U0001f935\U0001f3fb",  # 🤵🏻
+    "\U0001f935\U0001f3fb\u200d\u2640",  # 🤵🏻‍♀
+    "\U0001f935\U0001f3fb\u200d\u2640\ufe0f",  # 🤵🏻‍♀️
+    "\U0001f935\U0001f3fb\u200d\u2642",  # 🤵🏻‍♂
+    "\U0001f935\U0001f3fb\u200d\u2642\ufe0f",  # 🤵🏻‍♂️
+    "\U0001f935\U0001f3fc",  # 🤵🏼
+    "\U0001f935\U0001f3fc\u200d\u2640",  # 🤵🏼‍♀
+    "\U0001f935\U0001f3fc\u200d\u2640\ufe0f",  # 🤵🏼‍♀️
+    "\U0001f935\U0001f3fc\u200d\u2642",  # 🤵🏼‍♂
+    "\U0001f935\U0001f3fc\u200d\u2642\ufe0f",  # 🤵🏼‍♂️
+    "\U0001f935\U0001f3fd",  # 🤵🏽
+    "\U0001f935\U0001f3fd\u200d\u2640",  # 🤵🏽‍♀
+    "\U0001f935\U0001f3fd\u200d\u2640\ufe0f",  # 🤵🏽‍♀️
+    "\U0001f935\U0001f3fd\u200d\u2642",  # 🤵🏽‍♂
+    "\U0001f935\U0001f3fd\u200d\u2642\ufe0f",  # 🤵🏽‍♂️
+    "\U0001f935\U0001f3fe",  # 🤵🏾
+    "\U0001f935\U0001f3fe\u200d\u2640",  # 🤵🏾‍♀
+    "\U0001f935\U0001f3fe\u200d\u2640\ufe0f",  # 🤵🏾‍♀️
+    "\U0001f935\U0001f3fe\u200d\u2642",  # 🤵🏾‍♂
+    "\U0001f935\U0001f3fe\u200d\u2642\ufe0f",  # 🤵🏾‍♂️
+    "\U0001f935\U0001f3ff",  # 🤵🏿
+    "\U0001f935\U0001f3ff\u200d\u2640",  # 🤵🏿‍♀
+    "\U0001f935\U0001f3ff\u200d\u2640\ufe0f",  # 🤵🏿‍♀️
+    "\U0001f935\U0001f3ff\u200d\u2642",  # 🤵🏿‍♂
+    "\U0001f935\U0001f3ff\u200d\u2642\ufe0f",  # 🤵🏿‍♂️
+    "\U0001f936\U0001f3fb",  # 🤶🏻
+    "\U0001f936\U0001f3fc",  # 🤶🏼
+    "\U0001f936\U0001f3fd",  # 🤶🏽
+    "\U0001f936\U0001f3fe",  # 🤶🏾
+    "\U0001f936\U0001f3ff",  # 🤶🏿
+    "\U0001f937\u200d\u2640",  # 🤷‍♀
+    "\U0001f937\u200d\u2640\ufe0f",  # 🤷‍♀️
+    "\U0001f937\u200d\u2642",  # 🤷‍♂
+    "\U0001f937\u200d\u2642\ufe0f",  # 🤷‍♂️
+    "\U0001f937\U0001f3fb",  # 🤷🏻
+    "\U0001f937\U0001f3fb\u200d\u2640",  # 🤷🏻‍♀
+    "\U0001f937\U0001f3fb\u200d\u2640\ufe0f",  # 🤷🏻‍♀️
+    "\U0001f937\U0001f3fb\u200d\u2642",  # 🤷🏻‍♂
+    "\U0001f937\U0001f3fb\u200d\u2642\ufe0f",  # 🤷🏻‍♂️
+    "\U0001f937\U0001f3fc",  # 🤷🏼
+    "\U0001f937\U0001f3fc\u200d\u2640",  # 🤷🏼‍♀
+    "\U0001f937\U0001f3fc\u200d\u2640\ufe0f",  # 🤷🏼‍♀️
+    "\U0001f937\U0001f3fc\u200d\u2642",  # 🤷🏼‍♂
+    "\U0001f937\U0001f3fc\u200d\u2642\ufe0f",  # 🤷🏼‍♂️
+    "\U0001f937\U0001f3fd",  # 🤷🏽
+    "\U0001f937\U0001f3fd\u200d\u2640",  # 🤷🏽‍♀
+    "\U0001f937\U0001f3fd\u200d\u2640\ufe0f",  # 🤷🏽‍♀️
+    "\U0001f937\U0001f3fd\u200d\u2642",  # 🤷🏽‍♂
+    "\U0001f937\U0001f3fd\u200d\u2642\ufe0f",  # 🤷🏽‍♂️
+    "\U0001f937\U0001f3fe",  # 🤷🏾
+    "\U0001f937\U0001f3fe\u200d\u2640",  # 🤷🏾‍♀
+    "\U0001f937\U0001f3fe\u200d\u2640\ufe0f",  # 🤷🏾‍♀️
+    "\U0001f937\U0001f3fe\u200d\u2642",  # 🤷🏾‍♂
+    "\U0001f937\U0001f3fe\u200d\u2642\ufe0f",  # 🤷🏾‍♂️
+    "\U0001f937\U0001f3ff",  # 🤷🏿
+    "\U0001f937\U0001f3ff\u200d\u2640",  # 🤷🏿‍♀
+    "\U0001f937\U0001f3ff\u200d\u2640\ufe0f",  # 🤷🏿‍♀️
+    "\U0001f937\U0001f3ff\u200d\u2642",  # 🤷🏿‍♂
+    "\U0001f937\U0001f3ff\u200d\u2642\ufe0f",  # 🤷🏿‍♂️
+    "\U0001f938\u200d\u2640",  # 🤸‍♀
+    "\U0001f938\u200d\u2640\ufe0f",  # 🤸‍♀️
+    "\U0001f938\u200d\u2642",  # 🤸‍♂
+    "\U0001f938\u200d\u2642\ufe0f",  # 🤸‍♂️
+    "\U0001f938\U0001f3fb",  # 🤸🏻
+    "\U0001f938\U0001f3fb\u200d\u2640",  # 🤸🏻‍♀
+    "\U0001f938\U0001f3fb\u200d\u2640\ufe0f",  # 🤸🏻‍♀️
+    "\U0001f938\U0001f3fb\u200d\u2642",  # 🤸🏻‍♂
+    "\U0001f938\U0001f3fb\u200d\u2642\ufe0f",  # 🤸🏻‍♂️
+    "\U0001f938\U0001f3fc",  # 🤸🏼
+    "\U0001f938\U0001f3fc\u200d\u2640",  # 🤸🏼‍♀
+    "\U0001f938\U0001f3fc\u200d\u2640\ufe0f",  # 🤸🏼‍♀️
+    "\U0001f938\U0001f3fc\u200d\u2642",  # 🤸🏼‍♂
+    "\U0001f938\U0001f3fc\u200d\u2642\ufe0f",  # 🤸🏼‍♂️
+    "\U0001f938\U0001f3fd",  # 🤸🏽
+    "\U0001f938\U0001f3fd\u200d\u2640",  # 🤸🏽‍♀
+    "\U0001f938\U0001f3fd\u200d\u2640\ufe0f",  # 🤸🏽‍♀️
+    "\U0001f938\U0001f3fd\u200d\u2642",  # 🤸🏽‍♂
+    "\U0001f938\U0001f3fd\u200d\u2642\ufe0f",  # 🤸🏽‍♂️
+    "\U0001f938\U0001f3fe",  # 🤸🏾
+    "\U0001f938\U0001f3fe\u200d\u2640",  # 🤸🏾‍♀
+    "\U0001f938\U0001f3fe\u200d\u2640\ufe0f",  # 🤸🏾‍♀️
+    "\U0001f938\U0001f3fe\u200d\u2642",  # 🤸🏾‍♂
+    "\U0001f938\U0001f3fe\u200d\u2642\ufe0f",  # 🤸🏾‍♂️
+    "\U0001f938\U0001f3ff",  # 🤸🏿
+    "\U0001f938\U0001f3ff\u200d\u2640",  # 🤸🏿‍♀
+    "\U0001f938\U0001f3ff\u200d\u2640\ufe0f",  # 🤸🏿‍♀️
+    "\U0001f938\U0001f3ff\u200d\u2642",  # 🤸🏿‍♂
+    "\U0001f938\U0001f3ff\u200d\u2642\ufe0f",  # 🤸🏿‍♂️
+    "\U0001f939\u200d\u2640",  # 🤹‍♀
+    "\U0001f939\u200d\u2640\ufe0f",  # 🤹‍♀️
+    "\U0001f939\u200d\u2642",  # 🤹‍♂
+    "\U0001f939\u200d\u2642\ufe0f",  # 🤹‍♂️
+    "\U0001f939\U0001f3fb",  # 🤹🏻
+    "\U0001f939\U0001f3fb\u200d\u2640",  # 🤹🏻‍♀
+    "\U0001f939\U0001f3fb\u200d\u2640\ufe0f",  # 🤹🏻‍♀️
+    "\U0001f939\U0001f3fb\u200d\u2642",  # 🤹🏻‍♂
+    "\U0001f939\U0001f3fb\u200d\u2642\ufe0f",  # 🤹🏻‍♂️
+    "\U0001f939\U0001f3fc",  # 🤹🏼
+    "\U0001f939\U0001f3fc\u200d\u2640",  # 🤹🏼‍♀
+    "\U0001f939\U0001f3fc\u200d\u2640\ufe0f",  # 🤹🏼‍♀️
+    "\U0001f939\U0001f3fc\u200d\u2642",  # 🤹🏼‍♂
+    "\U0001f939\U0001f3fc\u200d\u2642\ufe0f",  # 🤹🏼‍♂️
+    "\U0001f939\U0001f3fd",  # 🤹🏽
+    "\U0001f939\U0001f3fd\u200d\u2640",  # 🤹🏽‍♀
+    "\U0001f939\U0001f3fd\u200d\u2640\ufe0f",  # 🤹🏽‍♀️
+    "\U0001f939\U0001f3fd\u200d\u2642",  # 🤹🏽‍♂
+    "\U0001f939\U0001f3fd\u200d\u2642\ufe0f",  # 🤹🏽‍♂️
+    "\U0001f939\U0001f3fe",  # 🤹🏾
+    "\U0001f939\U0001f3fe\u200d\u2640",  # 🤹🏾‍♀
+    "\U0001f939\U0001f3fe\u200d\u2640\ufe0f",  # 🤹🏾‍♀️
+    "\U0001f939\U0001f3fe\u200d\u2642",  # 🤹🏾‍♂
+    "\U0001f939\U0001f3fe\u200d\u2642\ufe0f",  # 🤹🏾‍♂️
+    "\U0001f939\U0001f3ff",  # 🤹🏿
+    "\U0001f939\U0001f3ff\u200d\u2640",  # 🤹🏿‍♀
+    "\U0001f939\U0001f3ff\u200d\u2640\ufe0f",  # 🤹🏿‍♀️
+    "\U0001f939\U0001f3ff\u200d\u2642",  # 🤹🏿‍♂
+    "\U0001f939\U0001f3ff\u200d\u2642\ufe0f",  # 🤹🏿‍♂️
+    "\U0001f93c\u200d\u2640",  # 🤼‍♀
+    "\U0001f93c\u200d\u2640\ufe0f",  # 🤼‍♀️
+    "\U0001f93c\u200d\u2642",  # 🤼‍♂
+    "\U0001f93c\u200d\u2642\ufe0f",  # 🤼‍♂️
+    "\U0001f93c\U0001f3fb",  # 🤼🏻
+    "\U0001f93c\U0001f3fb\u200d\u2640",  # 🤼🏻‍♀
+    "\U0001f93c\U0001f3fb\u200d\u2640\ufe0f",  # 🤼🏻‍♀️
+    "\U0001f93c\U0001f3fb\u200d\u2642",  # 🤼🏻‍♂
+    "\U0001f93c\U0001f3fb\u200d\u2642\ufe0f",  # 🤼🏻‍♂️
+    "\U0001f93c\U0001f3fc",  # 🤼🏼
+    "\U0001f93c\U0001f3fc\u200d\u2640",  # 🤼🏼‍♀
+    "\U0001f93c\U0001f3fc\u200d\u2640\ufe0f",  # 🤼🏼‍♀️
+    "\U0001f93c\U0001f3fc\u200d\u2642",  # 🤼🏼‍♂
+    "\U0001f93c\U0001f3fc\u200d\u2642\ufe0f",  # 🤼🏼‍♂️
+    "\U0001f93c\U0001f3fd",  # 🤼🏽
+    "\U0001f93c\U0001f3fd\u200d\u2640",  # 🤼🏽‍♀
+    "\U0001f93c\U0001f3fd\u200d\u2640\ufe0f",  # 🤼🏽‍♀️
+    "\U0001f93c\U0001f3fd\u200d\u2642",  # 🤼🏽‍♂
+    "\U0001f93c\U0001f3fd\u200d\u2642\ufe0f",  # 🤼🏽‍♂️
+    "\U0001f93c\U0001f3fe",  # 🤼🏾
+    "\U0001f93c\U0001f3fe\u200d\u2640",  # 🤼🏾‍♀
+    "\U0001f93c\U0001f3fe\u200d\u2640\ufe0f",  # 🤼🏾‍♀️
+    "\U0001f93c\U0001f3fe\u200d\u2642",  # 🤼🏾‍♂
+    "\U0001f93c\U0001f3fe\u200d\u2642\ufe0f",  # 🤼🏾‍♂️
+    "\U0001f93c\U0001f3ff",  # 🤼🏿
+    "\U0001f93c\U0001f3ff\u200d\u2640",  # 🤼🏿‍♀
+    "\U0001f93c\U0001f3ff\u200d\u2640\ufe0f",  # 🤼🏿‍♀️
+    "\U0001f93c\U0001f3ff\u200d\u2642",  # 🤼🏿‍♂
+    "\U0001f93c\U0001f3ff\u200d\u2642\ufe0f",  # 🤼🏿‍♂️
+    "\U0001f93d\u200d\u2640",  # 🤽‍♀
+    "\U0001f93d\u200d\u2640\ufe0f",  # 🤽‍♀️
+    "\U0001f93d\u200d\u2642",  # 🤽‍♂
+    "\U0001f93d\u200d\u2642\ufe0f",  # 🤽‍♂️
+    "\U0001f93d\U0001f3fb",  # 🤽🏻
+    "\U0001f93d\U0001f3fb\u200d\u2640",  # 🤽🏻‍♀
+    "\U0001f93d\U0001f3fb\u200d\u2640\ufe0f",  # 🤽🏻‍♀️
+    "\U0001f93d\U0001f3fb\u200d\u2642",  # 🤽🏻‍♂
+    "\U0001f93d\U0001f3fb\u200d\u2642\ufe0f",  # 🤽🏻‍♂️
+    "\U0001f93d\U0001f3fc",  # 🤽🏼
+    "\U0001f93d\U0001f3fc\u200d\u2640",  # 🤽🏼‍♀
+    "\U0001f93d\U0001f3fc\u200d\u2640\ufe0f",  # 🤽🏼‍♀️
+    "\U0001f93d\U0001f3fc\u200d\u2642",  # 🤽🏼‍♂
+    "\U0001f93d\U0001f3fc\u200d\u2642\ufe0f",  # 🤽🏼‍♂️
+    "\U0001f93d\U0001f3fd",  # 🤽🏽
+    "\U0001f93d\U0001f3fd\u200d\u2640",  # 🤽🏽‍♀
+    "\U0001f93d\U0001f3fd\u200d\u2640\ufe0f",  # 🤽🏽‍♀️
+    "\U0001f93d\U0001f3fd\u200d\u2642",  # 🤽🏽‍♂
+    "\U0001f93d\U0001f3fd\u200d\u2642\ufe0f",  # 🤽🏽‍♂️
+    "\U0001f93d\U0001f3fe",  # 🤽🏾
+    "\U0001f93d\U0001f3fe\u200d\u2640",  # 🤽🏾‍♀
+    "\U0001f93d\U0001f3fe\u200d\u2640\ufe0f",  # 🤽🏾‍♀️
+    "\U0001f93d\U0001f3fe\u200d\u2642",  # 🤽🏾‍♂
+    "\U0001f93d\U0001f3fe\u200d\u2642\ufe0f",  # 🤽🏾‍♂️
+    "\U0001f93d\U0001f3ff",  # 🤽🏿
+    "\U0001f93d\U0001f3ff\u200d\u2640",  # 🤽🏿‍♀
+    "\U0001f93d\U0001f3ff\u200d\u2640\ufe0f",  # 🤽🏿‍♀️
+    "\U0001f93d\U0001f3ff\u200d\u2642",  # 🤽🏿‍♂
+    "\U0001f93d\U0001f3ff\u200d\u2642\ufe0f",  # 🤽🏿‍♂️
+    "\U0001f93e\u200d\u2640",  # 🤾‍♀
+    "\U0001f93e\u200d\u2640\ufe0f",  # 🤾‍♀️
+    "\U0001f93e\u200d\u2642",  # 🤾‍♂
+    "\U0001f93e\u200d\u2642\ufe0f",  # 🤾‍♂️
+    "\U0001f93e\U0001f3fb",  # 🤾🏻
+    "\U0001f93e\U0001f3fb\u200d\u2640",  # 🤾🏻‍♀
+    "\U0001f93e\U0001f3fb\u200d\u2640\ufe0f",  # 🤾🏻‍♀️
+    "\U0001f93e\U0001f3fb\u200d\u2642",  # 🤾🏻‍♂
+    "\U0001f93e\U0001f3fb\u200d\u2642\ufe0f",  # 🤾🏻‍♂️
+    "\U0001f93e\U0001f3fc",  # 🤾🏼
+    "\U0001f93e\U0001f3fc\u200d\u2640",  # 🤾🏼‍♀
+    "\U0001f93e\U0001f3fc\u200d\u2640\ufe0f",  # 🤾🏼‍♀️
+    "\U0001f93e\U0001f3fc\u200d\u2642",  # 🤾🏼‍♂
+    "\U0001f93e\U0001f3fc\u200d\u2642\ufe0f",  # 🤾🏼‍♂️
+    "\U0001f93e\U0001f3fd",  # 🤾🏽
+    "\U0001f93e\U0001f3fd\u200d\u2640",  # 🤾🏽‍♀
+    "\U0001f93e\U0001f3fd\u200d\u2640\ufe0f",  # 🤾🏽‍♀️
+    "\U0001f93e\U0001f3fd\u200d\u2642",  # 🤾🏽‍♂
+    "\U0001f93e\U0001f3fd\u200d\u2642\ufe0f",  # 🤾🏽‍♂️
+    "\U0001f93e\U0001f3fe",  # 🤾🏾
+    "\U0001f93e\U0001f3fe\u200d\u2640",  # 🤾🏾‍♀
+    "\U0001f93e\U0001f3fe\u200d\u2640\ufe0f",  # 🤾🏾‍♀️
+    "\U0001f93e\U0001f3fe\u200d\u2642",  # 🤾🏾‍♂
+    "\U0001f93e\U0001f3fe\u200d\u2642\ufe0f",  # 🤾🏾‍♂️
+    "\U0001f93e\U0001f3ff",  # 🤾🏿
+    "\U0001f93e\U0001f3ff\u200d\u2640",  # 🤾🏿‍♀
+    "\U0001f93e\U0001f3ff\u200d\u2640\ufe0f",  # 🤾🏿‍♀️
+    "\U0001f93e\U0001f3ff\u200d\u2642",  # 🤾🏿‍♂
+    "\U0001f93e\U0001f3ff\u200d\u2642\ufe0f",  # 🤾🏿‍♂️
+    "\U0001f977\U0001f3fb",  # 🥷🏻
+    "\U0001f977\U0001f3fc",  # 🥷🏼
+    "\U0001f977\U0001f3fd",  # 🥷🏽
+    "\U0001f977\U0001f3fe",  # 🥷🏾
+    "\U0001f977\U0001f3ff",  # 🥷🏿
+    "\U0001f9b5\U0001f3fb",  # 🦵🏻
+    "\U0001f9b5\U0001f3fc",  # 🦵🏼
+    "\U0001f9b5\U0001f3fd",  # 🦵🏽
+    "\U0001f9b5\U0001f3fe",  # 🦵🏾
+    "\U0001f9b5\U0001f3ff",  # 🦵🏿
+    "\U0001f9b6\U0001f3fb",  # 🦶🏻
+    "\U0001f9b6\U0001f3fc",  # 🦶🏼
+    "\U0001f9b6\U0001f3fd",  # 🦶🏽
+    "\U0001f9b6\U0001f3fe",  # 🦶🏾
+    "\U0001f9b6\U0001f3ff",  # 🦶🏿
+    "\U0001f9b8\u200d\u2640",  # 🦸‍♀
+    "\U0001f9b8\u200d\u2640\ufe0f",  # 🦸‍♀️
+    "\U0001f9b8\u200d\u2642",  # 🦸‍♂
+    "\U0001f9b8\u200d\u2642\ufe0f",  # 🦸‍♂️
+    "\U0001f9b8\U0001f3fb",  # 🦸🏻
+    "\U0001f9b8\U0001f3fb\u200d\u2640",  # 🦸🏻‍♀
+    "\U0001f9b8\U0001f3fb\u200d\u2640\ufe0f",  # 🦸🏻‍♀️
+    "\U0001f9b8\U0001f3fb\u200d\u2642",  # 🦸🏻‍♂
+    "\U0001f9b8\U0001f3fb\u200d\u2642\ufe0f",  # 🦸🏻‍♂️
+    "\U0001f9b8\U0001f3fc",  # 🦸🏼
+    "\U0001f9b8\U0001f3fc\u200d\u2640",  # 🦸🏼‍♀
+    "\U0001f9b8\U0001f3fc\u200d\u2640\ufe0f",  # 🦸🏼‍♀️
+    "\U0001f9b8\U0001f3fc\u200d\u2642",  # 🦸🏼‍♂
+    "\U0001f9b8\U0001f3fc\u200d\u2642\ufe0f",  # 🦸🏼‍♂️
+    "\U0001f9b8\U0001f3fd",  # 🦸🏽
+    "\U0001f9b8\U0001f3fd\u200d\u2640",  # 🦸🏽‍♀
+    "\U0001f9b8\U0001f3fd\u200d\u2640\ufe0f",  # 🦸🏽‍♀️
+    "\U0001f9b8\U0001f3fd\u200d\u2642",  # 🦸🏽‍♂
+    "\U0001f9b8\U0001f3fd\u200d\u2642\ufe0f",  # 🦸🏽‍♂️
+    "\U0001f9b8\U0001f3fe",  # 🦸🏾
+    "\U0001f9b8\U0001f3fe\u200d\u2640",  # 🦸🏾‍♀
+    "\U0001f9b8\U0001f3fe\u200d\u2640\ufe0f",  # 🦸🏾‍♀️
+    "\U0001f9b8\U0001f3fe\u200d\u2642",  # 🦸🏾‍♂
+    "\U0001f9b8\U0001f3fe\u200d\u2642\ufe0f",  # 🦸🏾‍♂️
+    "\U0001f9b8\U0001f3ff",  # 🦸🏿
+    "\U0001f9b8\U0001f3ff\u200d\u2640",  # 🦸🏿‍♀
+    "\U0001f9b8\U0001f3ff\u200d\u2640\ufe0f",  # 🦸🏿‍♀️
+    "\U0001f9b8\U0001f3ff\u200d\u2642",  # 🦸🏿‍♂
+    "\U0001f9b8\U0001f3ff\u200d\u2642\ufe0f",  # 🦸🏿‍♂️
+    "\U0001f9b9\u200d\u2640",  # 🦹‍♀
+    "\U0001f9b9\u200d\u2640\ufe0f",  # 🦹‍♀️
+    "\U0001f9b9\u200d\u2642",  # 🦹‍♂
+    "\U0001f9b9\u200d\u2642\ufe0f",  # 🦹‍♂️
+    "\U0001f9b9\U0001f3fb",  # 🦹🏻
+    "\U0001f9b9\U0001f3fb\u200d\u2640",  # 🦹🏻‍♀
+    "\U0001f9b9\U0001f3fb\u200d\u2640\ufe0f",  # 🦹🏻‍♀️
+    "\U0001f9b9\U0001f3fb\u200d\u2642",  # 🦹🏻‍♂
+    "\U0001f9b9\U0001f3fb\u200d\u2642\ufe0f",  # 🦹🏻‍♂️
+    "\U0001f9b9\U0001f3fc",  # 🦹🏼
+    "\U0001f9b9\U0001f3fc\u200d\u2640",  # 🦹🏼‍♀
+    "\U0001f9b9\U0001f3fc\u200d\u2640\ufe0f",  # 🦹🏼‍♀️
+    "\U0001f9b9\U0001f3fc\u200d\u2642",  # 🦹🏼‍♂
+    "\U0001f9b9\U0001f3fc\u200d\u2642\ufe0f",  # 🦹🏼‍♂️
+    "\U0001f9b9\U0001f3fd",  # 🦹🏽
+    "\U0001f9b9\U0001f3fd\u200d\u2640",  # 🦹🏽‍♀
+    "\U0001f9b9\U0001f3fd\u200d\u2640\ufe0f",  # 🦹🏽‍♀️
+    "\U0001f9b9\U0001f3fd\u200d\u2642",  # 🦹🏽‍♂
+    "\U0001f9b9\U0001f3fd\u200d\u2642\ufe0f",  # 🦹🏽‍♂️
+    "\U0001f9b9\U0001f3fe",  # 🦹🏾
+    "\U0001f9b9\U0001f3fe\u200d\u2640",  # 🦹🏾‍♀
+    "\U0001f9b9\U0001f3fe\u200d\u2640\ufe0f",  # 🦹🏾‍♀️
+    "\U0001f9b9\U0001f3fe\u200d\u2642",  # 🦹🏾‍♂
+    "\U0001f9b9\U0001f3fe\u200d\u2642\ufe0f",  # 🦹🏾‍♂️
+    "\U0001f9b9\U0001f3ff",  # 🦹🏿
+    "\U0001f9b9\U0001f3ff\u200d\u2640",  # 🦹🏿‍♀
+    "\U0001f9b9\U0001f3ff\u200d\u2640\ufe0f",  # 🦹🏿‍♀️
+    "\U0001f9b9\U0001f3ff\u200d\u2642",  # 🦹🏿‍♂
+    "\U0001f9b9\U0001f3ff\u200d\u2642\ufe0f",  # 🦹🏿‍♂️
+    "\U0001f9bb\U0001f3fb",  # 🦻🏻
+    "\U0001f9bb\U0001f3fc",  # 🦻🏼
+    "\U0001f9bb\U0001f3fd",  # 🦻🏽
+    "\U0001f9bb\U0001f3fe",  # 🦻🏾
+    "\U0001f9bb\U0001f3ff",  # 🦻🏿
+    "\U0001f9cd\u200d\u2640",  # 🧍‍♀
+    "\U0001f9cd\u200d\u2640\ufe0f",  # 🧍‍♀️
+    "\U0001f9cd\u200d\u2642",  # 🧍‍♂
+    "\U0001f9cd\u200d\u2642\ufe0f",  # 🧍‍♂️
+    "\U0001f9cd\U0001f3fb",  # 🧍🏻
+    "\U0001f9cd\U0001f3fb\u200d\u2640",  # 🧍🏻‍♀
+    "\U0001f9cd\U0001f3fb\u200d\u2640\ufe0f",  # 🧍🏻‍♀️
+    "\U0001f9cd\U0001f3fb\u200d\u2642",  # 🧍🏻‍♂
+    "\U0001f9cd\U0001f3fb\u200d\u2642\ufe0f",  # 🧍🏻‍♂️
+    "\U0001f9cd\U0001f3fc",  # 🧍🏼
+    "\U0001f9cd\U0001f3fc\u200d\u2640",  # 🧍🏼‍♀
+    "\U0001f9cd\U0001f3fc\u200d\u2640\ufe0f",  # 🧍🏼‍♀️
+    "\U0001f9cd\U0001f3fc\u200d\u2642",  # 🧍🏼‍♂
+    "\U0001f9cd\U0001f3fc\u200d\u2642\ufe0f",  # 🧍🏼‍♂️
+    "\U0001f9cd\U0001f3fd",  # 🧍🏽
+    "\U0001f9cd\U0001f3fd\u200d\u2640",  # 🧍🏽‍♀
+    "\U0001f9cd\U0001f3fd\u200d\u2640\ufe0f",  # 🧍🏽‍♀️
+    "\U0001f9cd\U0001f3fd\u200d\u2642",  # 🧍🏽‍♂
+    "\U0001f9cd\U0001f3fd\u200d\u2642\ufe0f",  # 🧍🏽‍♂️
+    "\U0001f9cd\U0001f3fe",  # 🧍🏾
+    "\U0001f9cd\U0001f3fe\u200d\u2640",  # 🧍🏾‍♀
+    "\U0001f9cd\U0001f3fe\u200d\u2640\ufe0f",  # 🧍🏾‍♀️
+    "\U0001f9cd\U0001f3fe\u200d\u2642",  # 🧍🏾‍♂
+    "\U0001f9cd\U0001f3fe\u200d\u2642\ufe0f",  # 🧍🏾‍♂️
+    "\U0001f9cd\U0001f3ff",  # 🧍🏿
+    "\U0001f9cd\U0001f3ff\u200d\u2640",  # 🧍🏿‍♀
+    "\U0001f9cd\U0001f3ff\u200d\u2640\ufe0f",  # 🧍🏿‍♀️
+    "\U0001f9cd\U0001f3ff\u200d\u2642",  # 🧍🏿‍♂
+    "\U0001f9cd\U0001f3ff\u200d\u2642\ufe0f",  # 🧍🏿‍♂️
+    "\U0001f9ce\u200d\u2640",  # 🧎‍♀
+    "\U0001f9ce\u200d\u2640\u200d\u27a1",  # 🧎‍♀‍➡
+    "\U0001f9ce\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎‍♀‍➡️
+    "\U0001f9ce\u200d\u2640\ufe0f",  # 🧎‍♀️
+    "\U0001f9ce\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎‍♀️‍➡
+    "\U0001f9ce\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎‍♀️‍➡️
+    "\U0001f9ce\u200d\u2642",  # 🧎‍♂
+    "\U0001f9ce\u200d\u2642\u200d\u27a1",  # 🧎‍♂‍➡
+    "\U0001f9ce\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎‍♂‍➡️
+    "\U0001f9ce\u200d\u2642\ufe0f",  # 🧎‍♂️
+    "\U0001f9ce\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎‍♂️‍➡
+    "\U0001f9ce\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎‍♂️‍➡️
+    "\U0001f9ce\u200d\u27a1",  # 🧎‍➡
+    "\U0001f9ce\u200d\u27a1\ufe0f",  # 🧎‍➡️
+    "\U0001f9ce\U0001f3fb",  # 🧎🏻
+    "\U0001f9ce\U0001f3fb\u200d\u2640",  # 🧎🏻‍♀
+    "\U0001f9ce\U0001f3fb\u200d\u2640\u200d\u27a1",  # 🧎🏻‍♀‍➡
+    "\U0001f9ce\U0001f3fb\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎🏻‍♀‍➡️
+    "\U0001f9ce\U0001f3fb\u200d\u2640\ufe0f",  # 🧎🏻‍♀️
+    "\U0001f9ce\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎🏻‍♀️‍➡
+    "\U0001f9ce\U0001f3fb\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏻‍♀️‍➡️
+    "\U0001f9ce\U0001f3fb\u200d\u2642",  # 🧎🏻‍♂
+    "\U0001f9ce\U0001f3fb\u200d\u2642\u200d\u27a1",  # 🧎🏻‍♂‍➡
+    "\U0001f9ce\U0001f3fb\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎🏻‍♂‍➡️
+    "\U0001f9ce\U0001f3fb\u200d\u2642\ufe0f",  # 🧎🏻‍♂️
+    "\U0001f9ce\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎🏻‍♂️‍➡
+    "\U0001f9ce\U0001f3fb\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏻‍♂️‍➡️
+    "\U0001f9ce\U0001f3fb\u200d\u27a1",  # 🧎🏻‍➡
+    "\U0001f9ce\U0001f3fb\u200d\u27a1\ufe0f",  # 🧎🏻‍➡️
+    "\U0001f9ce\U0001f3fc",  # 🧎🏼
+    "\U0001f9ce\U0001f3fc\u200d\u2640",  # 🧎🏼‍♀
+    "\U0001f9ce\U0001f3fc\u200d\u2640\u200d\u27a1",  # 🧎🏼‍♀‍➡
+    "\U0001f9ce\U0001f3fc\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎🏼‍♀‍➡️
+    "\U0001f9ce\U0001f3fc\u200d\u2640\ufe0f",  # 🧎🏼‍♀️
+    "\U0001f9ce\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎🏼‍♀️‍➡
+    "\U0001f9ce\U0001f3fc\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏼‍♀️‍➡️
+    "\U0001f9ce\U0001f3fc\u200d\u2642",  # 🧎🏼‍♂
+    "\U0001f9ce\U0001f3fc\u200d\u2642\u200d\u27a1",  # 🧎🏼‍♂‍➡
+    "\U0001f9ce\U0001f3fc\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎🏼‍♂‍➡️
+    "\U0001f9ce\U0001f3fc\u200d\u2642\ufe0f",  # 🧎🏼‍♂️
+    "\U0001f9ce\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎🏼‍♂️‍➡
+    "\U0001f9ce\U0001f3fc\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏼‍♂️‍➡️
+    "\U0001f9ce\U0001f3fc\u200d\u27a1",  # 🧎🏼‍➡
+    "\U0001f9ce\U0001f3fc\u200d\u27a1\ufe0f",  # 🧎🏼‍➡️
+    "\U0001f9ce\U0001f3fd",  # 🧎🏽
+    "\U0001f9ce\U0001f3fd\u200d\u2640",  # 🧎🏽‍♀
+    "\U0001f9ce\U0001f3fd\u200d\u2640\u200d\u27a1",  # 🧎🏽‍♀‍➡
+    "\U0001f9ce\U0001f3fd\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎🏽‍♀‍➡️
+    "\U0001f9ce\U0001f3fd\u200d\u2640\ufe0f",  # 🧎🏽‍♀️
+    "\U0001f9ce\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎🏽‍♀️‍➡
+    "\U0001f9ce\U0001f3fd\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏽‍♀️‍➡️
+    "\U0001f9ce\U0001f3fd\u200d\u2642",  # 🧎🏽‍♂
+    "\U0001f9ce\U0001f3fd\u200d\u2642\u200d\u27a1",  # 🧎🏽‍♂‍➡
+    "\U0001f9ce\U0001f3fd\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎🏽‍♂‍➡️
+    "\U0001f9ce\U0001f3fd\u200d\u2642\ufe0f",  # 🧎🏽‍♂️
+    "\U0001f9ce\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎🏽‍♂️‍➡
+    "\U0001f9ce\U0001f3fd\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏽‍♂️‍➡️
+    "\U0001f9ce\U0001f3fd\u200d\u27a1",  # 🧎🏽‍➡
+    "\U0001f9ce\U0001f3fd\u200d\u27a1\ufe0f",  # 🧎🏽‍➡️
+    "\U0001f9ce\U0001f3fe",  # 🧎🏾
+    "\U0001f9ce\U0001f3fe\u200d\u2640",  # 🧎🏾‍♀
+    "\U0001f9ce\U0001f3fe\u200d\u2640\u200d\u27a1",  # 🧎🏾‍♀‍➡
+    "\U0001f9ce\U0001f3fe\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎🏾‍♀‍➡️
+    "\U0001f9ce\U0001f3fe\u200d\u2640\ufe0f",  # 🧎🏾‍♀️
+    "\U0001f9ce\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎🏾‍♀️‍➡
+    "\U0001f9ce\U0001f3fe\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏾‍♀️‍➡️
+    "\U0001f9ce\U0001f3fe\u200d\u2642",  # 🧎🏾‍♂
+    "\U0001f9ce\U0001f3fe\u200d\u2642\u200d\u27a1",  # 🧎🏾‍♂‍➡
+    "\U0001f9ce\U0001f3fe\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎🏾‍♂‍➡️
+    "\U0001f9ce\U0001f3fe\u200d\u2642\ufe0f",  # 🧎🏾‍♂️
+    "\U0001f9ce\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎🏾‍♂️‍➡
+    "\U0001f9ce\U0001f3fe\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏾‍♂️‍➡️
+    "\U0001f9ce\U0001f3fe\u200d\u27a1",  # 🧎🏾‍➡
+    "\U0001f9ce\U0001f3fe\u200d\u27a1\ufe0f",  # 🧎🏾‍➡️
+    "\U0001f9ce\U0001f3ff",  # 🧎🏿
+    "\U0001f9ce\U0001f3ff\u200d\u2640",  # 🧎🏿‍♀
+    "\U0001f9ce\U0001f3ff\u200d\u2640\u200d\u27a1",  # 🧎🏿‍♀‍➡
+    "\U0001f9ce\U0001f3ff\u200d\u2640\u200d\u27a1\ufe0f",  # 🧎🏿‍♀‍➡️
+    "\U0001f9ce\U0001f3ff\u200d\u2640\ufe0f",  # 🧎🏿‍♀️
+    "\U0001f9ce\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1",  # 🧎🏿‍♀️‍➡
+    "\U0001f9ce\U0001f3ff\u200d\u2640\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏿‍♀️‍➡️
+    "\U0001f9ce\U0001f3ff\u200d\u2642",  # 🧎🏿‍♂
+    "\U0001f9ce\U0001f3ff\u200d\u2642\u200d\u27a1",  # 🧎🏿‍♂‍➡
+    "\U0001f9ce\U0001f3ff\u200d\u2642\u200d\u27a1\ufe0f",  # 🧎🏿‍♂‍➡️
+    "\U0001f9ce\U0001f3ff\u200d\u2642\ufe0f",  # 🧎🏿‍♂️
+    "\U0001f9ce\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1",  # 🧎🏿‍♂️‍➡
+    "\U0001f9ce\U0001f3ff\u200d\u2642\ufe0f\u200d\u27a1\ufe0f",  # 🧎🏿‍♂️‍➡️
+    "\U0001f9ce\U0001f3ff\u200d\u27a1",  # 🧎🏿‍➡
+    "\U0001f9ce\U0001f3ff\u200d\u27a1\ufe0f",  # 🧎🏿‍➡️
+    "\U0001f9cf\u200d\u2640",  # 🧏‍♀
+    "\U0001f9cf\u200d\u2640\ufe0f",  # 🧏‍♀️
+    "\U0001f9cf\u200d\u2642",  # 🧏‍♂
+    "\U0001f9cf\u200d\u2642\ufe0f",  # 🧏‍♂️
+    "\U0001f9cf\U0001f3fb",  # 🧏🏻
+    "\U0001f9cf\U0001f3fb\u200d\u2640",  # 🧏🏻‍♀
+    "\U0001f9cf\U0001f3fb\u200d\u2640\ufe0f",  # 🧏🏻‍♀️
+    "\U0001f9cf\U0001f3fb\u200d\u2642",  # 🧏🏻‍♂
+    "\U0001f9cf\U0001f3fb\u200d\u2642\ufe0f",  # 🧏🏻‍♂️
+    "\U0001f9cf\U0001f3fc",  # 🧏🏼
+    "\U0001f9cf\U0001f3fc\u200d\u2640",  # 🧏🏼‍♀
+    "\U0001f9cf\U0001f3fc\u200d\u2640\ufe0f",  # 🧏🏼‍♀️
+    "\U0001f9cf\U0001f3fc\u200d\u2642",  # 🧏🏼‍♂
+    "\U0001f9cf\U0001f3fc\u200d\u2642\ufe0f",  # 🧏🏼‍♂️
+    "\U0001f9cf\U0001f3fd",  # 🧏🏽
+    "\U0001f9cf\U0001f3fd\u200d\u2640",  # 🧏🏽‍♀
+    "\U0001f9cf\U0001f3fd\u200d\u2640\ufe0f",  # 🧏🏽‍♀️
+    "\U0001f9cf\U0001f3fd\u200d\u2642",  # 🧏🏽‍♂
+    "\U0001f9cf\U0001f3fd\u200d\u2642\ufe0f",  # 🧏🏽‍♂️
+    "\U0001f9cf\U0001f3fe",  # 🧏🏾
+    "\U0001f9cf\U0001f3fe\u200d\u2640",  # 🧏🏾‍♀
+    "\U0001f9cf\U0001f3fe\u200d\u2640\ufe0f",  # 🧏🏾‍♀️
+    "\U0001f9cf\U0001f3fe\u200d\u2642",  # 🧏🏾‍♂
+    "\U0001f9cf\U0001f3fe\u200d\u2642\ufe0f",  # 🧏🏾‍♂️
+    "\U0001f9cf\U0001f3ff",  # 🧏🏿
+    "\U0001f9cf\U0001f3ff\u200d\u2640",  # 🧏🏿‍♀
+    "\U0001f9cf\U0001f3ff\u200d\u2640\ufe0f",  # 🧏🏿‍♀️
+    "\U0001f9cf\U0001f3ff\u200d\u2642",  # 🧏🏿‍♂
+    "\U0001f9cf\U0001f3ff\u200d\u2642\ufe0f",  # 🧏🏿‍♂️
+    "\U0001f9d1\u200d\u2695",  # 🧑‍⚕
+    "\U0001f9d1\u200d\u2695\ufe0f",  # 🧑‍⚕️
+    "\U0001f9d1\u200d\u2696",  # 🧑‍⚖
+    "\U0001f9d1\u200d\u2696\ufe0f",  # 🧑‍⚖️
+    "\U0001f9d1\u200d\u2708",  # 🧑‍✈
+    "\U0001f9d1\u200d\u2708\ufe0f",  # 🧑‍✈️
+    "\U0001f9d1\u200d\U0001f33e",  # 🧑‍🌾
+    "\U0001f9d1\u200d\U0001f373",  # 🧑‍🍳
+    "\U0001f9d1\u200d\U0001f37c",  # 🧑‍🍼
+    "\U0001f9d1\u200d\U0001f384",  # 🧑‍🎄
+    "\U0001f9d1\u200d\U0001f393",  # 🧑‍🎓
+    "\U0001f9d1\u200d\U0001f3a4",  # 🧑‍🎤
+    "\U0001f9d1\u200d\U0001f3a8",  # 🧑‍🎨
+    "\U0001f9d1\u200d\U0001f3eb",  # 🧑‍🏫
+    "\U0001f9d1\u200d\U0001f3ed",  # 🧑‍🏭
+    "\U0001f9d1\u200d\U0001f4bb",  # 🧑‍💻
+    "\U0001f9d1\u200d\U0001f4bc",  # 🧑‍💼
+    "\U0001f9d1\u200d\U0001f527",  # 🧑‍🔧
+    "\U0001f9d1\u200d\U0001f52c",  # 🧑‍🔬
+    "\U0001f9d1\u200d\U0001f680",  # 🧑‍🚀
+    "\U0001f9d1\u200d\U0001f692",  # 🧑‍🚒
+    "\U0001f9d1\u200d\U0001f91d\u200d\U0001f9d1",  # 🧑‍🤝‍🧑
+    "\U0001f9d1\u200d\U0001f9af",  # 🧑‍🦯
+    "\U0001f9d1\u200d\U0001f9af\u200d\u27a1",  # 🧑‍🦯‍➡
+    "\U0001f9d1\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑‍🦯‍➡️
+    "\U0001f9d1\u200d\U0001f9b0",  # 🧑‍🦰
+    "\U0001f9d1\u200d\U0001f9b1",  # 🧑‍🦱
+    "\U0001f9d1\u200d\U0001f9b2",  # 🧑‍🦲
+    "\U0001f9d1\u200d\U0001f9b3",  # 🧑‍🦳
+    "\U0001f9d1\u200d\U0001f9bc",  # 🧑‍🦼
+    "\U0001f9d1\u200d\U0001f9bc\u200d\u27a1",  # 🧑‍🦼‍➡
+    "\U0001f9d1\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑‍🦼‍➡️
+    "\U0001f9d1\u200d\U0001f9bd",  # 🧑‍🦽
+    "\U0001f9d1\u200d\U0001f9bd\u200d\u27a1",  # 🧑‍🦽‍➡
+    "\U0001f9d1\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑‍🦽‍➡️
+    "\U0001f9d1\u200d\U0001f9d1\u200d\U0001f9d2",  # 🧑‍🧑‍🧒
+    "\U0001f9d1\u200d\U0001f9d1\u200d\U0001f9d2\u200d\U0001f9d2",  # 🧑‍🧑‍🧒‍🧒
+    "\U0001f9d1\u200d\U0001f9d2",  # 🧑‍🧒
+    "\U0001f9d1\u200d\U0001f9d2\u200d\U0001f9d2",  # 🧑‍🧒‍🧒
+    "\U0001f9d1\u200d\U0001fa70",  # 🧑‍🩰
+    "\U0001f9d1\U0001f3fb",  # 🧑🏻
+    "\U0001f9d1\U0001f3fb\u200d\u2695",  # 🧑🏻‍⚕
+    "\U0001f9d1\U0001f3fb\u200d\u2695\ufe0f",  # 🧑🏻‍⚕️
+    "\U0001f9d1\U0001f3fb\u200d\u2696",  # 🧑🏻‍⚖
+    "\U0001f9d1\U0001f3fb\u200d\u2696\ufe0f",  # 🧑🏻‍⚖️
+    "\U0001f9d1\U0001f3fb\u200d\u2708",  # 🧑🏻‍✈
+    "\U0001f9d1\U0001f3fb\u200d\u2708\ufe0f",  # 🧑🏻‍✈️
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍❤‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍❤‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍❤‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍❤‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍❤‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍❤‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍❤‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\u2764\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍❤‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍❤️‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍❤️‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍❤️‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍❤️‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍❤️‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍❤️‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍❤️‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍❤️‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\U0001f33e",  # 🧑🏻‍🌾
+    "\U0001f9d1\U0001f3fb\u200d\U0001f373",  # 🧑🏻‍🍳
+    "\U0001f9d1\U0001f3fb\u200d\U0001f37c",  # 🧑🏻‍🍼
+    "\U0001f9d1\U0001f3fb\u200d\U0001f384",  # 🧑🏻‍🎄
+    "\U0001f9d1\U0001f3fb\u200d\U0001f393",  # 🧑🏻‍🎓
+    "\U0001f9d1\U0001f3fb\u200d\U0001f3a4",  # 🧑🏻‍🎤
+    "\U0001f9d1\U0001f3fb\u200d\U0001f3a8",  # 🧑🏻‍🎨
+    "\U0001f9d1\U0001f3fb\u200d\U0001f3eb",  # 🧑🏻‍🏫
+    "\U0001f9d1\U0001f3fb\u200d\U0001f3ed",  # 🧑🏻‍🏭
+    "\U0001f9d1\U0001f3fb\u200d\U0001f430\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍🐰‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\U0001f430\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍🐰‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\U0001f430\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍🐰‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\U0001f430\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍🐰‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\U0001f4bb",  # 🧑🏻‍💻
+    "\U0001f9d1\U0001f3fb\u200d\U0001f4bc",  # 🧑🏻‍💼
+    "\U0001f9d1\U0001f3fb\u200d\U0001f527",  # 🧑🏻‍🔧
+    "\U0001f9d1\U0001f3fb\u200d\U0001f52c",  # 🧑🏻‍🔬
+    "\U0001f9d1\U0001f3fb\u200d\U0001f680",  # 🧑🏻‍🚀
+    "\U0001f9d1\U0001f3fb\u200d\U0001f692",  # 🧑🏻‍🚒
+    "\U0001f9d1\U0001f3fb\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fb",  # 🧑🏻‍🤝‍🧑🏻
+    "\U0001f9d1\U0001f3fb\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍🤝‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍🤝‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍🤝‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\U0001f91d\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍🤝‍🧑🏿
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9af",  # 🧑🏻‍🦯
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9af\u200d\u27a1",  # 🧑🏻‍🦯‍➡
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑🏻‍🦯‍➡️
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9b0",  # 🧑🏻‍🦰
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9b1",  # 🧑🏻‍🦱
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9b2",  # 🧑🏻‍🦲
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9b3",  # 🧑🏻‍🦳
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bc",  # 🧑🏻‍🦼
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bc\u200d\u27a1",  # 🧑🏻‍🦼‍➡
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑🏻‍🦼‍➡️
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bd",  # 🧑🏻‍🦽
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bd\u200d\u27a1",  # 🧑🏻‍🦽‍➡
+    "\U0001f9d1\U0001f3fb\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑🏻‍🦽‍➡️
+    "\U0001f9d1\U0001f3fb\u200d\U0001fa70",  # 🧑🏻‍🩰
+    "\U0001f9d1\U0001f3fb\u200d\U0001faef\u200d\U0001f9d1\U0001f3fc",  # 🧑🏻‍🫯‍🧑🏼
+    "\U0001f9d1\U0001f3fb\u200d\U0001faef\u200d\U0001f9d1\U0001f3fd",  # 🧑🏻‍🫯‍🧑🏽
+    "\U0001f9d1\U0001f3fb\u200d\U0001faef\u200d\U0001f9d1\U0001f3fe",  # 🧑🏻‍🫯‍🧑🏾
+    "\U0001f9d1\U0001f3fb\u200d\U0001faef\u200d\U0001f9d1\U0001f3ff",  # 🧑🏻‍🫯‍🧑🏿
+    "\U0001f9d1\U0001f3fc",  # 🧑🏼
+    "\U0001f9d1\U0001f3fc\u200d\u2695",  # 🧑🏼‍⚕
+    "\U0001f9d1\U0001f3fc\u200d\u2695\ufe0f",  # 🧑🏼‍⚕️
+    "\U0001f9d1\U0001f3fc\u200d\u2696",  # 🧑🏼‍⚖
+    "\U0001f9d1\U0001f3fc\u200d\u2696\ufe0f",  # 🧑🏼‍⚖️
+    "\U0001f9d1\U0001f3fc\u200d\u2708",  # 🧑🏼‍✈
+    "\U0001f9d1\U0001f3fc\u200d\u2708\ufe0f",  # 🧑🏼‍✈️
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍❤‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍❤‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍❤‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍❤‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍❤‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍❤‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍❤‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\u2764\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍❤‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍❤️‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍❤️‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍❤️‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍❤️‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍❤️‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍❤️‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍❤️‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍❤️‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\U0001f33e",  # 🧑🏼‍🌾
+    "\U0001f9d1\U0001f3fc\u200d\U0001f373",  # 🧑🏼‍🍳
+    "\U0001f9d1\U0001f3fc\u200d\U0001f37c",  # 🧑🏼‍🍼
+    "\U0001f9d1\U0001f3fc\u200d\U0001f384",  # 🧑🏼‍🎄
+    "\U0001f9d1\U0001f3fc\u200d\U0001f393",  # 🧑🏼‍🎓
+    "\U0001f9d1\U0001f3fc\u200d\U0001f3a4",  # 🧑🏼‍🎤
+    "\U0001f9d1\U0001f3fc\u200d\U0001f3a8",  # 🧑🏼‍🎨
+    "\U0001f9d1\U0001f3fc\u200d\U0001f3eb",  # 🧑🏼‍🏫
+    "\U0001f9d1\U0001f3fc\u200d\U0001f3ed",  # 🧑🏼‍🏭
+    "\U0001f9d1\U0001f3fc\u200d\U0001f430\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍🐰‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\U0001f430\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍🐰‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\U0001f430\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍🐰‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\U0001f430\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍🐰‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\U0001f4bb",  # 🧑🏼‍💻
+    "\U0001f9d1\U0001f3fc\u200d\U0001f4bc",  # 🧑🏼‍💼
+    "\U0001f9d1\U0001f3fc\u200d\U0001f527",  # 🧑🏼‍🔧
+    "\U0001f9d1\U0001f3fc\u200d\U0001f52c",  # 🧑🏼‍🔬
+    "\U0001f9d1\U0001f3fc\u200d\U0001f680",  # 🧑🏼‍🚀
+    "\U0001f9d1\U0001f3fc\u200d\U0001f692",  # 🧑🏼‍🚒
+    "\U0001f9d1\U0001f3fc\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍🤝‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fc",  # 🧑🏼‍🤝‍🧑🏼
+    "\U0001f9d1\U0001f3fc\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍🤝‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍🤝‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\U0001f91d\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍🤝‍🧑🏿
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9af",  # 🧑🏼‍🦯
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9af\u200d\u27a1",  # 🧑🏼‍🦯‍➡
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑🏼‍🦯‍➡️
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9b0",  # 🧑🏼‍🦰
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9b1",  # 🧑🏼‍🦱
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9b2",  # 🧑🏼‍🦲
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9b3",  # 🧑🏼‍🦳
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bc",  # 🧑🏼‍🦼
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bc\u200d\u27a1",  # 🧑🏼‍🦼‍➡
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑🏼‍🦼‍➡️
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bd",  # 🧑🏼‍🦽
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bd\u200d\u27a1",  # 🧑🏼‍🦽‍➡
+    "\U0001f9d1\U0001f3fc\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑🏼‍🦽‍➡️
+    "\U0001f9d1\U0001f3fc\u200d\U0001fa70",  # 🧑🏼‍🩰
+    "\U0001f9d1\U0001f3fc\u200d\U0001faef\u200d\U0001f9d1\U0001f3fb",  # 🧑🏼‍🫯‍🧑🏻
+    "\U0001f9d1\U0001f3fc\u200d\U0001faef\u200d\U0001f9d1\U0001f3fd",  # 🧑🏼‍🫯‍🧑🏽
+    "\U0001f9d1\U0001f3fc\u200d\U0001faef\u200d\U0001f9d1\U0001f3fe",  # 🧑🏼‍🫯‍🧑🏾
+    "\U0001f9d1\U0001f3fc\u200d\U0001faef\u200d\U0001f9d1\U0001f3ff",  # 🧑🏼‍🫯‍🧑🏿
+    "\U0001f9d1\U0001f3fd",  # 🧑🏽
+    "\U0001f9d1\U0001f3fd\u200d\u2695",  # 🧑🏽‍⚕
+    "\U0001f9d1\U0001f3fd\u200d\u2695\ufe0f",  # 🧑🏽‍⚕️
+    "\U0001f9d1\U0001f3fd\u200d\u2696",  # 🧑🏽‍⚖
+    "\U0001f9d1\U0001f3fd\u200d\u2696\ufe0f",  # 🧑🏽‍⚖️
+    "\U0001f9d1\U0001f3fd\u200d\u2708",  # 🧑🏽‍✈
+    "\U0001f9d1\U0001f3fd\u200d\u2708\ufe0f",  # 🧑🏽‍✈️
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍❤‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍❤‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍❤‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍❤‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍❤‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍❤‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍❤‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\u2764\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍❤‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍❤️‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍❤️‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍❤️‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍❤️‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍❤️‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍❤️‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍❤️‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍❤️‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\U0001f33e",  # 🧑🏽‍🌾
+    "\U0001f9d1\U0001f3fd\u200d\U0001f373",  # 🧑🏽‍🍳
+    "\U0001f9d1\U0001f3fd\u200d\U0001f37c",  # 🧑🏽‍🍼
+    "\U0001f9d1\U0001f3fd\u200d\U0001f384",  # 🧑🏽‍🎄
+    "\U0001f9d1\U0001f3fd\u200d\U0001f393",  # 🧑🏽‍🎓
+    "\U0001f9d1\U0001f3fd\u200d\U0001f3a4",  # 🧑🏽‍🎤
+    "\U0001f9d1\U0001f3fd\u200d\U0001f3a8",  # 🧑🏽‍🎨
+    "\U0001f9d1\U0001f3fd\u200d\U0001f3eb",  # 🧑🏽‍🏫
+    "\U0001f9d1\U0001f3fd\u200d\U0001f3ed",  # 🧑🏽‍🏭
+    "\U0001f9d1\U0001f3fd\u200d\U0001f430\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍🐰‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\U0001f430\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍🐰‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\U0001f430\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍🐰‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\U0001f430\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍🐰‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\U0001f4bb",  # 🧑🏽‍💻
+    "\U0001f9d1\U0001f3fd\u200d\U0001f4bc",  # 🧑🏽‍💼
+    "\U0001f9d1\U0001f3fd\u200d\U0001f527",  # 🧑🏽‍🔧
+    "\U0001f9d1\U0001f3fd\u200d\U0001f52c",  # 🧑🏽‍🔬
+    "\U0001f9d1\U0001f3fd\u200d\U0001f680",  # 🧑🏽‍🚀
+    "\U0001f9d1\U0001f3fd\u200d\U0001f692",  # 🧑🏽‍🚒
+    "\U0001f9d1\U0001f3fd\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍🤝‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍🤝‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fd",  # 🧑🏽‍🤝‍🧑🏽
+    "\U0001f9d1\U0001f3fd\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍🤝‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\U0001f91d\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍🤝‍🧑🏿
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9af",  # 🧑🏽‍🦯
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9af\u200d\u27a1",  # 🧑🏽‍🦯‍➡
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑🏽‍🦯‍➡️
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9b0",  # 🧑🏽‍🦰
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9b1",  # 🧑🏽‍🦱
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9b2",  # 🧑🏽‍🦲
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9b3",  # 🧑🏽‍🦳
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bc",  # 🧑🏽‍🦼
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bc\u200d\u27a1",  # 🧑🏽‍🦼‍➡
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑🏽‍🦼‍➡️
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bd",  # 🧑🏽‍🦽
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bd\u200d\u27a1",  # 🧑🏽‍🦽‍➡
+    "\U0001f9d1\U0001f3fd\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑🏽‍🦽‍➡️
+    "\U0001f9d1\U0001f3fd\u200d\U0001fa70",  # 🧑🏽‍🩰
+    "\U0001f9d1\U0001f3fd\u200d\U0001faef\u200d\U0001f9d1\U0001f3fb",  # 🧑🏽‍🫯‍🧑🏻
+    "\U0001f9d1\U0001f3fd\u200d\U0001faef\u200d\U0001f9d1\U0001f3fc",  # 🧑🏽‍🫯‍🧑🏼
+    "\U0001f9d1\U0001f3fd\u200d\U0001faef\u200d\U0001f9d1\U0001f3fe",  # 🧑🏽‍🫯‍🧑🏾
+    "\U0001f9d1\U0001f3fd\u200d\U0001faef\u200d\U0001f9d1\U0001f3ff",  # 🧑🏽‍🫯‍🧑🏿
+    "\U0001f9d1\U0001f3fe",  # 🧑🏾
+    "\U0001f9d1\U0001f3fe\u200d\u2695",  # 🧑🏾‍⚕
+    "\U0001f9d1\U0001f3fe\u200d\u2695\ufe0f",  # 🧑🏾‍⚕️
+    "\U0001f9d1\U0001f3fe\u200d\u2696",  # 🧑🏾‍⚖
+    "\U0001f9d1\U0001f3fe\u200d\u2696\ufe0f",  # 🧑🏾‍⚖️
+    "\U0001f9d1\U0001f3fe\u200d\u2708",  # 🧑🏾‍✈
+    "\U0001f9d1\U0001f3fe\u200d\u2708\ufe0f",  # 🧑🏾‍✈️
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍❤‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍❤‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍❤‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍❤‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍❤‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍❤‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍❤‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\u2764\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍❤‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍❤️‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍❤️‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍❤️‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍❤️‍💋‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍❤️‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍❤️‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍❤️‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍❤️‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\U0001f33e",  # 🧑🏾‍🌾
+    "\U0001f9d1\U0001f3fe\u200d\U0001f373",  # 🧑🏾‍🍳
+    "\U0001f9d1\U0001f3fe\u200d\U0001f37c",  # 🧑🏾‍🍼
+    "\U0001f9d1\U0001f3fe\u200d\U0001f384",  # 🧑🏾‍🎄
+    "\U0001f9d1\U0001f3fe\u200d\U0001f393",  # 🧑🏾‍🎓
+    "\U0001f9d1\U0001f3fe\u200d\U0001f3a4",  # 🧑🏾‍🎤
+    "\U0001f9d1\U0001f3fe\u200d\U0001f3a8",  # 🧑🏾‍🎨
+    "\U0001f9d1\U0001f3fe\u200d\U0001f3eb",  # 🧑🏾‍🏫
+    "\U0001f9d1\U0001f3fe\u200d\U0001f3ed",  # 🧑🏾‍🏭
+    "\U0001f9d1\U0001f3fe\u200d\U0001f430\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍🐰‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\U0001f430\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍🐰‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\U0001f430\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍🐰‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\U0001f430\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍🐰‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\U0001f4bb",  # 🧑🏾‍💻
+    "\U0001f9d1\U0001f3fe\u200d\U0001f4bc",  # 🧑🏾‍💼
+    "\U0001f9d1\U0001f3fe\u200d\U0001f527",  # 🧑🏾‍🔧
+    "\U0001f9d1\U0001f3fe\u200d\U0001f52c",  # 🧑🏾‍🔬
+    "\U0001f9d1\U0001f3fe\u200d\U0001f680",  # 🧑🏾‍🚀
+    "\U0001f9d1\U0001f3fe\u200d\U0001f692",  # 🧑🏾‍🚒
+    "\U0001f9d1\U0001f3fe\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍🤝‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍🤝‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍🤝‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fe",  # 🧑🏾‍🤝‍🧑🏾
+    "\U0001f9d1\U0001f3fe\u200d\U0001f91d\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍🤝‍🧑🏿
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9af",  # 🧑🏾‍🦯
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9af\u200d\u27a1",  # 🧑🏾‍🦯‍➡
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑🏾‍🦯‍➡️
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9b0",  # 🧑🏾‍🦰
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9b1",  # 🧑🏾‍🦱
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9b2",  # 🧑🏾‍🦲
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9b3",  # 🧑🏾‍🦳
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bc",  # 🧑🏾‍🦼
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bc\u200d\u27a1",  # 🧑🏾‍🦼‍➡
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑🏾‍🦼‍➡️
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bd",  # 🧑🏾‍🦽
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bd\u200d\u27a1",  # 🧑🏾‍🦽‍➡
+    "\U0001f9d1\U0001f3fe\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑🏾‍🦽‍➡️
+    "\U0001f9d1\U0001f3fe\u200d\U0001fa70",  # 🧑🏾‍🩰
+    "\U0001f9d1\U0001f3fe\u200d\U0001faef\u200d\U0001f9d1\U0001f3fb",  # 🧑🏾‍🫯‍🧑🏻
+    "\U0001f9d1\U0001f3fe\u200d\U0001faef\u200d\U0001f9d1\U0001f3fc",  # 🧑🏾‍🫯‍🧑🏼
+    "\U0001f9d1\U0001f3fe\u200d\U0001faef\u200d\U0001f9d1\U0001f3fd",  # 🧑🏾‍🫯‍🧑🏽
+    "\U0001f9d1\U0001f3fe\u200d\U0001faef\u200d\U0001f9d1\U0001f3ff",  # 🧑🏾‍🫯‍🧑🏿
+    "\U0001f9d1\U0001f3ff",  # 🧑🏿
+    "\U0001f9d1\U0001f3ff\u200d\u2695",  # 🧑🏿‍⚕
+    "\U0001f9d1\U0001f3ff\u200d\u2695\ufe0f",  # 🧑🏿‍⚕️
+    "\U0001f9d1\U0001f3ff\u200d\u2696",  # 🧑🏿‍⚖
+    "\U0001f9d1\U0001f3ff\u200d\u2696\ufe0f",  # 🧑🏿‍⚖️
+    "\U0001f9d1\U0001f3ff\u200d\u2708",  # 🧑🏿‍✈
+    "\U0001f9d1\U0001f3ff\u200d\u2708\ufe0f",  # 🧑🏿‍✈️
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍❤‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍❤‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍❤‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍❤‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍❤‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍❤‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍❤‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\u2764\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍❤‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍❤️‍💋‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍❤️‍💋‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍❤️‍💋‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍❤️‍💋‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍❤️‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍❤️‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍❤️‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\u2764\ufe0f\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍❤️‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\U0001f33e",  # 🧑🏿‍🌾
+    "\U0001f9d1\U0001f3ff\u200d\U0001f373",  # 🧑🏿‍🍳
+    "\U0001f9d1\U0001f3ff\u200d\U0001f37c",  # 🧑🏿‍🍼
+    "\U0001f9d1\U0001f3ff\u200d\U0001f384",  # 🧑🏿‍🎄
+    "\U0001f9d1\U0001f3ff\u200d\U0001f393",  # 🧑🏿‍🎓
+    "\U0001f9d1\U0001f3ff\u200d\U0001f3a4",  # 🧑🏿‍🎤
+    "\U0001f9d1\U0001f3ff\u200d\U0001f3a8",  # 🧑🏿‍🎨
+    "\U0001f9d1\U0001f3ff\u200d\U0001f3eb",  # 🧑🏿‍🏫
+    "\U0001f9d1\U0001f3ff\u200d\U0001f3ed",  # 🧑🏿‍🏭
+    "\U0001f9d1\U0001f3ff\u200d\U0001f430\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍🐰‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\U0001f430\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍🐰‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\U0001f430\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍🐰‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\U0001f430\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍🐰‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\U0001f4bb",  # 🧑🏿‍💻
+    "\U0001f9d1\U0001f3ff\u200d\U0001f4bc",  # 🧑🏿‍💼
+    "\U0001f9d1\U0001f3ff\u200d\U0001f527",  # 🧑🏿‍🔧
+    "\U0001f9d1\U0001f3ff\u200d\U0001f52c",  # 🧑🏿‍🔬
+    "\U0001f9d1\U0001f3ff\u200d\U0001f680",  # 🧑🏿‍🚀
+    "\U0001f9d1\U0001f3ff\u200d\U0001f692",  # 🧑🏿‍🚒
+    "\U0001f9d1\U0001f3ff\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍🤝‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍🤝‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍🤝‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\U0001f91d\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍🤝‍🧑🏾
+    "\U0001f9d1\U0001f3ff\u200d\U0001f91d\u200d\U0001f9d1\U0001f3ff",  # 🧑🏿‍🤝‍🧑🏿
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9af",  # 🧑🏿‍🦯
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9af\u200d\u27a1",  # 🧑🏿‍🦯‍➡
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9af\u200d\u27a1\ufe0f",  # 🧑🏿‍🦯‍➡️
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9b0",  # 🧑🏿‍🦰
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9b1",  # 🧑🏿‍🦱
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9b2",  # 🧑🏿‍🦲
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9b3",  # 🧑🏿‍🦳
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bc",  # 🧑🏿‍🦼
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bc\u200d\u27a1",  # 🧑🏿‍🦼‍➡
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bc\u200d\u27a1\ufe0f",  # 🧑🏿‍🦼‍➡️
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bd",  # 🧑🏿‍🦽
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bd\u200d\u27a1",  # 🧑🏿‍🦽‍➡
+    "\U0001f9d1\U0001f3ff\u200d\U0001f9bd\u200d\u27a1\ufe0f",  # 🧑🏿‍🦽‍➡️
+    "\U0001f9d1\U0001f3ff\u200d\U0001fa70",  # 🧑🏿‍🩰
+    "\U0001f9d1\U0001f3ff\u200d\U0001faef\u200d\U0001f9d1\U0001f3fb",  # 🧑🏿‍🫯‍🧑🏻
+    "\U0001f9d1\U0001f3ff\u200d\U0001faef\u200d\U0001f9d1\U0001f3fc",  # 🧑🏿‍🫯‍🧑🏼
+    "\U0001f9d1\U0001f3ff\u200d\U0001faef\u200d\U0001f9d1\U0001f3fd",  # 🧑🏿‍🫯‍🧑🏽
+    "\U0001f9d1\U0001f3ff\u200d\U0001faef\u200d\U0001f9d1\U0001f3fe",  # 🧑🏿‍🫯‍🧑🏾
+    "\U0001f9d2\U0001f3fb",  # 🧒🏻
+    "\U0001f9d2\U0001f3fc",  # 🧒🏼
+    "\U0001f9d2\U0001f3fd",  # 🧒🏽
+    "\U0001f9d2\U0001f3fe",  # 🧒🏾
+    "\U0001f9d2\U0001f3ff",  # 🧒🏿
+    "\U0001f9d3\U0001f3fb",  # 🧓🏻
+    "\U0001f9d3\U0001f3fc",  # 🧓🏼
+    "\U0001f9d3\U0001f3fd",  # 🧓🏽
+    "\U0001f9d3\U0001f3fe",  # 🧓🏾
+    "\U0001f9d3\U0001f3ff",  # 🧓🏿
+    "\U0001f9d4\u200d\u2640",  # 🧔‍♀
+    "\U0001f9d4\u200d\u2640\ufe0f",  # 🧔‍♀️
+    "\U0001f9d4\u200d\u2642",  # 🧔‍♂
+    "\U0001f9d4\u200d\u2642\ufe0f",  # 🧔‍♂️
+    "\U0001f9d4\U0001f3fb",  # 🧔🏻
+    "\U0001f9d4\U0001f3fb\u200d\u2640",  # 🧔🏻‍♀
+    "\U0001f9d4\U0001f3fb\u200d\u2640\ufe0f",  # 🧔🏻‍♀️
+    "\U0001f9d4\U0001f3fb\u200d\u2642",  # 🧔🏻‍♂
+    "\U0001f9d4\U0001f3fb\u200d\u2642\ufe0f",  # 🧔🏻‍♂️
+    "\U0001f9d4\U0001f3fc",  # 🧔🏼
+    "\U0001f9d4\U0001f3fc\u200d\u2640",  # 🧔🏼‍♀
+    "\U0001f9d4\U0001f3fc\u200d\u2640\ufe0f",  # 🧔🏼‍♀️
+    "\U0001f9d4\U0001f3fc\u200d\u2642",  # 🧔🏼‍♂
+    "\U0001f9d4\U0001f3fc\u200d\u2642\ufe0f",  # 🧔🏼‍♂️
+    "\U0001f9d4\U0001f3fd",  # 🧔🏽
+    "\U0001f9d4\U0001f3fd\u200d\u2640",  # 🧔🏽‍♀
+    "\U0001f9d4\U0001f3fd\u200d\u2640\ufe0f",  # 🧔🏽‍♀️
+    "\U0001f9d4\U0001f3fd\u200d\u2642",  # 🧔🏽‍♂
+    "\U0001f9d4\U0001f3fd\u200d\u2642\ufe0f",  # 🧔🏽‍♂️
+    "\U0001f9d4\U0001f3fe",  # 🧔🏾
+    "\U0001f9d4\U0001f3fe\u200d\u2640",  # 🧔🏾‍♀
+    "\U0001f9d4\U0001f3fe\u200d\u2640\ufe0f",  # 🧔🏾‍♀️
+    "\U0001f9d4\U0001f3fe\u200d\u2642",  # 🧔🏾‍♂
+    "\U0001f9d4\U0001f3fe\u200d\u2642\ufe0f",  # 🧔🏾‍♂️
+    "\U0001f9d4\U0001f3ff",  # 🧔🏿
+    "\U0001f9d4\U0001f3ff\u200d\u2640",  # 🧔🏿‍♀
+    "\U0001f9d4\U0001f3ff\u200d\u2640\ufe0f",  # 🧔🏿‍♀️
+    "\U0001f9d4\U0001f3ff\u200d\u2642",  # 🧔🏿‍♂
+    "\U0001f9d4\U0001f3ff\u200d\u2642\ufe0f",  # 🧔🏿‍♂️
+    "\U0001f9d5\U0001f3fb",  # 🧕🏻
+    "\U0001f9d5\U0001f3fc",  # 🧕🏼
+    "\U0001f9d5\U0001f3fd",  # 🧕🏽
+    "\U0001f9d5\U0001f3fe",  # 🧕🏾
+    "\U0001f9d5\U0001f3ff",  # 🧕🏿
+    "\U0001f9d6\u200d\u2640",  # 🧖‍♀
+    "\U0001f9d6\u200d\u2640\ufe0f",  # 🧖‍♀️
+    "\U0001f9d6\u200d\u2642",  # 🧖‍♂
+    "\U0001f9d6\u200d\u2642\ufe0f",  # 🧖‍♂️
+    "\U0001f9d6\U0001f3fb",  # 🧖🏻
+    "\U0001f9d6\U0001f3fb\u200d\u2640",  # 🧖🏻‍♀
+    "\U0001f9d6\U0001f3fb\u200d\u2640\ufe0f",  # 🧖🏻‍♀️
+    "\U0001f9d6\U0001f3fb\u200d\u2642",  # 🧖🏻‍♂
+    "\U0001f9d6\U0001f3fb\u200d\u2642\ufe0f",  # 🧖🏻‍♂️
+    "\U0001f9d6\U0001f3fc",  # 🧖🏼
+    "\U0001f9d6\U0001f3fc\u200d\u2640",  # 🧖🏼‍♀
+    "\U0001f9d6\U0001f3fc\u200d\u2640\ufe0f",  # 🧖🏼‍♀️
+    "\U0001f9d6\U0001f3fc\u200d\u2642",  # 🧖🏼‍♂
+    "\U0001f9d6\U0001f3fc\u200d\u2642\ufe0f",  # 🧖🏼‍♂️
+    "\U0001f9d6\U0001f3fd",  # 🧖🏽
+    "\U0001f9d6\U0001f3fd\u200d\u2640",  # 🧖🏽‍♀
+    "\U0001f9d6\U0001f3fd\u200d\u2640\ufe0f",  # 🧖🏽‍♀️
+    "\U0001f9d6\U0001f3fd\u200d\u2642",  # 🧖🏽‍♂
+    "\U0001f9d6\U0001f3fd\u200d\u2642\ufe0f",  # 🧖🏽‍♂️
+    "\U0001f9d6\U0001f3fe",  # 🧖🏾
+    "\U0001f9d6\U0001f3fe\u200d\u2640",  # 🧖🏾‍♀
+    "\U0001f9d6\U0001f3fe\u200d\u2640\ufe0f",  # 🧖🏾‍♀️
+    "\U0001f9d6\U0001f3fe\u200d\u2642",  # 🧖🏾‍♂
+    "\U0001f9d6\U0001f3fe\u200d\u2642\ufe0f",  # 🧖🏾‍♂️
+    "\U0001f9d6\U0001f3ff",  # 🧖🏿
+    "\U0001f9d6\U0001f3ff\u200d\u2640",  # 🧖🏿‍♀
+    "\U0001f9d6\U0001f3ff\u200d\u2640\ufe0f",  # 🧖🏿‍♀️
+    "\U0001f9d6\U0001f3ff\u200d\u2642",  # 🧖🏿‍♂
+    "\U0001f9d6\U0001f3ff\u200d\u2642\ufe0f",  # 🧖🏿‍♂️
+    "\U0001f9d7\u200d\u2640",  # 🧗‍♀
+    "\U0001f9d7\u200d\u2640\ufe0f",  # 🧗‍♀️
+    "\U0001f9d7\u200d\u2642",  # 🧗‍♂
+    "\U0001f9d7\u200d\u2642\ufe0f",  # 🧗‍♂️
+    "\U0001f9d7\U0001f3fb",  # 🧗🏻
+    "\U0001f9d7\U0001f3fb\u200d\u2640",  # 🧗🏻‍♀
+    "\U0001f9d7\U0001f3fb\u200d\u2640\ufe0f",  # 🧗🏻‍♀️
+    "\U0001f9d7\U0001f3fb\u200d\u2642",  # 🧗🏻‍♂
+    "\U0001f9d7\U0001f3fb\u200d\u2642\ufe0f",  # 🧗🏻‍♂️
+    "\U0001f9d7\U0001f3fc",  # 🧗🏼
+    "\U0001f9d7\U0001f3fc\u200d\u2640",  # 🧗🏼‍♀
+    "\U0001f9d7\U0001f3fc\u200d\u2640\ufe0f",  # 🧗🏼‍♀️
+    "\U0001f9d7\U0001f3fc\u200d\u2642",  # 🧗🏼‍♂
+    "\U0001f9d7\U0001f3fc\u200d\u2642\ufe0f",  # 🧗🏼‍♂️
+    "\U0001f9d7\U0001f3fd",  # 🧗🏽
+    "\U0001f9d7\U0001f3fd\u200d\u2640",  # 🧗🏽‍♀
+    "\U0001f9d7\U0001f3fd\u200d\u2640\ufe0f",  # 🧗🏽‍♀️
+    "\U0001f9d7\U0001f3fd\u200d\u2642",  # 🧗🏽‍♂
+    "\U0001f9d7\U0001f3fd\u200d\u2642\ufe0f",  # 🧗🏽‍♂️
+    "\U0001f9d7\U0001f3fe",  # 🧗🏾
+    "\U0001f9d7\U0001f3fe\u200d\u2640",  # 🧗🏾‍♀
+    "\U0001f9d7\U0001f3fe\u200d\u2640\ufe0f",  # 🧗🏾‍♀️
+    "\U0001f9d7\U0001f3fe\u200d\u2642",  # 🧗🏾‍♂
+    "\U0001f9d7\U0001f3fe\u200d\u2642\ufe0f",  # 🧗🏾‍♂️
+    "\U0001f9d7\U0001f3ff",  # 🧗🏿
+    "\U0001f9d7\U0001f3ff\u200d\u2640",  # 🧗🏿‍♀
+    "\U0001f9d7\U0001f3ff\u200d\u2640\ufe0f",  # 🧗🏿‍♀️
+    "\U0001f9d7\U0001f3ff\u200d\u2642",  # 🧗🏿‍♂
+    "\U0001f9d7\U0001f3ff\u200d\u2642\ufe0f",  # 🧗🏿‍♂️
+    "\U0001f9d8\u200d\u2640",  # 🧘‍♀
+    "\U0001f9d8\u200d\u2640\ufe0f",  # 🧘‍♀️
+    "\U0001f9d8\u200d\u2642",  # 🧘‍♂
+    "\U0001f9d8\u200d\u2642\ufe0f",  # 🧘‍♂️
+    "\U0001f9d8\U0001f3fb",  # 🧘🏻
+    "\U0001f9d8\U0001f3fb\u200d\u2640",  # 🧘🏻‍♀
+    "\U0001f9d8\U0001f3fb\u200d\u2640\ufe0f",  # 🧘🏻‍♀️
+    "\U0001f9d8\U0001f3fb\u200d\u2642",  # 🧘🏻‍♂
+    "\U0001f9d8\U0001f3fb\u200d\u2642\ufe0f",  # 🧘🏻‍♂️
+    "\U0001f9d8\U0001f3fc",  # 🧘🏼
+    "\U0001f9d8\U0001f3fc\u200d\u2640",  # 🧘🏼‍♀
+    "\U0001f9d8\U0001f3fc\u200d\u2640\ufe0f",  # 🧘🏼‍♀️
+    "\U0001f9d8\U0001f3fc\u200d\u2642",  # 🧘🏼‍♂
+    "\U0001f9d8\U0001f3fc\u200d\u2642\ufe0f",  # 🧘🏼‍♂️
+    "\U0001f9d8\U0001f3fd",  # 🧘🏽
+    "\U0001f9d8\U0001f3fd\u200d\u2640",  # 🧘🏽‍♀
+    "\U0001f9d8\U0001f3fd\u200d\u2640\ufe0f",  # 🧘🏽‍♀️
+    "\U0001f9d8\U0001f3fd\u200d\u2642",  # 🧘🏽‍♂
+    "\U0001f9d8\U0001f3fd\u200d\u2642\ufe0f",  # 🧘🏽‍♂️
+    "\U0001f9d8\U0001f3fe",  # 🧘🏾
+    "\U0001f9d8\U0001f3fe\u200d\u2640",  # 🧘🏾‍♀
+    "\U0001f9d8\U0001f3fe\u200d\u2640\ufe0f",  # 🧘🏾‍♀️
+    "\U0001f9d8\U0001f3fe\u200d\u2642",  # 🧘🏾‍♂
+    "\U0001f9d8\U0001f3fe\u200d\u2642\ufe0f",  # 🧘🏾‍♂️
+    "\U0001f9d8\U0001f3ff",  # 🧘🏿
+    "\U0001f9d8\U0001f3ff\u200d\u2640",  # 🧘🏿‍♀
+    "\U0001f9d8\U0001f3ff\u200d\u2640\ufe0f",  # 🧘🏿‍♀️
+    "\U0001f9d8\U0001f3ff\u200d\u2642",  # 🧘🏿‍♂
+    "\U0001f9d8\U0001f3ff\u200d\u2642\ufe0f",  # 🧘🏿‍♂️
+    "\U0001f9d9\u200d\u2640",  # 🧙‍♀
+    "\U0001f9d9\u200d\u2640\ufe0f",  # 🧙‍♀️
+    "\U0001f9d9\u200d\u2642",  # 🧙‍♂
+    "\U0001f9d9\u200d\u2642\ufe0f",  # 🧙‍♂️
+    "\U0001f9d9\U0001f3fb",  # 🧙🏻
+    "\U0001f9d9\U0001f3fb\u200d\u2640",  # 🧙🏻‍♀
+    "\U0001f9d9\U0001f3fb\u200d\u2640\ufe0f",  # 🧙🏻‍♀️
+    "\U0001f9d9\U0001f3fb\u200d\u2642",  # 🧙🏻‍♂
+    "\U0001f9d9\U0001f3fb\u200d\u2642\ufe0f",  # 🧙🏻‍♂️
+    "\U0001f9d9\U0001f3fc",  # 🧙🏼
+    "\U0001f9d9\U0001f3fc\u200d\u2640",  # 🧙🏼‍♀
+    "\U0001f9d9\U0001f3fc\u200d\u2640\ufe0f",  # 🧙🏼‍♀️
+    "\U0001f9d9\U0001f3fc\u200d\u2642",  # 🧙🏼‍♂
+    "\U0001f9d9\U0001f3fc\u200d\u2642\ufe0f",  # 🧙🏼‍♂️
+    "\U0001f9d9\U0001f3fd",  # 🧙🏽
+    "\U0001f9d9\U0001f3fd\u200d\u2640",  # 🧙🏽‍♀
+    "\U0001f9d9\U0001f3fd\u200d\u2640\ufe0f",  # 🧙🏽‍♀️
+    "\U0001f9d9\U0001f3fd\u200d\u2642",  # 🧙🏽‍♂
+    "\U0001f9d9\U0001f3fd\u200d\u2642\ufe0f",  # 🧙🏽‍♂️
+    "\U0001f9d9\U0001f3fe",  # 🧙🏾
+    "\U0001f9d9\U0001f3fe\u200d\u2640",  # 🧙🏾‍♀
+    "\U0001f9d9\U0001f3fe\u200d\u2640\ufe0f",  # 🧙🏾‍♀️
+    "\U0001f9d9\U0001f3fe\u200d\u2642",  # 🧙🏾‍♂
+    "\U0001f9d9\U0001f3fe\u200d\u2642\ufe0f",  # 🧙🏾‍♂️
+    "\U0001f9d9\U0001f3ff",  # 🧙🏿
+    "\U0001f9d9\U0001f3ff\u200d\u2640",  # 🧙🏿‍♀
+    "\U0001f9d9\U0001f3ff\u200d\u2640\ufe0f",  # 🧙🏿‍♀️
+    "\U0001f9d9\U0001f3ff\u200d\u2642",  # 🧙🏿‍♂
+    "\U0001f9d9\U0001f3ff\u200d\u2642\ufe0f",  # 🧙🏿‍♂️
+    "\U0001f9da\u200d\u2640",  # 🧚‍♀
+    "\U0001f9da\u200d\u2640\ufe0f",  # 🧚‍♀️
+    "\U0001f9da\u200d\u2642",  # 🧚‍♂
+    "\U0001f9da\u200d\u2642\ufe0f",  # 🧚‍♂️
+    "\U0001f9da\U0001f3fb",  # 🧚🏻
+    "\U0001f9da\U0001f3fb\u200d\u2640",  # 🧚🏻‍♀
+    "\U0001f9da\U0001f3fb\u200d\u2640\ufe0f",  # 🧚🏻‍♀️
+    "\U0001f9da\U0001f3fb\u200d\u2642",  # 🧚🏻‍♂
+    "\U0001f9da\U0001f3fb\u200d\u2642\ufe0f",  # 🧚🏻‍♂️
+    "\U0001f9da\U0001f3fc",  # 🧚🏼
+    "\U0001f9da\U0001f3fc\u200d\u2640",  # 🧚🏼‍♀
+    "\U0001f9da\U0001f3fc\u200d\u2640\ufe0f",  # 🧚🏼‍♀️
+    "\U0001f9da\U0001f3fc\u200d\u2642",  # 🧚🏼‍♂
+    "\U0001f9da\U0001f3fc\u200d\u2642\ufe0f",  # 🧚🏼‍♂️
+    "\U0001f9da\U0001f3fd",  # 🧚🏽
+    "\U0001f9da\U0001f3fd\u200d\u2640",  # 🧚🏽‍♀
+    "\U0001f9da\U0001f3fd\u200d\u2640\ufe0f",  # 🧚🏽‍♀️
+    "\U0001f9da\U0001f3fd\u200d\u2642",  # 🧚🏽‍♂
+    "\U0001f9da\U0001f3fd\u200d\u2642\ufe0f",  # 🧚🏽‍♂️
+    "\U0001f9da\U0001f3fe",  # 🧚🏾
+    "\U0001f9da\U0001f3fe\u200d\u2640",  # 🧚🏾‍♀
+    "\U0001f9da\U0001f3fe\u200d\u2640\ufe0f",  # 🧚🏾‍♀️
+    "\U0001f9da\U0001f3fe\u200d\u2642",  # 🧚🏾‍♂
+    "\U0001f9da\U0001f3fe\u200d\u2642\ufe0f",  # 🧚🏾‍♂️
+    "\U0001f9da\U0001f3ff",  # 🧚🏿
+    "\U0001f9da\U0001f3ff\u200d\u2640",  # 🧚🏿‍♀
+    "\U0001f9da\U0001f3ff\u200d\u2640\ufe0f",  # 🧚🏿‍♀️
+    "\U0001f9da\U0001f3ff\u200d\u2642",  # 🧚🏿‍♂
+    "\U0001f9da\U0001f3ff\u200d\u2642\ufe0f",  # 🧚🏿‍♂️
+    "\U0001f9db\u200d\u2640",  # 🧛‍♀
+    "\U0001f9db\u200d\u2640\ufe0f",  # 🧛‍♀️
+    "\U0001f9db\u200d\u2642",  # 🧛‍♂
+    "\U0001f9db\u200d\u2642\ufe0f",  # 🧛‍♂️
+    "\U0001f9db\U0001f3fb",  # 🧛🏻
+    "\U0001f9db\U0001f3fb\u200d\u2640",  # 🧛🏻‍♀
+    "\U0001f9db\U0001f3fb\u200d\u2640\ufe0f",  # 🧛🏻‍♀️
+    "\U0001f9db\U0001f3fb\u200d\u2642",  # 🧛🏻‍♂
+    "\U0001f9db\U0001f3fb\u200d\u2642\ufe0f",  # 🧛🏻‍♂️
+    "\U0001f9db\U0001f3fc",  # 🧛🏼
+    "\U0001f9db\U0001f3fc\u200d\u2640",  # 🧛🏼‍♀
+    "\U0001f9db\U0001f3fc\u200d\u2640\ufe0f",  # 🧛🏼‍♀️
+    "\U0001f9db\U0001f3fc\u200d\u2642",  # 🧛🏼‍♂
+    "\U0001f9db\U0001f3fc\u200d\u2642\ufe0f",  # 🧛🏼‍♂️
+    "\U0001f9db\U0001f3fd",  # 🧛🏽
+    "\U0001f9db\U0001f3fd\u200d\u2640",  # 🧛🏽‍♀
+    "\U0001f9db\U0001f3fd\u200d\u2640\ufe0f",  # 🧛🏽‍♀️
+    "\U0001f9db\U0001f3fd\u200d\u2642",  # 🧛🏽‍♂
+    "\U0001f9db\U0001f3fd\u200d\u2642\ufe0f",  # 🧛🏽‍♂️
+    "\U0001f9db\U0001f3fe",  # 🧛🏾
+    "\U0001f9db\U0001f3fe\u200d\u2640",  # 🧛🏾‍♀
+    "\U0001f9db\U0001f3fe\u200d\u2640\ufe0f",  # 🧛🏾‍♀️
+    "\U0001f9db\U0001f3fe\u200d\u2642",  # 🧛🏾‍♂
+    "\U0001f9db\U0001f3fe\u200d\u2642\ufe0f",  # 🧛🏾‍♂️
+    "\U0001f9db\U0001f3ff",  # 🧛🏿
+    "\U0001f9db\U0001f3ff\u200d\u2640",  # 🧛🏿‍♀
+    "\U0001f9db\U0001f3ff\u200d\u2640\ufe0f",  # 🧛🏿‍♀️
+    "\U0001f9db\U0001f3ff\u200d\u2642",  # 🧛🏿‍♂
+    "\U0001f9db\U0001f3ff\u200d\u2642\ufe0f",  # 🧛🏿‍♂️
+    "\U0001f9dc\u200d\u2640",  # 🧜‍♀
+    "\U0001f9dc\u200d\u2640\ufe0f",  # 🧜‍♀️
+    "\U0001f9dc\u200d\u2642",  # 🧜‍♂
+    "\U0001f9dc\u200d\u2642\ufe0f",  # 🧜‍♂️
+    "\U0001f9dc\U0001f3fb",  # 🧜🏻
+    "\U0001f9dc\U0001f3fb\u200d\u2640",  # 🧜🏻‍♀
+    "\U0001f9dc\U0001f3fb\u200d\u2640\ufe0f",  # 🧜🏻‍♀️
+    "\U0001f9dc\U0001f3fb\u200d\u2642",  # 🧜🏻‍♂
+    "\U0001f9dc\U0001f3fb\u200d\u2642\ufe0f",  # 🧜🏻‍♂️
+    "\U0001f9dc\U0001f3fc",  # 🧜🏼
+    "\U0001f9dc\U0001f3fc\u200d\u2640",  # 🧜🏼‍♀
+    "\U0001f9dc\U0001f3fc\u200d\u2640\ufe0f",  # 🧜🏼‍♀️
+    "\U0001f9dc\U0001f3fc\u200d\u2642",  # 🧜🏼‍♂
+    "\U0001f9dc\U0001f3fc\u200d\u2642\ufe0f",  # 🧜🏼‍♂️
+    "\U0001f9dc\U0001f3fd",  # 🧜🏽
+    "\U0001f9dc\U0001f3fd\u200d\u2640",  # 🧜🏽‍♀
+    "\U0001f9dc\U0001f3fd\u200d\u2640\ufe0f",  # 🧜🏽‍♀️
+    "\U0001f9dc\U0001f3fd\u200d\u2642",  # 🧜🏽‍♂
+    "\U0001f9dc\U0001f3fd\u200d\u2642\ufe0f",  # 🧜🏽‍♂️
+    "\U0001f9dc\U0001f3fe",  # 🧜🏾
+    "\U0001f9dc\U0001f3fe\u200d\u2640",  # 🧜🏾‍♀
+    "\U0001f9dc\U0001f3fe\u200d\u2640\ufe0f",  # 🧜🏾‍♀️
+    "\U0001f9dc\U0001f3fe\u200d\u2642",  # 🧜🏾‍♂
+    "\U0001f9dc\U0001f3fe\u200d\u2642\ufe0f",  # 🧜🏾‍♂️
+    "\U0001f9dc\U0001f3ff",  # 🧜🏿
+    "\U0001f9dc\U0001f3ff\u200d\u2640",  # 🧜🏿‍♀
+    "\U0001f9dc\U0001f3ff\u200d\u2640\ufe0f",  # 🧜🏿‍♀️
+    "\U0001f9dc\U0001f3ff\u200d\u2642",  # 🧜🏿‍♂
+    "\U0001f9dc\U0001f3ff\u200d\u2642\ufe0f",  # 🧜🏿‍♂️
+    "\U0001f9dd\u200d\u2640",  # 🧝‍♀
+    "\U0001f9dd\u200d\u2640\ufe0f",  # 🧝‍♀️
+    "\U0001f9dd\u200d\u2642",  # 🧝‍♂
+    "\U0001f9dd\u200d\u2642\ufe0f",  # 🧝‍♂️
+    "\U0001f9dd\U0001f3fb",  # 🧝🏻
+    "\U0001f9dd\U0001f3fb\u200d\u2640",  # 🧝🏻‍♀
+    "\U0001f9dd\U0001f3fb\u200d\u2640\ufe0f",  # 🧝🏻‍♀️
+    "\U0001f9dd\U0001f3fb\u200d\u2642",  # 🧝🏻‍♂
+    "\U0001f9dd\U0001f3fb\u200d\u2642\ufe0f",  # 🧝🏻‍♂️
+    "\U0001f9dd\U0001f3fc",  # 🧝🏼
+    "\U0001f9dd\U0001f3fc\u200d\u2640",  # 🧝🏼‍♀
+    "\U0001f9dd\U0001f3fc\u200d\u2640\ufe0f",  # 🧝🏼‍♀️
+    "\U0001f9dd\U0001f3fc\u200d\u2642",  # 🧝🏼‍♂
+    "\U0001f9dd\U0001f3fc\u200d\u2642\ufe0f",  # 🧝🏼‍♂️
+    "\U0001f9dd\U0001f3fd",  # 🧝🏽
+    "\U0001f9dd\U0001f3fd\u200d\u2640",  # 🧝🏽‍♀
+    "\U0001f9dd\U0001f3fd\u200d\u2640\ufe0f",  # 🧝🏽‍♀️
+    "\U0001f9dd\U0001f3fd\u200d\u2642",  # 🧝🏽‍♂
+    "\U0001f9dd\U0001f3fd\u200d\u2642\ufe0f",  # 🧝🏽‍♂️
+    "\U0001f9dd\U0001f3fe",  # 🧝🏾
+    "\U0001f9dd\U0001f3fe\u200d\u2640",  # 🧝🏾‍♀
+    "\U0001f9dd\U0001f3fe\u200d\u2640\ufe0f",  # 🧝🏾‍♀️
+    "\U0001f9dd\U0001f3fe\u200d\u2642",  # 🧝🏾‍♂
+    "\U0001f9dd\U0001f3fe\u200d\u2642\ufe0f",  # 🧝🏾‍♂️
+    "\U0001f9dd\U0001f3ff",  # 🧝🏿
+    "\U0001f9dd\U0001f3ff\u200d\u2640",  # 🧝🏿‍♀
+    "\U0001f9dd\U0001f3ff\u200d\u2640\ufe0f",  # 🧝🏿‍♀️
+    "\U0001f9dd\U0001f3ff\u200d\u2642",  # 🧝🏿‍♂
+    "\U0001f9dd\U0001f3ff\u200d\u2642\ufe0f",  # 🧝🏿‍♂️
+    "\U0001f9de\u200d\u2640",  # 🧞‍♀
+    "\U0001f9de\u200d\u2640\ufe0f",  # 🧞‍♀️
+    "\U0001f9de\u200d\u2642",  # 🧞‍♂
+    "\U0001f9de\u200d\u2642\ufe0f",  # 🧞‍♂️
+    "\U0001f9df\u200d\u2640",  # 🧟‍♀
+    "\U0001f9df\u200d\u2640\ufe0f",  # 🧟‍♀️
+    "\U0001f9df\u200d\u2642",  # 🧟‍♂
+    "\U0001f9df\u200d\u2642\ufe0f",  # 🧟‍♂️
+    "\U0001fac3\U0001f3fb",  # 🫃🏻
+    "\U0001fac3\U0001f3fc",  # 🫃🏼
+    "\U0001fac3\U0001f3fd",  # 🫃🏽
+    "\U0001fac3\U0001f3fe",  # 🫃🏾
+    "\U0001fac3\U0001f3ff",  # 🫃🏿
+    "\U0001fac4\U0001f3fb",  # 🫄🏻
+    "\U0001fac4\U0001f3fc",  # 🫄🏼
+    "\U0001fac4\U0001f3fd",  # 🫄🏽
+    "\U0001fac4\U0001f3fe",  # 🫄🏾
+    "\U0001fac4\U0001f3ff",  # 🫄🏿
+    "\U0001fac5\U0001f3fb",  # 🫅🏻
+    "\U0001fac5\U0001f3fc",  # 🫅🏼
+    "\U0001fac5\U0001f3fd",  # 🫅🏽
+    "\U0001fac5\U0001f3fe",  # 🫅🏾
+    "\U0001fac5\U0001f3ff",  # 🫅🏿
+    "\U0001faf0\U0001f3fb",  # 🫰🏻
+    "\U0001faf0\U0001f3fc",  # 🫰🏼
+    "\U0001faf0\U0001f3fd",  # 🫰🏽
+    "\U0001faf0\U0001f3fe",  # 🫰🏾
+    "\U0001faf0\U0001f3ff",  # 🫰🏿
+    "\U0001faf1\U0001f3fb",  # 🫱🏻
+    "\U0001faf1\U0001f3fb\u200d\U0001faf2\U0001f3fc",  # 🫱🏻‍🫲🏼
+    "\U0001faf1\U0001f3fb\u200d\U0001faf2\U0001f3fd",  # 🫱🏻‍🫲🏽
+    "\U0001faf1\U0001f3fb\u200d\U0001faf2\U0001f3fe",  # 🫱🏻‍🫲🏾
+    "\U0001faf1\U0001f3fb\u200d\U0001faf2\U0001f3ff",  # 🫱🏻‍🫲🏿
+    "\U0001faf1\U0001f3fc",  # 🫱🏼
+    "\U0001faf1\U0001f3fc\u200d\U0001faf2\U0001f3fb",  # 🫱🏼‍🫲🏻
+    "\U0001faf1\U0001f3fc\u200d\U0001faf2\U0001f3fd",  # 🫱🏼‍🫲🏽
+    "\U0001faf1\U0001f3fc\u200d\U0001faf2\U0001f3fe",  # 🫱🏼‍🫲🏾
+    "\U0001faf1\U0001f3fc\u200d\U0001faf2\U0001f3ff",  # 🫱🏼‍🫲🏿
+    "\U0001faf1\U0001f3fd",  # 🫱🏽
+    "\U0001faf1\U0001f3fd\u200d\U0001faf2\U0001f3fb",  # 🫱🏽‍🫲🏻
+    "\U0001faf1\U0001f3fd\u200d\U0001faf2\U0001f3fc",  # 🫱🏽‍🫲🏼
+    "\U0001faf1\U0001f3fd\u200d\U0001faf2\U0001f3fe",  # 🫱🏽‍🫲🏾
+    "\U0001faf1\U0001f3fd\u200d\U0001faf2\U0001f3ff",  # 🫱🏽‍🫲🏿
+    "\U0001faf1\U0001f3fe",  # 🫱🏾
+    "\U0001faf1\U0001f3fe\u200d\U0001faf2\U0001f3fb",  # 🫱🏾‍🫲🏻
+    "\U0001faf1\U0001f3fe\u200d\U0001faf2\U0001f3fc",  # 🫱🏾‍🫲🏼
+    "\U0001faf1\U0001f3fe\u200d\U0001faf2\U0001f3fd",  # 🫱🏾‍🫲🏽
+    "\U0001faf1\U0001f3fe\u200d\U0001faf2\U0001f3ff",  # 🫱🏾‍🫲🏿
+    "\U0001faf1\U0001f3ff",  # 🫱🏿
+    "\U0001faf1\U0001f3ff\u200d\U0001faf2\U0001f3fb",  # 🫱🏿‍🫲🏻
+    "\U0001faf1\U0001f3ff\u200d\U0001faf2\U0001f3fc",  # 🫱🏿‍🫲🏼
+    "\U0001faf1\U0001f3ff\u200d\U0001faf2\U0001f3fd",  # 🫱🏿‍🫲🏽
+    "\U0001faf1\U0001f3ff\u200d\U0001faf2\U0001f3fe",  # 🫱🏿‍🫲🏾
+    "\U0001faf2\U0001f3fb",  # 🫲🏻
+    "\U0001faf2\U0001f3fc",  # 🫲🏼
+    "\U0001faf2\U0001f3fd",  # 🫲🏽
+    "\U0001faf2\U0001f3fe",  # 🫲🏾
+    "\U0001faf2\U0001f3ff",  # 🫲🏿
+    "\U0001faf3\U0001f3fb",  # 🫳🏻
+    "\U0001faf3\U0001f3fc",  # 🫳🏼
+    "\U0001faf3\U0001f3fd",  # 🫳🏽
+    "\U0001faf3\U0001f3fe",  # 🫳🏾
+    "\U0001faf3\U0001f3ff",  # 🫳🏿
+    "\U0001faf4\U0001f3fb",  # 🫴🏻
+    "\U0001faf4\U0001f3fc",  # 🫴🏼
+    "\U0001faf4\U0001f3fd",  # 🫴🏽
+    "\U0001faf4\U0001f3fe",  # 🫴🏾
+    "\U0001faf4\U0001f3ff",  # 🫴🏿
+    "\U0001faf5\U0001f3fb",  # 🫵🏻
+    "\U0001faf5\U0001f3fc",  # 🫵🏼
+    "\U0001faf5\U0001f3fd",  # 🫵🏽
+    "\U0001faf5\U0001f3fe",  # 🫵🏾
+    "\U0001faf5\U0001f3ff",  # 🫵🏿
+    "\U0001faf6\U0001f3fb",  # 🫶🏻
+    "\U0001faf6\U0001f3fc",  # 🫶🏼
+    "\U0001faf6\U0001f3fd",  # 🫶🏽
+    "\U0001faf6\U0001f3fe",  # 🫶🏾
+    "\U0001faf6\U0001f3ff",  # 🫶🏿
+    "\U0001faf7\U0001f3fb",  # 🫷🏻
+    "\U0001faf7\U0001f3fc",  # 🫷🏼
+    "\U0001faf7\U0001f3fd",  # 🫷🏽
+    "\U0001faf7\U0001f3fe",  # 🫷🏾
+    "\U0001faf7\U0001f3ff",  # 🫷🏿
+    "\U0001faf8\U0001f3fb",  # 🫸🏻
+    "\U0001faf8\U0001f3fc",  # 🫸🏼
+    "\U0001faf8\U0001f3fd",  # 🫸🏽
+    "\U0001faf8\U0001f3fe",  # 🫸🏾
+    "\U0001faf8\U0001f3ff",  # 🫸🏿
+    "\U0001faf9\U0001f3fb",  # 🫹🏻
+    "\U0001faf9\U0001f3fc",  # 🫹🏼
+    "\U0001faf9\U0001f3fd",  # 🫹🏽
+    "\U0001faf9\U0001f3fe",  # 🫹🏾
+    "\U0001faf9\U0001f3ff",  # 🫹🏿
+    "\U0001fafa\U0001f3fb",  # 🫺🏻
+    "\U0001fafa\U0001f3fc",  # 🫺🏼
+    "\U0001fafa\U0001f3fd",  # 🫺🏽
+    "\U0001fafa\U0001f3fe",  # 🫺🏾
+    "\U0001fafa\U0001f3ff",  # 🫺🏿
+}
@@ -0,0 +1,146 @@
+"""
+Sampling-based estimates of how much of a corpus needs sanitization.
+
+A full pass over a 200 GB file takes as long as reading 200 GB. To decide
+whether it needs cleaning at all, `estimate_suspicious` memory-maps the file,
+reads a random sample of fixed-size blocks (aligned to UTF-8 characters) and
+counts the disallowed characters in them.
+
+Suspicious characters cluster (a file of Cyrillic text, a section of
+math), so blocks rather than characters are the units of the sample. The rate
+of each character is a ratio estimate (its occurrences over the sampled
+characters), and its confidence interval comes from the variance between
+blocks, with a finite population correction: sampling every block gives the
+exact rate with an interval of zero width. The intervals use the normal
+approximation, so with few blocks and strongly clustered characters they are
+somewhat narrower than their nominal confidence.
+"""
+
+import math
+import mmap
+import random
+from statistics import NormalDist
+
+from sanitext.scan import align_to_character, allowed_run_pattern, count_suspicious
+from sanitext.text_sanitization import get_allowed_characters, unicode_name
+
+BLOCK_SIZE = 64 * 1024
+MIN_BLOCKS = 100
+
+
+class _RatioEstimate:
+    """Running sums for the ratio of a count to the sampled characters."""
+
+    def __init__(self):
+        self.total = 0  # Sum of counts
+        self.squares = 0  # Sum of squared counts
+        self.products = 0  # Sum of count * block characters
+
+    def add(self, count, characters):
+        self.total += count
+        self.squares += count * count
+        self.products += count * characters
+
+
+def _interval(estimate, blocks, characters, squared_characters, fraction, z):
+    """Returns (rate, low, high) for a ratio estimate over `blocks` blocks."""
+    rate = estimate.total / characters
+    if fraction == 1:
+        return rate, rate, rate  # Every block was read
+    if blocks < 2:
+        return rate, 0.0, 1.0
+    # Sum over blocks of (count - rate * characters) ** 2
+    residuals = (
+        estimate.squares
+        - 2 * rate * estimate.products
+        + rate * rate * squared_characters
+    )
+    mean_characters = characters / blocks
+    variance = (
+        (1 - fraction)
+        * max(residuals, 0)
+        / (blocks - 1)
+        / (blocks * mean_characters**2)
+    )
+    margin = z * math.sqrt(variance)
+    return rate, max(rate - margin, 0.0), min(rate + margin, 1.0)
+
+
+def estimate_suspicious(
+    source,
+    sample_rate=0.001,
+    allowed_characters=get_allowed_characters(),
+    allowed_sequences=None,
+    confidence=0.95,
+    block_size=BLOCK_SIZE,
+    seed=None,
+):
+    """
+    Estimate the rate of suspicious characters in the UTF-8 file `source` by
+    reading about `sample_rate` of it (at least MIN_BLOCKS blocks of
+    `block_size` bytes, or the whole file) at random offsets.
+
+    Returns a dict with:
+      - "blocks", "sampled_bytes", "sampled_characters": the size of the sample
+      - "estimated_characters": the estimated number of characters in the file
+      - "rate": (rate, low, high), the estimated fraction of characters that are
+        suspicious, with its `confidence` interval
+      - "characters": one (char, sample count, rate, low, high, name) tuple per
+        suspicious character seen in the sample, highest rate first
+    Characters that don't occur in the sample are not listed; their rate is
+    likely below about 3 / "sampled_characters".
+    """
+    with open(source, "rb") as file:
+        size = file.seek(0, 2)
+        if not size:
+            return {
+                "blocks": 0,
+                "sampled_bytes": 0,
+                "sampled_characters": 0,
+                "estimated_characters": 0,
+                "rate": (0.0, 0.0, 0.0),
+                "characters": [],
+            }
+        slots = math.ceil(size / block_size)
+        wanted = max(math.ceil(slots * sample_rate), MIN_BLOCKS)
+        # Sorted, so the file is read front to back
+        chosen = sorted(random.Random(seed).sample(range(slots), min(wanted, slots)))
+
+        pattern = allowed_run_pattern(allowed_characters)
+        overall = _RatioEstimate()
+        estimates = {}
+        characters = squared_characters = sampled_bytes = 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for slot in chosen:
+                start = align_to_character(data, slot * block_size)
+                end = align_to_character(data, (slot + 1) * block_size)
+                text = data[start:end].decode("utf-8", errors="replace")
+                counts = count_suspicious(text, pattern, allowed_sequences)
+                for char, (count, _) in counts.items():
+                    estimate = estimates.get(char)
+                    if estimate is None:
+                        estimate = estimates[char] = _RatioEstimate()
+                    estimate.add(count, len(text))
+                overall.add(sum(count for count, _ in counts.values()), len(text))
+                characters += len(text)
+                squared_characters += len(text) ** 2
+                sampled_bytes += end - start
+
+    if not characters:
+        characters = 1  # Only possible if every block is empty after alignment
+    blocks = len(chosen)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    arguments = blocks, characters, squared_characters, blocks / slots, z
+    per_character = [
+        (char, estimate.total, *_interval(estimate, *arguments), unicode_name(char))
+        for char, estimate in estimates.items()
+    ]
+    per_character.sort(key=lambda entry: (-entry[2], entry[0]))
+    return {
+        "blocks": blocks,
+        "sampled_bytes": sampled_bytes,
+        "sampled_characters": characters,
+        "estimated_characters": round(characters * size / max(sampled_bytes, 1)),
+        "rate": _interval(overall, *arguments),
+        "characters": per_character,
+    }
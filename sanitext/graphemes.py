@@ -0,0 +1,178 @@
+"""
+Grapheme-cluster-aware sanitization.
+
+`sanitize_text` decides per code point, so a base letter with combining marks,
+a Hangul jamo sequence or an Indic conjunct can be partly removed, leaving
+broken output. `sanitize_graphemes` segments the text into extended grapheme
+clusters (UAX #29) and decides once per distinct cluster: a cluster is either
+kept, replaced as a whole, or removed as a whole.
+
+The UAX #29 rules are precompiled into a single regex built from the range
+tables in sanitext.grapheme_data. Runs of characters that always form clusters
+on their own (most letters, digits, punctuation and spaces) are matched in one
+piece and translated per code point, so only text with combining marks and
+similar constructs pays for per-cluster work.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from sanitext.grapheme_data import (
+    EXTENDED_PICTOGRAPHIC_RANGES,
+    GRAPHEME_BREAK_RANGES,
+    INDIC_CONJUNCT_BREAK_RANGES,
+)
+from sanitext.text_sanitization import default_replacement, get_allowed_characters
+
+
+def _char_class(*range_lists, negate=False):
+    ranges = sorted(r for range_list in range_lists for r in range_list)
+    if negate:
+        # Spell out the complement: the regex engine checks BMP members of a
+        # positive class with a bitmap, while a negated class has to scan all
+        # of its non-BMP ranges for every character it does not contain.
+        complement = []
+        start = 0
+        for first, last in ranges:
+            if first > start:
+                complement.append((start, first - 1))
+            start = max(start, last + 1)
+        if start <= 0x10FFFF:
+            complement.append((start, 0x10FFFF))
+        ranges = complement
+    parts = [
+        f"\\U{first:08X}" if first == last else f"\\U{first:08X}-\\U{last:08X}"
+        for first, last in ranges
+    ]
+    return "[" + "".join(parts) + "]"
+
+
+@lru_cache(maxsize=None)
+def grapheme_pattern():
+    """
+    Returns the compiled extended grapheme cluster regex (UAX #29, Table 1b).
+    Every match sets exactly one of two groups: group 1 is a run of characters
+    that are each a cluster on their own, group 2 is a single cluster.
+    """
+    gcb = GRAPHEME_BREAK_RANGES
+    incb = INDIC_CONJUNCT_BREAK_RANGES
+    control = _char_class(gcb["CR"], gcb["LF"], gcb["Control"])
+    not_control = _char_class(gcb["CR"], gcb["LF"], gcb["Control"], negate=True)
+    postcore = _char_class(gcb["Extend"], gcb["ZWJ"], gcb["SpacingMark"])
+    # Characters that never join the previous one and only join a following
+    # postcore (or V/T for precomposed Hangul syllables): Grapheme_Cluster_Break
+    # Other, LV, LVT and the controls except CR, which joins a following LF.
+    standalone_breaks = [
+        ranges
+        for value, ranges in gcb.items()
+        if value not in ("LV", "LVT", "LF", "Control")
+    ]
+    standalone = _char_class(*standalone_breaks, negate=True)
+    run_end = _char_class(
+        gcb["Extend"], gcb["ZWJ"], gcb["SpacingMark"], gcb["V"], gcb["T"]
+    )
+    L, V, T = _char_class(gcb["L"]), _char_class(gcb["V"]), _char_class(gcb["T"])
+    LV, LVT = _char_class(gcb["LV"]), _char_class(gcb["LVT"])
+    regional_indicator = _char_class(gcb["Regional_Indicator"])
+    pictographic = _char_class(EXTENDED_PICTOGRAPHIC_RANGES)
+    consonant = _char_class(incb["Consonant"])
+    linker = _char_class(incb["Linker"])
+    extend_or_linker = _char_class(incb["Extend"], incb["Linker"])
+
+    hangul_syllable = f"{L}*(?:{V}+|{LV}{V}*|{LVT}){T}*|{L}+|{T}+"
+    ri_pair = f"{regional_indicator}{regional_indicator}"
+    xpicto_sequence = (
+        f"{pictographic}(?:{_char_class(gcb['Extend'])}*"
+        f"{_char_class(gcb['ZWJ'])}{pictographic})*"
+    )
+    conjunct_cluster = (
+        f"{consonant}(?:{extend_or_linker}*{linker}{extend_or_linker}*{consonant})+"
+    )
+    core = (
+        f"(?:{hangul_syllable}|{ri_pair}|{xpicto_sequence}"
+        f"|{conjunct_cluster}|{not_control})"
+    )
+    prepend = _char_class(gcb["Prepend"])
+    cluster = f"\r\n|{control}|{prepend}*{core}{postcore}*"
+    return re.compile(f"({standalone}+(?!{run_end}))|({cluster})")
+
+
+def grapheme_clusters(text):
+    """Yields the extended grapheme clusters of `text`."""
+    for run, cluster in grapheme_pattern().findall(text):
+        if run:
+            yield from run
+        else:
+            yield cluster
+
+
+def decide_cluster(cluster, allowed_characters, replace_char, allowed_sequences=None):
+    """
+    Returns the replacement of a grapheme cluster that contains a disallowed
+    code point. The cluster is kept if its composed (NFC) form is allowed;
+    otherwise its first code point decides: if that is removed, the whole
+    cluster is removed, so no combining marks or jamo are left orphaned.
+    """
+    if all(ch in allowed_characters for ch in cluster):
+        return cluster
+    if len(cluster) == 1:
+        return replace_char(cluster)
+    if allowed_sequences is not None and allowed_sequences.match(cluster, 0) == len(
+        cluster
+    ):
+        return cluster
+    composed = unicodedata.normalize("NFC", cluster)
+    if all(ch in allowed_characters for ch in composed):
+        return composed
+    base = replace_char(composed[0])
+    if not base:
+        return ""
+    return base + "".join(replace_char(ch) for ch in composed[1:])
+
+
+def sanitize_graphemes(
+    text,
+    allowed_characters=get_allowed_characters(),
+    decisions=None,
+    allowed_sequences=None,
+):
+    """
+    Remove or replace disallowed characters, deciding per grapheme cluster.
+
+    Single-code-point clusters get the same result as `sanitize_text`;
+    decisions for multi-code-point clusters are cached per distinct cluster.
+    `decisions` and `allowed_sequences` work as in `sanitize_text`.
+    Returns the sanitized text.
+    """
+    disallowed_chars = [ch for ch in set(text) if ch not in allowed_characters]
+    if not disallowed_chars:
+        return text
+
+    replacements = {}
+
+    def replace_char(ch):
+        if ch in allowed_characters:
+            return ch
+        if ch not in replacements:
+            if decisions and ch in decisions:
+                replacements[ch] = decisions[ch]
+            else:
+                replacements[ch] = default_replacement(ch, allowed_characters)
+        return replacements[ch]
+
+    table = {ord(ch): replace_char(ch) for ch in disallowed_chars}
+    cluster_decisions = {}
+    parts = []
+    for run, cluster in grapheme_pattern().findall(text):
+        if run:
+            # Run of single-code-point clusters
+            parts.append(run.translate(table))
+            continue
+        replacement = cluster_decisions.get(cluster)
+        if replacement is None:
+            replacement = cluster_decisions[cluster] = decide_cluster(
+                cluster, allowed_characters, replace_char, allowed_sequences
+            )
+        parts.append(replacement)
+    return "".join(parts)
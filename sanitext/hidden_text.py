@@ -0,0 +1,84 @@
+"""
+Detect and decode text hidden in invisible tag and variation selector characters.
+
+Two covert channels are common in LLM output:
+  - Tag characters (U+E0020-U+E007E) mirror printable ASCII, so "boss" can be
+    written as U+E0062 U+E006F U+E0073 U+E0073.
+  - Variation selectors (U+FE00-U+FE0F, U+E0100-U+E01EF) are 256 code points,
+    one per byte value, so any UTF-8 payload can ride after a visible character.
+
+Both are invisible and are dropped by `sanitize_text`, which hides the fact that
+a message was smuggled. `find_hidden_text` reports every run in a single regex
+pass, so clean text costs one scan and no per-character Python work.
+"""
+
+import re
+from itertools import groupby
+
+TAG = "tag"
+VARIATION_SELECTOR = "variation selector"
+
+# One character class covering both blocks (plus the unassigned U+E0080-U+E00FF
+# between them) is about twice as fast to scan as an alternation of two classes;
+# runs are split by kind afterwards, which only costs anything when found.
+HIDDEN_TEXT_PATTERN = re.compile("[\ufe00-\ufe0f\U000e0000-\U000e01ef]+")
+
+_BLACK_FLAG = "\U0001f3f4"
+# The tags of a subdivision flag (UTS #51): a region code of two letters and a
+# subdivision of one to four letters or digits (e.g. "gbeng"), then CANCEL TAG
+_SUBDIVISION_FLAG_TAGS = re.compile(
+    "[\U000e0061-\U000e007a]{2}[\U000e0030-\U000e0039\U000e0061-\U000e007a]{1,4}"
+    "\U000e007f"
+)
+
+
+def decode_tags(run):
+    """Returns the ASCII text carried by a run of tag characters."""
+    # U+E0001 (LANGUAGE TAG) and U+E007F (CANCEL TAG) carry no text
+    return "".join(
+        chr(ord(ch) - 0xE0000) for ch in run if 0xE0020 <= ord(ch) <= 0xE007E
+    )
+
+
+def decode_variation_selectors(run):
+    """Returns the text carried by a run of variation selectors, one byte each."""
+    # U+FE00-U+FE0F are bytes 0-15, U+E0100-U+E01EF are bytes 16-255
+    data = bytes(
+        ord(ch) - 0xFE00 if ord(ch) <= 0xFE0F else ord(ch) - 0xE0100 + 16 for ch in run
+    )
+    return data.decode("utf-8", errors="replace")
+
+
+def find_hidden_text(text):
+    """
+    Find runs of tag and variation selector characters and decode their payload.
+
+    Legitimate uses are skipped: a single variation selector (emoji or text
+    presentation, ideographic variants) and emoji tag sequences (subdivision
+    flags such as England: a black flag followed by the tags of a subdivision
+    code and a cancel tag).
+    Returns a list of (start, end, kind, payload) in order of appearance, with
+    kind either TAG or VARIATION_SELECTOR.
+    """
+    found = []
+    for match in HIDDEN_TEXT_PATTERN.finditer(text):
+        start = match.start()
+        for is_tag, chars in groupby(match.group(), key=_is_tag):
+            run = "".join(chars)
+            end = start + len(run)
+            if is_tag:
+                if not (
+                    text[start - 1 : start] == _BLACK_FLAG
+                    and _SUBDIVISION_FLAG_TAGS.fullmatch(run)
+                ):
+                    found.append((start, end, TAG, decode_tags(run)))
+            elif len(run) > 1:
+                found.append(
+                    (start, end, VARIATION_SELECTOR, decode_variation_selectors(run))
+                )
+            start = end
+    return found
+
+
+def _is_tag(ch):
+    return 0xE0000 <= ord(ch) <= 0xE00FF
@@ -1,6 +1,10 @@
-# A comprehensive mapping of Unicode homoglyphs to ASCII characters
+# A comprehensive mapping of Unicode homoglyphs to ASCII characters:
+# the ASCII look-alikes from Unicode's confusables data, overridden by the
+# hand-picked entries below.
 
-HOMOGLYPH_MAP = {
+from sanitext.confusables_data import CONFUSABLES
+
+MANUAL_HOMOGLYPHS = {
     # Latin Homoglyphs
     chr(0xC0): "A",  # "À"
     chr(0xC1): "A",  # "Á"
@@ -284,6 +288,8 @@ HOMOGLYPH_MAP = {
     chr(0x206F): "",  # "⁯"
 }
 
+HOMOGLYPH_MAP = {**CONFUSABLES, **MANUAL_HOMOGLYPHS}
+
 
 def get_homoglyph_replacement(char):
     """Returns the ASCII replacement for a given Unicode character if available."""
@@ -0,0 +1,173 @@
+"""
+JSON-aware sanitization.
+
+Running `sanitize_text` on raw JSON can corrupt it (a removed character next to
+an escape, a homoglyph replaced inside a "\\uXXXX" sequence), and parsing the
+whole document into objects costs memory proportional to its size.
+`sanitize_json_stream` instead walks the token stream chunk by chunk and only
+rewrites string tokens: each one is decoded, sanitized and re-escaped, while
+numbers, literals, punctuation and whitespace are copied as they are. Strings
+that need no change are copied verbatim, escapes included.
+
+Memory use is bounded by the chunk size plus the longest single string token,
+whatever the size of the document.
+"""
+
+import re
+from json.decoder import scanstring
+from json.encoder import encode_basestring
+
+from sanitext.text_sanitization import (
+    TranslationTable,
+    get_allowed_characters,
+    sanitize_text,
+)
+
+# A complete string token; quotes outside strings only ever start or end one,
+# so scanning from outside a string never matches inside one
+STRING_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+# The body of a string up to its closing quote, or up to where the input ends
+# (never stopping inside an escape)
+STRING_BODY_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+CHUNK_SIZE = 1 << 16
+
+
+def sanitize_json_stream(
+    chunks,
+    allowed_characters=get_allowed_characters(),
+    sanitize_keys=False,
+    interactive=False,
+    decisions=None,
+    allowed_sequences=None,
+):
+    """
+    Sanitize the string values of a JSON document read from `chunks` (an
+    iterable of text pieces of any size), yielding the output piece by piece.
+    Object keys (strings followed by ":") are only sanitized if `sanitize_keys`
+    is set. The other arguments work as in `sanitize_text`; in interactive mode
+    each character is asked about once for the whole document.
+
+    Raises ValueError if a string token is unterminated or not valid JSON.
+    """
+    if interactive and decisions is None:
+        decisions = {}
+    # Without prompts or sequences, one lazily filled table serves all strings
+    table = None
+    if not interactive and allowed_sequences is None:
+        table = TranslationTable(allowed_characters, decisions)
+
+    def sanitize_string(token):
+        """Returns the sanitized string token, or None if it is unchanged."""
+        value = scanstring(token, 1)[0] if "\\" in token else token[1:-1]
+        if allowed_characters.issuperset(value):
+            return None
+        if table is not None:
+            sanitized = value.translate(table)
+        else:
+            sanitized = sanitize_text(
+                value,
+                allowed_characters=allowed_characters,
+                interactive=interactive,
+                decisions=decisions,
+                allowed_sequences=allowed_sequences,
+            )
+        return None if sanitized == value else encode_basestring(sanitized)
+
+    def rewrite(token, is_key):
+        if is_key and not sanitize_keys:
+            return token
+        replacement = sanitize_string(token)
+        return token if replacement is None else replacement
+
+    unfinished = []  # A string token cut by the end of a chunk
+    held = None  # A string token that may be a key, pending the next chunk
+    held_space = []  # The whitespace after it
+    for buffer in chunks:
+        output = []
+        position = 0
+        if unfinished:
+            # Its last part is "" or a lone backslash starting an escape
+            buffer = unfinished.pop() + buffer
+            end = STRING_BODY_PATTERN.match(buffer).end()
+            if not buffer.startswith('"', end):
+                unfinished += [buffer[:end], buffer[end:]]
+                continue
+            unfinished.append(buffer[: end + 1])
+            held = "".join(unfinished)
+            unfinished.clear()
+            position = end + 1
+        if held is not None:
+            space = WHITESPACE_PATTERN.match(buffer, position).end()
+            if space == len(buffer):
+                held_space.append(buffer[position:])
+                continue
+            output.append(rewrite(held, buffer.startswith(":", space)))
+            output.extend(held_space)
+            held = None
+            held_space.clear()
+
+        # Copy the buffer, splicing in the strings that change
+        copied = scanned = position
+        for match in STRING_PATTERN.finditer(buffer, position):
+            scanned = match.end()
+            token = match.group()
+            if "\\" not in token and allowed_characters.issuperset(token):
+                continue
+            start, end = match.span()
+            space = WHITESPACE_PATTERN.match(buffer, end).end()
+            if space == len(buffer):
+                # Whether it is a key depends on the next chunk
+                output.append(buffer[copied:start])
+                held = token
+                held_space.append(buffer[end:])
+                copied = space
+                break
+            replacement = rewrite(token, buffer.startswith(":", space))
+            if replacement is not token:
+                output.append(buffer[copied:start])
+                output.append(replacement)
+                copied = end
+        else:
+            quote = buffer.find('"', scanned)
+            if quote != -1:
+                # A string that continues in the next chunk
+                end = STRING_BODY_PATTERN.match(buffer, quote + 1).end()
+                unfinished += [buffer[quote:end], buffer[end:]]
+                output.append(buffer[copied:quote])
+                copied = len(buffer)
+        output.append(buffer[copied:])
+        yield "".join(output)
+
+    if unfinished:
+        raise ValueError(f"Unterminated JSON string: {''.join(unfinished)[:40]!r}")
+    if held is not None:
+        yield rewrite(held, False) + "".join(held_space)
+
+
+def sanitize_json(
+    text,
+    allowed_characters=get_allowed_characters(),
+    sanitize_keys=False,
+    interactive=False,
+    decisions=None,
+    allowed_sequences=None,
+):
+    """Sanitize the string values of a JSON document, see `sanitize_json_stream`."""
+    return "".join(
+        sanitize_json_stream(
+            [text],
+            allowed_characters=allowed_characters,
+            sanitize_keys=sanitize_keys,
+            interactive=interactive,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+    )
+
+
+def read_chunks(file, size=CHUNK_SIZE):
+    """Yields `file` in chunks of `size` characters, for `sanitize_json_stream`."""
+    while chunk := file.read(size):
+        yield chunk
@@ -0,0 +1,156 @@
+"""
+Markdown-aware sanitization.
+
+LLM output is mostly Markdown: prose should be normalized, but code must stay
+exactly as written. `sanitize_markdown_stream` splits its input into prose and
+code in a single pass over the lines and sends each region to its own policy:
+fenced code blocks (``` or ~~~) and inline code spans (`code`, ``co`de``) are
+kept verbatim, or sanitized with `code_allowed_characters` if given.
+
+Code spans follow CommonMark: a run of N backticks is closed by the next run of
+exactly N backticks in the same paragraph, and a backslash escapes a backtick
+outside code. Prose is buffered one paragraph at a time, so memory use is
+bounded by the longest paragraph or code line, not by the document.
+"""
+
+import re
+from bisect import bisect_right
+
+from sanitext.text_sanitization import get_allowed_characters, sanitize_text
+
+FENCE_PATTERN = re.compile(r" {0,3}(`{3,}|~{3,})")
+BACKTICKS_PATTERN = re.compile(r"`+")
+
+
+def closes_fence(line, fence):
+    """Returns True if `line` closes the code block opened by `fence`."""
+    stripped = line.lstrip(" ")
+    if len(line) - len(stripped) > 3:
+        return False
+    run = len(stripped) - len(stripped.lstrip(fence[0]))
+    return run >= len(fence) and not stripped[run:].strip()
+
+
+def inline_regions(text):
+    """
+    Split a paragraph into prose and inline code spans.
+    Yields (is_code, text) regions; concatenated they give back `text`.
+    """
+    if "`" not in text:
+        if text:
+            yield False, text
+        return
+    runs = [match.span() for match in BACKTICKS_PATTERN.finditer(text)]
+    starts_by_length = {}
+    for start, end in runs:
+        starts_by_length.setdefault(end - start, []).append(start)
+
+    position = 0  # End of the last region yielded
+    for start, end in runs:
+        if start < position:
+            continue  # Closing run of a code span already yielded
+        # An odd number of backslashes escapes the first backtick of the run
+        backslash = start
+        while backslash > position and text[backslash - 1] == "\\":
+            backslash -= 1
+        if (start - backslash) % 2:
+            start += 1
+        length = end - start
+        if not length:
+            continue
+        closers = starts_by_length.get(length, ())
+        index = bisect_right(closers, start)
+        if index == len(closers):
+            continue  # No closing run: the backticks are literal
+        close = closers[index] + length
+        if start > position:
+            yield False, text[position:start]
+        yield True, text[start:close]
+        position = close
+    if position < len(text):
+        yield False, text[position:]
+
+
+def iter_markdown_regions(lines):
+    """
+    Split Markdown into prose and code in one pass over `lines` (with their
+    line endings, e.g. a file object). Yields (is_code, text) regions in order;
+    concatenated they give back the input. Fence lines count as code.
+    """
+    paragraph = []
+    fence = None  # Opening fence of the code block we are in
+    for line in lines:
+        if fence is not None:
+            yield True, line
+            if closes_fence(line, fence):
+                fence = None
+            continue
+        match = FENCE_PATTERN.match(line)
+        # The info string of a backtick fence can't contain backticks
+        if match and not (match.group(1)[0] == "`" and "`" in line[match.end() :]):
+            yield from inline_regions("".join(paragraph))
+            paragraph.clear()
+            fence = match.group(1)
+            yield True, line
+            continue
+        paragraph.append(line)
+        if not line.strip():
+            # A blank line ends the paragraph, and any open code span with it
+            yield from inline_regions("".join(paragraph))
+            paragraph.clear()
+    yield from inline_regions("".join(paragraph))
+
+
+def sanitize_markdown_stream(
+    lines,
+    allowed_characters=get_allowed_characters(),
+    code_allowed_characters=None,
+    interactive=False,
+    decisions=None,
+    allowed_sequences=None,
+):
+    """
+    Sanitize Markdown read from `lines`, yielding the sanitized text region by
+    region. Prose is sanitized with `allowed_characters`; code blocks and code
+    spans are kept as they are, or sanitized with `code_allowed_characters` if
+    given. The other arguments work as in `sanitize_text`; in interactive mode
+    each character is asked about once for the whole document.
+    """
+    if interactive and decisions is None:
+        decisions = {}
+    for is_code, region in iter_markdown_regions(lines):
+        if is_code:
+            if code_allowed_characters is None:
+                yield region
+                continue
+            policy = code_allowed_characters
+        else:
+            policy = allowed_characters
+        yield sanitize_text(
+            region,
+            allowed_characters=policy,
+            interactive=interactive,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+
+
+def sanitize_markdown(
+    text,
+    allowed_characters=get_allowed_characters(),
+    code_allowed_characters=None,
+    interactive=False,
+    decisions=None,
+    allowed_sequences=None,
+):
+    """Sanitize the prose of a Markdown document, see `sanitize_markdown_stream`."""
+    return "".join(
+        sanitize_markdown_stream(
+            text.splitlines(keepends=True),
+            allowed_characters=allowed_characters,
+            code_allowed_characters=code_allowed_characters,
+            interactive=interactive,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+    )
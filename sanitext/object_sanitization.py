@@ -0,0 +1,117 @@
+"""
+Sanitization of nested Python objects, such as parsed LLM tool results.
+
+`sanitize_obj` walks dicts, lists and tuples with an explicit stack, so deeply
+nested data never hits the recursion limit. Each distinct string is sanitized
+once: results are memoized by value (a dict lookup, which compares identity
+first), so repeated enum values and keys cost a single lookup. Containers are
+only rebuilt where something changed; clean subtrees, and containers shared
+between several places, are reused as they are rather than copied.
+"""
+
+from sanitext.policy import Policy
+
+CONTAINERS = (dict, list, tuple)
+
+_UNSEEN = object()
+
+
+def _children(container):
+    if type(container) is dict:
+        return iter(container.items())
+    return enumerate(container)
+
+
+def _rebuild(container, changes):
+    """Copy `container` with the (key, new key, new value) `changes` applied."""
+    if type(container) is not dict:
+        values = list(container)
+        for index, _, value in changes:
+            values[index] = value
+        return values if type(container) is list else tuple(values)
+    if all(key is new_key for key, new_key, _ in changes):
+        result = container.copy()
+        for key, _, value in changes:
+            result[key] = value
+        return result
+    # Renamed keys keep their position
+    changed = {key: (new_key, value) for key, new_key, value in changes}
+    result = {}
+    for key, value in container.items():
+        key, value = changed.get(key, (key, value))
+        result[key] = value
+    return result
+
+
+def sanitize_obj(obj, policy=None, sanitize_keys=False):
+    """
+    Sanitize every string in `obj`, looking inside dicts, lists and tuples
+    (exact types; other objects are returned as they are). Dict keys are only
+    sanitized if `sanitize_keys` is set; keys that become equal are merged, the
+    last one wins. `policy` is a `Policy` (default: ASCII printable).
+
+    Returns `obj` itself if nothing changed; otherwise new containers along the
+    paths that changed, sharing everything else with `obj`.
+    Raises ValueError if `obj` contains a reference cycle.
+    """
+    if policy is None:
+        policy = Policy()
+    # Distinct string -> sanitized string, or None if it is clean. Clean strings
+    # are kept as the objects they are, equal or not to the first one seen
+    strings = {}
+    # id() of a walked container -> its result, or _UNSEEN while it is walked
+    containers = {}
+
+    def sanitize_string(text):
+        result = strings.get(text, _UNSEEN)
+        if result is _UNSEEN:
+            result = policy.sanitize(text)
+            result = strings[text] = None if result == text else result
+        return text if result is None else result
+
+    if type(obj) is str:
+        return sanitize_string(obj)
+    if type(obj) not in CONTAINERS:
+        return obj
+
+    # Frames are [container, children, changes, pending child]
+    stack = [[obj, _children(obj), [], None]]
+    containers[id(obj)] = _UNSEEN
+    while True:
+        frame = stack[-1]
+        container, children, changes = frame[:3]
+        for key, value in children:
+            new_key = key
+            if sanitize_keys and type(key) is str:
+                new_key = sanitize_string(key)
+            if type(value) is str:
+                new_value = strings.get(value, _UNSEEN)
+                if new_value is None:
+                    new_value = value
+                elif new_value is _UNSEEN:
+                    new_value = sanitize_string(value)
+            elif type(value) in CONTAINERS:
+                new_value = containers.get(id(value))
+                if new_value is _UNSEEN:
+                    raise ValueError("Circular reference detected")
+                if new_value is None:
+                    # Walk the child first, then resume this container
+                    frame[3] = key, new_key, value
+                    stack.append([value, _children(value), [], None])
+                    containers[id(value)] = _UNSEEN
+                    break
+            else:
+                new_value = value
+            if new_key is not key or new_value is not value:
+                changes.append((key, new_key, new_value))
+        else:
+            # All children done
+            stack.pop()
+            result = _rebuild(container, changes) if changes else container
+            containers[id(container)] = result
+            if not stack:
+                return result
+            parent = stack[-1]
+            key, new_key, value = parent[3]
+            if new_key is not key or result is not value:
+                parent[2].append((key, new_key, result))
@@ -0,0 +1,178 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def _push(src_starts, dst_starts, src, dst):
+    """
+    Appends a segment boundary, merging the segment it closes into the previous
+    one when both advance in lockstep.
+    """
+    if src_starts[-1] == src:
+        return
+    if (
+        len(src_starts) > 1
+        and src_starts[-1] - src_starts[-2] == dst_starts[-1] - dst_starts[-2]
+        and src - src_starts[-1] == dst - dst_starts[-1]
+    ):
+        src_starts[-1] = src
+        dst_starts[-1] = dst
+        return
+    src_starts.append(src)
+    dst_starts.append(dst)
+
+
+class OffsetMap:
+    """
+    Maps offsets between an original text and its sanitized version.
+
+    The map is stored as run-length segments in two parallel arrays: `src_starts`
+    holds where each segment starts in the original text and `dst_starts` where
+    it starts in the sanitized text. A segment is either a run where both texts
+    advance in lockstep (unchanged characters and 1-to-1 replacements such as
+    'і' -> 'i') or a single original character that was removed or expanded
+    (e.g. 'Ⅵ' -> 'VI'). Mostly clean text therefore needs only a handful of
+    segments, and both directions are translated with a binary search.
+    """
+
+    def __init__(self, src_starts, dst_starts, original_length, sanitized_length):
+        self.src_starts = src_starts
+        self.dst_starts = dst_starts
+        self.original_length = original_length
+        self.sanitized_length = sanitized_length
+
+    @classmethod
+    def identity(cls, length):
+        """Returns the map of a text that was left unchanged."""
+        return cls(array("q", [0]), array("q", [0]), length, length)
+
+    @classmethod
+    def from_replacements(cls, text, replacements, ranges=None):
+        """
+        Builds the map for `text` sanitized with `replacements` (char -> string).
+        If `ranges` is given, only those (start, end) ranges were sanitized and
+        the rest of the text was kept as is.
+
+        Only characters whose replacement does not have length 1 start new
+        segments, and they are located with a single regex scan.
+        """
+        resizing = [ch for ch, rep in replacements.items() if len(rep) != 1]
+        src_starts = array("q", [0])
+        dst_starts = array("q", [0])
+        shift = 0  # sanitized offset minus original offset at the current position
+        if resizing:
+            pattern = re.compile("[" + "".join(re.escape(ch) for ch in resizing) + "]")
+            matches = (
+                pattern.finditer(text)
+                if ranges is None
+                else (
+                    match
+                    for start, end in ranges
+                    for match in pattern.finditer(text, start, end)
+                )
+            )
+            for match in matches:
+                position = match.start()
+                if src_starts[-1] != position:
+                    src_starts.append(position)
+                    dst_starts.append(position + shift)
+                shift += len(replacements[match.group()]) - 1
+                src_starts.append(position + 1)
+                dst_starts.append(position + 1 + shift)
+        return cls(src_starts, dst_starts, len(text), len(text) + shift)
+
+    def splice(self, start, end, replacement):
+        """
+        Returns the map after original[start:end] is replaced by a text whose own
+        map is `replacement` (as returned by sanitize_text(..., return_offsets=True)).
+
+        Segments before the edit are copied, the replacement's segments are
+        rebased onto the edit position and later segments are shifted, so the
+        cost depends on the number of segments, not on the length of the text.
+        """
+        dst_start = self.to_sanitized(start)
+        dst_end = self.to_sanitized(end)
+        src_shift = replacement.original_length - (end - start)
+        dst_shift = replacement.sanitized_length - (dst_end - dst_start)
+
+        head = bisect_left(self.src_starts, start)
+        src_starts = self.src_starts[:head] or array("q", [0])
+        dst_starts = self.dst_starts[:head] or array("q", [0])
+        for src, dst in zip(replacement.src_starts, replacement.dst_starts):
+            _push(src_starts, dst_starts, start + src, dst_start + dst)
+        _push(src_starts, dst_starts, end + src_shift, dst_end + dst_shift)
+        for index in range(bisect_right(self.src_starts, end), len(self.src_starts)):
+            _push(
+                src_starts,
+                dst_starts,
+                self.src_starts[index] + src_shift,
+                self.dst_starts[index] + dst_shift,
+            )
+
+        original_length = self.original_length + src_shift
+        sanitized_length = self.sanitized_length + dst_shift
+        # Drop the last boundary if it only separates two lockstep segments
+        if (
+            len(src_starts) > 1
+            and src_starts[-1] - src_starts[-2] == dst_starts[-1] - dst_starts[-2]
+            and original_length - src_starts[-1] == sanitized_length - dst_starts[-1]
+        ):
+            src_starts.pop()
+            dst_starts.pop()
+        return OffsetMap(src_starts, dst_starts, original_length, sanitized_length)
+
+    def __len__(self):
+        """Number of segments in the map."""
+        return len(self.src_starts)
+
+    def _translate(self, offset, starts, length, other_starts, other_length):
+        if not 0 <= offset <= length:
+            raise ValueError(f"Offset {offset} is outside the text (length {length}).")
+        index = bisect_right(starts, offset) - 1
+        if index + 1 < len(starts):
+            size = starts[index + 1] - starts[index]
+            other_size = other_starts[index + 1] - other_starts[index]
+        else:
+            size = length - starts[index]
+            other_size = other_length - other_starts[index]
+        if size == other_size:
+            return other_starts[index] + (offset - starts[index])
+        # Removed or expanded character: every offset maps to its start
+        return other_starts[index]
+
+    def to_sanitized(self, offset):
+        """Translates an offset in the original text to the sanitized text."""
+        return self._translate(
+            offset,
+            self.src_starts,
+            self.original_length,
+            self.dst_starts,
+            self.sanitized_length,
+        )
+
+    def to_original(self, offset):
+        """
+        Translates an offset in the sanitized text to the original text.
+        Offsets inside the expansion of a character map to that character.
+        """
+        return self._translate(
+            offset,
+            self.dst_starts,
+            self.sanitized_length,
+            self.src_starts,
+            self.original_length,
+        )
+
+    def span_to_original(self, start, end):
+        """
+        Translates a [start, end) span of the sanitized text to the original
+        text, widening it to cover any character it only partly includes.
+        """
+        original_start = self.to_original(start)
+        if end <= start:
+            return original_start, original_start
+        return original_start, self.to_original(end - 1) + 1
+
+    def span_to_sanitized(self, start, end):
+        """Translates a [start, end) span of the original text to the sanitized text."""
+        return self.to_sanitized(start), self.to_sanitized(end)
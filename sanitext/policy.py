@@ -0,0 +1,111 @@
+"""
+Compiled sanitization policies.
+
+`sanitize_text` works out what to do with each disallowed character every time
+it is called, which dominates the cost when it runs on many short texts (the
+fields of a dataset, the strings of a JSON document). A `Policy` bundles the
+allowed characters, saved decisions and allowed sequences once, and keeps the
+replacement of every character it has seen in a translation table, so each
+further text costs a single `str.translate` call, or nothing if it is clean.
+
+Policies can be pickled, e.g. to send them once to each worker of a pool, or
+saved to a file compiled (see sanitext.compiled_policy) and loaded by mapping
+it, without resolving anything again.
+"""
+
+from sanitext.cache import policy_key
+from sanitext.char_ranges import CODE_POINTS, CharacterRanges
+from sanitext.compiled_policy import load_policy, save_policy
+from sanitext.text_sanitization import (
+    TranslationTable,
+    get_allowed_characters,
+    sanitize_text,
+)
+
+
+class Policy:
+    """
+    A non-interactive sanitization policy:
+      - `allowed_characters`: set or CharacterRanges of allowed characters
+        (default ASCII printable)
+      - `decisions`: optional mapping of character -> replacement applied first
+        (see sanitext.decisions)
+      - `allowed_sequences`: optional matcher of multi-code-point sequences kept
+        as they are (see get_allowed_sequences)
+      - `cache`: optional ResultCache (see sanitext.cache) of whole-text results,
+        which can be shared between policies
+    """
+
+    def __init__(
+        self,
+        allowed_characters=None,
+        decisions=None,
+        allowed_sequences=None,
+        cache=None,
+    ):
+        if allowed_characters is None:
+            allowed_characters = get_allowed_characters()
+        if not isinstance(allowed_characters, CharacterRanges):
+            allowed_characters = frozenset(allowed_characters)
+        self.allowed_characters = allowed_characters
+        self.decisions = dict(decisions) if decisions else {}
+        self.allowed_sequences = allowed_sequences
+        self.table = TranslationTable(self.allowed_characters, self.decisions)
+        self.cache = cache
+        self.key = policy_key(
+            self.allowed_characters, self.decisions, self.allowed_sequences
+        )
+        # With most of Unicode allowed (a deny list), replacing the few
+        # disallowed characters found is cheaper than translating every one
+        self.blocked = None
+        if (
+            isinstance(allowed_characters, CharacterRanges)
+            and len(allowed_characters) > CODE_POINTS // 2
+        ):
+            self.blocked = allowed_characters.outside_pattern()
+
+    def save(self, path):
+        """
+        Save this policy compiled to `path`, to be loaded with `Policy.load`.
+        """
+        save_policy(self, path)
+
+    @staticmethod
+    def load(path, cache=None):
+        """
+        Load a policy saved with `save` by mapping the file read-only. Returns a
+        CompiledPolicy, which sanitizes the same way and has the same interface.
+        """
+        return load_policy(path, cache)
+
+    def is_clean(self, text):
+        """Returns True if every character of `text` is allowed."""
+        return self.allowed_characters.issuperset(text)
+
+    def sanitize(self, text):
+        """Sanitize `text`, like `sanitize_text` with this policy's settings."""
+        if self.cache is not None:
+            key = self.key, text
+            sanitized = self.cache.get(key)
+            if sanitized is None:
+                sanitized = self._sanitize(text)
+                self.cache.put(key, sanitized)
+            return sanitized
+        return self._sanitize(text)
+
+    def _sanitize(self, text):
+        if self.allowed_characters.issuperset(text):
+            return text
+        if self.allowed_sequences is not None:
+            return sanitize_text(
+                text,
+                allowed_characters=self.allowed_characters,
+                decisions=self.decisions,
+                allowed_sequences=self.allowed_sequences,
+            )
+        if self.blocked is not None:
+            return self.blocked.sub(self._replace, text)
+        return text.translate(self.table)
+
+    def _replace(self, match):
+        return self.table[ord(match.group())]
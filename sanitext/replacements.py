@@ -0,0 +1,104 @@
+"""
+Site-specific replacement maps ('€' -> "EUR", '→' -> "->", '…' -> "...").
+
+A replacement file is TOML or JSON with a `replacements` table mapping
+characters, written as themselves or as "U+XXXX", to their replacement:
+
+    [replacements]
+    "€" = "EUR"
+    "U+2192" = "->"
+
+They are an overlay like saved decisions (see sanitext.decisions), so for a
+disallowed character the first of these that applies wins:
+
+  1. saved or interactive decisions
+  2. replacement files, later files over earlier ones
+  3. the built-in homoglyph map, then NFKC and decomposition (`closest_ascii`)
+
+Allowed characters are always kept. `with_replacements` stacks a replacement
+map under the decisions; new interactive decisions are only added to the
+decisions. A `TranslationTable` (and so a `Policy`) fills in every entry of the
+overlay when it is created, so the characters they cover are translated by
+`str.translate` without calling back into Python.
+"""
+
+import json
+from collections import ChainMap
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+def parse_character(key):
+    """Returns the character a replacement file key stands for, or None."""
+    if len(key) == 1:
+        return key
+    if key[:2].upper() == "U+":
+        try:
+            code = int(key[2:], 16)
+        except ValueError:
+            return None
+        if 0 <= code < 0x110000:
+            return chr(code)
+    return None
+
+
+def read_replacements(path):
+    """
+    Read a replacement file (.toml or .json) and return its character ->
+    replacement dict. Raises ValueError if the file is invalid.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+    elif path.suffix.lower() == ".toml":
+        if tomllib is None:
+            raise ValueError(
+                f"Reading {path} needs Python 3.11+ or the tomli package "
+                "(or use a JSON replacement file)."
+            )
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    else:
+        raise ValueError(f"Replacement file {path} must be .toml or .json.")
+    table = data.get("replacements") if isinstance(data, dict) else None
+    if not isinstance(table, dict):
+        raise ValueError(f"Replacement file {path} has no [replacements] table.")
+    replacements = {}
+    for key, replacement in table.items():
+        char = parse_character(key)
+        if char is None:
+            raise ValueError(
+                f"Invalid key {key!r} in {path} (expected one character or U+XXXX)."
+            )
+        if not isinstance(replacement, str):
+            raise ValueError(
+                f"Replacement of {key!r} in {path} must be a string, "
+                f"not {replacement!r}."
+            )
+        replacements[char] = replacement
+    return replacements
+
+
+def load_replacements(paths):
+    """Read and merge replacement files, later files taking precedence."""
+    replacements = {}
+    for path in paths:
+        replacements.update(read_replacements(path))
+    return replacements
+
+
+def with_replacements(decisions, replacements):
+    """
+    Returns `decisions` (a dict or None) with `replacements` under it, to pass
+    as `decisions` to the sanitization functions. Decisions take precedence,
+    and new decisions are added to `decisions` only.
+    """
+    if not replacements:
+        return decisions
+    return ChainMap(decisions if decisions is not None else {}, replacements)
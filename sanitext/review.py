@@ -0,0 +1,161 @@
+"""
+Batch review of disallowed characters.
+
+Instead of prompting for one character at a time, the text is scanned once and
+every distinct disallowed character is listed with its occurrence count and a
+context snippet, most frequent first. The user then takes bulk decisions, e.g.
+"1-5 y" (keep), "cyrillic a" (replace all Cyrillic characters with their ASCII
+homoglyphs) or "all n" (remove). The resulting decisions are applied with
+`sanitize_text(..., decisions=...)` in a single translation pass.
+"""
+
+import re
+
+from sanitext.text_sanitization import (
+    default_replacement,
+    get_allowed_characters,
+    sanitize_text,
+    summarize_suspicious,
+)
+
+REVIEW_HELP = """Commands: <selection> <action> [replacement], or an empty line to apply.
+  selection: item numbers ("3", "1,4", "2-7"), "all", the character itself,
+             or the start of a Unicode name ("cyrillic", "greek", "mathematical")
+  action:    y = keep, n = remove, a = closest ASCII (homoglyph), r = replace
+             with the text after it (e.g. "4 r --")
+Characters left undecided get their closest ASCII replacement."""
+
+ACTIONS = {"y": "keep", "n": "remove", "a": "closest ASCII", "r": "replace"}
+
+
+def snippet(text, offset, width=20):
+    """Returns the text around `offset`, with the character itself in brackets."""
+    before = text[max(0, offset - width) : offset]
+    after = text[offset + 1 : offset + 1 + width]
+    context = f"{before}[{text[offset]}]{after}"
+    # Keep each entry on one line
+    return re.sub(r"[\r\n\t]", " ", context)
+
+
+def format_entry(number, entry, text, replacement):
+    char, count, first_offset, name = entry
+    return (
+        f"{number:4}. '{char}' U+{ord(char):04X} {name} x{count}"
+        f" -> {replacement!r} | {snippet(text, first_offset)}"
+    )
+
+
+def parse_selection(selection, entries):
+    """Returns the entries picked by a selection, or None if it is not valid."""
+    by_char = [entry for entry in entries if entry[0] == selection]
+    if by_char:
+        return by_char
+    selection = selection.lower()
+    if selection == "all":
+        return list(entries)
+    if re.fullmatch(r"\d+(-\d+)?(,\d+(-\d+)?)*", selection):
+        picked = []
+        for part in selection.split(","):
+            first, _, last = part.partition("-")
+            first = int(first)
+            last = int(last) if last else first
+            if not 1 <= first <= last <= len(entries):
+                return None
+            picked.extend(entries[first - 1 : last])
+        return picked
+    # Otherwise select by the start of the Unicode name (e.g. "cyrillic")
+    picked = [entry for entry in entries if entry[3].lower().startswith(selection)]
+    return picked or None
+
+
+def review_characters(
+    text,
+    allowed_characters=get_allowed_characters(),
+    decisions=None,
+    allowed_sequences=None,
+):
+    """
+    Show all distinct disallowed characters of `text`, ranked by frequency, and
+    ask for bulk decisions.
+
+    Characters already present in `decisions` are not shown. Returns
+    (decisions, defaults): the decisions (char -> replacement) with the ones
+    the user took added to those passed in, and the default replacements of
+    the characters left undecided. Only the decisions are meant to be saved,
+    so undecided characters follow later improvements of the defaults.
+    """
+    decisions = {} if decisions is None else decisions
+    entries = [
+        entry
+        for entry in summarize_suspicious(text, allowed_characters, allowed_sequences)
+        if entry[0] not in decisions
+    ]
+    if not entries:
+        return decisions, {}
+    # Most frequent first, ties in order of appearance
+    entries.sort(key=lambda entry: (-entry[1], entry[2]))
+    defaults = {
+        entry[0]: default_replacement(entry[0], allowed_characters) for entry in entries
+    }
+    reviewed = {}
+
+    def show():
+        total = sum(entry[1] for entry in entries)
+        print(f"{len(entries)} distinct disallowed characters ({total} occurrences):")
+        for number, entry in enumerate(entries, start=1):
+            char = entry[0]
+            print(format_entry(number, entry, text, reviewed.get(char, defaults[char])))
+
+    show()
+    print(REVIEW_HELP)
+    while True:
+        command = input("Decision (empty line to apply): ").strip()
+        if not command:
+            break
+        if command.lower() in ("list", "l"):
+            show()
+            continue
+        selection, _, rest = command.partition(" ")
+        action, _, replacement = rest.lstrip().partition(" ")
+        action = action.lower()
+        picked = parse_selection(selection, entries)
+        if picked is None or action not in ACTIONS:
+            print(f"Invalid command {command!r}.")
+            print(REVIEW_HELP)
+            continue
+        for char, _, _, _ in picked:
+            if action == "y":
+                reviewed[char] = char
+            elif action == "n":
+                reviewed[char] = ""
+            elif action == "a":
+                reviewed[char] = defaults[char]
+            else:
+                reviewed[char] = replacement
+        print(f"{len(picked)} character(s) set to {ACTIONS[action]}.")
+
+    decisions.update(reviewed)
+    return decisions, {
+        char: replacement
+        for char, replacement in defaults.items()
+        if char not in reviewed
+    }
+
+
+def review_text(
+    text,
+    allowed_characters=get_allowed_characters(),
+    decisions=None,
+    allowed_sequences=None,
+):
+    """Review `text` with `review_characters` and return it sanitized accordingly."""
+    decisions, _ = review_characters(
+        text, allowed_characters, decisions, allowed_sequences
+    )
+    # Undecided characters get their defaults from sanitize_text
+    return sanitize_text(
+        text,
+        allowed_characters=allowed_characters,
+        decisions=decisions,
+        allowed_sequences=allowed_sequences,
+    )
@@ -0,0 +1,186 @@
+"""
+Parallel detection on files too large to hold as one string.
+
+`scan_large_file` memory-maps the file and splits it into chunks of about
+CHUNK_SIZE bytes. A chunk starts after a line break when there is one nearby,
+so words, hidden-text runs and allowed sequences are never cut, and otherwise
+at the start of a UTF-8 character, so no character is. Each chunk is decoded
+and scanned by a worker process that maps the file itself; only the findings
+are sent back, and they are merged in file order with offsets relative to the
+whole file (in characters, as for `sanitext --detect`).
+
+Suspicious characters are counted without a Python loop over the text: runs
+of allowed characters are deleted with one compiled regex, and what remains is
+counted with `collections.Counter`.
+"""
+
+import mmap
+import re
+from collections import Counter
+from functools import partial
+from multiprocessing import Pool
+
+from sanitext.char_ranges import character_class, to_intervals
+from sanitext.hidden_text import find_hidden_text
+from sanitext.scripts import detect_mixed_script
+from sanitext.text_sanitization import (
+    get_allowed_characters,
+    sanitized_ranges,
+    unicode_name,
+)
+
+CHUNK_SIZE = 16 * 1024 * 1024
+# How far past a chunk's nominal end to look for a line break
+LINE_SEARCH = 64 * 1024
+
+
+def allowed_run_pattern(allowed_characters):
+    """
+    Returns a regex matching runs of characters in `allowed_characters` (a set
+    or a CharacterRanges), with one class item per interval of code points.
+    """
+    escaped = character_class(to_intervals(allowed_characters))
+    return re.compile(f"[{escaped}]+" if escaped else "(?!)")
+
+
+def align_to_character(data, position):
+    """
+    Returns the offset of the first UTF-8 character that starts at or after
+    `position` in `data`, skipping continuation bytes (10xxxxxx), or len(data).
+    """
+    size = len(data)
+    while position < size and data[position] & 0xC0 == 0x80:
+        position += 1
+    return min(position, size)
+
+
+def chunk_boundaries(data, chunk_size=CHUNK_SIZE):
+    """
+    Split the UTF-8 encoded `data` (bytes or mmap) into chunks of about
+    `chunk_size` bytes. Returns the byte offsets [0, ..., len(data)] of their
+    boundaries, each just after a line break if there is one within
+    LINE_SEARCH bytes, otherwise at the start of a character.
+    """
+    size = len(data)
+    boundaries = [0]
+    position = chunk_size
+    while position < size:
+        newline = data.find(b"\n", position, position + LINE_SEARCH)
+        if newline != -1:
+            position = newline + 1
+        elif position + LINE_SEARCH >= size:
+            break  # The last line runs to the end of the file
+        else:
+            position = align_to_character(data, position)
+        if position >= size:
+            break
+        boundaries.append(position)
+        position += chunk_size
+    boundaries.append(size)
+    return boundaries
+
+
+def count_suspicious(text, pattern, allowed_sequences=None):
+    """
+    Count the characters of `text` that `pattern` (from `allowed_run_pattern`)
+    doesn't match. Returns a dict mapping each of them to [count, first offset],
+    in order of first occurrence.
+    """
+    suspicious = {}
+    for start, end in sanitized_ranges(text, allowed_sequences):
+        counts = Counter(pattern.sub("", text[start:end]))
+        for char, count in counts.items():
+            entry = suspicious.get(char)
+            if entry is None:
+                suspicious[char] = [count, text.find(char, start, end)]
+            else:
+                entry[0] += count
+    return suspicious
+
+
+def scan_text(text, pattern, allowed_sequences=None):
+    """
+    Run detection on `text` with `pattern` from `allowed_run_pattern`. Returns
+    (suspicious, hidden text, mixed-script words), with suspicious as returned by
+    `count_suspicious`.
+    """
+    return (
+        count_suspicious(text, pattern, allowed_sequences),
+        find_hidden_text(text),
+        detect_mixed_script(text),
+    )
+
+
+_worker_job = None
+
+
+def _init_worker(path, pattern, allowed_sequences):
+    global _worker_job
+    _worker_job = path, pattern, allowed_sequences
+
+
+def _scan_chunk(job, span):
+    path, pattern, allowed_sequences = job
+    start, end = span
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            text = data[start:end].decode("utf-8", errors="replace")
+    return (len(text),) + scan_text(text, pattern, allowed_sequences)
+
+
+def _scan_chunk_job(span):
+    return _scan_chunk(_worker_job, span)
+
+
+def scan_large_file(
+    path,
+    allowed_characters=get_allowed_characters(),
+    allowed_sequences=None,
+    jobs=None,
+    chunk_size=CHUNK_SIZE,
+):
+    """
+    Detect suspicious characters, hidden text and mixed-script words in a UTF-8
+    file of any size, in chunks processed by `jobs` worker processes (default:
+    one per CPU, 1 scans in this process).
+
+    Returns (summary, hidden text, mixed-script words) in the formats of
+    `summarize_suspicious`, `find_hidden_text` and `detect_mixed_script`, with
+    offsets in characters from the start of the file.
+    """
+    with open(path, "rb") as file:
+        size = file.seek(0, 2)
+        if not size:
+            return [], [], []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            boundaries = chunk_boundaries(data, chunk_size)
+    spans = list(zip(boundaries, boundaries[1:]))
+    job = path, allowed_run_pattern(allowed_characters), allowed_sequences
+
+    if jobs == 1:
+        return _merge(map(partial(_scan_chunk, job), spans))
+    with Pool(jobs, initializer=_init_worker, initargs=job) as pool:
+        return _merge(pool.imap(_scan_chunk_job, spans))
+
+
+def _merge(results):
+    """Merge per-chunk results, shifting their offsets by the chunk's start."""
+    suspicious = {}
+    hidden = []
+    mixed = []
+    base = 0
+    for length, chunk_suspicious, chunk_hidden, chunk_mixed in results:
+        for char, (count, first) in chunk_suspicious.items():
+            entry = suspicious.get(char)
+            if entry is None:
+                suspicious[char] = [count, base + first]
+            else:
+                entry[0] += count
+        hidden += [(base + s, base + e, kind, p) for s, e, kind, p in chunk_hidden]
+        mixed += [(base + s, base + e, word, sc) for s, e, word, sc in chunk_mixed]
+        base += length
+    summary = [
+        (char, count, first, unicode_name(char))
+        for char, (count, first) in suspicious.items()
+    ]
+    return summary, hidden, mixed
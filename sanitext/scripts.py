@@ -0,0 +1,84 @@
+"""
+Mixed-script word detection.
+
+Homoglyph attacks usually hide a look-alike from another script inside an
+otherwise normal word ("pаypal" with a Cyrillic "а"). Each character's script
+(UAX #24) is looked up with bisect in the range table of sanitext.script_data,
+and a word is flagged when it contains letters from more than one script.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+from sanitext.script_data import SCRIPT_RANGES
+
+_STARTS, _SCRIPTS = (tuple(column) for column in zip(*SCRIPT_RANGES))
+
+# Scripts shared by all writing systems (punctuation, digits, combining marks)
+NEUTRAL_SCRIPTS = frozenset({"Common", "Inherited", "Unknown"})
+
+# Script combinations that are a single writing system (UTS #39, section 5.1)
+WRITING_SYSTEMS = (
+    frozenset({"Han", "Hiragana", "Katakana"}),  # Japanese
+    frozenset({"Han", "Bopomofo"}),  # Chinese
+    frozenset({"Han", "Hangul"}),  # Korean
+)
+
+# Letters and digits plus the combining mark blocks, so decomposed accents don't
+# split words
+WORD_PATTERN = re.compile(
+    r"[\w\u0300-\u036F\u0483-\u0489\u1AB0-\u1AFF\u1DC0-\u1DFF\u20D0-\u20FF\uFE20-\uFE2F]+"
+)
+
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]")
+
+
+@lru_cache(maxsize=4096)
+def script_of(char):
+    """Returns the Unicode script of `char`, e.g. "Latin", "Cyrillic" or "Common"."""
+    return _SCRIPTS[bisect_right(_STARTS, ord(char)) - 1]
+
+
+def word_scripts(word):
+    """
+    Returns the scripts of the letters of `word` in order of first appearance,
+    or an empty tuple if they all belong to one writing system.
+    """
+    scripts = dict.fromkeys(script_of(char) for char in word)
+    for neutral in NEUTRAL_SCRIPTS:
+        scripts.pop(neutral, None)
+    if len(scripts) < 2 or any(
+        system.issuperset(scripts) for system in WRITING_SYSTEMS
+    ):
+        return ()
+    return tuple(scripts)
+
+
+def detect_mixed_script(text):
+    """
+    Find words that mix letters from different scripts.
+    Returns a list of (start, end, word, scripts) in order of appearance.
+    """
+    if text.isascii():
+        return []
+    found = []
+    scripts_by_word = {}
+    # Only lines with a non-ASCII character are split into words
+    non_ascii = NON_ASCII_PATTERN.search(text)
+    while non_ascii is not None:
+        start = text.rfind("\n", 0, non_ascii.start()) + 1
+        end = text.find("\n", non_ascii.start())
+        if end == -1:
+            end = len(text)
+        for match in WORD_PATTERN.finditer(text, start, end):
+            word = match.group()
+            if word.isascii():
+                continue
+            scripts = scripts_by_word.get(word)
+            if scripts is None:
+                scripts = scripts_by_word[word] = word_scripts(word)
+            if scripts:
+                found.append((match.start(), match.end(), word, scripts))
+        non_ascii = NON_ASCII_PATTERN.search(text, end)
+    return found
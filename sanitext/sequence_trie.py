@@ -0,0 +1,89 @@
+import re
+
+_END = ""  # Trie key marking the end of a sequence (never a real character)
+
+
+class SequenceTrie:
+    """
+    Matches multi-code-point sequences (e.g. emoji ZWJ sequences, flags, keycaps)
+    in a single left-to-right pass, always preferring the longest sequence.
+
+    Candidate start positions are found by one compiled regex that checks the
+    first two code points against character classes, so scanning costs the same
+    however many sequences are defined; the trie is only walked at candidates.
+    """
+
+    def __init__(self, sequences):
+        self.root = {}
+        # The sequences, e.g. to store them (see sanitext.compiled_policy)
+        self.sequences = tuple(sorted({seq for seq in sequences if len(seq) >= 2}))
+        self.chars = set()  # Every character of a sequence
+        firsts = set()
+        seconds = set()
+        for sequence in self.sequences:
+            self.chars.update(sequence)
+            node = self.root
+            for char in sequence:
+                node = node.setdefault(char, {})
+            node[_END] = True
+            firsts.add(sequence[0])
+            seconds.add(sequence[1])
+        self.candidates = re.compile(
+            f"{_char_class(firsts)}(?={_char_class(seconds)})" if firsts else "(?!)"
+        )
+
+    def match(self, text, start):
+        """Returns the end of the longest sequence starting at `start`, or None."""
+        node = self.root
+        longest = None
+        for position in range(start, len(text)):
+            node = node.get(text[position])
+            if node is None:
+                break
+            if _END in node:
+                longest = position + 1
+        return longest
+
+    def finditer(self, text):
+        """Yields (start, end) of non-overlapping longest sequences in `text`."""
+        search = self.candidates.search
+        candidate = search(text)
+        while candidate:
+            start = candidate.start()
+            end = self.match(text, start)
+            if end is None:
+                candidate = search(text, start + 1)
+            else:
+                yield start, end
+                candidate = search(text, end)
+
+    def span_around(self, text, start, end):
+        """
+        Returns the smallest (start, end) span containing text[start:end] that
+        no sequence can cross: its ends are next to characters of no sequence
+        (or at the ends of `text`), so the sequences found inside it don't
+        depend on the rest of the text, nor those outside on what is inside.
+        """
+        chars = self.chars
+        while start > 0 and text[start - 1] in chars:
+            start -= 1
+        while end < len(text) and text[end] in chars:
+            end += 1
+        return start, end
+
+    def outside(self, text):
+        """
+        Yields (start, end) of the parts of `text` outside any sequence, in order.
+        Yields (0, len(text)) if the text contains no sequence.
+        """
+        position = 0
+        for start, end in self.finditer(text):
+            if start > position:
+                yield position, start
+            position = end
+        if position < len(text) or position == 0:
+            yield position, len(text)
+
+
+def _char_class(chars):
+    return "[" + "".join(re.escape(char) for char in sorted(chars)) + "]"
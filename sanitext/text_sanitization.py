@@ -2,17 +2,45 @@ import unicodedata
 import re
 import string
 import sys
+from functools import lru_cache
 from sanitext.homoglyph_map import get_homoglyph_replacement
 from sanitext.emoji_set import EMOJI_SET
+from sanitext.offset_map import OffsetMap
+from sanitext.sequence_trie import SequenceTrie
+from sanitext.char_ranges import CharacterRanges
 
 
-def get_allowed_characters(allow_emoji=False, allow_chars=None, allow_file=None):
+@lru_cache(maxsize=4096)
+def unicode_name(char):
+    """
+    Returns the Unicode name of a character, or "Unknown" if it has none.
+
+    Reports repeat the same few characters many times, so lookups are cached and
+    every occurrence shares the same name string.
+    """
+    return unicodedata.name(char, "Unknown")
+
+
+def get_allowed_characters(
+    allow_emoji=False,
+    allow_chars=None,
+    allow_file=None,
+    allow_specs=None,
+    deny_specs=None,
+):
     """
     Build and return the set of allowed characters based on:
       - default ASCII printable
       - user-specified flag to allow single code point emojis
       - user-specified chars
       - user-specified file (pathlib.Path object)
+      - user-specified ranges, general categories or scripts (see
+        sanitext.char_ranges), e.g. ["U+0370..U+03FF", "L", "Cyrillic"]
+    With `deny_specs` (same syntax), every character is allowed except the
+    ones they select, and the characters above are allowed even if denied (so
+    denying "Cc" still keeps tabs and newlines).
+    With `allow_specs` or `deny_specs`, the result is a CharacterRanges instead
+    of a set. Raises ValueError on an invalid specification.
     """
     allowed = set(string.printable)
 
@@ -28,29 +56,115 @@ def get_allowed_characters(allow_emoji=False, allow_chars=None, allow_file=None)
         text_from_file = allow_file.read_text(encoding="utf-8", errors="replace")
         allowed.update(text_from_file)
 
+    if deny_specs:
+        denied = CharacterRanges(deny_specs)
+        return denied.complement() | CharacterRanges(allow_specs or (), chars=allowed)
+    if allow_specs:
+        return CharacterRanges(allow_specs, chars=allowed)
     return allowed
 
 
-def sanitize_text(text, allowed_characters=get_allowed_characters(), interactive=False):
+@lru_cache(maxsize=None)
+def get_allowed_sequences(allow_emoji=False):
+    """
+    Build and return the matcher (SequenceTrie) of allowed multi-code-point
+    sequences, or None if there are none:
+      - user-specified flag to allow emoji sequences (ZWJ sequences, skin tone
+        modifiers, flags, keycaps and tag sequences)
+    Allowed sequences are kept intact even if some of their code points (e.g.
+    ZERO WIDTH JOINER) are not allowed on their own.
+    """
+    if not allow_emoji:
+        return None
+    # Large table, only loaded when emoji sequences are requested
+    from sanitext.emoji_sequences import EMOJI_SEQUENCES
+
+    return SequenceTrie(EMOJI_SEQUENCES)
+
+
+def sanitized_ranges(text, allowed_sequences=None):
+    """
+    Returns the (start, end) ranges of `text` that are subject to sanitization,
+    i.e. everything outside the allowed sequences.
+    """
+    if allowed_sequences is None:
+        return [(0, len(text))]
+    return list(allowed_sequences.outside(text))
+
+
+def sanitize_text(
+    text,
+    allowed_characters=get_allowed_characters(),
+    interactive=False,
+    return_offsets=False,
+    decisions=None,
+    allowed_sequences=None,
+    cache=None,
+):
     """
     Remove or replace characters not in the allowed set. Optionally prompt the user interactively.
-    Returns the sanitized text.
+    Returns the sanitized text, or a (sanitized text, OffsetMap) tuple if `return_offsets`
+    is set, so that offsets in either text can be translated to the other.
+
+    `decisions` is an optional mapping of character -> replacement (see
+    sanitext.decisions) applied on top of the allowed set: those characters are
+    never prompted for. In interactive mode, new answers are added to it so the
+    caller can persist them.
+
+    `allowed_sequences` (see get_allowed_sequences) lists multi-code-point
+    sequences, such as emoji, that are kept as they are.
+
+    `cache` is an optional ResultCache (see sanitext.cache): repeated texts are
+    then answered from it. It is not used in interactive mode or with
+    `return_offsets`. The cache remembers the key of the policy by its objects,
+    so change `allowed_characters` and `decisions` in place only by adding to
+    them (or use a new set or dict).
     """
+    if cache is not None and not interactive and not return_offsets:
+        policy = cache.policy_key(allowed_characters, decisions, allowed_sequences)
+        key = policy, text
+        sanitized = cache.get(key)
+        if sanitized is None:
+            sanitized = sanitize_text(
+                text,
+                allowed_characters=allowed_characters,
+                decisions=decisions,
+                allowed_sequences=allowed_sequences,
+            )
+            cache.put(key, sanitized)
+        return sanitized
+
+    ranges = sanitized_ranges(text, allowed_sequences)
+    if allowed_sequences is None:
+        present_chars = set(text)
+    else:
+        present_chars = set().union(*(text[start:end] for start, end in ranges))
+
     # Identify disallowed characters
-    disallowed_chars = sorted(set(ch for ch in text if ch not in allowed_characters))
+    disallowed_chars = sorted(
+        ch for ch in present_chars if ch not in allowed_characters
+    )
     if not disallowed_chars:
         # If nothing disallowed, just return original text
+        if return_offsets:
+            return text, OffsetMap.identity(len(text))
         return text
 
-    # If interactive is enabled, ask the user for each unique disallowed char
+    # Apply previously taken decisions first
     char_decisions = {}
+    if decisions:
+        for ch in disallowed_chars:
+            if ch in decisions:
+                char_decisions[ch] = decisions[ch]
+
+    # If interactive is enabled, ask the user for each unique disallowed char
     if interactive:
         for ch in disallowed_chars:
             # Decision for this character already been taken
             if ch in char_decisions:
                 continue
             # Provide some info about the character
-            char_info = f"'{ch}' (U+{ord(ch):04X}, {unicodedata.name(ch, 'Unknown')})"
+            char_info = f"'{ch}' (U+{ord(ch):04X}, {unicode_name(ch)})"
             while True:
                 decision = (
                     input(
@@ -70,25 +184,140 @@ def sanitize_text(text, allowed_characters=get_allowed_characters(), interactive
                         # Replace => ask user for replacement
                         replacement = input("Enter replacement character(s): ")
                         char_decisions[ch] = replacement
+                    if decisions is not None:
+                        decisions[ch] = char_decisions[ch]
                     break
                 else:
                     print("Invalid input. Please enter 'y', 'n', or 'r'.")
     else:
         for ch in disallowed_chars:
-            closest = closest_ascii(ch, allowed_characters)
-            char_decisions[ch] = (
-                closest if set(closest).issubset(allowed_characters) else ""
-            )
+            if ch in char_decisions:
+                continue
+            char_decisions[ch] = default_replacement(ch, allowed_characters)
 
-    # Build the sanitized text
-    sanitized_chars = []
-    for ch in text:
-        if ch in disallowed_chars:
-            sanitized_chars.append(char_decisions[ch])
-        else:
-            sanitized_chars.append(ch)
+    # Build the sanitized text in a single translation pass
+    table = {ord(ch): rep for ch, rep in char_decisions.items()}
+    if allowed_sequences is None:
+        sanitized = text.translate(table)
+    else:
+        # Copy allowed sequences as they are and translate what is in between
+        parts = []
+        position = 0
+        for start, end in ranges:
+            parts.append(text[position:start])
+            parts.append(text[start:end].translate(table))
+            position = end
+        parts.append(text[position:])
+        sanitized = "".join(parts)
 
-    return "".join(sanitized_chars)
+    if return_offsets:
+        offsets = OffsetMap.from_replacements(
+            text, char_decisions, None if allowed_sequences is None else ranges
+        )
+        return sanitized, offsets
+    return sanitized
+
+
+def sanitize_edit(
+    offsets,
+    start,
+    end,
+    replacement,
+    allowed_characters=get_allowed_characters(),
+    decisions=None,
+    allowed_sequences=None,
+    text=None,
+):
+    """
+    Re-sanitize only the edited part of a previously sanitized text.
+
+    Outside allowed sequences, sanitization decides per character, so after
+    original[start:end] is replaced by `replacement`, only the replacement needs
+    to be sanitized again. Instead of re-sending the whole buffer, pass the
+    OffsetMap of the previous result. With `allowed_sequences`, a sequence may
+    start before the edit or end after it, so the original `text` (before the
+    edit) is needed too: the edit is widened to the characters around it that
+    belong to sequences.
+
+    Args:
+        offsets (OffsetMap): Map from sanitize_text(..., return_offsets=True) or
+            from a previous sanitize_edit call.
+        start (int): Start of the edited range in the original text.
+        end (int): End (exclusive) of the edited range in the original text.
+        replacement (str): The new text of the edited range.
+        allowed_characters (set): Set of allowed characters
+        decisions (dict): Decisions, as for sanitize_text
+        allowed_sequences (SequenceTrie): Allowed sequences, as for sanitize_text
+        text (str): The original text before the edit (with allowed_sequences)
+
+    Returns:
+        tuple: (sanitized_start, sanitized_end, sanitized_replacement, new_offsets).
+        Apply the edit by replacing sanitized[sanitized_start:sanitized_end] with
+        sanitized_replacement; new_offsets describes the edited texts.
+    """
+    if allowed_sequences is not None:
+        if text is None:
+            raise ValueError("sanitize_edit needs the original text with sequences.")
+        left, right = allowed_sequences.span_around(text, start, end)
+        # The characters around the edit are unchanged, so the span is the
+        # same in the edited text
+        replacement = text[left:start] + replacement + text[end:right]
+        start, end = left, right
+    sanitized_start, sanitized_end = offsets.span_to_sanitized(start, end)
+    sanitized_replacement, replacement_offsets = sanitize_text(
+        replacement,
+        allowed_characters=allowed_characters,
+        return_offsets=True,
+        decisions=decisions,
+        allowed_sequences=allowed_sequences,
+    )
+    return (
+        sanitized_start,
+        sanitized_end,
+        sanitized_replacement,
+        offsets.splice(start, end, replacement_offsets),
+    )
+
+
+def default_replacement(char, allowed_characters):
+    """
+    Returns what non-interactive sanitization replaces a disallowed character
+    with: its closest ASCII form if that is allowed, otherwise "".
+    """
+    closest = closest_ascii(char, allowed_characters)
+    return closest if all(c in allowed_characters for c in closest) else ""
+
+
+class TranslationTable(dict):
+    """
+    A `str.translate` table that works out each character's replacement the
+    first time it is seen: allowed characters map to themselves, then
+    `decisions` apply, then `default_replacement`. Reusing one table across
+    many short texts avoids redoing that work for every text.
+
+    The disallowed characters in `decisions` (which may include replacement
+    maps, see sanitext.replacements) are entered up front, so translating them
+    never calls back into Python.
+    """
+
+    def __init__(self, allowed_characters, decisions=None):
+        super().__init__()
+        self.allowed_characters = allowed_characters
+        self.decisions = decisions if decisions is not None else {}
+        for char, replacement in self.decisions.items():
+            if len(char) == 1 and char not in allowed_characters:
+                self[ord(char)] = replacement
+
+    def __missing__(self, code):
+        char = chr(code)
+        if char in self.allowed_characters:
+            replacement = code
+        elif char in self.decisions:
+            replacement = self.decisions[char]
+        else:
+            replacement = default_replacement(char, self.allowed_characters)
+        self[code] = replacement
+        return replacement
 
 
 def closest_ascii(char, allowed_characters):
@@ -126,19 +355,60 @@ def closest_ascii(char, allowed_characters):
     return ""
 
 
-def detect_suspicious_characters(text, allowed_characters=get_allowed_characters()):
+def detect_suspicious_characters(
+    text, allowed_characters=get_allowed_characters(), allowed_sequences=None
+):
     """
     Finds characters in the text that are not ASCII letters, digits, punctuation, or common whitespace.
 
     Args:
         text (str): The input text to check.
         allowed_characters (set): Set of allowed characters
+        allowed_sequences (SequenceTrie): Multi-code-point sequences to skip
 
     Returns:
         list of tuple: A list of tuples, each containing a suspicious character and its Unicode name.
     """
     return [
-        (char, unicodedata.name(char, "Unknown"))
-        for char in text
+        (char, unicode_name(char))
+        for start, end in sanitized_ranges(text, allowed_sequences)
+        for char in text[start:end]
         if char not in allowed_characters
     ]
+
+
+def summarize_suspicious(
+    text, allowed_characters=get_allowed_characters(), allowed_sequences=None
+):
+    """
+    Aggregates the characters in the text that are not in the allowed set.
+
+    Unlike `detect_suspicious_characters`, which reports every occurrence, this
+    returns one entry per distinct character, so memory grows with the number of
+    distinct suspicious characters rather than with the length of the text.
+
+    Args:
+        text (str): The input text to check.
+        allowed_characters (set): Set of allowed characters
+        allowed_sequences (SequenceTrie): Multi-code-point sequences to skip
+
+    Returns:
+        list of tuple: One (char, count, first_offset, name) tuple per distinct
+        suspicious character, ordered by first occurrence.
+    """
+    counts = {}
+    first_offsets = {}
+    for start, end in sanitized_ranges(text, allowed_sequences):
+        for offset, char in enumerate(text[start:end], start):
+            if char in allowed_characters:
+                continue
+            if char in counts:
+                counts[char] += 1
+            else:
+                counts[char] = 1
+                first_offsets[char] = offset
+
+    return [
+        (char, count, first_offsets[char], unicode_name(char))
+        for char, count in counts.items()
+    ]
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+
+import pytest
+
+from sanitext.batch import (
+    pipeline,
+    sanitize_csv,
+    sanitize_csv_row,
+    sanitize_jsonl,
+)
+from sanitext.policy import Policy
+
+LINES = [
+    '{"id": 1, "text": "Café — “x”", "meta": "naïve"}\n',
+    '{"id": 2, "text": "plain", "meta": "naïve"}\r\n',
+    '{"id": 3, "text": "caf\\u00e9"}\n',
+    "\n",
+    '{"id": 4, "meta": "no text"}\n',
+    '["not", "a", "record—"]\n',
+    '{"id": 5, "text": 5}',
+]
+
+
+def test_sanitize_jsonl():
+    result = list(sanitize_jsonl(LINES, ["text"], jobs=1))
+    assert result == [
+        '{"id": 1, "text": "Cafe - \\"x\\"", "meta": "naïve"}\n',
+        # Unchanged records are kept as they are
+        LINES[1],
+        # Re-serialized ASCII-only, like the input
+        '{"id": 3, "text": "cafe"}\n',
+        *LINES[3:],
+    ]
+    result = list(sanitize_jsonl(LINES, ["text", "meta"], jobs=1))
+    assert json.loads(result[1]) == {"id": 2, "text": "plain", "meta": "naive"}
+    assert result[1].endswith("\r\n")
+
+
+def test_sanitize_jsonl_invalid_line():
+    with pytest.raises(ValueError, match="Line 2"):
+        list(sanitize_jsonl(['{"text": "ok"}\n', '{"text": "broken—\n'], ["text"]))
+
+
+def test_sanitize_csv():
+    source = io.StringIO('id,body,other\n1,"Café,\n— x",ü\n2,ok,ü\n3\n')
+    result = list(sanitize_csv(csv.reader(source), ["body"], jobs=1))
+    assert result == [
+        ["id", "body", "other"],
+        ["1", "Cafe,\n- x", "ü"],
+        ["2", "ok", "ü"],
+        ["3"],
+    ]
+    assert list(sanitize_csv([], ["body"])) == []
+    with pytest.raises(ValueError, match="missing"):
+        list(sanitize_csv([["id", "body"]], ["body", "missing"]))
+
+
+def test_sanitize_csv_row_copies_changed_rows_only():
+    policy = Policy()
+    row = ["ü", "ok"]
+    assert sanitize_csv_row(row, policy, (1,)) is row
+    assert sanitize_csv_row(row, policy, (0, 5)) == ["u", "ok"]
+    assert row == ["ü", "ok"]
+
+
+def test_pipeline_with_workers_keeps_order():
+    """Batches processed by worker processes come back in input order."""
+    lines = [json.dumps({"id": i, "text": f"{i} — ü"}) + "\n" for i in range(500)]
+    expected = list(sanitize_jsonl(lines, ["text"], jobs=1))
+    assert list(sanitize_jsonl(lines, ["text"], jobs=2)) == expected
+    assert (
+        list(
+            pipeline(
+                sanitize_csv_row, [["ü"]] * 50, Policy(), (0,), jobs=2, batch_size=3
+            )
+        )
+        == [["u"]] * 50
+    )
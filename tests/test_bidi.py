@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from sanitext.bidi import (
+    MARK,
+    TERMINATED,
+    UNMATCHED,
+    UNTERMINATED,
+    contains_bidi_bytes,
+    is_balanced,
+    scan_bidi,
+    scan_file,
+    scan_paths,
+)
+
+LRE, RLE, PDF, LRO, RLO = "\u202a", "\u202b", "\u202c", "\u202d", "\u202e"
+LRI, RLI, FSI, PDI = "\u2066", "\u2067", "\u2068", "\u2069"
+RLM = "\u200f"
+
+
+def statuses(text):
+    return [(char, status) for _, _, _, char, status in scan_bidi(text)]
+
+
+def test_scan_bidi_trojan_source():
+    """The "stretched string" example from the Trojan Source paper."""
+    text = f'ok\nif access_level != "user{RLO} {LRI}// Check if admin{PDI} {LRI}" {{\n'
+    assert scan_bidi(text) == [
+        (27, 2, 25, RLO, UNTERMINATED),
+        (29, 2, 27, LRI, TERMINATED),
+        (47, 2, 45, PDI, TERMINATED),
+        (49, 2, 47, LRI, UNTERMINATED),
+    ]
+    assert not is_balanced(scan_bidi(text))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("plain text", []),
+        (f"a{RLE}b{PDF}c", [(RLE, TERMINATED), (PDF, TERMINATED)]),
+        (
+            f"{LRO}{RLE}x{PDF}{PDF}",
+            [
+                (LRO, TERMINATED),
+                (RLE, TERMINATED),
+                (PDF, TERMINATED),
+                (PDF, TERMINATED),
+            ],
+        ),
+        # PDI closes the embeddings opened inside its isolate
+        (
+            f"{RLI}{LRE}x{PDI}",
+            [(RLI, TERMINATED), (LRE, TERMINATED), (PDI, TERMINATED)],
+        ),
+        # PDF can't close an embedding outside an open isolate
+        (
+            f"{RLE}{FSI}x{PDF}",
+            [(RLE, UNTERMINATED), (FSI, UNTERMINATED), (PDF, UNMATCHED)],
+        ),
+        (f"x{PDI}{PDF}", [(PDI, UNMATCHED), (PDF, UNMATCHED)]),
+        # The end of a line closes everything
+        (f"{RLO}x\n{PDF}", [(RLO, UNTERMINATED), (PDF, UNMATCHED)]),
+        (f"x{RLM}y", [(RLM, MARK)]),
+    ],
+)
+def test_scan_bidi_nesting(text, expected):
+    assert statuses(text) == expected
+
+
+def test_scan_bidi_lines_and_columns():
+    text = f"one\n\ntwo {RLM}\nthree{RLI}{PDI}"
+    assert [(line, column) for _, line, column, _, _ in scan_bidi(text)] == [
+        (3, 5),
+        (4, 6),
+        (4, 7),
+    ]
+    assert is_balanced(scan_bidi(text))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_scan_paths(tmp_path, jobs):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "bad.py").write_text(f'x = "a{RLO}b"\n', encoding="utf-8")
+    (tmp_path / "src" / "ok.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "src" / "bin.dat").write_bytes(b"\0" + RLO.encode("utf-8"))
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "objects").write_text(RLO, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text(f"{LRI}quoted{PDI}", encoding="utf-8")
+
+    # Files in walk order; clean, binary and VCS files are left out
+    results = list(scan_paths([tmp_path], jobs=jobs))
+    assert [(os.path.basename(path), error) for path, _, error in results] == [
+        ("notes.txt", None),
+        ("bad.py", None),
+    ]
+    findings = {os.path.basename(path): findings for path, findings, _ in results}
+    assert findings["bad.py"] == [(6, 1, 7, RLO, UNTERMINATED)]
+    assert is_balanced(findings["notes.txt"])
+
+
+def test_scan_file_skips_decoding_clean_files(tmp_path):
+    path = tmp_path / "latin1.txt"
+    path.write_bytes("caf\xe9".encode("latin-1"))
+    assert scan_file(path) == []
+
+
+def test_contains_bidi_bytes_across_chunks():
+    for position in range(4090, 4100):
+        data = b"x" * position + RLO.encode("utf-8") + b"y" * 10
+        assert contains_bidi_bytes(data)
+    assert not contains_bidi_bytes("x — “ü”".encode("utf-8") * 2000)
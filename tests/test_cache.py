@@ -0,0 +1,119 @@
+import sys
+import tracemalloc
+
+from sanitext.cache import ENTRY_OVERHEAD, ResultCache, key_size, policy_key
+from sanitext.policy import Policy
+from sanitext.text_sanitization import get_allowed_characters, sanitize_text
+
+
+def test_result_cache_lru_by_bytes():
+    texts = [f"text {i} " * 10 for i in range(3)]
+    entry = ENTRY_OVERHEAD + sys.getsizeof(texts[0])
+    # The policy key is counted once, for all its entries
+    max_bytes = 2 * entry + key_size("policy")
+    cache = ResultCache(max_bytes=max_bytes)
+    for text in texts[:2]:
+        cache.put(("policy", text), text)
+    assert cache.get(("policy", texts[0])) == texts[0]  # Now most recently used
+    cache.put(("policy", texts[2]), texts[2])
+    assert cache.get(("policy", texts[1])) is None
+    assert cache.get(("policy", texts[0])) == texts[0]
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "evictions": 1,
+        "entries": 2,
+        "bytes": max_bytes,
+        "max_bytes": max_bytes,
+    }
+
+
+def test_result_cache_skips_oversized_texts():
+    cache = ResultCache(max_bytes=1000)
+    cache.put(("policy", "x" * 2000), "")
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_result_cache_replaces_and_clears():
+    cache = ResultCache()
+    cache.put(("policy", "ü"), "u")
+    cache.put(("policy", "ü"), "ue")
+    assert cache.get(("policy", "ü")) == "ue"
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.get(("policy", "ü")) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_sanitize_text_with_cache():
+    cache = ResultCache()
+    text = "Thіs іs а “quoted” tеxt — naïve"
+    expected = sanitize_text(text)
+    assert sanitize_text(text, cache=cache) == expected
+    # An equal copy hits too
+    assert sanitize_text("".join(list(text)), cache=cache) == expected
+    assert cache.stats()["hits"] == 1
+    # Another policy doesn't share results
+    allowed_characters = get_allowed_characters(allow_chars="ï")
+    assert sanitize_text(text, allowed_characters, cache=cache) != expected
+    assert sanitize_text(text, decisions={"—": "--"}, cache=cache) != expected
+    assert len(cache) == 3
+
+
+def test_policy_with_cache():
+    cache = ResultCache()
+    policy = Policy(cache=cache)
+    assert policy.sanitize("naïve —") == "naive -"
+    assert policy.sanitize("naïve —") == "naive -"
+    assert policy.sanitize("plain") == "plain"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 2
+    # Policies with the same settings share entries
+    assert Policy(cache=cache).key == policy.key
+    assert policy_key(get_allowed_characters()) == policy.key
+
+
+def test_result_cache_memory_stays_within_max_bytes():
+    allowed_characters = get_allowed_characters(allow_emoji=True)
+    decisions = {"—": "--"}
+    cache = ResultCache(max_bytes=500_000)
+    tracemalloc.start()
+    try:
+        for i in range(5_000):
+            text = f"Entry {i} — naïve “quoted” text"
+            sanitize_text(text, allowed_characters, decisions=decisions, cache=cache)
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert cache.stats()["evictions"] > 0
+    # Every call rebuilt the policy key, which is only kept once (entry sizes
+    # are estimates, hence the margin)
+    assert used <= 1.1 * cache.max_bytes
+
+
+def test_sanitize_text_cache_hit_does_not_rebuild_the_policy_key(monkeypatch):
+    allowed_characters = get_allowed_characters(allow_emoji=True)
+    decisions = {"—": "--"}
+    cache = ResultCache()
+    built = []
+
+    def counting_policy_key(*policy):
+        built.append(policy)
+        return policy_key(*policy)
+
+    def sanitize(text):
+        return sanitize_text(text, allowed_characters, decisions=decisions, cache=cache)
+
+    monkeypatch.setattr("sanitext.cache.policy_key", counting_policy_key)
+    for _ in range(3):
+        assert sanitize("naïve —") == "naive --"
+    assert len(built) == 1
+    assert cache.stats()["hits"] == 2
+    # Adding to the allowed characters or the decisions makes a new key
+    allowed_characters.add("ï")
+    assert sanitize("naïve —") == "naïve --"
+    decisions["é"] = "e"
+    assert sanitize("naïve —") == "naïve --"
+    assert len(built) == 3
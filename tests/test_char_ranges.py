@@ -0,0 +1,157 @@
+import unicodedata
+
+import pytest
+
+from sanitext.cache import ResultCache
+from sanitext.char_ranges import CharacterRanges, merge_intervals, parse_spec
+from sanitext.compiled_policy import CompiledPolicy, compile_policy
+from sanitext.policy import Policy
+from sanitext.scan import allowed_run_pattern, count_suspicious
+from sanitext.scripts import script_of
+from sanitext.text_sanitization import get_allowed_characters, sanitize_text
+
+TEXT = "Ελληνικά naïve “q” ж — ١٢٣ 𝟙𝐀 漢字 \U0001f44d"
+
+
+def test_parse_spec_ranges():
+    assert parse_spec("U+0370..U+03FF") == [(0x370, 0x400)]
+    assert parse_spec("u+e9") == [(0xE9, 0xEA)]
+    assert parse_spec(" U+10FFFF ") == [(0x10FFFF, 0x110000)]
+    for spec in ["U+03FF..U+0370", "U+110000", "U+", "0370..03FF"]:
+        with pytest.raises(ValueError):
+            parse_spec(spec)
+
+
+@pytest.mark.parametrize("spec", ["Nd", "Lu", "Cf", "Co"])
+def test_parse_spec_categories(spec):
+    ranges = CharacterRanges([spec])
+    for code in range(0, 0x30000, 7):
+        char = chr(code)
+        assert (char in ranges) == (unicodedata.category(char) == spec), hex(code)
+
+
+def test_parse_spec_major_classes_and_scripts():
+    letters = CharacterRanges(["L"])
+    assert all(c in letters for c in "aZéжΩ漢")
+    assert not any(c in letters for c in "1 -́")
+    assert letters == CharacterRanges(["Lu", "Ll", "Lt", "Lm", "Lo"])
+    greek = CharacterRanges(["greek"])
+    assert "Ω" in greek and "ἀ" in greek and "a" not in greek
+    assert all(script_of(char) == "Greek" for char in greek)
+    assert CharacterRanges(["Old Italic"]) == CharacterRanges(["Old_Italic"])
+    with pytest.raises(ValueError, match="Unknown character specification"):
+        parse_spec("Klingon")
+
+
+def test_merge_intervals():
+    assert merge_intervals([(5, 8), (0, 2), (2, 3), (7, 10), (4, 4)]) == [
+        (0, 3),
+        (5, 10),
+    ]
+
+
+def test_character_ranges_set_operations():
+    ranges = CharacterRanges(["U+0041..U+0043"], chars="xyzé")
+    assert ranges.intervals == ((0x41, 0x44), (0x78, 0x7B), (0xE9, 0xEA))
+    assert list(ranges) == list("ABCxyzé")
+    assert len(ranges) == 7
+    assert "ab" not in ranges and 1 not in ranges
+    assert ranges == CharacterRanges(chars="ABCxyzé")
+    assert hash(ranges) == hash(CharacterRanges(chars="ABCxyzé"))
+    assert {"q"} | ranges == ranges | "q" == CharacterRanges(chars="ABCqxyzé")
+    assert ranges | CharacterRanges(["U+0044"]) == CharacterRanges(chars="ABCDxyzé")
+
+
+def test_character_ranges_issuperset():
+    ranges = get_allowed_characters(allow_specs=["L", "N"])
+    assert ranges.issuperset("plain text")
+    assert ranges.issuperset("Ελληνικά ж 漢字 𝐀 𝟙")
+    assert not ranges.issuperset("naïve — x")
+    assert not ranges.issuperset("x \U0001f44d")
+    assert ranges.issuperset(["a", "ж"])
+    assert not ranges.issuperset(["a", "—"])
+    assert not CharacterRanges().issuperset("a")
+    assert CharacterRanges().issuperset("")
+    bmp = CharacterRanges(["U+0000..U+FFFF"])
+    assert bmp.issuperset("￿") and not bmp.issuperset("\U00010000")
+    for char in TEXT:
+        assert ranges.issuperset(char) == (char in ranges)
+
+
+def test_get_allowed_characters_with_specs():
+    allowed = get_allowed_characters(allow_chars="—", allow_specs=["Greek"])
+    assert isinstance(allowed, CharacterRanges)
+    assert get_allowed_characters().issubset(allowed)
+    assert "—" in allowed and "Ω" in allowed
+    assert isinstance(get_allowed_characters(), set)
+
+
+def test_sanitize_with_character_ranges():
+    allowed = get_allowed_characters(allow_specs=["Greek", "Nd"])
+    as_set = set(allowed)
+    assert sanitize_text(TEXT, allowed) == sanitize_text(TEXT, as_set)
+    assert sanitize_text(TEXT, allowed) == 'Ελληνικά naive "q"  - ١٢٣ 𝟙A  '
+    policy = Policy(allowed, cache=ResultCache())
+    assert policy.allowed_characters is allowed
+    assert policy.sanitize(TEXT) == sanitize_text(TEXT, as_set)
+    assert policy.sanitize(TEXT) == sanitize_text(TEXT, as_set)
+    assert policy.cache.stats()["hits"] == 1
+    compiled = CompiledPolicy(compile_policy(policy))
+    assert compiled.sanitize(TEXT) == policy.sanitize(TEXT)
+
+
+def test_allowed_run_pattern_with_character_ranges():
+    allowed = get_allowed_characters(allow_specs=["L"])
+    counts = count_suspicious(TEXT, allowed_run_pattern(allowed))
+    expected = count_suspicious(TEXT, allowed_run_pattern(set(allowed)))
+    assert counts == expected
+    assert set(counts) == {"“", "”", "—", "١", "٢", "٣", "𝟙", "\U0001f44d"}
+
+
+def test_named_classes():
+    assert "​" in CharacterRanges(["zero-width"])
+    assert "﻿" in CharacterRanges(["Zero-Width"])
+    bidi = CharacterRanges(["bidi"])
+    assert all(char in bidi for char in "؜‎‏‪‮⁦⁩")
+    assert "⁥" not in bidi
+    assert CharacterRanges(["private-use"]) == CharacterRanges(["Co"])
+    assert "\U000e0041" in CharacterRanges(["tags"])
+    assert "\U000e0100" in CharacterRanges(["variation-selectors"])
+
+
+def test_complement():
+    ranges = CharacterRanges(["U+0000..U+0041", "U+10FFFF"])
+    assert ranges.complement().intervals == ((0x42, 0x10FFFF),)
+    assert ranges.complement().complement() == ranges
+    assert CharacterRanges().complement().intervals == ((0, 0x110000),)
+    assert (
+        CharacterRanges().complement().outside_pattern().search("x\U0010ffff") is None
+    )
+
+
+def test_deny_list():
+    allowed = get_allowed_characters(deny_specs=["zero-width", "bidi", "Cc"])
+    assert len(allowed.intervals) == 10
+    assert all(char in allowed for char in "aé漢ж\U0001f44d\t\n")
+    assert not any(char in allowed for char in "​‮\x00\x7f")
+    # Explicitly allowed characters stay allowed
+    assert "‍" in get_allowed_characters(allow_chars="‍", deny_specs=["zero-width"])
+    assert "​" in get_allowed_characters(
+        allow_specs=["U+200B"], deny_specs=["zero-width"]
+    )
+
+
+def test_deny_list_policy_replaces_only_blocked_characters():
+    allowed = get_allowed_characters(deny_specs=["zero-width", "bidi", "tags"])
+    text = "Ж​x‮é\U000e0041 漢字 ﬁ ​"
+    expected = sanitize_text(text, allowed)
+    assert expected == "Жxé 漢字 ﬁ "
+    policy = Policy(allowed, decisions={"‮": "<RLO>"})
+    assert policy.blocked is not None
+    assert policy.sanitize(text) == "Жx<RLO>é 漢字 ﬁ "
+    assert policy.sanitize("Ж 漢字") == "Ж 漢字"
+    # Only the blocked characters found are in the table
+    assert set(policy.table) == {0x200B, 0x202E, 0xE0041}
+    compiled = CompiledPolicy(compile_policy(policy))
+    assert compiled.sanitize(text) == policy.sanitize(text)
+    assert "\U0010fffd" in compiled.allowed_characters
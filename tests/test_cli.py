@@ -6,6 +6,7 @@ from pathlib import Path
 import tempfile
 
 from sanitext.cli import app
+from sanitext.decisions import load_decisions
 
 runner = CliRunner()
 
@@ -21,6 +22,18 @@ def test_cli_detect():
     assert result.exit_code == 0
 
 
+def test_cli_detect_summary():
+    """Detection prints one line per distinct character with its count."""
+    result = runner.invoke(app, ["--detect", "-s", "Thіs іs а test."])
+    assert "Detected: 2 distinct suspicious character(s)" in result.output
+    assert "U+0456" in result.output
+    assert "2 occurrence(s), first at offset 2" in result.output
+    assert "1 occurrence(s), first at offset 8" in result.output
+    # Each character is reported once, however often it occurs
+    assert result.output.count("CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I") == 1
+    assert result.exit_code == 0
+
+
 def test_cli_process():
     """Test processing and replacing text."""
     result = runner.invoke(app, ["--string", "Thіs іs а test.🔥"])
@@ -90,6 +103,201 @@ def test_cli_allow_emoji():
     assert result.exit_code == 0
 
 
+def test_cli_allow_emoji_sequences():
+    """
+    --allow-emoji keeps multi-code-point emoji (ZWJ sequences, skin tones, flags) intact.
+    """
+    input_text = "Family 👨‍👩‍👧, thumbs 👍🏽, flag 🇬🇧"
+    result = runner.invoke(app, ["--allow-emoji", "-s", input_text])
+    assert input_text in result.output
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["--allow-emoji", "--detect", "-s", input_text])
+    assert "Detected: 0 distinct suspicious character(s)" in result.output
+
+
+def test_cli_detect_hidden_text():
+    """
+    --detect decodes text hidden in variation selectors.
+    """
+    result = runner.invoke(app, ["--allow-emoji", "--detect", "-s", "boss 😎󠅒󠅟󠅣󠅣"])
+    assert result.exit_code == 0
+    assert "Hidden text (variation selectors) at offsets 6-10: 'boss'" in result.output
+
+
+def test_cli_detect_mixed_script():
+    """
+    --detect reports words mixing letters from different scripts.
+    """
+    result = runner.invoke(app, ["--detect", "-s", "Log in to pаypal"])
+    assert result.exit_code == 0
+    assert (
+        "Mixed-script word at offsets 10-16: 'pаypal' (Latin, Cyrillic)"
+        in result.output
+    )
+
+
+def test_cli_graphemes():
+    """
+    --graphemes removes a letter together with its combining marks.
+    """
+    input_text = "xж\u0301y é"
+    result = runner.invoke(
+        app, ["--graphemes", "--allow-chars", "\u0301", "-s", input_text]
+    )
+    assert result.exit_code == 0
+    assert "xy e" in result.output
+
+    result = runner.invoke(app, ["--graphemes", "-i", "-s", input_text])
+    assert result.exit_code == 1
+
+
+def test_cli_markdown():
+    """
+    --markdown leaves inline code and code blocks untouched.
+    """
+    input_text = "Use `naïve — x` — ok\n```\n“code”\n```\n"
+    result = runner.invoke(app, ["--markdown", "-s", input_text])
+    assert result.exit_code == 0
+    assert "Use `naïve — x` - ok\n```\n“code”\n```\n" in result.output
+
+
+def test_cli_json():
+    """
+    --json sanitizes string values only, --json-keys keys too.
+    """
+    input_text = '{"naïve—": "Café — \\"x\\"", "n": 1}'
+    result = runner.invoke(app, ["--json", "-s", input_text])
+    assert result.exit_code == 0
+    assert '{"naïve—": "Cafe - \\"x\\"", "n": 1}' in result.output
+    result = runner.invoke(app, ["--json", "--json-keys", "-s", input_text])
+    assert '{"naive-": "Cafe - \\"x\\"", "n": 1}' in result.output
+    result = runner.invoke(app, ["--json", "-s", '{"a": "unterminated'])
+    assert result.exit_code == 1
+
+
+def test_cli_jsonl(tmp_path):
+    """
+    --jsonl --field sanitizes the selected field of each record.
+    """
+    source = tmp_path / "data.jsonl"
+    source.write_text(
+        '{"text": "Café —", "meta": "ü"}\n{"text": "ok", "meta": "ü"}\n',
+        encoding="utf-8",
+    )
+    target = tmp_path / "clean.jsonl"
+    result = runner.invoke(
+        app,
+        ["--jsonl", "--field", "text", "--input", str(source), "--output", str(target)],
+    )
+    assert result.exit_code == 0
+    assert target.read_text(encoding="utf-8") == (
+        '{"text": "Cafe -", "meta": "ü"}\n{"text": "ok", "meta": "ü"}\n'
+    )
+    result = runner.invoke(app, ["--jsonl", "--input", str(source)])
+    assert result.exit_code == 1
+
+
+def test_cli_csv():
+    """
+    --csv --column sanitizes the selected column, reading stdin by default.
+    """
+    result = runner.invoke(
+        app,
+        ["--csv", "--column", "body", "-j", "1"],
+        input="id,body,other\n1,Café —,ü\n",
+    )
+    assert result.exit_code == 0
+    assert result.output == "id,body,other\n1,Cafe -,ü\n"
+    result = runner.invoke(app, ["--csv", "--column", "body", "-i"], input="")
+    assert result.exit_code == 1
+
+
+def test_cli_scan(tmp_path):
+    """
+    `sanitext scan` reports the same as --detect, for a file.
+    """
+    path = tmp_path / "dump.txt"
+    path.write_text("Thіs is a “test”\npаypal\n", encoding="utf-8")
+    result = runner.invoke(app, ["scan", "--file", str(path), "-j", "1"])
+    assert result.exit_code == 0
+    assert "Detected: 4 distinct suspicious character(s)" in result.output
+    assert "first at offset 2" in result.output
+    assert "Mixed-script word at offsets 17-23: 'pаypal'" in result.output
+
+
+def test_cli_estimate(tmp_path):
+    """
+    `sanitext estimate` reports sampled rates with confidence intervals.
+    """
+    path = tmp_path / "corpus.txt"
+    path.write_text("plain line\nnaïve — xy\n" * 100, encoding="utf-8")
+    result = runner.invoke(app, ["estimate", "--file", str(path), "--seed", "1"])
+    assert result.exit_code == 0
+    assert "Sampled 1 block(s), 2,500 bytes, 2,200 characters" in result.output
+    assert "Suspicious: 90,909.1 per million characters (95% CI" in result.output
+    assert "about 200 in the file" in result.output
+    assert "'—' (U+2014, EM DASH): 45,454.5 per million" in result.output
+
+
+def test_cli_profile(tmp_path):
+    """
+    `sanitext profile` prints the most frequent disallowed characters and
+    exports the full histogram.
+    """
+    (tmp_path / "a.txt").write_text("naïve — naïve\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("\u2165 \ufb01\n", encoding="utf-8")
+    output = tmp_path / "histogram.csv"
+    result = runner.invoke(
+        app, ["profile", str(tmp_path), "-j", "1", "--top", "1", "-o", str(output)]
+    )
+    assert result.exit_code == 0
+    assert "Profiled 2 file(s): 5 disallowed character(s), 4 distinct" in result.output
+    assert "'ï' (U+00EF, LATIN SMALL LETTER I WITH DIAERESIS): 2 -> 'i'" in (
+        result.output
+    )
+    assert "EM DASH" not in result.output
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "code_point,character,count,name,category,closest_ascii"
+    assert "U+2165,\u2165,1,ROMAN NUMERAL SIX,Nl,VI" in lines
+
+
+def test_cli_allow_specs():
+    """
+    --allow takes code point ranges, general categories and scripts.
+    """
+    result = runner.invoke(
+        app,
+        [
+            "-s",
+            "Ωμέγα ж ١٢ ïx",
+            "--allow",
+            "Greek",
+            "--allow",
+            "Nd",
+            "--allow",
+            "U+00EF",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Ωμέγα  ١٢ ïx" in result.output
+    result = runner.invoke(app, ["-s", "x", "--allow", "Klingon"])
+    assert result.exit_code == 1
+    assert "Unknown character specification 'Klingon'" in result.output
+
+
+def test_cli_deny_list():
+    """
+    --deny allows every character except the denied ones.
+    """
+    result = runner.invoke(
+        app,
+        ["-s", "naïve ж x\u200by\u202ez", "--deny", "zero-width", "--deny", "bidi"],
+    )
+    assert result.exit_code == 0
+    assert "naïve ж xyz" in result.output
+
+
 def test_cli_allow_file():
     """
     Test allowing extra characters from a file.
@@ -217,6 +425,29 @@ def test_cli_interactive_remove_replace(monkeypatch):
     assert result.exit_code == 0
 
 
+def test_cli_remember_decisions(monkeypatch, tmp_path):
+    """
+    Interactive decisions are saved with --decisions-file and reused on the next run.
+    """
+    decisions_file = tmp_path / "decisions.json"
+    user_inputs = iter(["r", "'"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(user_inputs))
+
+    args = ["-i", "--decisions-file", str(decisions_file), "-s", "It’s"]
+    result = runner.invoke(app, args)
+    assert "It's" in result.output
+    assert decisions_file.exists()
+
+    # Second run must not prompt again
+    def no_input(prompt):
+        raise AssertionError("Should not prompt for a remembered character")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    result = runner.invoke(app, args)
+    assert "It's" in result.output
+    assert result.exit_code == 0
+
+
 def test_cli_help():
     """
     Simple check that `sanitext --help` works (and doesn't crash).
@@ -233,3 +464,74 @@ def test_cli_help():
     assert "--allow-chars" in result.output
     assert "--allow-emoji" in result.output
     assert "--allow-file" in result.output
+
+
+def test_cli_bidi(tmp_path):
+    """
+    `sanitext bidi` reports bidi controls and fails on unterminated ones.
+    """
+    path = tmp_path / "example.py"
+    path.write_text('access = "user\u202e admin"\n', encoding="utf-8")
+    result = runner.invoke(app, ["bidi", str(tmp_path), "--jobs", "1"])
+    assert result.exit_code == 1
+    assert f"{path}:1:15: U+202E RIGHT-TO-LEFT OVERRIDE (unterminated)" in result.output
+
+    path.write_text('access = "user\u2067 admin\u2069"\n', encoding="utf-8")
+    result = runner.invoke(app, ["bidi", str(path)])
+    assert result.exit_code == 0
+    assert "U+2067 RIGHT-TO-LEFT ISOLATE (terminated)" in result.output
+
+
+def test_cli_replacements(tmp_path):
+    """
+    --replacements files replace characters before the built-in replacements.
+    """
+    first = tmp_path / "first.json"
+    first.write_text(
+        '{"replacements": {"€": "EUR", "U+2026": "..."}}', encoding="utf-8"
+    )
+    second = tmp_path / "second.json"
+    second.write_text('{"replacements": {"€": "euro"}}', encoding="utf-8")
+    args = ["-s", "5€ — x…", "--replacements", str(first)]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "5EUR - x..." in result.output
+    result = runner.invoke(app, args + ["--replacements", str(second)])
+    assert "5euro - x..." in result.output
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"replacements": {"ab": "x"}}', encoding="utf-8")
+    result = runner.invoke(app, ["-s", "x", "--replacements", str(invalid)])
+    assert result.exit_code == 1
+    assert "Invalid key" in result.output
+
+
+def test_cli_review_saves_only_explicit_decisions(monkeypatch, tmp_path):
+    """
+    --review with --remember saves the characters the user decided, not the
+    defaults of the others.
+    """
+    decisions_file = tmp_path / "decisions.json"
+    user_inputs = iter(["☯ y", ""])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(user_inputs))
+    args = ["--review", "--decisions-file", str(decisions_file), "-s", "Café ☯"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Cafe ☯" in result.output
+    assert load_decisions(decisions_file) == {"☯": "☯"}
+
+
+@pytest.mark.parametrize("content", ["{not json", '{"version": 99, "decisions": {}}'])
+def test_cli_invalid_decisions_file(tmp_path, content):
+    """
+    An invalid decision file is reported as an error, not a traceback.
+    """
+    decisions_file = tmp_path / "decisions.json"
+    decisions_file.write_text(content, encoding="utf-8")
+    for args in (["-s", "x"], ["--jsonl", "--field", "text"]):
+        result = runner.invoke(
+            app, args + ["--decisions-file", str(decisions_file)], input="{}\n"
+        )
+        assert result.exit_code == 1
+        assert "Error:" in result.output
+        assert "decision file" in result.output
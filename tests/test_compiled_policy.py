@@ -0,0 +1,215 @@
+import pickle
+import random
+import subprocess
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+import pytest
+
+from sanitext import compiled_policy
+from sanitext.batch import sanitize_jsonl
+from sanitext.cache import ResultCache
+from sanitext.compiled_policy import (
+    CompiledPolicy,
+    attach_policy,
+    compile_policy,
+    share_policy,
+)
+from sanitext.policy import Policy
+from sanitext.sequence_trie import SequenceTrie
+from sanitext.text_sanitization import (
+    get_allowed_characters,
+    get_allowed_sequences,
+)
+
+TEXTS = [
+    "plain",
+    "Thіs іs а “quoted” tеxt — naïve",
+    "ж ø ☯ Ⅵ ﬁ",
+    "👍🏽 and 🇬🇧",
+    "x​y‮\U000e0068\U0010fffd",
+]
+
+
+@pytest.fixture
+def shared():
+    policy = share_policy(Policy())
+    yield policy
+    policy.close()
+    policy.unlink()
+
+
+def test_compiled_policy_matches_policy():
+    allowed_characters = get_allowed_characters(allow_emoji=True, allow_chars="é")
+    decisions = {"ø": "o!", "ï": "", "ж": "zh"}
+    for policy in [Policy(), Policy(allowed_characters, decisions)]:
+        compiled = CompiledPolicy(compile_policy(policy))
+        for text in TEXTS:
+            assert compiled.sanitize(text) == policy.sanitize(text)
+            assert compiled.is_clean(text) == policy.is_clean(text)
+
+
+def test_compiled_policy_replacement_in_every_plane():
+    policy = Policy(get_allowed_characters(allow_chars="é"), {"ø": "o"})
+    compiled = CompiledPolicy(compile_policy(policy))
+    # The whole Basic Multilingual Plane, and a sample of each other plane
+    sample = random.Random(0)
+    codes = list(range(0x10000))
+    for plane in range(1, 17):
+        codes += sample.sample(range(plane << 16, (plane + 1) << 16), 2000)
+    for code in codes:
+        char = chr(code)
+        assert compiled.replacement(char) == policy.sanitize(char), hex(code)
+    assert "é" in compiled.allowed_characters
+    assert "ab" not in compiled.allowed_characters
+
+
+def test_compiled_policy_clean_text_and_cache():
+    compiled = CompiledPolicy(compile_policy(Policy()), cache=ResultCache())
+    text = "plain ASCII"
+    assert compiled.sanitize(text) is text
+    assert compiled.sanitize("naïve") == "naive"
+    assert compiled.sanitize("naïve") == "naive"
+    assert compiled.cache.stats()["hits"] == 1
+
+
+def test_compiled_policy_keeps_allowed_sequences(tmp_path):
+    policy = Policy(
+        get_allowed_characters(allow_emoji=True),
+        allowed_sequences=get_allowed_sequences(allow_emoji=True),
+    )
+    compiled = CompiledPolicy(compile_policy(policy))
+    path = tmp_path / "policy.bin"
+    policy.save(path)
+    loaded = Policy.load(path)
+    try:
+        for text in TEXTS + ["👨‍👩‍👧 x👩‍💻", "a\u200db\ufe0f 🏳️‍🌈"]:
+            assert compiled.sanitize(text) == policy.sanitize(text)
+            assert loaded.sanitize(text) == policy.sanitize(text)
+    finally:
+        loaded.close()
+    assert compiled.sanitize("👍🏽 and 🇬🇧") == "👍🏽 and 🇬🇧"
+    assert CompiledPolicy(compile_policy(Policy())).allowed_sequences is None
+
+
+def test_compile_policy_rejects_sequences_with_nul():
+    policy = Policy(allowed_sequences=SequenceTrie(["a\0b"]))
+    with pytest.raises(ValueError, match="NUL"):
+        compile_policy(policy)
+
+
+def test_compiled_policy_rejects_invalid_images():
+    image = compile_policy(Policy())
+    with pytest.raises(ValueError, match="magic"):
+        CompiledPolicy(b"XXXX" + image[4:])
+    with pytest.raises(ValueError, match="version"):
+        CompiledPolicy(image[:4] + b"\x09\x00" + image[6:])
+    with pytest.raises(ValueError, match="Truncated"):
+        CompiledPolicy(image[:-1])
+    with pytest.raises(ValueError, match="too short"):
+        CompiledPolicy(image[:100])
+
+
+def test_compiled_policy_rejects_other_unicode_versions(tmp_path):
+    image = compile_policy(Policy())
+    offset = 8  # The Unicode version, after the magic, format version and reserved
+    other = image[:offset] + b"1.1.0".ljust(16, b"\0") + image[offset + 16 :]
+    with pytest.raises(ValueError, match="Unicode 1.1.0"):
+        CompiledPolicy(other)
+    path = tmp_path / "policy.bin"
+    path.write_bytes(other)
+    with pytest.raises(ValueError, match="compile it again"):
+        Policy.load(path)
+
+
+def test_attach_policy(shared):
+    attached = attach_policy(shared.name)
+    try:
+        assert attached.name == shared.name
+        assert attached.key == shared.key
+        assert attached.sanitize(TEXTS[1]) == 'This is a "quoted" text - naive'
+    finally:
+        attached.close()
+
+
+def test_pickled_shared_policy_attaches_by_name(shared):
+    data = pickle.dumps(shared)
+    assert len(data) < 200
+    copy = pickle.loads(data)
+    try:
+        assert copy.sanitize("ﬁ") == "fi"
+    finally:
+        copy.close()
+    plain = CompiledPolicy(compile_policy(Policy()))
+    assert pickle.loads(pickle.dumps(plain)).sanitize("ﬁ") == "fi"
+
+
+def _sanitize_in_worker(text):
+    return compiled_policy_in_worker.sanitize(text)
+
+
+def _init_worker(name):
+    global compiled_policy_in_worker
+    compiled_policy_in_worker = attach_policy(name)
+
+
+def test_shared_policy_in_worker_processes(shared):
+    with Pool(2, initializer=_init_worker, initargs=(shared.name,)) as pool:
+        results = pool.map(_sanitize_in_worker, TEXTS)
+    assert results == [Policy().sanitize(text) for text in TEXTS]
+    lines = [f'{{"text": "{text}"}}\n' for text in TEXTS]
+    expected = list(sanitize_jsonl(lines, ["text"], jobs=1))
+    assert list(sanitize_jsonl(lines, ["text"], policy=shared, jobs=2)) == expected
+
+
+def test_attach_does_not_load_the_tables(shared):
+    code = (
+        "import sys\n"
+        "from sanitext.compiled_policy import attach_policy\n"
+        f"policy = attach_policy({shared.name!r})\n"
+        "print(policy.sanitize('na\\u00efve \\u0436'))\n"
+        "policy.close()\n"
+        "print(sorted(m for m in sys.modules if m.startswith('sanitext.')))\n"
+    )
+    root = Path(compiled_policy.__file__).parent.parent
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.splitlines() == [
+        "naive ",
+        "['sanitext.compiled_policy']",
+    ]
+
+
+def test_save_and_load_policy(tmp_path):
+    allowed_characters = get_allowed_characters(allow_emoji=True, allow_chars="é")
+    policy = Policy(allowed_characters, {"ø": "o!"})
+    path = tmp_path / "policy.bin"
+    policy.save(path)
+    assert not (tmp_path / "policy.bin.tmp").exists()
+    loaded = Policy.load(path)
+    try:
+        assert loaded.path == path
+        for text in TEXTS:
+            assert loaded.sanitize(text) == policy.sanitize(text)
+        copy = pickle.loads(pickle.dumps(loaded))
+        assert copy.path == path
+        assert copy.sanitize("ø ﬁ") == "o! fi"
+        copy.close()
+    finally:
+        loaded.close()
+
+
+def test_load_policy_rejects_other_files(tmp_path):
+    path = tmp_path / "policy.bin"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="empty"):
+        Policy.load(path)
+    path.write_text("not a policy\n" * 20000)
+    with pytest.raises(ValueError, match="magic"):
+        Policy.load(path)
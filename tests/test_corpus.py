@@ -0,0 +1,77 @@
+import io
+import json
+
+import pytest
+
+from sanitext.corpus import histogram, profile_paths, write_histogram
+from sanitext.text_sanitization import get_allowed_characters
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "a.txt").write_text("naïve “quote”\n" * 50, encoding="utf-8")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "b.md").write_text("Ⅵ ﬁle ж\n" * 30, encoding="utf-8")
+    (nested / "empty.txt").write_bytes(b"")
+    (nested / "image.bin").write_bytes(b"\x89PNG\0\0\xff")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_profile_paths_counts_across_files_and_chunks(corpus, jobs):
+    counts, files, skipped = profile_paths([corpus], jobs=jobs, chunk_size=64)
+    assert counts == {
+        "ï": 50,
+        "“": 50,
+        "”": 50,
+        "Ⅵ": 30,
+        "ﬁ": 30,
+        "ж": 30,
+    }
+    assert files == 2
+    assert skipped == [(str(corpus / "nested" / "image.bin"), "binary")]
+
+
+def test_profile_paths_respects_allowed_characters(corpus):
+    allowed = get_allowed_characters() | {"ж", "ï"}
+    counts, _, _ = profile_paths([corpus], allowed_characters=allowed, jobs=1)
+    assert "ж" not in counts and "ï" not in counts
+    assert counts["Ⅵ"] == 30
+
+
+def test_histogram_rows():
+    rows = histogram({"ж": 1, "Ⅵ": 3, "ﬁ": 3, "ï": 2})
+    assert rows == [
+        ("U+2165", "Ⅵ", 3, "ROMAN NUMERAL SIX", "Nl", "VI"),
+        ("U+FB01", "ﬁ", 3, "LATIN SMALL LIGATURE FI", "Ll", "fi"),
+        ("U+00EF", "ï", 2, "LATIN SMALL LETTER I WITH DIAERESIS", "Ll", "i"),
+        ("U+0436", "ж", 1, "CYRILLIC SMALL LETTER ZHE", "Ll", ""),
+    ]
+
+
+def test_write_histogram_formats():
+    rows = histogram({"ï": 2, "—": 1})
+
+    file = io.StringIO()
+    write_histogram(rows, file, "csv")
+    assert file.getvalue().splitlines() == [
+        "code_point,character,count,name,category,closest_ascii",
+        "U+00EF,ï,2,LATIN SMALL LETTER I WITH DIAERESIS,Ll,i",
+        "U+2014,—,1,EM DASH,Pd,-",
+    ]
+
+    file = io.StringIO()
+    write_histogram(rows, file, "json")
+    records = json.loads(file.getvalue())
+    assert records[1] == {
+        "code_point": "U+2014",
+        "character": "—",
+        "count": 1,
+        "name": "EM DASH",
+        "category": "Pd",
+        "closest_ascii": "-",
+    }
+
+    with pytest.raises(ValueError):
+        write_histogram(rows, io.StringIO(), "xml")
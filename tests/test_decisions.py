@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from sanitext.decisions import (
+    default_decisions_path,
+    load_decisions,
+    save_decisions,
+)
+
+
+def test_default_decisions_path_uses_xdg_config_home(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    assert default_decisions_path() == tmp_path / "sanitext" / "decisions.json"
+
+
+def test_load_decisions_missing_file(tmp_path):
+    assert load_decisions(tmp_path / "missing.json") == {}
+
+
+def test_save_and_load_decisions_roundtrip(tmp_path):
+    path = tmp_path / "nested" / "decisions.json"
+    decisions = {"’": "'", "—": "-", "​": "", "é": "é"}
+    save_decisions(decisions, path)
+    assert load_decisions(path) == decisions
+    # Invisible characters are stored escaped, so the file stays auditable
+    assert "\\u200b" in path.read_text(encoding="utf-8")
+
+
+def test_load_decisions_rejects_unknown_version(tmp_path):
+    path = tmp_path / "decisions.json"
+    path.write_text(json.dumps({"version": 99, "decisions": {}}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_decisions(path)
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"version": 1}'])
+def test_load_decisions_rejects_invalid_files(tmp_path, content):
+    path = tmp_path / "decisions.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_decisions(path)
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from sanitext.estimate import estimate_suspicious
+from sanitext.text_sanitization import get_allowed_characters
+
+CLEAN = "A plain ASCII line, as most lines are.\n"
+DIRTY = "Some “quoted” text — naïve.\n"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    rng = random.Random(0)
+    lines = [DIRTY if rng.random() < 0.05 else CLEAN for _ in range(40_000)]
+    text = "".join(lines)
+    path = tmp_path / "corpus.txt"
+    path.write_text(text, encoding="utf-8")
+    return path, text
+
+
+def test_estimate_whole_file_is_exact(corpus):
+    path, text = corpus
+    result = estimate_suspicious(path, sample_rate=1, block_size=4096)
+    dirty = text.count(DIRTY)
+    assert result["sampled_characters"] == len(text)
+    assert result["estimated_characters"] == len(text)
+    assert result["rate"] == (dirty * 4 / len(text),) * 3
+    rates = {char: rate for char, _, rate, *_ in result["characters"]}
+    assert set(rates) == {"“", "”", "—", "ï"}
+    assert rates["—"] == dirty / len(text)
+
+
+def test_estimate_sample_interval(corpus):
+    path, text = corpus
+    true_rate = text.count(DIRTY) * 4 / len(text)
+    result = estimate_suspicious(path, sample_rate=0.1, block_size=512, seed=1)
+    assert 100 <= result["blocks"] < len(text) // 512
+    rate, low, high = result["rate"]
+    assert low < rate < high
+    assert low <= true_rate <= high
+    assert result["characters"][0][5] in {
+        "LEFT DOUBLE QUOTATION MARK",
+        "RIGHT DOUBLE QUOTATION MARK",
+        "EM DASH",
+        "LATIN SMALL LETTER I WITH DIAERESIS",
+    }
+    # The same seed gives the same sample
+    assert estimate_suspicious(path, sample_rate=0.1, block_size=512, seed=1) == result
+
+
+def test_estimate_allowed_characters(corpus):
+    path, _ = corpus
+    allowed_characters = get_allowed_characters(allow_chars="“”—ï")
+    result = estimate_suspicious(path, 1, allowed_characters)
+    assert result["rate"] == (0.0, 0.0, 0.0)
+    assert result["characters"] == []
+
+
+def test_estimate_utf8_alignment(tmp_path):
+    """Blocks that start inside a character don't count it as invalid."""
+    path = tmp_path / "cyrillic.txt"
+    path.write_text("жжж" * 1000, encoding="utf-8")
+    result = estimate_suspicious(path, sample_rate=1, block_size=7)
+    assert [entry[0] for entry in result["characters"]] == ["ж"]
+    assert result["sampled_characters"] == 3000
+
+
+def test_estimate_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert estimate_suspicious(path)["blocks"] == 0
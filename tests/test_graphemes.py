@@ -0,0 +1,90 @@
+import pytest
+
+from sanitext.graphemes import grapheme_clusters, sanitize_graphemes
+from sanitext.text_sanitization import (
+    get_allowed_characters,
+    get_allowed_sequences,
+    sanitize_text,
+)
+
+
+@pytest.fixture
+def ascii_allowed():
+    return get_allowed_characters()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("ab", ["a", "b"]),
+        ("éx", ["é", "x"]),  # Base + combining mark
+        ("a\r\nb\n", ["a", "\r\n", "b", "\n"]),  # CR LF stays together
+        ("👨‍👩‍👧!", ["👨‍👩‍👧", "!"]),  # ZWJ sequence
+        ("🇬🇧🇬", ["🇬🇧", "🇬"]),  # Regional indicator pairs
+        ("각가", ["각", "가"]),  # Hangul jamo sequence + syllable
+        ("각ᆨx", ["각ᆨ", "x"]),  # LVT syllable + trailing jamo
+        ("क्षa", ["क्ष", "a"]),  # Indic conjunct
+        ("؀١", ["؀١"]),  # Prepend
+        ("👍🏽x", ["👍🏽", "x"]),  # Emoji modifier
+    ],
+)
+def test_grapheme_clusters(text, expected):
+    assert list(grapheme_clusters(text)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Thіs tеxt cоntaіns homoglyphs.",
+        "𝑇ℎ𝑖𝑠 𝑡𝑒𝑥𝑡 𝑢𝑠𝑒𝑠 𝑚𝑎𝑡ℎ 𝑏𝑜𝑙𝑑.\n",
+        "Peace ☯ within Ⅵ ﬁ\r\n",
+        "Café crème",
+        "",
+    ],
+)
+def test_sanitize_graphemes_matches_code_point_path(text, ascii_allowed):
+    """Text made of single-code-point clusters gets the same result as sanitize_text."""
+    assert sanitize_graphemes(text, ascii_allowed) == sanitize_text(text, ascii_allowed)
+
+
+def test_sanitize_graphemes_composes_allowed_form(ascii_allowed):
+    """A decomposed 'é' is kept if the precomposed form is allowed."""
+    allowed = ascii_allowed | {"é"}
+    text = "Café"
+    assert sanitize_text(text, allowed) == "Cafe"
+    assert sanitize_graphemes(text, allowed) == "Café"
+
+
+def test_sanitize_graphemes_no_orphaned_marks(ascii_allowed):
+    """If the base of a cluster is removed, its combining marks go with it."""
+    allowed = ascii_allowed | {"́"}
+    text = "xж́y"
+    assert sanitize_text(text, allowed) == "x́y"
+    assert sanitize_graphemes(text, allowed) == "xy"
+
+
+def test_sanitize_graphemes_hangul_removed_whole(ascii_allowed):
+    """A Hangul jamo sequence is removed as a whole, not partly."""
+    allowed = ascii_allowed | {"ᄀ"}
+    text = "a 각 ᄀ"
+    assert sanitize_text(text, allowed) == "a ᄀ ᄀ"
+    assert sanitize_graphemes(text, allowed) == "a  ᄀ"
+
+
+def test_sanitize_graphemes_marks_follow_replaced_base(ascii_allowed):
+    """A replaced base keeps the ASCII approximation of the whole cluster."""
+    assert sanitize_graphemes("ñö", ascii_allowed) == "no"
+    assert sanitize_graphemes("і́", ascii_allowed) == "i"
+
+
+def test_sanitize_graphemes_decisions_and_sequences():
+    allowed = get_allowed_characters(allow_emoji=True)
+    sequences = get_allowed_sequences(allow_emoji=True)
+    text = "Team 👨‍👩‍👧 — ok"
+    assert (
+        sanitize_graphemes(
+            text, allowed, decisions={"—": "--"}, allowed_sequences=sequences
+        )
+        == "Team 👨‍👩‍👧 -- ok"
+    )
@@ -1,5 +1,11 @@
+import unicodedata
 import unittest
-from sanitext.homoglyph_map import get_homoglyph_replacement, HOMOGLYPH_MAP
+from sanitext.confusables_data import CONFUSABLES, UNICODE_VERSION
+from sanitext.homoglyph_map import (
+    get_homoglyph_replacement,
+    HOMOGLYPH_MAP,
+    MANUAL_HOMOGLYPHS,
+)
 
 
 class TestHomoglyphMap(unittest.TestCase):
@@ -41,6 +47,46 @@ class TestHomoglyphMap(unittest.TestCase):
                 self.assertIsInstance(key, str)
                 self.assertIsInstance(value, str)
 
+    def test_confusables_mappings(self):
+        """Look-alikes from Unicode's confusables data map to readable ASCII."""
+        test_cases = {
+            "Ι": "I",  # GREEK CAPITAL LETTER IOTA
+            "ꓲ": "l",  # LISU LETTER I
+            "١": "1",  # ARABIC-INDIC DIGIT ONE
+            "০": "0",  # BENGALI DIGIT ZERO
+            "٥": "5",  # ARABIC-INDIC DIGIT FIVE (confusable with "o")
+            "٧": "7",  # ARABIC-INDIC DIGIT SEVEN (confusable with "V")
+            "৪": "4",  # BENGALI DIGIT FOUR (confusable with "8")
+            "੧": "1",  # GURMUKHI DIGIT ONE (confusable with "9")
+            "०": "0",  # DEVANAGARI DIGIT ZERO (confusable with "o")
+            "Օ": "O",  # ARMENIAN CAPITAL LETTER OH
+            "Ɓ": "B",  # LATIN CAPITAL LETTER B WITH HOOK
+            "″": '"',  # DOUBLE PRIME
+            "≫": ">>",  # MUCH GREATER-THAN
+        }
+        for char, expected in test_cases.items():
+            with self.subTest(char=char):
+                self.assertEqual(get_homoglyph_replacement(char), expected)
+
+    def test_manual_mappings_take_precedence(self):
+        self.assertEqual(UNICODE_VERSION, "13.0.0")
+        self.assertTrue(set(MANUAL_HOMOGLYPHS) & set(CONFUSABLES))
+        for key, value in MANUAL_HOMOGLYPHS.items():
+            with self.subTest(key=key):
+                self.assertEqual(HOMOGLYPH_MAP[key], value)
+
+    def test_confusables_are_ascii(self):
+        for key, value in CONFUSABLES.items():
+            with self.subTest(key=key):
+                self.assertFalse(key.isascii())
+                self.assertTrue(value.isascii())
+
+    def test_confusable_numbers_map_to_their_value(self):
+        for key, value in CONFUSABLES.items():
+            if unicodedata.category(key)[0] == "N":
+                with self.subTest(key=key):
+                    self.assertEqual(value, str(int(unicodedata.numeric(key))))
+
 
 if __name__ == "__main__":
     unittest.main()
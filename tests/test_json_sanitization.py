@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from sanitext.json_sanitization import (
+    read_chunks,
+    sanitize_json,
+    sanitize_json_stream,
+)
+from sanitext.text_sanitization import TranslationTable, get_allowed_characters
+
+DOCUMENT = (
+    '{"naïve — key": "Café — “x”", "n": [1, -2.5e3, true, null, "ü\\u00fc\\n"], '
+    '"nested": {"k—": "v—"}, "escaped": "a\\"b\\\\\\/", "emoji": "\\ud83d\\ude00ok", '
+    '"empty": "" , "spaced—"  :  "v" , "last": ["end—"]}'
+)
+
+
+def test_sanitize_json_values_only():
+    result = sanitize_json(DOCUMENT)
+    assert json.loads(result) == {
+        "naïve — key": 'Cafe - "x"',
+        "n": [1, -2.5e3, True, None, "uu\n"],
+        "nested": {"k—": "v-"},
+        "escaped": 'a"b\\/',
+        "emoji": "ok",
+        "empty": "",
+        "spaced—": "v",
+        "last": ["end-"],
+    }
+    # Unchanged strings keep their original escapes and spacing
+    assert '"a\\"b\\\\\\/"' in result
+    assert '"empty": "" , "spaced—"  :  "v" ,' in result
+
+
+def test_sanitize_json_keys():
+    result = json.loads(sanitize_json(DOCUMENT, sanitize_keys=True))
+    assert list(result) == [
+        "naive - key",
+        "n",
+        "nested",
+        "escaped",
+        "emoji",
+        "empty",
+        "spaced-",
+        "last",
+    ]
+    assert result["nested"] == {"k-": "v-"}
+
+
+def test_sanitize_json_top_level_string():
+    assert sanitize_json('"Café"') == '"Cafe"'
+    assert sanitize_json('  "Café"\n') == '  "Cafe"\n'
+
+
+@pytest.mark.parametrize("sanitize_keys", [False, True])
+def test_sanitize_json_stream_any_chunking(sanitize_keys):
+    """Strings, escapes and keys cut by chunk boundaries give the same output."""
+    expected = sanitize_json(DOCUMENT, sanitize_keys=sanitize_keys)
+    for size in range(1, len(DOCUMENT)):
+        chunks = [DOCUMENT[i : i + size] for i in range(0, len(DOCUMENT), size)]
+        result = "".join(sanitize_json_stream(chunks, sanitize_keys=sanitize_keys))
+        assert result == expected, size
+
+
+def test_sanitize_json_interactive_skips_keys(monkeypatch):
+    """Only characters of sanitized strings are asked about, each once."""
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return "n"
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    result = sanitize_json('{"—": "—", "a": ["—", "—"]}', interactive=True)
+    assert result == '{"—": "", "a": ["", ""]}'
+    assert len(prompts) == 1
+
+
+def test_sanitize_json_unterminated_string():
+    with pytest.raises(ValueError):
+        sanitize_json('{"a": "unterminated')
+    with pytest.raises(ValueError):
+        list(sanitize_json_stream(['{"a": "cut', " at the end\\"]))
+
+
+def test_sanitize_json_invalid_escape():
+    with pytest.raises(ValueError):
+        sanitize_json('["—\\x"]')
+
+
+def test_read_chunks(tmp_path):
+    path = tmp_path / "document.json"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    with open(path, encoding="utf-8") as file:
+        result = "".join(sanitize_json_stream(read_chunks(file, size=7)))
+    assert result == sanitize_json(DOCUMENT)
+
+
+def test_translation_table():
+    table = TranslationTable(get_allowed_characters(), decisions={"é": "e!"})
+    assert "Café — naïve ж".translate(table) == "Cafe! - naive "
+    # Replacements are worked out once and cached
+    assert table[ord("—")] == "-"
+    assert ord("—") in table
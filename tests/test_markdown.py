@@ -0,0 +1,105 @@
+import io
+
+import pytest
+
+from sanitext.markdown import (
+    inline_regions,
+    iter_markdown_regions,
+    sanitize_markdown,
+    sanitize_markdown_stream,
+)
+from sanitext.text_sanitization import get_allowed_characters
+
+MARKDOWN = """# Résumé — “intro”
+
+Call `naïve(“x”)` or ``a`b — c``, not \\`ünïcode.
+
+```python
+s = "naïve — “quoted”"
+```
+After — the fence.
+~~~~
+still code ü
+~~~
+still code ü
+~~~~~
+Done — ✓
+"""
+
+SANITIZED = """# Resume - "intro"
+
+Call `naïve(“x”)` or ``a`b — c``, not \\`unicode.
+
+```python
+s = "naïve — “quoted”"
+```
+After - the fence.
+~~~~
+still code ü
+~~~
+still code ü
+~~~~~
+Done - 
+"""
+
+
+def test_sanitize_markdown_keeps_code():
+    assert sanitize_markdown(MARKDOWN) == SANITIZED
+
+
+def test_sanitize_markdown_stream_from_file():
+    chunks = list(sanitize_markdown_stream(io.StringIO(MARKDOWN)))
+    assert "".join(chunks) == SANITIZED
+    assert len(chunks) > 1
+
+
+def test_sanitize_markdown_code_policy():
+    code_allowed = get_allowed_characters() | {"ï"}
+    text = "Use `naïve — x` — ok"
+    assert (
+        sanitize_markdown(text, code_allowed_characters=code_allowed)
+        == "Use `naïve - x` - ok"
+    )
+
+
+def test_sanitize_markdown_unclosed_fence_runs_to_the_end():
+    text = "Text —\n```\ncode —\nmore —"
+    assert sanitize_markdown(text) == "Text -\n```\ncode —\nmore —"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("plain", [(False, "plain")]),
+        ("a `b` c", [(False, "a "), (True, "`b`"), (False, " c")]),
+        ("``a`b``", [(True, "``a`b``")]),
+        ("`a`` b", [(False, "`a`` b")]),  # No closer of the same length
+        ("\\`a` b`", [(False, "\\`a"), (True, "` b`")]),  # Escaped opener
+        ("\\\\`a`", [(False, "\\\\"), (True, "`a`")]),  # Escaped backslash
+        ("`a\\`b", [(True, "`a\\`"), (False, "b")]),  # No escapes in code
+        ("`multi\nline`", [(True, "`multi\nline`")]),
+    ],
+)
+def test_inline_regions(text, expected):
+    assert list(inline_regions(text)) == expected
+
+
+def test_code_spans_end_with_the_paragraph():
+    lines = ["a `b\n", "\n", "c` d\n"]
+    regions = list(iter_markdown_regions(lines))
+    assert all(not is_code for is_code, _ in regions)
+    assert "".join(region for _, region in regions) == "".join(lines)
+
+
+def test_sanitize_markdown_interactive_asks_once(monkeypatch):
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return "n"
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    text = "ü `x` ü\n\nü `y` ü"
+    assert sanitize_markdown(text, interactive=True) == " `x` \n\n `y` "
+    assert len(prompts) == 1
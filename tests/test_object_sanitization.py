@@ -0,0 +1,94 @@
+import pytest
+
+from sanitext.object_sanitization import sanitize_obj
+from sanitext.policy import Policy
+from sanitext.text_sanitization import get_allowed_characters
+
+
+def test_sanitize_obj_nested():
+    obj = {
+        "naïve—": "Café",
+        "list": [1, 2.5, None, True, "—", ["deep", "ü"]],
+        "tuple": ("a", "ж"),
+        "nested": {"a": {"b": {"c": "“x”"}}},
+    }
+    assert sanitize_obj(obj) == {
+        "naïve—": "Cafe",
+        "list": [1, 2.5, None, True, "-", ["deep", "u"]],
+        "tuple": ("a", ""),
+        "nested": {"a": {"b": {"c": '"x"'}}},
+    }
+    # The input is left as it was
+    assert obj["list"][4] == "—"
+
+
+def test_sanitize_obj_keys():
+    obj = {"naïve": 1, "b": {"ü": "ü"}, "naive": 2}
+    assert sanitize_obj(obj, sanitize_keys=True) == {"naive": 2, "b": {"u": "u"}}
+    result = sanitize_obj({"ü": 1, "b": 2, "c": 3}, sanitize_keys=True)
+    assert list(result) == ["u", "b", "c"]
+
+
+def test_sanitize_obj_shares_clean_subtrees():
+    clean = {"status": "ok", "items": [{"kind": "enum"}, ("x", "y")]}
+    obj = {"clean": clean, "dirty": ["ü", clean], "plain": [1, 2]}
+    result = sanitize_obj(obj)
+    assert result is not obj
+    assert result["clean"] is clean
+    assert result["dirty"][1] is clean
+    assert result["plain"] is obj["plain"]
+    assert sanitize_obj(clean) is clean
+    # Equal clean strings keep their own identity
+    first, second = "".join(["o", "k"]), "".join(["o", "k"])
+    values = [first, second]
+    assert sanitize_obj(values) is values
+
+
+def test_sanitize_obj_memoizes_strings():
+    calls = []
+
+    class CountingPolicy(Policy):
+        def sanitize(self, text):
+            calls.append(text)
+            return super().sanitize(text)
+
+    shared = ["ü"]
+    result = sanitize_obj([{"kind": "—"}] * 3 + [shared, shared], CountingPolicy())
+    assert result == [{"kind": "-"}] * 3 + [["u"], ["u"]]
+    assert sorted(calls) == ["ü", "—"]
+    assert result[0] is result[1]
+    assert result[3] is result[4]
+    # Equal results are the same string object
+    first, second = sanitize_obj(["—", {"k": "—"}])
+    assert first is second["k"]
+
+
+def test_sanitize_obj_scalars_and_other_types():
+    assert sanitize_obj("ü") == "u"
+    assert sanitize_obj(5) == 5
+    other = {"ü"}
+    assert sanitize_obj([other])[0] is other
+
+
+def test_sanitize_obj_deep_nesting():
+    obj = leaf = []
+    for _ in range(50_000):
+        leaf.append([])
+        leaf = leaf[0]
+    leaf.append("ü")
+    result = sanitize_obj(obj)
+    for _ in range(50_000):
+        result = result[0]
+    assert result == ["u"]
+
+
+def test_sanitize_obj_cycle():
+    cycle = {"a": []}
+    cycle["a"].append(cycle)
+    with pytest.raises(ValueError):
+        sanitize_obj(cycle)
+
+
+def test_sanitize_obj_policy():
+    policy = Policy(get_allowed_characters(allow_chars="é"))
+    assert sanitize_obj({"k": "Café —"}, policy) == {"k": "Café -"}
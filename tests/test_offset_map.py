@@ -0,0 +1,90 @@
+import pytest
+
+from sanitext.offset_map import OffsetMap
+from sanitext.text_sanitization import get_allowed_characters, sanitize_text
+
+
+def expected_offsets(text, replacements):
+    """
+    Reference per-character mapping: original offset -> sanitized offset of the
+    start of that character's replacement (plus the end of the text).
+    """
+    offsets = []
+    position = 0
+    for ch in text:
+        offsets.append(position)
+        position += len(replacements.get(ch, ch))
+    offsets.append(position)
+    return offsets
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "Plain ASCII text.",
+        "Ⅵ is VI",
+        "Invisible​ character.",
+        "​​ⅥⅥﬁ​",
+        "Thіs tеxt cоntaіns homoglyphs.",
+        "Peace ☯ within ﬁne Ⅻ​",
+    ],
+)
+def test_offset_map_matches_reference(text):
+    sanitized, offsets = sanitize_text(
+        text, allowed_characters=get_allowed_characters(), return_offsets=True
+    )
+    assert sanitized == sanitize_text(text)
+    assert offsets.original_length == len(text)
+    assert offsets.sanitized_length == len(sanitized)
+
+    replacements = {ch: sanitize_text(ch) for ch in set(text)}
+    reference = expected_offsets(text, replacements)
+    for original, expected in enumerate(reference):
+        assert offsets.to_sanitized(original) == expected
+
+    # Every sanitized offset maps back to the character that produced it
+    for original, ch in enumerate(text):
+        start = reference[original]
+        for sanitized_offset in range(start, start + len(replacements[ch])):
+            assert offsets.to_original(sanitized_offset) == original
+    assert offsets.to_original(len(sanitized)) == len(text)
+
+
+def test_offset_map_clean_text_is_single_segment():
+    """1-to-1 replacements (homoglyphs) don't add segments."""
+    text = "Thіs tеxt cоntaіns homoglyphs." * 100
+    sanitized, offsets = sanitize_text(text, return_offsets=True)
+    assert sanitized == "This text contains homoglyphs." * 100
+    assert len(offsets) == 1
+
+
+def test_offset_map_spans():
+    text = "See Ⅵ​ here"
+    sanitized, offsets = sanitize_text(text, return_offsets=True)
+    assert sanitized == "See VI here"
+    # "here" in the sanitized text maps back to "here" in the original
+    start = sanitized.index("here")
+    assert offsets.span_to_original(start, start + 4) == (7, 11)
+    # Half of the expansion "VI" maps back to the whole "Ⅵ"
+    assert offsets.span_to_original(4, 5) == (4, 5)
+    assert offsets.span_to_sanitized(4, 5) == (4, 6)
+    assert offsets.span_to_sanitized(7, 11) == (start, start + 4)
+
+
+def test_offset_map_identity():
+    offsets = OffsetMap.identity(5)
+    assert [offsets.to_sanitized(i) for i in range(6)] == list(range(6))
+    assert [offsets.to_original(i) for i in range(6)] == list(range(6))
+    with pytest.raises(ValueError):
+        offsets.to_sanitized(6)
+
+
+def test_offset_map_splice_merges_clean_edits():
+    """Clean edits of clean text keep the map at a single segment."""
+    _, offsets = sanitize_text("Hello, world!", return_offsets=True)
+    _, inserted = sanitize_text("brave new ", return_offsets=True)
+    spliced = offsets.splice(7, 7, inserted)
+    assert len(spliced) == 1
+    assert spliced.original_length == spliced.sanitized_length == 23
+    assert spliced.to_original(20) == 20
@@ -0,0 +1,46 @@
+import pickle
+
+from sanitext.policy import Policy
+from sanitext.text_sanitization import (
+    get_allowed_characters,
+    get_allowed_sequences,
+    sanitize_text,
+)
+
+TEXTS = ["plain", "Thіs іs а “quoted” tеxt — naïve", "ж ø ☯", "👍🏽 and 🇬🇧"]
+
+
+def test_policy_matches_sanitize_text():
+    policy = Policy()
+    for text in TEXTS:
+        assert policy.sanitize(text) == sanitize_text(text)
+
+
+def test_policy_clean_text_is_returned_as_is():
+    text = "plain ASCII"
+    assert Policy().sanitize(text) is text
+    assert Policy().is_clean(text)
+    assert not Policy().is_clean("naïve")
+
+
+def test_policy_decisions_and_sequences():
+    allowed_characters = get_allowed_characters(allow_emoji=True)
+    allowed_sequences = get_allowed_sequences(allow_emoji=True)
+    decisions = {"ø": "o!"}
+    policy = Policy(allowed_characters, decisions, allowed_sequences)
+    for text in TEXTS:
+        assert policy.sanitize(text) == sanitize_text(
+            text,
+            allowed_characters=allowed_characters,
+            decisions=decisions,
+            allowed_sequences=allowed_sequences,
+        )
+    assert Policy(decisions=decisions).sanitize("ø — ж") == "o! - "
+
+
+def test_policy_pickles_with_its_table():
+    policy = Policy(decisions={"ø": "o"})
+    policy.sanitize("naïve ø")
+    copy = pickle.loads(pickle.dumps(policy))
+    assert copy.table == policy.table
+    assert copy.sanitize("naïve ø — ж") == "naive o - "
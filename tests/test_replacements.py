@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from sanitext.compiled_policy import CompiledPolicy, compile_policy
+from sanitext.policy import Policy
+from sanitext.replacements import (
+    load_replacements,
+    parse_character,
+    read_replacements,
+    tomllib,
+    with_replacements,
+)
+from sanitext.text_sanitization import sanitize_text
+
+needs_toml = pytest.mark.skipif(tomllib is None, reason="needs tomllib or tomli")
+
+
+def write_json(path, replacements):
+    path.write_text(json.dumps({"replacements": replacements}), encoding="utf-8")
+    return path
+
+
+def test_parse_character():
+    assert parse_character("€") == "€"
+    assert parse_character("U+2192") == "→"
+    assert parse_character("u+2026") == "…"
+    assert parse_character("ab") is None
+    assert parse_character("U+XYZ") is None
+    assert parse_character("U+110000") is None
+
+
+@needs_toml
+def test_read_toml_replacements(tmp_path):
+    path = tmp_path / "replacements.toml"
+    path.write_text(
+        '[replacements]\n"€" = "EUR"\n"U+2192" = "->"\n"…" = "..."\n',
+        encoding="utf-8",
+    )
+    assert read_replacements(path) == {"€": "EUR", "→": "->", "…": "..."}
+
+
+def test_read_json_replacements(tmp_path):
+    path = write_json(tmp_path / "replacements.json", {"€": "EUR", "U+200B": ""})
+    assert read_replacements(path) == {"€": "EUR", "​": ""}
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("replacements.txt", "€ EUR"),
+        ("replacements.json", '{"other": {}}'),
+        ("replacements.json", '{"replacements": {"ab": "x"}}'),
+        ("replacements.json", '{"replacements": {"€": 1}}'),
+    ],
+)
+def test_read_invalid_replacements(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_replacements(path)
+
+
+def test_later_files_take_precedence(tmp_path):
+    first = write_json(tmp_path / "first.json", {"€": "EUR", "…": "..."})
+    second = write_json(tmp_path / "second.json", {"€": "euro"})
+    assert load_replacements([first, second]) == {"€": "euro", "…": "..."}
+
+
+def test_precedence():
+    # Decisions over replacements over the homoglyph map; allowed characters stay
+    decisions = with_replacements({"—": "---"}, {"—": "--", "а": "A", "x": "y"})
+    assert sanitize_text("x—а", decisions=decisions) == "x---A"
+    assert sanitize_text("x—а") == "x-a"
+
+
+def test_new_decisions_are_added_to_decisions_only():
+    saved = {}
+    replacements = {"€": "EUR"}
+    decisions = with_replacements(saved, replacements)
+    decisions["ж"] = "zh"
+    assert saved == {"ж": "zh"}
+    assert replacements == {"€": "EUR"}
+    assert with_replacements(saved, {}) is saved
+
+
+def test_replacements_are_in_the_table_before_sanitizing():
+    policy = Policy(decisions=with_replacements(None, {"€": "EUR", "…": "..."}))
+    assert policy.table[0x20AC] == "EUR"
+    assert policy.table[0x2026] == "..."
+    assert policy.sanitize("5€…") == "5EUR..."
+
+
+def test_compiled_policy_keeps_replacements():
+    policy = Policy(decisions=with_replacements(None, {"€": "EUR", "→": "->"}))
+    compiled = CompiledPolicy(compile_policy(policy))
+    assert compiled.sanitize("5€ → x") == "5EUR -> x"
@@ -0,0 +1,84 @@
+import pytest
+
+from sanitext.review import parse_selection, review_characters, review_text, snippet
+from sanitext.text_sanitization import get_allowed_characters, summarize_suspicious
+
+
+@pytest.fixture
+def ascii_allowed():
+    return get_allowed_characters()
+
+
+def feed(monkeypatch, commands):
+    """Queue review commands as user input."""
+    inputs = iter(commands)
+    monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
+
+
+def test_review_lists_by_frequency(monkeypatch, capsys, ascii_allowed):
+    text = "é ☯☯☯ øø"
+    feed(monkeypatch, [""])
+    review_characters(text, ascii_allowed)
+    output = capsys.readouterr().out
+    assert "3 distinct disallowed characters (6 occurrences)" in output
+    # Ranked by count: ☯ (3), ø (2), é (1)
+    assert output.index("'☯'") < output.index("'ø'") < output.index("'é'")
+    assert "x3" in output and "YIN YANG" in output
+
+
+def test_review_bulk_decisions(monkeypatch, ascii_allowed):
+    text = "Тhе сat ☯ Ⅵ ℌ —"
+    # Keep nothing Cyrillic, replace it with homoglyphs; remove the rest except
+    # the em dash, which gets a custom replacement.
+    feed(monkeypatch, ["all n", "cyrillic a", "— r --", ""])
+    sanitized = review_text(text, ascii_allowed)
+    assert sanitized == "The cat    --"
+
+
+def test_review_undecided_get_default(monkeypatch, ascii_allowed):
+    feed(monkeypatch, ["2 y", ""])
+    decisions, defaults = review_characters("Café ☯ é", ascii_allowed)
+    # 'é' occurs twice so it is item 1; '☯' is item 2 and is kept. Only the
+    # explicit choice is a decision, so it is the only one saved
+    assert decisions == {"☯": "☯"}
+    assert defaults == {"é": "e"}
+
+
+def test_review_skips_known_decisions(monkeypatch, capsys, ascii_allowed):
+    feed(monkeypatch, [""])
+    decisions, defaults = review_characters(
+        "Café ☯", ascii_allowed, decisions={"é": "é"}
+    )
+    output = capsys.readouterr().out
+    assert "'é'" not in output
+    assert decisions == {"é": "é"}
+    assert defaults == {"☯": ""}
+
+
+def test_review_invalid_command_reprompts(monkeypatch, capsys, ascii_allowed):
+    feed(monkeypatch, ["7 y", "1 x", "1 y", ""])
+    decisions, _ = review_characters("☯", ascii_allowed)
+    assert capsys.readouterr().out.count("Invalid command") == 2
+    assert decisions == {"☯": "☯"}
+
+
+def test_review_nothing_to_review(monkeypatch, ascii_allowed):
+    def no_input(prompt):
+        raise AssertionError("Should not prompt")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    assert review_characters("plain", ascii_allowed) == ({}, {})
+
+
+def test_parse_selection(ascii_allowed):
+    entries = summarize_suspicious("аβвγ", ascii_allowed)
+    assert [e[0] for e in parse_selection("1,3-4", entries)] == ["а", "в", "γ"]
+    assert [e[0] for e in parse_selection("greek", entries)] == ["β", "γ"]
+    assert parse_selection("5", entries) is None
+    assert parse_selection("hebrew", entries) is None
+
+
+def test_snippet():
+    assert snippet("line one\nbad☯char here", 12, width=5) == "e\nbad[☯]char ".replace(
+        "\n", " "
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from sanitext import scan
+from sanitext.hidden_text import find_hidden_text
+from sanitext.scan import allowed_run_pattern, chunk_boundaries, scan_large_file
+from sanitext.scripts import detect_mixed_script
+from sanitext.text_sanitization import (
+    get_allowed_characters,
+    get_allowed_sequences,
+    summarize_suspicious,
+)
+
+TEXT = (
+    "Thіs іs а “test” — naïve pаypal\n"
+    "x\U000e0068\U000e0069y 👨‍👩‍👧 ]^-\\ \x00\n" * 20 + "no newline at the end: ж𝑚"
+)
+
+
+def detect(text, allowed_characters, allowed_sequences=None):
+    return (
+        summarize_suspicious(text, allowed_characters, allowed_sequences),
+        find_hidden_text(text),
+        detect_mixed_script(text),
+    )
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "dump.txt"
+    path.write_bytes(TEXT.encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 20])
+@pytest.mark.parametrize("allow_emoji", [False, True])
+def test_scan_large_file_matches_whole_text(text_file, chunk_size, allow_emoji):
+    allowed_characters = get_allowed_characters(allow_emoji=allow_emoji)
+    allowed_sequences = get_allowed_sequences(allow_emoji=allow_emoji)
+    result = scan_large_file(
+        text_file,
+        allowed_characters,
+        allowed_sequences,
+        jobs=1,
+        chunk_size=chunk_size,
+    )
+    assert result == detect(TEXT, allowed_characters, allowed_sequences)
+
+
+def test_scan_large_file_workers(text_file):
+    allowed_characters = get_allowed_characters()
+    result = scan_large_file(text_file, allowed_characters, jobs=2, chunk_size=64)
+    assert result == detect(TEXT, allowed_characters)
+
+
+def test_scan_large_file_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert scan_large_file(path) == ([], [], [])
+
+
+def test_chunk_boundaries_utf8(monkeypatch):
+    """Without line breaks nearby, chunks still start at a character."""
+    monkeypatch.setattr(scan, "LINE_SEARCH", 2)
+    data = ("ж—𝑚" * 50).encode("utf-8")
+    boundaries = chunk_boundaries(data, 4)
+    assert boundaries[0] == 0 and boundaries[-1] == len(data)
+    for start, end in zip(boundaries, boundaries[1:]):
+        assert start < end
+        data[start:end].decode("utf-8")
+
+
+def test_chunk_boundaries_lines():
+    assert chunk_boundaries(b"one\ntwo\nthree", 1) == [0, 4, 8, 13]
+    assert chunk_boundaries(b"short", 100) == [0, 5]
+
+
+def test_allowed_run_pattern():
+    pattern = allowed_run_pattern({"a", "]", "^", "-", "\\"})
+    assert pattern.sub("", "a]^-\\bж") == "bж"
+    assert allowed_run_pattern(set()).sub("", "abc") == "abc"
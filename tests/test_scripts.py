@@ -0,0 +1,55 @@
+import pytest
+
+from sanitext.scripts import detect_mixed_script, script_of
+
+
+@pytest.mark.parametrize(
+    "char, expected",
+    [
+        ("a", "Latin"),
+        ("Z", "Latin"),
+        ("é", "Latin"),
+        ("а", "Cyrillic"),
+        ("ο", "Greek"),
+        ("東", "Han"),
+        ("タ", "Katakana"),
+        ("한", "Hangul"),
+        ("1", "Common"),
+        ("!", "Common"),
+        ("́", "Inherited"),
+        ("𝐀", "Common"),
+        ("\U0010ffff", "Unknown"),
+    ],
+)
+def test_script_of(char, expected):
+    assert script_of(char) == expected
+
+
+def test_detect_mixed_script():
+    text = "Log in to pаypal.com, Ѕсоtt!"
+    assert detect_mixed_script(text) == [
+        (10, 16, "pаypal", ("Latin", "Cyrillic")),
+        (22, 27, "Ѕсоtt", ("Cyrillic", "Latin")),
+    ]
+
+
+def test_detect_mixed_script_combining_marks_stay_in_word():
+    text = "pа́ypal"
+    assert detect_mixed_script(text) == [(0, 7, text, ("Latin", "Cyrillic"))]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "Plain ASCII text.",
+        "Привет мир, Καλημέρα, Café crème",
+        "Café 2024 — naïve",  # Latin with combining marks and digits
+        "東京タワーへ行く",  # Japanese: Han + Katakana + Hiragana
+        "한국어漢字",  # Korean: Hangul + Han
+        "ㄅㄆ漢字",  # Chinese: Bopomofo + Han
+        "MPa 𝐀𝐁𝐂",  # Mathematical letters are Common
+    ],
+)
+def test_detect_mixed_script_single_writing_system(text):
+    assert detect_mixed_script(text) == []
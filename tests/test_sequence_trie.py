@@ -0,0 +1,58 @@
+import pytest
+
+from sanitext.sequence_trie import SequenceTrie
+from sanitext.text_sanitization import get_allowed_sequences
+
+FAMILY = "👨‍👩‍👧"
+COUPLE = "👨‍👩"
+
+
+@pytest.fixture
+def trie():
+    return SequenceTrie([COUPLE, FAMILY, "🇬🇧", "1️⃣", "x"])
+
+
+def test_match_prefers_longest(trie):
+    assert trie.match(FAMILY, 0) == len(FAMILY)
+    assert trie.match(COUPLE + "‍", 0) == len(COUPLE)
+    assert trie.match("🇬🇧", 1) is None
+
+
+def test_single_code_points_are_ignored(trie):
+    """Only multi-code-point sequences are matched."""
+    assert list(trie.finditer("x")) == []
+
+
+def test_finditer(trie):
+    text = f"a {FAMILY} b 🇬🇧🇬 1 1️⃣ {COUPLE}"
+    spans = [text[start:end] for start, end in trie.finditer(text)]
+    assert spans == [FAMILY, "🇬🇧", "1️⃣", COUPLE]
+
+
+def test_outside(trie):
+    text = f"{FAMILY}ab🇬🇧c"
+    assert list(trie.outside(text)) == [(5, 7), (9, 10)]
+    assert list(trie.outside("plain")) == [(0, 5)]
+    assert list(trie.outside("")) == [(0, 0)]
+    assert list(trie.outside(FAMILY)) == []
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    [
+        FAMILY,
+        "👍🏽",  # Skin tone modifier
+        "🇬🇧",  # Flag
+        "#️⃣",  # Keycap
+        "🏴󠁧󠁢󠁳󠁣󠁴󠁿",  # Tag sequence (Scotland)
+        "❤️",  # Presentation sequence
+        "🏳️‍🌈",
+    ],
+)
+def test_emoji_sequences(sequence):
+    trie = get_allowed_sequences(allow_emoji=True)
+    assert list(trie.finditer(f"a{sequence}b")) == [(1, 1 + len(sequence))]
+
+
+def test_no_sequences_without_emoji():
+    assert get_allowed_sequences() is None
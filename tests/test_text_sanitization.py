@@ -1,4 +1,5 @@
 import pytest
+import random
 import string
 import unicodedata
 import tempfile
@@ -9,6 +10,10 @@ from sanitext.text_sanitization import (
     sanitize_text,
     closest_ascii,
     detect_suspicious_characters,
+    summarize_suspicious,
+    unicode_name,
+    sanitize_edit,
+    get_allowed_sequences,
 )
 from sanitext.emoji_set import EMOJI_SET
 
@@ -232,6 +237,62 @@ def test_detect_suspicious_characters_parametrized(text, expected):
     )
 
 
+def test_detect_suspicious_characters_shares_names(ascii_allowed):
+    """
+    Repeated characters should reuse the cached name rather than look it up again.
+    """
+    detected = detect_suspicious_characters("ааа", ascii_allowed)
+    assert detected[0][1] is detected[1][1] is detected[2][1]
+
+
+@pytest.mark.parametrize(
+    "char, expected",
+    [
+        ("а", "CYRILLIC SMALL LETTER A"),
+        ("👋", "WAVING HAND SIGN"),
+        ("\x00", "Unknown"),  # Control characters have no name
+    ],
+)
+def test_unicode_name(char, expected):
+    assert unicode_name(char) == expected
+
+
+# -------------------------------------------------------------------
+# Tests for summarize_suspicious
+# -------------------------------------------------------------------
+
+
+def test_summarize_suspicious_counts_and_first_offsets(ascii_allowed):
+    text = "Thіs іs а test, іі."
+    summary = summarize_suspicious(text, ascii_allowed)
+    assert summary == [
+        ("і", 4, 2, "CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I"),
+        ("а", 1, 8, "CYRILLIC SMALL LETTER A"),
+    ]
+
+
+def test_summarize_suspicious_matches_detect(ascii_allowed):
+    """
+    The summary should agree with the per-occurrence detection output.
+    """
+    text = "𝑇ℎ𝑖𝑠 ​ 𝑖𝑠 ℎ𝑒𝑟𝑒 ​ 👋"
+    detected = detect_suspicious_characters(text, ascii_allowed)
+    summary = summarize_suspicious(text, ascii_allowed)
+
+    assert [entry[0] for entry in summary] == list(
+        dict.fromkeys(ch for ch, _ in detected)
+    )
+    for char, count, first_offset, name in summary:
+        assert count == sum(1 for ch, _ in detected if ch == char)
+        assert text.index(char) == first_offset
+        assert name == unicodedata.name(char)
+
+
+def test_summarize_suspicious_none(ascii_allowed):
+    assert summarize_suspicious("Hello, world!\n", ascii_allowed) == []
+    assert summarize_suspicious("", ascii_allowed) == []
+
+
 # -------------------------------------------------------------------
 # Tests for sanitize_text (non-interactive)
 # -------------------------------------------------------------------
@@ -308,6 +369,118 @@ def test_sanitize_text_all_disallowed():
     ), f"With a minimal allowed set, everything gets removed or replaced with ''. Got: {sanitized}"
 
 
+# -------------------------------------------------------------------
+# Tests for multi-code-point emoji sequences
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Family: 👨‍👩‍👧!",
+        "Thumbs 👍🏽 and flag 🇬🇧",
+        "Keycap #️⃣ and ❤️",
+    ],
+)
+def test_sanitize_text_keeps_emoji_sequences(text):
+    allowed = get_allowed_characters(allow_emoji=True)
+    sequences = get_allowed_sequences(allow_emoji=True)
+    assert sanitize_text(text, allowed, allowed_sequences=sequences) == text
+    assert detect_suspicious_characters(text, allowed, sequences) == []
+    assert summarize_suspicious(text, allowed, sequences) == []
+
+
+def test_sanitize_text_sequences_only_protect_whole_sequences():
+    """
+    Code points that are only allowed inside a sequence are still removed elsewhere.
+    """
+    allowed = get_allowed_characters(allow_emoji=True)
+    sequences = get_allowed_sequences(allow_emoji=True)
+    text = "a\u200db 👨‍👩‍👧 Ⅵ🏽"
+    sanitized, offsets = sanitize_text(
+        text, allowed, allowed_sequences=sequences, return_offsets=True
+    )
+    assert sanitized == "ab 👨‍👩‍👧 VI"
+    assert offsets.to_original(sanitized.index("VI")) == text.index("Ⅵ")
+    assert offsets.to_sanitized(len(text)) == len(sanitized)
+    assert summarize_suspicious(text, allowed, sequences) == [
+        ("\u200d", 1, 1, "ZERO WIDTH JOINER"),
+        ("Ⅵ", 1, text.index("Ⅵ"), "ROMAN NUMERAL SIX"),
+        ("🏽", 1, text.index("🏽"), "EMOJI MODIFIER FITZPATRICK TYPE-4"),
+    ]
+
+
+# -------------------------------------------------------------------
+# Tests for sanitize_edit (incremental re-sanitization)
+# -------------------------------------------------------------------
+
+
+def test_sanitize_edit_replaces_only_edited_region(ascii_allowed):
+    original = "Thіs is Ⅵ"
+    sanitized, offsets = sanitize_text(original, ascii_allowed, return_offsets=True)
+    assert sanitized == "This is VI"
+
+    # Replace "is" (original[5:7]) with "wаs ​ﬁne"
+    start, end, replacement, offsets = sanitize_edit(
+        offsets, 5, 7, "wаs ​ﬁne", ascii_allowed
+    )
+    assert (start, end, replacement) == (5, 7, "was fine")
+    sanitized = sanitized[:start] + replacement + sanitized[end:]
+    assert sanitized == "This was fine VI"
+    assert offsets.to_original(sanitized.index("VI")) == len("Thіs wаs ​ﬁne ")
+
+
+@pytest.mark.parametrize(
+    "alphabet, decisions, allowed_sequences",
+    [
+        ("ab \nіⅥ​ﬁ☯é", None, None),
+        ("ab \nіⅥ​ﬁ☯é", {"☯": "(yin yang)", "é": "e'", "ﬁ": ""}, None),
+        # Pieces of emoji sequences (skin tone, flag, ZWJ family, keycap)
+        ("a #\u20e3\ufe0f👍🏽🇬🇧👨\u200d👩é", {"é": "e'"}, get_allowed_sequences(True)),
+    ],
+)
+def test_sanitize_edit_matches_full_sanitization(
+    ascii_allowed, alphabet, decisions, allowed_sequences
+):
+    """
+    Applying a series of random edits incrementally should give the same text
+    and the same offsets as sanitizing the edited buffer from scratch.
+    """
+    rng = random.Random(0)
+    options = {"decisions": decisions, "allowed_sequences": allowed_sequences}
+    original = "".join(rng.choice(alphabet) for _ in range(60))
+    sanitized, offsets = sanitize_text(
+        original, ascii_allowed, return_offsets=True, **options
+    )
+
+    for _ in range(200):
+        start = rng.randint(0, len(original))
+        end = rng.randint(start, min(len(original), start + 5))
+        inserted = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+
+        sanitized_start, sanitized_end, replacement, offsets = sanitize_edit(
+            offsets, start, end, inserted, ascii_allowed, text=original, **options
+        )
+        original = original[:start] + inserted + original[end:]
+        sanitized = (
+            sanitized[:sanitized_start] + replacement + sanitized[sanitized_end:]
+        )
+
+        expected, expected_offsets = sanitize_text(
+            original, ascii_allowed, return_offsets=True, **options
+        )
+        assert sanitized == expected
+        assert len(offsets) <= len(expected_offsets)
+        for position in range(len(original) + 1):
+            assert offsets.to_sanitized(position) == expected_offsets.to_sanitized(
+                position
+            )
+        for position in range(len(sanitized) + 1):
+            assert offsets.to_original(position) == expected_offsets.to_original(
+                position
+            )
+
+
 # -------------------------------------------------------------------
 # Testing interactive mode
 # -------------------------------------------------------------------
@@ -362,3 +535,49 @@ def test_sanitize_text_interactive_repeated_characters(monkeypatch, ascii_allowe
     # We expect: "Hello !, !, and !!"
     # Because all 'é' were replaced with '!'
     assert sanitized == "Hello !, !, and !!"
+
+
+def test_sanitize_text_decisions_overlay(monkeypatch, ascii_allowed):
+    """
+    Saved decisions are applied without prompting; only new characters are asked about.
+    """
+    decisions = {"’": "'", "—": "--"}
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return "n"
+
+    monkeypatch.setattr("builtins.input", fake_input)
+
+    sanitized = sanitize_text(
+        "It’s done — ☯", ascii_allowed, interactive=True, decisions=decisions
+    )
+    assert sanitized == "It's done -- "
+    assert len(prompts) == 1 and "☯" in prompts[0]
+    # The new answer was recorded so it can be persisted
+    assert decisions == {"’": "'", "—": "--", "☯": ""}
+
+
+def test_sanitize_text_decisions_non_interactive(ascii_allowed):
+    """
+    Batch runs apply saved decisions and fall back to closest_ascii for the rest.
+    """
+    decisions = {"é": "é"}
+    sanitized = sanitize_text("Café Ⅵ", ascii_allowed, decisions=decisions)
+    assert sanitized == "Café VI"
+    assert decisions == {"é": "é"}
+
+
+def test_sanitize_edit_with_sequences_needs_the_text(ascii_allowed):
+    sequences = get_allowed_sequences(allow_emoji=True)
+    original = "ok 👍🏽"
+    _, offsets = sanitize_text(
+        original, ascii_allowed, return_offsets=True, allowed_sequences=sequences
+    )
+    with pytest.raises(ValueError):
+        sanitize_edit(offsets, 0, 1, "x", ascii_allowed, allowed_sequences=sequences)
+    # Removing the skin tone widens the edit to the whole emoji
+    assert sanitize_edit(
+        offsets, 4, 5, "", ascii_allowed, allowed_sequences=sequences, text=original
+    )[:3] == (3, 5, "")
@@ -0,0 +1,146 @@
+"""
+Generate sanitext/confusables_data.py, the ASCII look-alikes from Unicode's
+confusables data (UTS #39, confusables.txt).
+
+The data file is vendored under data/unicode/<version>/ so the table can be
+regenerated offline. To move to a new Unicode version, add its confusables.txt
+next to the existing ones and run:
+
+    python tools/generate_confusables.py [version]
+
+Only entries that matter for ASCII sanitization are kept: a non-ASCII source
+whose prototype is all ASCII, and whose NFKC form is not already ASCII (those
+are handled by normalization in `closest_ascii`, which gives e.g. "0" instead
+of the prototype "O" for "𝟎"). Combining marks and symbols whose prototype is
+a word are skipped. Digits are replaced with their value rather than with the
+ASCII character they look like, and other numbers are only kept when they look
+like their value.
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA = ROOT / "data" / "unicode"
+OUTPUT = ROOT / "sanitext" / "confusables_data.py"
+
+
+def escape(text):
+    return "".join(
+        f"\\U{ord(ch):08x}" if ord(ch) > 0xFFFF else f"\\u{ord(ch):04x}" for ch in text
+    )
+
+
+def comment(char):
+    # Separators (e.g. U+2028 LINE SEPARATOR) would break the line in editors
+    if unicodedata.category(char)[0] in "ZC":
+        return f"U+{ord(char):04X} {unicodedata.name(char)}"
+    return char
+
+
+def quote(text):
+    # Like black, use single quotes when that takes fewer escapes
+    text = text.replace("\\", "\\\\")
+    if text.count('"') > text.count("'"):
+        return "'" + text.replace("'", "\\'") + "'"
+    return '"' + text.replace('"', '\\"') + '"'
+
+
+def parse(path):
+    """Yields (source, prototype) pairs from confusables.txt."""
+    with open(path, encoding="utf-8-sig") as file:
+        for line in file:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            source, prototype = (field.strip() for field in line.split(";")[:2])
+            yield (
+                "".join(chr(int(cp, 16)) for cp in source.split()),
+                "".join(chr(int(cp, 16)) for cp in prototype.split()),
+            )
+
+
+def readable(source, prototype):
+    """
+    Prototypes are chosen for comparing strings, not for reading them: "I", "1"
+    and "|" all map to "l", "0" maps to "O" and '"' to "''". Pick the ASCII
+    character that the source actually stands for.
+    """
+    category = unicodedata.category(source)
+    if prototype == "l":
+        if category == "Lu":
+            return "I"
+        if category[0] == "N":
+            return "1"
+        if category[0] in "PS":
+            return "|"
+    if prototype == "O" and category[0] == "N":
+        return "0"
+    if prototype == "''":
+        return '"'
+    # Letters with a hook or horn: "Ɓ" -> "'B" becomes "B"
+    letter = prototype.replace("'", "")
+    if category[0] == "L" and len(letter) == 1 and letter.isalnum():
+        return letter
+    return prototype
+
+
+def number_value(char):
+    """Returns the ASCII digits of a whole number character's value, or None."""
+    value = unicodedata.numeric(char, None)
+    if value is None or value != int(value):
+        return None
+    return str(int(value))
+
+
+def main():
+    versions = sorted(
+        (path.name for path in DATA.iterdir() if (path / "confusables.txt").exists()),
+        key=lambda version: tuple(int(part) for part in version.split(".")),
+    )
+    version = sys.argv[1] if len(sys.argv) > 1 else versions[-1]
+    confusables = {}
+    for source, prototype in parse(DATA / version / "confusables.txt"):
+        if len(source) != 1 or source.isascii() or not prototype.isascii():
+            continue
+        if unicodedata.normalize("NFKC", source).isascii():
+            continue
+        # A combining mark only looks like its prototype next to its base
+        if unicodedata.category(source)[0] == "M":
+            continue
+        # Symbols spelled as words are shape coincidences ("∞" -> "oo")
+        if (
+            unicodedata.category(source)[0] == "S"
+            and sum(ch.isalpha() for ch in prototype) > 1
+        ):
+            continue
+        target = readable(source, prototype)
+        # Digits are often confusable with other ASCII characters than their
+        # value ("٧" with "V", "৪" with "8"): replace them with their value,
+        # and drop other numbers that don't look like theirs
+        if unicodedata.category(source)[0] == "N":
+            if unicodedata.digit(source, None) is not None:
+                target = str(unicodedata.digit(source))
+            elif target != number_value(source):
+                continue
+        confusables[source] = target
+
+    lines = [
+        "# Generated by tools/generate_confusables.py, do not edit.",
+        f"# ASCII look-alikes from Unicode {version} confusables.txt (UTS #39).",
+        f'UNICODE_VERSION = "{version}"',
+        "",
+        "CONFUSABLES = {",
+    ]
+    lines += [
+        f'    "{escape(source)}": {quote(target)},  # {comment(source)}'
+        for source, target in sorted(confusables.items())
+    ]
+    lines.append("}")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Wrote {len(confusables)} confusables (Unicode {version}) to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
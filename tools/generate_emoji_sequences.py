@@ -0,0 +1,44 @@
+"""
+Generate sanitext/emoji_sequences.py, the set of multi-code-point emoji sequences
+(ZWJ sequences, skin tone modifiers, flags, keycaps, tag sequences and
+presentation sequences).
+
+The data comes from the `emoji` package, which tracks Unicode's emoji-test.txt:
+
+    pip install emoji
+    python tools/generate_emoji_sequences.py
+"""
+
+from pathlib import Path
+
+import emoji
+
+OUTPUT = Path(__file__).resolve().parent.parent / "sanitext" / "emoji_sequences.py"
+
+
+def escape(sequence):
+    return "".join(
+        f"\\U{ord(ch):08x}" if ord(ch) > 0xFFFF else f"\\u{ord(ch):04x}"
+        for ch in sequence
+    )
+
+
+def main():
+    sequences = sorted(
+        (sequence for sequence in emoji.EMOJI_DATA if len(sequence) > 1),
+        key=lambda sequence: [ord(ch) for ch in sequence],
+    )
+    lines = [
+        "# Generated by tools/generate_emoji_sequences.py, do not edit.",
+        f"# Multi-code-point emoji sequences from the emoji package {emoji.__version__}",
+        "# (fully-qualified, minimally-qualified and unqualified forms).",
+        "EMOJI_SEQUENCES = {",
+    ]
+    lines += [f'    "{escape(sequence)}",  # {sequence}' for sequence in sequences]
+    lines.append("}")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Wrote {len(sequences)} sequences to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
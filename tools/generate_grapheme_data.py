@@ -0,0 +1,93 @@
+"""
+Generate sanitext/grapheme_data.py, the code point range tables behind the
+UAX #29 extended grapheme cluster rules used by sanitext.graphemes:
+Grapheme_Cluster_Break, Extended_Pictographic and Indic_Conjunct_Break.
+
+The properties are read from the Unicode Character Database tables shipped
+with the `uniseg` package:
+
+    pip install uniseg
+    python tools/generate_grapheme_data.py
+"""
+
+from pathlib import Path
+
+import uniseg
+from uniseg.graphemecluster import (
+    extended_pictographic,
+    grapheme_cluster_break,
+    indic_conjunct_break,
+)
+
+OUTPUT = Path(__file__).resolve().parent.parent / "sanitext" / "grapheme_data.py"
+
+
+def ranges_by_value(prop, skip):
+    """Returns {value: [(first, last), ...]} for all code points not in `skip`."""
+    ranges = {}
+    previous = None
+    for code_point in range(0x110000):
+        value = prop(chr(code_point))
+        value = None if value in skip else value
+        if value is not None:
+            if value == previous and ranges[value][-1][1] == code_point - 1:
+                ranges[value][-1][1] = code_point
+            else:
+                ranges.setdefault(value, []).append([code_point, code_point])
+        previous = value
+    return ranges
+
+
+def format_range(first, last):
+    return f"(0x{first:04X}, 0x{last:04X}),"
+
+
+def format_ranges(ranges, indent):
+    pad = " " * indent
+    return "\n".join(f"{pad}{format_range(first, last)}" for first, last in ranges)
+
+
+def format_entry(value, ranges):
+    # A single range fits on one line, as black writes it
+    if len(ranges) == 1:
+        return [f'    "{value}": ({format_range(*ranges[0])}),']
+    return [f'    "{value}": (', format_ranges(ranges, 8), "    ),"]
+
+
+def gcb_value(char):
+    # UAX #29 assigns surrogates (Cs) to Control
+    if 0xD800 <= ord(char) <= 0xDFFF:
+        return "Control"
+    return grapheme_cluster_break(char).value
+
+
+def main():
+    gcb = ranges_by_value(gcb_value, {"Other"})
+    pictographic = ranges_by_value(lambda c: extended_pictographic(c) or None, set())
+    incb = ranges_by_value(lambda c: indic_conjunct_break(c).value, {"None"})
+
+    out = [
+        "# Generated by tools/generate_grapheme_data.py, do not edit.",
+        "# Inclusive code point ranges of the UAX #29 grapheme cluster properties.",
+        f'UNICODE_VERSION = "{uniseg.unidata_version}"',
+        "",
+        "# Grapheme_Cluster_Break values other than Other",
+        "GRAPHEME_BREAK_RANGES = {",
+    ]
+    for value in sorted(gcb):
+        out += format_entry(value, gcb[value])
+    out += ["}", "", "EXTENDED_PICTOGRAPHIC_RANGES = ("]
+    out += [format_ranges(pictographic[True], 4), ")", ""]
+    out += [
+        "# Indic_Conjunct_Break values other than None",
+        "INDIC_CONJUNCT_BREAK_RANGES = {",
+    ]
+    for value in sorted(incb):
+        out += format_entry(value, incb[value])
+    out.append("}")
+    OUTPUT.write_text("\n".join(out) + "\n", encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
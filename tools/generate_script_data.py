@@ -0,0 +1,41 @@
+"""
+Generate sanitext/script_data.py, the Unicode Script property (UAX #24) as a
+table of range starts for bisect lookups in sanitext.scripts.
+
+The data comes from the Scripts.txt tables shipped with the `fonttools`
+package:
+
+    pip install fonttools
+    python tools/generate_script_data.py
+"""
+
+import re
+from pathlib import Path
+
+from fontTools.unicodedata import Scripts
+
+OUTPUT = Path(__file__).resolve().parent.parent / "sanitext" / "script_data.py"
+
+
+def main():
+    version = re.search(r"Scripts-([\d.]+)\.txt", Path(Scripts.__file__).read_text())
+    ranges = []
+    for start, code in zip(Scripts.RANGES, Scripts.VALUES):
+        name = Scripts.NAMES[code]
+        if not ranges or ranges[-1][1] != name:
+            ranges.append((start, name))
+    lines = [
+        "# Generated by tools/generate_script_data.py, do not edit.",
+        "# Script property of every code point from each start up to the next start.",
+        f'UNICODE_VERSION = "{version.group(1)}"',
+        "",
+        "SCRIPT_RANGES = (",
+    ]
+    lines += [f'    (0x{start:04X}, "{name}"),' for start, name in ranges]
+    lines.append(")")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Wrote {len(ranges)} ranges to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()